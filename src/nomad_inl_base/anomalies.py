@@ -0,0 +1,285 @@
+"""
+Rolling-window anomaly detection for the battery chamber process logs.
+
+Three detectors run over the ~1 Hz series of a sputtering run:
+
+* **pressure excursions** — robust z-score of the process pressure against a
+  trailing rolling median / MAD;
+* **arc bursts** — PS4 arc + spark events (diffs of the cumulative counters)
+  summed over a trailing window;
+* **reflected power** — reflected/forward ratio of each RF supply while it
+  delivers power.
+
+All windows are trailing, so :class:`AnomalyDetector` can be fed the log in
+consecutive chunks (``update``) and yields the same intervals as a single
+call over the whole run: each detector carries just the last window of rows
+into the next chunk. Flagged rows are merged into intervals with the highest
+severity reached inside them. Between chunks the detector can be saved as
+plain arrays (``state`` / ``from_state``), e.g. next to a parse cache.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from nomad_inl_base.utils import change_points
+
+PRESSURE_WINDOW = 61
+# Robust z-score (|p - median| / (1.4826 MAD)) for warning / critical
+PRESSURE_Z = (6.0, 12.0)
+# MAD floor relative to the median, so a flat pressure does not flag noise
+_PRESSURE_REL_FLOOR = 0.01
+_MAD_TO_SIGMA = 1.4826
+
+ARC_WINDOW = 60
+# Arc + spark events per window for warning / critical
+ARC_BURST = (5, 20)
+
+# Reflected/forward ratio for warning / critical, only where forward > 5 W
+REFLECTED_RATIO = (0.1, 0.25)
+_MIN_FORWARD_POWER = 5.0
+
+SEVERITIES = ('warning', 'critical')
+
+
+@dataclass
+class Anomaly:
+    """A flagged interval of rows ``[start, stop)``."""
+
+    kind: str
+    channel: str
+    severity: str
+    start: int
+    stop: int
+    peak: float
+
+
+def _severity(score: np.ndarray, thresholds) -> np.ndarray:
+    """0 (ok), 1 (warning) or 2 (critical) per row; NaN scores are ok."""
+    score = np.nan_to_num(np.asarray(score, dtype=np.float64), nan=-np.inf)
+    return (score >= thresholds[0]).astype(np.int8) + (score >= thresholds[1])
+
+
+def _rolling_median(values: np.ndarray, window: int) -> np.ndarray:
+    import pandas as pd
+
+    return (
+        pd.Series(values).rolling(window, min_periods=1).median().to_numpy(np.float64)
+    )
+
+
+class _Tail:
+    """The last ``window - 1`` rows of a series, carried into the next chunk."""
+
+    def __init__(self, window: int):
+        self.keep = window - 1
+        self.rows = np.zeros(0)
+
+    def extend(self, chunk: np.ndarray) -> tuple[np.ndarray, int]:
+        """Return ``(tail + chunk, len(tail))`` and remember the new tail."""
+        joined = np.concatenate((self.rows, chunk))
+        offset = len(self.rows)
+        self.rows = joined[max(0, len(joined) - self.keep) :]
+        return joined, offset
+
+
+class _Intervals:
+    """Merge flagged rows of one ``(kind, channel)`` into ``Anomaly`` intervals,
+    keeping an interval open across chunk boundaries."""
+
+    def __init__(self, kind: str, channel: str):
+        self.kind = kind
+        self.channel = channel
+        self.open: Anomaly | None = None
+        self.closed: list[Anomaly] = []
+
+    def add(self, offset: int, severity: np.ndarray, score: np.ndarray) -> None:
+        if len(severity) == 0:
+            return
+        change_index, flagged = change_points(severity > 0)
+        stops = np.append(change_index[1:], len(severity))
+        score = np.nan_to_num(np.asarray(score, dtype=np.float64), nan=-np.inf)
+        worst = np.maximum.reduceat(severity, change_index)
+        peak = np.maximum.reduceat(score, change_index)
+        for start, stop, on, sev, top in zip(change_index, stops, flagged, worst, peak):
+            if not on:
+                self._close()
+                continue
+            if self.open is not None and self.open.stop == offset + start:
+                self.open.stop = offset + int(stop)
+                self.open.severity = max(
+                    self.open.severity, SEVERITIES[sev - 1], key=SEVERITIES.index
+                )
+                self.open.peak = max(self.open.peak, float(top))
+                continue
+            self._close()
+            self.open = Anomaly(
+                self.kind,
+                self.channel,
+                SEVERITIES[sev - 1],
+                offset + int(start),
+                offset + int(stop),
+                float(top),
+            )
+
+    def _close(self) -> None:
+        if self.open is not None:
+            self.closed.append(self.open)
+            self.open = None
+
+    def finish(self) -> list[Anomaly]:
+        self._close()
+        return self.closed
+
+
+class AnomalyDetector:
+    """
+    Incremental detector over consecutive chunks of a chamber log.
+
+    Call :meth:`update` once per chunk (rows in order; channels absent from
+    the log are passed as ``None``) and :meth:`finish` at the end.
+    """
+
+    def __init__(self):
+        self._rows = 0
+        self._pressure = _Tail(PRESSURE_WINDOW)
+        self._deviation = _Tail(PRESSURE_WINDOW)
+        self._arc_diffs = _Tail(ARC_WINDOW)
+        self._last_count = None
+        self._intervals: dict[tuple[str, str], _Intervals] = {}
+
+    def _track(self, kind: str, channel: str) -> _Intervals:
+        key = (kind, channel)
+        if key not in self._intervals:
+            self._intervals[key] = _Intervals(kind, channel)
+        return self._intervals[key]
+
+    def update(
+        self,
+        n: int,
+        pressure=None,
+        arc_count=None,
+        rf_power=(),
+    ) -> None:
+        """
+        Process the next *n* rows.
+
+        *pressure* is the process pressure, *arc_count* the cumulative PS4
+        arc + spark count and *rf_power* an iterable of ``(channel, forward,
+        reflected)`` arrays per RF supply.
+        """
+        if pressure is not None:
+            self._update_pressure(np.asarray(pressure, dtype=np.float64))
+        if arc_count is not None:
+            self._update_arcs(np.asarray(arc_count, dtype=np.float64))
+        for channel, forward, reflected in rf_power:
+            if forward is None or reflected is None:
+                continue
+            fwd = np.asarray(forward, dtype=np.float64)
+            rfl = np.asarray(reflected, dtype=np.float64)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                ratio = np.where(fwd > _MIN_FORWARD_POWER, rfl / fwd, np.nan)
+            self._track('reflected_power', channel).add(
+                self._rows, _severity(ratio, REFLECTED_RATIO), ratio
+            )
+        self._rows += n
+
+    def _update_pressure(self, chunk: np.ndarray) -> None:
+        joined, offset = self._pressure.extend(chunk)
+        median = _rolling_median(joined, PRESSURE_WINDOW)[offset:]
+        deviation = np.abs(chunk - median)
+        joined, offset = self._deviation.extend(deviation)
+        mad = _rolling_median(joined, PRESSURE_WINDOW)[offset:]
+        scale = np.maximum(_MAD_TO_SIGMA * mad, _PRESSURE_REL_FLOOR * np.abs(median))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z = np.where(scale > 0, deviation / scale, np.nan)
+        self._track('pressure_excursion', 'Capman').add(
+            self._rows, _severity(z, PRESSURE_Z), z
+        )
+
+    def _update_arcs(self, chunk: np.ndarray) -> None:
+        previous = chunk[:1] if self._last_count is None else [self._last_count]
+        diffs = np.diff(np.concatenate((previous, chunk)))
+        # Counter resets (and NaN gaps) count as no new events
+        diffs = np.clip(np.nan_to_num(diffs, nan=0.0), 0, None)
+        if len(chunk):
+            self._last_count = chunk[-1]
+        joined, offset = self._arc_diffs.extend(diffs)
+        burst = np.cumsum(joined)
+        lagged = np.concatenate((np.zeros(ARC_WINDOW), burst))[: len(burst)]
+        events = (burst - lagged)[offset:]
+        self._track('arc_burst', 'PS4').add(
+            self._rows, _severity(events, ARC_BURST), events
+        )
+
+    def finish(self) -> list[Anomaly]:
+        """All flagged intervals, ordered by start row."""
+        anomalies = [a for t in self._intervals.values() for a in t.finish()]
+        return sorted(anomalies, key=lambda a: (a.start, a.kind, a.channel))
+
+    def state(self) -> dict[str, np.ndarray]:
+        """The detector between two chunks as plain arrays (no pickles)."""
+        intervals = [
+            (a, a is track.open)
+            for track in self._intervals.values()
+            for a in [*track.closed, *([track.open] if track.open else [])]
+        ]
+        return {
+            'rows': np.array(self._rows, dtype=np.int64),
+            'pressure': self._pressure.rows,
+            'deviation': self._deviation.rows,
+            'arc_diffs': self._arc_diffs.rows,
+            'last_count': np.array(
+                np.nan if self._last_count is None else self._last_count,
+                dtype=np.float64,
+            ),
+            'kind': np.array([a.kind for a, _ in intervals], dtype=str),
+            'channel': np.array([a.channel for a, _ in intervals], dtype=str),
+            'severity': np.array([a.severity for a, _ in intervals], dtype=str),
+            'start': np.array([a.start for a, _ in intervals], dtype=np.int64),
+            'stop': np.array([a.stop for a, _ in intervals], dtype=np.int64),
+            'peak': np.array([a.peak for a, _ in intervals], dtype=np.float64),
+            'open': np.array([is_open for _, is_open in intervals], dtype=bool),
+        }
+
+    @classmethod
+    def from_state(cls, state) -> 'AnomalyDetector':
+        """The detector saved by :meth:`state` (any mapping of its arrays)."""
+        detector = cls()
+        detector._rows = int(state['rows'])
+        detector._pressure.rows = np.asarray(state['pressure'], dtype=np.float64)
+        detector._deviation.rows = np.asarray(state['deviation'], dtype=np.float64)
+        detector._arc_diffs.rows = np.asarray(state['arc_diffs'], dtype=np.float64)
+        # A NaN last count adds no events, just like no last count
+        last_count = float(state['last_count'])
+        detector._last_count = None if np.isnan(last_count) else last_count
+        for kind, channel, severity, start, stop, peak, is_open in zip(
+            state['kind'],
+            state['channel'],
+            state['severity'],
+            state['start'],
+            state['stop'],
+            state['peak'],
+            state['open'],
+        ):
+            track = detector._track(str(kind), str(channel))
+            anomaly = Anomaly(
+                str(kind),
+                str(channel),
+                str(severity),
+                int(start),
+                int(stop),
+                float(peak),
+            )
+            if is_open:
+                track.open = anomaly
+            else:
+                track.closed.append(anomaly)
+        return detector
+
+
+def detect_anomalies(n: int, pressure=None, arc_count=None, rf_power=()):
+    """Run :class:`AnomalyDetector` over a complete run of *n* rows."""
+    detector = AnomalyDetector()
+    detector.update(n, pressure=pressure, arc_count=arc_count, rf_power=rf_power)
+    return detector.finish()
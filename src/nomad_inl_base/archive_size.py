@@ -0,0 +1,211 @@
+"""
+Byte contribution of quantities and figures to an archive.
+
+Entries holding long time series or many figures (Testo histories, SEM
+galleries, sputtering logs) can exceed NOMAD's archive size limits.
+:func:`archive_size` breaks an archive down into the bytes each quantity
+path (summed over repeated sub-sections, e.g. ``data.sources.thickness``)
+and each figure (``data.figures[Pressure]``) contributes to its JSON and
+YAML serialization, and flags everything over a budget::
+
+    from nomad_inl_base.archive_size import archive_size
+
+    report = archive_size(archive, budget=1_000_000)
+    assert not report.over_budget, report.format()
+
+The same report is available for archive files on the command line::
+
+    python -m nomad_inl_base.archive_size run.archive.json --budget 1MB
+
+which exits with status 1 if anything is over budget. Byte counts are those
+of each value serialized on its own, so keys and indentation are only
+included in the totals.
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+
+_UNITS = {'': 1, 'b': 1, 'kb': 1000, 'mb': 1000**2, 'gb': 1000**3}
+
+
+@dataclass
+class SizeEntry:
+    path: str
+    json_bytes: int
+    yaml_bytes: int | None = None
+
+    @property
+    def bytes(self) -> int:
+        """Size in the larger of the measured serializations."""
+        return max(self.json_bytes, self.yaml_bytes or 0)
+
+
+@dataclass
+class SizeReport:
+    json_bytes: int
+    yaml_bytes: int | None
+    entries: list[SizeEntry]
+    budget: int | None = None
+    over_budget: list[SizeEntry] = field(default_factory=list)
+
+    def format(self, top: int | None = 20) -> str:
+        """Human-readable table of the *top* largest entries."""
+        yaml_total = '-' if self.yaml_bytes is None else _human(self.yaml_bytes)
+        lines = [f'total: {_human(self.json_bytes)} JSON, {yaml_total} YAML']
+        over = {id(entry) for entry in self.over_budget}
+        for entry in self.entries[:top]:
+            yaml_bytes = '-' if entry.yaml_bytes is None else _human(entry.yaml_bytes)
+            flag = '  OVER BUDGET' if id(entry) in over else ''
+            lines.append(
+                f'{_human(entry.json_bytes):>10} {yaml_bytes:>10}  {entry.path}{flag}'
+            )
+        return '\n'.join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            'json_bytes': self.json_bytes,
+            'yaml_bytes': self.yaml_bytes,
+            'budget': self.budget,
+            'entries': [vars(entry) for entry in self.entries],
+            'over_budget': [entry.path for entry in self.over_budget],
+        }
+
+
+def _human(size: int) -> str:
+    for unit in ('B', 'kB', 'MB'):
+        if size < 1000:
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1000
+    return f'{size:.1f} GB'
+
+
+def parse_size(value) -> int:
+    """Bytes of a size given as a number or a string like ``'500kB'``."""
+    if isinstance(value, int | float):
+        return int(value)
+    match = re.fullmatch(r'\s*([\d.]+)\s*([kmg]?b?)\s*', str(value), re.IGNORECASE)
+    if not match:
+        raise ValueError(f'Invalid size {value!r}.')
+    number, unit = match.groups()
+    return int(float(number) * _UNITS[unit.lower()])
+
+
+def _json_size(value) -> int:
+    return len(json.dumps(value).encode())
+
+
+def _yaml_size(value) -> int:
+    import yaml
+
+    from nomad_inl_base.utils import _SafeFloatDumper
+
+    return len(yaml.dump(value, Dumper=_SafeFloatDumper).encode())
+
+
+def _figure_label(figure, index: int) -> str:
+    label = figure.get('label') if isinstance(figure, dict) else None
+    return str(label) if label else str(index)
+
+
+def _leaves(value, path: str):
+    """``(path, value)`` of every quantity and figure below *value*."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _leaves(item, f'{path}.{key}' if path else key)
+    elif value and isinstance(value, list) and isinstance(value[0], dict):
+        if path.rsplit('.', 1)[-1] == 'figures':
+            for index, figure in enumerate(value):
+                yield f'{path}[{_figure_label(figure, index)}]', figure
+        else:
+            for item in value:
+                yield from _leaves(item, path)
+    else:
+        yield path, value
+
+
+def _as_dict(archive) -> dict:
+    if isinstance(archive, dict):
+        return archive
+    if isinstance(archive, str):
+        return load_archive_file(archive)
+    return archive.m_to_dict()
+
+
+def load_archive_file(path: str) -> dict:
+    """The archive dict stored in a ``.json`` or ``.yaml`` archive file."""
+    with open(path, encoding='utf-8') as file:
+        if path.endswith(('.yaml', '.yml')):
+            import yaml
+
+            return yaml.safe_load(file)
+        return json.load(file)
+
+
+def archive_size(
+    archive, budget: int | str | None = None, *, yaml: bool = True
+) -> SizeReport:
+    """
+    Bytes contributed by every quantity path and figure of *archive* (an
+    ``EntryArchive`` or any section, its dict, or the path of an archive
+    file), largest first. Entries larger than *budget* in either
+    serialization are listed in ``over_budget``. Measuring the YAML size of
+    large arrays is slow; pass ``yaml=False`` to skip it.
+    """
+    data = _as_dict(archive)
+    sizes: dict[str, SizeEntry] = {}
+    for path, value in _leaves(data, ''):
+        entry = sizes.setdefault(path, SizeEntry(path, 0, 0 if yaml else None))
+        entry.json_bytes += _json_size(value)
+        if yaml:
+            entry.yaml_bytes += _yaml_size(value)
+    entries = sorted(sizes.values(), key=lambda entry: entry.bytes, reverse=True)
+    budget = None if budget is None else parse_size(budget)
+    return SizeReport(
+        json_bytes=_json_size(data),
+        yaml_bytes=_yaml_size(data) if yaml else None,
+        entries=entries,
+        budget=budget,
+        over_budget=[]
+        if budget is None
+        else [entry for entry in entries if entry.bytes > budget],
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m nomad_inl_base.archive_size',
+        description='Report the bytes contributed by each quantity and figure '
+        'of NOMAD archive files (.json or .yaml).',
+    )
+    parser.add_argument('files', nargs='+', help='Archive files to analyze.')
+    parser.add_argument(
+        '--budget', help='Flag quantities and figures above this size (e.g. 1MB).'
+    )
+    parser.add_argument(
+        '--top', type=int, default=20, help='Number of entries to list per file.'
+    )
+    parser.add_argument(
+        '--no-yaml', action='store_true', help='Only measure the JSON serialization.'
+    )
+    parser.add_argument(
+        '--json', action='store_true', help='Print the full reports as JSON.'
+    )
+    args = parser.parse_args(argv)
+
+    reports = {
+        path: archive_size(path, args.budget, yaml=not args.no_yaml)
+        for path in args.files
+    }
+    if args.json:
+        print(json.dumps({path: r.to_dict() for path, r in reports.items()}, indent=2))
+    else:
+        for path, report in reports.items():
+            print(f'{path}\n{report.format(args.top)}\n')
+    return 1 if any(report.over_budget for report in reports.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,345 @@
+"""
+An in-process stand-in for a NOMAD server upload.
+
+Much of what the schemas do only happens outside a ``ClientContext``:
+writing child archives with :func:`~nomad_inl_base.utils.create_archive` and
+processing them, matching samples by name through ``nomad.search``, merging
+the history of Testo loggers sharing a lab id and appending deposition
+records to sputtering targets. :class:`LocalUpload` runs these paths without
+a server: it processes the raw files of a local directory the way an upload
+is processed, with a context that reads and writes that directory, keeps the
+processed archives in memory and answers searches from an in-memory index of
+them::
+
+    upload = LocalUpload(tmp_path)
+    substrate = upload.add('tests/data/schemas/substrate.archive.yaml')
+    upload.process(substrate)
+    archive = upload.process(upload.add('PC03_All Signals_S1 ….csv'))
+    upload.search(query={'entry_type': 'INLThinFilmStack'}).data
+
+Files written during processing are processed when the writer calls
+``process_updated_raw_file``, like in a local (synchronous) server
+processing run. All files processed in one :meth:`LocalUpload.process` call
+share one context, as all entries of one processing run do on a server.
+
+The search shim implements the part of ``nomad.search.search`` used here:
+equality (or membership for lists) on dotted metadata keys, ``page_size`` /
+``page_after_value`` pagination and ``required.include``. ``owner`` and
+``user_id`` are ignored, everything in the upload is visible.
+"""
+
+import contextlib
+import dataclasses
+import os
+import shutil
+import sys
+import types
+from datetime import UTC, datetime
+
+from nomad.datamodel.context import Context
+
+from nomad_inl_base.utils import get_entry_id
+
+
+@dataclasses.dataclass
+class MetadataPagination:
+    page_size: int = 10
+    page_after_value: str | None = None
+
+
+@dataclasses.dataclass
+class MetadataRequired:
+    include: list[str] | None = None
+
+
+@dataclasses.dataclass
+class PaginationResponse:
+    total: int
+    page_size: int
+    next_page_after_value: str | None = None
+
+
+@dataclasses.dataclass
+class MetadataResponse:
+    data: list[dict]
+    pagination: PaginationResponse
+
+
+def _values(hit: dict, key: str) -> list:
+    """The values at the dotted *key* of a search hit, lists flattened."""
+    values = [hit]
+    for part in key.split('.'):
+        found = []
+        for value in values:
+            if isinstance(value, dict) and part in value:
+                item = value[part]
+                found.extend(item if isinstance(item, list) else [item])
+        values = found
+    return values
+
+
+def _matches(hit: dict, key: str, expected) -> bool:
+    expected = expected if isinstance(expected, list | tuple) else [expected]
+    return any(value in expected for value in _values(hit, key))
+
+
+def _project(hit: dict, include: list[str]) -> dict:
+    """*hit* reduced to the dotted keys in *include*."""
+    projected: dict = {}
+    for key in include:
+        source, target = hit, projected
+        *parents, last = key.split('.')
+        for part in parents:
+            source = source.get(part) if isinstance(source, dict) else None
+            target = target.setdefault(part, {})
+        if isinstance(source, dict) and last in source:
+            target[last] = source[last]
+    return projected
+
+
+class LocalServerContext(Context):
+    """The processing context of a :class:`LocalUpload`."""
+
+    def __init__(self, upload: 'LocalUpload'):
+        super().__init__()
+        self.upload = upload
+
+    @property
+    def upload_id(self):
+        return self.upload.upload_id
+
+    def raw_path(self) -> str:
+        return self.upload.directory
+
+    def raw_file(self, path: str, *args, **kwargs):
+        return self.upload.raw_file(path, *args, **kwargs)
+
+    def raw_path_exists(self, path: str) -> bool:
+        return self.upload.raw_path_exists(path)
+
+    def process_updated_raw_file(self, path, allow_modify=False):
+        self.upload.process_updated_raw_file(path, allow_modify)
+
+    def load_archive(self, entry_id: str, upload_id: str, installation_url: str):
+        from nomad.datamodel.datamodel import EntryArchive
+        from nomad.metainfo import MetainfoReferenceError
+
+        if upload_id not in (None, self.upload_id):
+            raise MetainfoReferenceError('Referencing another Upload is not allowed.')
+        if entry_id in self.upload.archives:
+            return EntryArchive.m_from_dict(
+                self.upload.archives[entry_id], m_context=self
+            )
+        if entry_id in self.upload.mainfiles:
+            # Still being processed in this run
+            return self.load_raw_file(
+                self.upload.mainfiles[entry_id], self.upload_id, installation_url
+            )
+        raise MetainfoReferenceError(f'Could not load {entry_id}.')
+
+    def load_raw_file(
+        self, path: str, upload_id: str, installation_url: str, url: str | None = None
+    ):
+        from nomad.datamodel.datamodel import EntryArchive, EntryMetadata
+        from nomad.metainfo import MetainfoReferenceError
+        from nomad.parsing.parser import ArchiveParser
+
+        try:
+            archive = EntryArchive(
+                m_context=self,
+                metadata=EntryMetadata(
+                    upload_id=self.upload_id,
+                    mainfile=path,
+                    entry_id=get_entry_id(self.upload_id, path),
+                ),
+            )
+            parser = ArchiveParser()
+            with self.raw_file(path, 'rt') as file:
+                parser.parse_file(path, file, archive)
+            if url:
+                self.cache_archive(url, archive)
+            return archive
+        except Exception:
+            raise MetainfoReferenceError(f'Could not load {path}.')
+
+
+class LocalUpload:
+    """
+    The raw files in *directory* processed as one NOMAD upload.
+
+    ``archives`` holds the serialized archive of every processed entry by
+    entry id, ``processed`` the mainfiles in processing order and ``failed``
+    the error of every file whose processing, triggered through
+    ``process_updated_raw_file``, failed.
+    """
+
+    def __init__(
+        self,
+        directory,
+        upload_id: str = 'local_upload',
+        *,
+        user_id: str = 'local_user',
+        upload_create_time: datetime | None = None,
+        logger=None,
+    ):
+        from nomad import utils
+
+        self.directory = os.fspath(directory)
+        self.upload_id = upload_id
+        self.user_id = user_id
+        self.upload_create_time = upload_create_time or datetime.now(UTC)
+        self.logger = logger or utils.get_logger(__name__)
+        self.archives: dict[str, dict] = {}
+        self.mainfiles: dict[str, str] = {}
+        self.processed: list[str] = []
+        self.failed: dict[str, Exception] = {}
+        self._index: dict[str, dict] = {}
+        self._context: LocalServerContext | None = None
+
+    def os_path(self, path: str) -> str:
+        return os.path.join(self.directory, path)
+
+    def raw_path_exists(self, path: str) -> bool:
+        return os.path.exists(self.os_path(path))
+
+    def raw_file(self, path: str, mode='r', *args, **kwargs):
+        if any(flag in mode for flag in 'wax'):
+            os.makedirs(os.path.dirname(self.os_path(path)), exist_ok=True)
+        return open(self.os_path(path), mode, *args, **kwargs)
+
+    def add(self, source, path: str | None = None) -> str:
+        """Copy the file *source* into the upload (as *path*, by default its
+        file name) and return its path in the upload."""
+        path = path or os.path.basename(source)
+        os.makedirs(os.path.dirname(self.os_path(path)), exist_ok=True)
+        shutil.copyfile(source, self.os_path(path))
+        return path
+
+    @contextlib.contextmanager
+    def _run(self):
+        """The context of the current processing run, with ``nomad.search``
+        answered by :meth:`search` while it lasts."""
+        if self._context is not None:
+            yield self._context
+            return
+        shim = types.ModuleType('nomad.search')
+        shim.search = self.search
+        shim.MetadataPagination = MetadataPagination
+        shim.MetadataRequired = MetadataRequired
+        previous = sys.modules.get('nomad.search')
+        sys.modules['nomad.search'] = shim
+        self._context = LocalServerContext(self)
+        try:
+            yield self._context
+        finally:
+            self._context = None
+            if previous is None:
+                sys.modules.pop('nomad.search', None)
+            else:
+                sys.modules['nomad.search'] = previous
+
+    def process(self, path: str):
+        """
+        Parse and normalize the raw file *path* of the upload (reprocessing
+        it if it was processed before) and return its archive, or ``None`` if
+        no parser matches it. Errors are raised.
+        """
+        with self._run() as context:
+            return self._process(context, path)
+
+    def process_updated_raw_file(self, path: str, allow_modify: bool = False):
+        """Process a file added or modified during processing. Unless
+        *allow_modify* is set, it must not be an entry yet. Processing errors
+        are logged and kept in ``failed``, as on a server."""
+        if not os.path.isfile(self.os_path(path)):
+            raise ValueError('Provided path does not denote a file')
+        if not allow_modify and get_entry_id(self.upload_id, path) in self.mainfiles:
+            raise ValueError(f'The entry for {path} already exists')
+        with self._run() as context:
+            try:
+                self._process(context, path)
+            except Exception as exc:
+                self.failed[path] = exc
+                self.logger.error('processing failed', mainfile=path, exc_info=exc)
+
+    def _process(self, context: LocalServerContext, path: str):
+        from nomad.client import normalize_all
+        from nomad.datamodel import User
+        from nomad.datamodel.datamodel import EntryArchive, EntryMetadata
+        from nomad.parsing.parsers import match_parser
+
+        os_path = self.os_path(path)
+        parser, _ = match_parser(os_path, strict=True)
+        if parser is None:
+            return None
+        entry_id = get_entry_id(self.upload_id, path)
+        self.mainfiles[entry_id] = path
+        self.failed.pop(path, None)
+        archive = EntryArchive(
+            m_context=context,
+            metadata=EntryMetadata(
+                upload_id=self.upload_id,
+                entry_id=entry_id,
+                mainfile=path,
+                upload_create_time=self.upload_create_time,
+                main_author=User(user_id=self.user_id),
+            ),
+        )
+        logger = self.logger.bind(mainfile=path, parser=parser.name)
+        parser.parse(os_path, archive, logger=logger)
+        if archive.metadata.domain is None:
+            archive.metadata.domain = parser.domain
+        normalize_all(archive, logger=logger)
+
+        stored = archive.m_to_dict()
+        # Loading a user id asks the user management (keycloak) for the user
+        stored['metadata'].pop('main_author', None)
+        self.archives[entry_id] = stored
+        hit = dict(stored['metadata'])
+        if archive.results is not None:
+            hit['results'] = archive.results.m_to_dict()
+        self._index[entry_id] = hit
+        self.processed.append(path)
+        return archive
+
+    def search(
+        self,
+        owner: str | None = None,
+        query: dict | None = None,
+        pagination: MetadataPagination | None = None,
+        required: MetadataRequired | None = None,
+        user_id: str | None = None,
+        **kwargs,
+    ) -> MetadataResponse:
+        """The processed entries matching *query*, by entry id, like
+        ``nomad.search.search``."""
+        pagination = pagination or MetadataPagination()
+        hits = [
+            hit
+            for _, hit in sorted(self._index.items())
+            if all(_matches(hit, key, value) for key, value in (query or {}).items())
+        ]
+        start = 0
+        if pagination.page_after_value is not None:
+            start = next(
+                (
+                    position + 1
+                    for position, hit in enumerate(hits)
+                    if hit['entry_id'] == pagination.page_after_value
+                ),
+                len(hits),
+            )
+        page = hits[start : start + pagination.page_size]
+        if required is not None and required.include:
+            page = [_project(hit, required.include) for hit in page]
+        next_page_after_value = None
+        if start + pagination.page_size < len(hits):
+            next_page_after_value = hits[start + pagination.page_size - 1]['entry_id']
+        return MetadataResponse(
+            data=page,
+            pagination=PaginationResponse(
+                total=len(hits),
+                page_size=pagination.page_size,
+                next_page_after_value=next_page_after_value,
+            ),
+        )
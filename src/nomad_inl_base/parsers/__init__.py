@@ -1,11 +1,10 @@
 from nomad.config.models.plugins import ParserEntryPoint
-
-# from pydantic import Field
+from pydantic import Field
 
 
 class CVConfigurationParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import CVParser
+        from nomad_inl_base.parsers.electrochemistry import CVParser
 
         return CVParser(**self.dict())
 
@@ -20,7 +19,7 @@ CV_parser_entry_point = CVConfigurationParserEntryPoint(
 
 class EDConfigurationParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import EDParser
+        from nomad_inl_base.parsers.electrochemistry import EDParser
 
         return EDParser(**self.dict())
 
@@ -34,8 +33,15 @@ ED_parser_entry_point = EDConfigurationParserEntryPoint(
 
 
 class PC03ParserEntryPoint(ParserEntryPoint):
+    incremental: bool = Field(
+        False,
+        description='Cache the parsed rows of the CSV log in the upload so that '
+        're-syncing a log that is still being written only parses the appended '
+        'rows.',
+    )
+
     def load(self):
-        from nomad_inl_base.parsers.parser import PC03CathodeChamberParser
+        from nomad_inl_base.parsers.chambers import PC03CathodeChamberParser
 
         return PC03CathodeChamberParser(**self.dict())
 
@@ -49,8 +55,15 @@ pc03_parser_entry_point = PC03ParserEntryPoint(
 
 
 class PC04ParserEntryPoint(ParserEntryPoint):
+    incremental: bool = Field(
+        False,
+        description='Cache the parsed rows of the CSV log in the upload so that '
+        're-syncing a log that is still being written only parses the appended '
+        'rows.',
+    )
+
     def load(self):
-        from nomad_inl_base.parsers.parser import PC04ChamberParser
+        from nomad_inl_base.parsers.chambers import PC04ChamberParser
 
         return PC04ChamberParser(**self.dict())
 
@@ -65,7 +78,7 @@ pc04_parser_entry_point = PC04ParserEntryPoint(
 
 class FourPointProbeParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import FourPointProbeParser
+        from nomad_inl_base.parsers.four_point_probe import FourPointProbeParser
 
         return FourPointProbeParser(**self.dict())
 
@@ -80,7 +93,7 @@ four_point_probe_parser_entry_point = FourPointProbeParserEntryPoint(
 
 class KLATencorProfilerParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import KLATencorProfilerParser
+        from nomad_inl_base.parsers.kla_profiler import KLATencorProfilerParser
 
         return KLATencorProfilerParser(**self.dict())
 
@@ -95,7 +108,7 @@ kla_tencor_profiler_parser_entry_point = KLATencorProfilerParserEntryPoint(
 
 class EQEParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import EQEParser
+        from nomad_inl_base.parsers.eqe import EQEParser
 
         return EQEParser(**self.dict())
 
@@ -110,7 +123,7 @@ eqe_parser_entry_point = EQEParserEntryPoint(
 
 class SolarCellIVParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import SolarCellIVParser
+        from nomad_inl_base.parsers.solar_iv import SolarCellIVParser
 
         return SolarCellIVParser(**self.dict())
 
@@ -125,7 +138,7 @@ solar_cell_iv_parser_entry_point = SolarCellIVParserEntryPoint(
 
 class GDOESParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import GDOESParser
+        from nomad_inl_base.parsers.gdoes import GDOESParser
 
         return GDOESParser(**self.dict())
 
@@ -140,7 +153,7 @@ gdoes_parser_entry_point = GDOESParserEntryPoint(
 
 class SEMZipParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import SEMZipParser
+        from nomad_inl_base.parsers.sem import SEMZipParser
 
         return SEMZipParser(**self.dict())
 
@@ -160,7 +173,7 @@ sem_zip_parser_entry_point = SEMZipParserEntryPoint(
 
 class EMSAEDXParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import EMSAEDXParser
+        from nomad_inl_base.parsers.edx import EMSAEDXParser
 
         return EMSAEDXParser(**self.dict())
 
@@ -176,7 +189,7 @@ edx_emsa_parser_entry_point = EMSAEDXParserEntryPoint(
 
 class BrukerAFMParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import BrukerAFMParser
+        from nomad_inl_base.parsers.afm import BrukerAFMParser
 
         return BrukerAFMParser(**self.dict())
 
@@ -195,7 +208,7 @@ bruker_afm_parser_entry_point = BrukerAFMParserEntryPoint(
 
 class MPRParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import MPRParser
+        from nomad_inl_base.parsers.biologic import MPRParser
 
         return MPRParser(**self.dict())
 
@@ -213,7 +226,7 @@ mpr_parser_entry_point = MPRParserEntryPoint(
 
 class METEORParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import METEORParser
+        from nomad_inl_base.parsers.meteor import METEORParser
 
         return METEORParser(**self.dict())
 
@@ -228,7 +241,7 @@ meteor_parser_entry_point = METEORParserEntryPoint(
 
 class TestoVI2ParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import TestoVI2Parser
+        from nomad_inl_base.parsers.testo import TestoVI2Parser
 
         return TestoVI2Parser(**self.dict())
 
@@ -246,7 +259,7 @@ testo_vi2_parser_entry_point = TestoVI2ParserEntryPoint(
 
 class INLUVVisTransmissionParserEntryPoint(ParserEntryPoint):
     def load(self):
-        from nomad_inl_base.parsers.parser import INLUVVisTransmissionParser
+        from nomad_inl_base.parsers.uvvis import INLUVVisTransmissionParser
 
         return INLUVVisTransmissionParser(**self.dict())
 
@@ -0,0 +1,989 @@
+"""Parsers for the CSV logs of the PC03/PC04 battery sputtering chambers."""
+
+import hashlib
+import io
+import json
+import os
+import re
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from nomad.datamodel.datamodel import EntryArchive
+from nomad.parsing.parser import MatchingParser
+
+from nomad_inl_base.profiling import instrumented, parse_phase, record_parse
+from nomad_inl_base.utils import plugin_option
+
+if TYPE_CHECKING:
+    from nomad_inl_base.anomalies import AnomalyDetector
+
+
+def _extract_sample_name(filename: str) -> 'str | None':
+    """
+    Extract the sample name embedded in a battery chamber log filename.
+
+    Expected convention::
+
+        PC03_All Signals_[Sample Name] Date.csv
+        PC04_All Signals_[Sample Name] Date.csv
+
+    e.g. ``PC04_All Signals_LNbO_004 2026.07.16-09.32.33.csv`` → ``LNbO_004``.
+
+    Requires the literal ``All Signals_`` marker followed by the sample name,
+    a space, and a ``YYYY.MM.DD-HH.MM.SS`` timestamp. Returns ``None`` (never
+    raises) if the filename doesn't follow this convention, e.g. the older
+    ``PC03_sample.CSV`` fixtures without an embedded sample name.
+    """
+    basename = filename.rsplit('/', maxsplit=1)[-1]
+    match = re.search(
+        r'All Signals_(?P<sample>.+?)\s+\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}',
+        basename,
+    )
+    if not match:
+        return None
+    sample_name = match.group('sample').strip()
+    return sample_name or None
+
+
+# Cache of the rows parsed so far from a growing chamber log, see
+# _BaseSputteringChamberParser._read_rows.
+_TAIL_STATE_SUFFIX = '.tail.npz'
+# Bytes of data rows at the start of the log whose digest identifies it
+_HEAD_BYTES = 65536
+
+# Columns _parse_deposition and _parse_annealing store as time series. The
+# logs have ~460 columns; the others are never read.
+_SERIES_COLUMNS = frozenset(
+    [
+        'Time Stamp',
+        'Process Phase',
+        'Process Time',
+        'PC Capman Pressure',
+        'PC Capman Pressure Setpoint',
+        'PC Ion Gauge Pressure',
+        'PC Wide Range Gauge',
+        'PC Roughing Pressure',
+        'PC Substrate Shutter Open',
+        'Substrate Heater Temperature',
+        'Substrate Heater Temperature 2',
+        'Substrate Heater Temperature Setpoint',
+        'Substrate Heater Current',
+        'Substrate Rotation_Speed',
+        'Substrate Bias Active',
+        'Rigel DC Voltage',
+        'Rigel DC Current',
+        'Rigel DC Power',
+        *(f'TC{i} Temperature' for i in range(1, 7)),
+        *(f'PC MFC {i} {field}' for i in (1, 2, 3) for field in ('Flow', 'Setpoint')),
+        *(
+            f'PC Source {i} {field}'
+            for i in (1, 2, 3, 4)
+            for field in (
+                'Active',
+                'Shutter Open',
+                'Rate',
+                'Thickness',
+                'Accumulate Thickness',
+            )
+        ),
+        *(
+            f'Power Supply {i} {field}'
+            for i in (1, 3, 5)
+            for field in (
+                'Fwd Power',
+                'Rfl Power',
+                'DC Bias',
+                'Load Cap Position',
+                'Tune Cap Position',
+                'Output Setpoint',
+            )
+        ),
+        *(
+            f'Power Supply 4 {field}'
+            for field in (
+                'Current',
+                'Voltage',
+                'Power',
+                'Pulse Frequency',
+                'Output Setpoint',
+                'Current Setpoint',
+                'Voltage Setpoint',
+                'DC Count',
+                'Spark Count',
+            )
+        ),
+    ]
+)
+# Columns only read as one value per log, by reduction: the first or last
+# non-empty value, the last number, or whether any row is set
+_REDUCED_COLUMNS = {
+    'first': frozenset(
+        [
+            *(f'PC MFC {i} Gas' for i in (1, 2, 3)),
+            *(
+                f'PC Source {i} {field}'
+                for i in (1, 2, 3, 4)
+                for field in ('Material', 'Loaded Target')
+            ),
+        ]
+    ),
+    'last': frozenset(['Substrate Type']),
+    'last_number': frozenset(
+        f'PC Source {i} Final Thickness Setpoint' for i in (1, 2, 3, 4)
+    ),
+    'any': frozenset(
+        [
+            'PC Source 1 Switch-RF-PWS1',
+            'PC Source 1 Switch-PDC-PWS4',
+            'PC Source 3 Switch-RF-PWS3',
+            'PC Source 3 Switch-PDC-PWS4',
+            'PC Source 4 Switch-RF-PWS3',
+            'PC Source 4 Switch-PDC-PWS4',
+        ]
+    ),
+}
+_READ_COLUMNS = _SERIES_COLUMNS.union(*_REDUCED_COLUMNS.values())
+
+
+def _reduce(reduced: dict, rows: pd.DataFrame) -> pd.DataFrame:
+    """Fold the reduced columns of *rows* into *reduced* (column name to
+    value, JSON-serializable) and return the series columns of *rows*."""
+    for how, names in _REDUCED_COLUMNS.items():
+        for name in names.intersection(rows.columns):
+            if how == 'any':
+                values = pd.to_numeric(rows[name], errors='coerce').fillna(0)
+                reduced[name] = reduced.get(name, False) or bool(values.any())
+                continue
+            if how == 'last_number':
+                values = pd.to_numeric(rows[name], errors='coerce').dropna()
+            else:
+                values = rows[name].dropna()
+            if len(values) == 0 or (how == 'first' and name in reduced):
+                continue
+            if how == 'last_number':
+                reduced[name] = float(values.iloc[-1])
+            else:
+                reduced[name] = str(values.iloc[0 if how == 'first' else -1])
+    return rows[[name for name in rows.columns if name in _SERIES_COLUMNS]]
+
+
+def _active_rows(rows: pd.DataFrame) -> np.ndarray:
+    """Rows where any source is active: those the deposition normalizer keeps
+    (see ``BatteryChamberSputteringDeposition._trim_inactive``)."""
+    active = np.zeros(len(rows), dtype=bool)
+    for i in (1, 2, 3, 4):
+        name = f'PC Source {i} Active'
+        if name in rows.columns:
+            active |= (
+                pd.to_numeric(rows[name], errors='coerce')
+                .fillna(0)
+                .astype(bool)
+                .to_numpy()
+            )
+    return active
+
+
+def _feed_detector(detector, rows: pd.DataFrame) -> None:
+    """Pass the active rows of the chunk *rows* to the
+    :class:`~nomad_inl_base.anomalies.AnomalyDetector` *detector*, with the
+    channels and units the deposition normalizer uses."""
+    from nomad_inl_base.schema_packages.batteries import _TORR_TO_PA
+
+    active = _active_rows(rows)
+    if not active.any():
+        return
+
+    def kept(name):
+        if name not in rows.columns:
+            return None
+        values = pd.to_numeric(rows[name], errors='coerce')
+        return values.to_numpy(dtype=np.float64)[active]
+
+    pressure = kept('PC Capman Pressure')
+    if pressure is not None:
+        pressure = pressure * _TORR_TO_PA
+    # Counters as the parser stores them: missing values count as 0
+    counts = [
+        np.nan_to_num(count).astype(np.int64)
+        for count in (
+            kept('Power Supply 4 DC Count'),
+            kept('Power Supply 4 Spark Count'),
+        )
+        if count is not None
+    ]
+    rf_power = [
+        (
+            f'PS{i}',
+            kept(f'Power Supply {i} Fwd Power'),
+            kept(f'Power Supply {i} Rfl Power'),
+        )
+        for i in (1, 3, 5)
+    ]
+    detector.update(
+        int(active.sum()),
+        pressure,
+        np.sum(counts, axis=0) if counts else None,
+        rf_power,
+    )
+
+
+def _head_digest(head: bytes) -> str:
+    return hashlib.sha256(head).hexdigest()
+
+
+def _save_tail_state(
+    archive: EntryArchive,
+    filename: str,
+    log: str,
+    header: bytes,
+    head: bytes,
+    offset: int,
+    last_line: bytes,
+    df: pd.DataFrame,
+    reduced: dict,
+    detector=None,
+) -> None:
+    """Write *df*, the *reduced* values, the anomaly *detector* (if any) and
+    the consumed byte *offset* of the upload file *log* to the upload file
+    *filename*. *head* holds the first data bytes of the log, of which those
+    consumed are stored as a digest to recognise the log.
+
+    Only plain arrays are stored (no pickles): numeric columns as they are,
+    other columns as strings plus a missing-value mask, *reduced* as JSON
+    and the detector as its ``state()`` arrays.
+    """
+    arrays = {
+        'log': np.array(log),
+        'head_size': np.array(len(head), dtype=np.int64),
+        'head_digest': np.array(_head_digest(head)),
+        'header': np.array(header.decode('utf-8', errors='replace')),
+        'offset': np.array(offset, dtype=np.int64),
+        'last_line': np.frombuffer(last_line, dtype=np.uint8),
+        'columns': np.array([str(c) for c in df.columns]),
+        'reduced': np.array(json.dumps(reduced)),
+    }
+    for i, name in enumerate(df.columns):
+        values = df[name]
+        if values.dtype.kind in 'biuf':
+            arrays[f'c{i}'] = values.to_numpy()
+        else:
+            missing = values.isna().to_numpy()
+            arrays[f'c{i}'] = np.where(missing, '', values.astype(str)).astype(str)
+            arrays[f'm{i}'] = missing
+    if detector is not None:
+        for name, values in detector.state().items():
+            arrays[f'detector_{name}'] = values
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    with archive.m_context.raw_file(filename, 'wb') as fh:
+        fh.write(buffer.getvalue())
+
+
+def _load_tail_state(
+    archive: EntryArchive, filename: str, log: str, header: bytes, head: bytes, fh
+):
+    """``(rows, reduced, detector, offset, last_line)`` cached in *filename*
+    (``detector`` is ``None`` if none was saved), or ``None`` if there is no
+    cache or it does not match the upload file *log* open as *fh*, whose
+    first data bytes are *head* (another log, header drift, or the file was
+    truncated/rewritten instead of appended to)."""
+    if not archive.m_context.raw_path_exists(filename):
+        return None
+    with archive.m_context.raw_file(filename, 'rb') as state_fh:
+        state = np.load(io.BytesIO(state_fh.read()), allow_pickle=False)
+    if (
+        'log' not in state.files
+        or str(state['log']) != log
+        or str(state['header']) != header.decode('utf-8', errors='replace')
+        or len(head) < int(state['head_size'])
+        or _head_digest(head[: int(state['head_size'])]) != str(state['head_digest'])
+    ):
+        return None
+    offset = int(state['offset'])
+    last_line = state['last_line'].tobytes()
+    fh.seek(max(0, offset - len(last_line)))
+    if fh.read(len(last_line)) != last_line:
+        return None
+    frame = {}
+    for i, name in enumerate(state['columns']):
+        values = state[f'c{i}']
+        if f'm{i}' in state:
+            values = values.astype(object)
+            values[state[f'm{i}']] = np.nan
+        frame[str(name)] = values
+    reduced = json.loads(str(state['reduced']))
+    detector = None
+    if 'detector_rows' in state:
+        from nomad_inl_base.anomalies import AnomalyDetector
+
+        detector = AnomalyDetector.from_state(
+            {
+                name.removeprefix('detector_'): state[name]
+                for name in state.files
+                if name.startswith('detector_')
+            }
+        )
+    return pd.DataFrame(frame), reduced, detector, offset, last_line
+
+
+class _BaseSputteringChamberParser(MatchingParser):
+    """
+    Shared parser for INL Battery Chamber sputtering system CSV log files (PC03, PC04, …).
+
+    Subclasses set ``_ENTRY_CLASS`` to the name of the concrete
+    ``BatteryChamberSputteringDeposition`` subclass (in
+    :mod:`~nomad_inl_base.schema_packages.batteries`) that should be created for
+    their instrument. The schema package is only imported when a log is parsed.
+
+    CSV format (identical across chambers):
+      Line 1: meta-column names  (Recording Name, Date Started, User)
+      Line 2: meta-values        (All Signals, YYYY-M-D HH-MM-SS, OperatorName)
+      Line 3: empty
+      Line 4: data column headers (~460 columns)
+      Lines 5+: data rows at ~1 Hz
+
+    Filename convention (used to auto-link/create a sample entry)::
+
+        PC0X_All Signals_[Sample Name] Date.csv
+
+    e.g. ``PC04_All Signals_LNbO_004 2026.07.16-09.32.33.csv``. If the filename
+    doesn't follow this convention, sample auto-linking is skipped gracefully
+    (a warning is logged, parsing still succeeds).
+    """
+
+    # Subclasses override this with the name of their specific entry class.
+    # Read-only: parser instances are shared between files (and threads).
+    _ENTRY_CLASS = None
+    # Parser entry point whose ``incremental`` option enables tail parsing.
+    _ENTRY_POINT_ID = None
+    # Metadata lines above the column header row
+    _PREAMBLE_LINES = 3
+
+    # Offset used to convert Celsius (from CSV) to Kelvin (stored in schema)
+    _KELVIN_OFFSET = 273.15
+    # Angstrom-to-nm conversion factor (QCM reads in Å)
+    _ANG_TO_NM = 0.1
+
+    def _read_rows(
+        self, mainfile: str, archive: EntryArchive, logger, detect: bool = False
+    ) -> 'tuple[pd.DataFrame, dict, AnomalyDetector | None]':
+        """Read the data rows (below the preamble) of *mainfile*: the series
+        columns, and the other columns the parsers read reduced to one value
+        each (see ``_REDUCED_COLUMNS``). Other columns are skipped.
+
+        With *detect*, each chunk read is also passed to an
+        :class:`~nomad_inl_base.anomalies.AnomalyDetector` (see
+        ``_feed_detector``), returned unfinished; otherwise the detector is
+        ``None``.
+
+        If the parser entry point enables ``incremental``, the rows parsed so
+        far are cached in ``<log>.tail.npz`` next to the log in the upload
+        together with the reductions, the detector and the byte offset
+        consumed, and a re-sync of a log that is still being written only
+        parses the complete lines appended since. The cache records the log's
+        upload path and a digest of its first data rows; a cache of another
+        log, a changed column header or a rewritten file falls back to a full
+        parse.
+        """
+        from nomad_inl_base.anomalies import AnomalyDetector
+
+        incremental = self._ENTRY_POINT_ID and plugin_option(
+            self._ENTRY_POINT_ID, 'incremental', False
+        )
+        if not incremental or archive.m_context is None:
+            reduced = {}
+            rows = pd.read_csv(
+                mainfile,
+                skiprows=self._PREAMBLE_LINES,
+                usecols=lambda name: name in _READ_COLUMNS,
+                low_memory=False,
+            )
+            df = _reduce(reduced, rows)
+            detector = AnomalyDetector() if detect else None
+            if detector is not None:
+                _feed_detector(detector, df)
+            return df, reduced, detector
+
+        log = os.path.relpath(mainfile, archive.m_context.raw_path())
+        state_file = f'{os.path.splitext(log)[0]}{_TAIL_STATE_SUFFIX}'
+        with open(mainfile, 'rb') as fh:
+            for _ in range(self._PREAMBLE_LINES):
+                fh.readline()
+            header = fh.readline()
+            body_start = fh.tell()
+            head = fh.read(_HEAD_BYTES)
+            columns = pd.read_csv(io.BytesIO(header), nrows=0).columns
+            try:
+                cached = _load_tail_state(archive, state_file, log, header, head, fh)
+            except Exception as exc:
+                logger.warning(
+                    f'Could not read parse cache {state_file!r}; parsing the '
+                    'whole log.',
+                    exc_info=exc,
+                )
+                cached = None
+            if cached is not None and detect and cached[2] is None:
+                # Cached without a detector: the rows read so far are lost to it
+                cached = None
+            if cached is None:
+                rows, reduced, offset, last_line = None, {}, body_start, b''
+                detector = AnomalyDetector() if detect else None
+            else:
+                rows, reduced, detector, offset, last_line = cached
+            fh.seek(offset)
+            appended = fh.read()
+
+        # A row the instrument is still writing is left for the next sync
+        complete = appended.rfind(b'\n') + 1
+        if complete == 0 and rows is not None:
+            return rows, reduced, detector
+        new_rows = pd.read_csv(
+            io.BytesIO(appended[:complete]),
+            header=None,
+            names=columns,
+            usecols=lambda name: name in _READ_COLUMNS,
+            index_col=False,
+            low_memory=False,
+        )
+        new_rows = _reduce(reduced, new_rows)
+        if detector is not None:
+            _feed_detector(detector, new_rows)
+        if complete:
+            last_line = appended[: complete - 1].rsplit(b'\n', 1)[-1] + b'\n'
+        df = (
+            new_rows if rows is None else pd.concat([rows, new_rows], ignore_index=True)
+        )
+        try:
+            _save_tail_state(
+                archive,
+                state_file,
+                log,
+                header,
+                head[: offset + complete - body_start],
+                offset + complete,
+                last_line,
+                df,
+                reduced,
+                detector,
+            )
+        except Exception as exc:
+            logger.warning(f'Could not write parse cache {state_file!r}.', exc_info=exc)
+        return df, reduced, detector
+
+    @instrumented
+    def parse(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        self._parse_deposition(mainfile, archive, logger, self._ENTRY_CLASS)
+
+    def _parse_deposition(
+        self, mainfile: str, archive: EntryArchive, logger, entry_class: str
+    ) -> None:
+        """Parse a sputtering log into a new *entry_class* entry.
+
+        The entry class is passed per call rather than read from (or set on)
+        the parser, as one parser instance serves all files of a worker.
+        """
+        from nomad.datamodel.metainfo.basesections import PureSubstanceSection
+
+        from nomad_inl_base.schema_packages import batteries
+        from nomad_inl_base.schema_packages.batteries import (
+            _SCCM_TO_M3S,
+            _TORR_TO_PA,
+            SputteringChamberEnvironment,
+            SputteringDCPowerSupply,
+            SputteringGasFlow,
+            SputteringPressure,
+            SputteringRFPowerSupply,
+            SputteringSource,
+            SputteringVolumetricFlowRate,
+            StepSignal,
+        )
+
+        # --- Read 2-line header (metadata) ---
+        with open(mainfile, encoding='utf-8', errors='replace') as fh:
+            meta_keys = [k.strip() for k in fh.readline().rstrip('\n').split(',')]
+            meta_values = [v.strip() for v in fh.readline().rstrip('\n').split(',')]
+
+        meta = dict(zip(meta_keys, meta_values))
+        recording_name = meta.get('Recording Name', '')
+        operator = meta.get('User', '')
+        date_started_str = meta.get('Date Started', '')
+
+        # Parse start datetime: '2026-3-18 14-15-53'
+        start_datetime = None
+        for fmt in ('%Y-%m-%d %H-%M-%S', '%Y-%m-%d %H:%M:%S'):
+            try:
+                start_datetime = datetime.strptime(date_started_str, fmt)
+                break
+            except ValueError:
+                continue
+
+        # --- Read time-series data (skip 3-line preamble) ---
+        with parse_phase('read'):
+            df, reduced, detector = self._read_rows(
+                mainfile, archive, logger, detect=True
+            )
+        record_parse(rows=len(df))
+
+        # --- Helpers ---
+        def col(name):
+            """Return float64 array for column, or None if absent/all-NaN."""
+            if name not in df.columns:
+                return None
+            with parse_phase('decode'):
+                arr = pd.to_numeric(df[name], errors='coerce')
+                arr = arr.to_numpy(dtype=np.float64)
+            return arr if not np.all(np.isnan(arr)) else None
+
+        def col_bool(name):
+            """Return bool array, treating 1/0 as True/False."""
+            if name not in df.columns:
+                return None
+            return (
+                pd.to_numeric(df[name], errors='coerce')
+                .fillna(0)
+                .astype(bool)
+                .to_numpy()
+            )
+
+        def col_str(name):
+            if name not in df.columns:
+                return None
+            arr = df[name].fillna('').astype(str).to_numpy(dtype=str)
+            return arr if not np.all(arr == '') else None
+
+        def col_temp(name):
+            """Return Kelvin array from a Celsius column."""
+            arr = col(name)
+            return arr + self._KELVIN_OFFSET if arr is not None else None
+
+        def col_int(name):
+            if name not in df.columns:
+                return None
+            return (
+                pd.to_numeric(df[name], errors='coerce')
+                .fillna(0)
+                .astype(np.int64)
+                .to_numpy()
+            )
+
+        # --- Timestamps ---
+        ts_fmt = '%b-%d-%Y %I:%M:%S.%f %p'
+        try:
+            ts = pd.to_datetime(df['Time Stamp'], format=ts_fmt)
+            t0 = ts.iloc[0]
+            timestamps = (ts - t0).dt.total_seconds().to_numpy(dtype=np.float64)
+        except Exception:
+            timestamps = np.arange(len(df), dtype=np.float64)
+
+        # --- Build entry ---
+        entry = getattr(batteries, entry_class)()
+        entry.recording_name = recording_name
+        entry.operator = operator
+        if start_datetime:
+            entry.start_datetime = start_datetime
+
+        sample_name = _extract_sample_name(mainfile)
+        if sample_name:
+            entry.sample_name = sample_name
+        else:
+            logger.warning(
+                f'{type(self).__name__}: could not extract a sample name from '
+                f'filename {mainfile.rsplit("/", maxsplit=1)[-1]!r} '
+                "(expected 'PC0X_All Signals_[Sample Name] Date.csv'). "
+                'Skipping automatic sample linking.'
+            )
+
+        entry.timestamps = timestamps
+
+        # Piecewise-constant signals (phases, flags, setpoints, counters) are
+        # stored change-point encoded, see StepSignal.
+        def set_steps(section, name, arr):
+            section.step_signals.append(StepSignal.from_array(name, arr))
+
+        # Process tracking
+        ph = col_str('Process Phase')
+        if ph is not None:
+            set_steps(entry, 'process_phase', ph)
+        arr = col('Process Time')
+        if arr is not None:
+            entry.process_time = arr
+
+        # --- Chamber environment (gas flows + pressures) ---
+        env = SputteringChamberEnvironment()
+
+        # Main process pressure: Capman value [Pa] + setpoint [Pa]
+        capman_arr = col('PC Capman Pressure')
+        capman_sp_arr = col('PC Capman Pressure Setpoint')
+        if capman_arr is not None or capman_sp_arr is not None:
+            p = SputteringPressure()
+            if capman_arr is not None:
+                p.value = capman_arr * _TORR_TO_PA
+            if capman_sp_arr is not None:
+                p.set_value = capman_sp_arr * _TORR_TO_PA
+            env.pressure = p
+
+        # Additional pressure gauges [Pa]
+        for attr, csv_col in [
+            ('ion_gauge_pressure', 'PC Ion Gauge Pressure'),
+            ('wide_range_gauge_pressure', 'PC Wide Range Gauge'),
+            ('roughing_pressure', 'PC Roughing Pressure'),
+        ]:
+            arr = col(csv_col)
+            if arr is not None:
+                p = SputteringPressure()
+                p.value = arr * _TORR_TO_PA
+                setattr(env, attr, p)
+
+        # Base pressure (minimum ion gauge reading, stored in Pa)
+        arr = col('PC Ion Gauge Pressure')
+        if arr is not None:
+            valid = arr[~np.isnan(arr)]
+            if len(valid) > 0:
+                entry.base_pressure = float(np.min(valid)) * _TORR_TO_PA
+
+        # Substrate shutter
+        arr = col_bool('PC Substrate Shutter Open')
+        if arr is not None:
+            set_steps(entry, 'substrate_shutter_open', arr)
+
+        # Substrate heater
+        for attr, csv_col in [
+            ('substrate_temperature', 'Substrate Heater Temperature'),
+            ('substrate_temperature_2', 'Substrate Heater Temperature 2'),
+        ]:
+            arr = col_temp(csv_col)
+            if arr is not None:
+                setattr(entry, attr, arr)
+        arr = col_temp('Substrate Heater Temperature Setpoint')
+        if arr is not None:
+            set_steps(entry, 'substrate_temperature_setpoint', arr)
+        arr = col('Substrate Heater Current')
+        if arr is not None:
+            entry.substrate_heater_current = arr
+
+        # Substrate rotation
+        arr = col('Substrate Rotation_Speed')
+        if arr is not None:
+            entry.substrate_rotation_speed = arr
+
+        # Substrate bias (Rigel)
+        arr = col_bool('Substrate Bias Active')
+        if arr is not None:
+            set_steps(entry, 'substrate_bias_active', arr)
+        for attr, csv_col in [
+            ('substrate_bias_voltage', 'Rigel DC Voltage'),
+            ('substrate_bias_current', 'Rigel DC Current'),
+            ('substrate_bias_power', 'Rigel DC Power'),
+        ]:
+            arr = col(csv_col)
+            if arr is not None:
+                setattr(entry, attr, arr)
+
+        # Thermocouples TC1–TC6
+        for i in range(1, 7):
+            arr = col_temp(f'TC{i} Temperature')
+            if arr is not None:
+                setattr(entry, f'tc{i}_temperature', arr)
+
+        # Substrate type (last non-empty value)
+        if 'Substrate Type' in reduced:
+            entry.substrate_type = reduced['Substrate Type']
+
+        # Gas flows: MFC 1–3 [m³/s]
+        for mfc_idx in [1, 2, 3]:
+            gf = SputteringGasFlow()
+            gf.mfc_index = mfc_idx
+
+            gas_name = reduced.get(f'PC MFC {mfc_idx} Gas')
+            if gas_name is not None:
+                gf.name = gas_name
+                gf.gas = PureSubstanceSection(name=gas_name)
+
+            arr = col(f'PC MFC {mfc_idx} Flow')
+            arr_sp = col(f'PC MFC {mfc_idx} Setpoint')
+            if arr is not None or arr_sp is not None:
+                gf.flow_rate = SputteringVolumetricFlowRate()
+                if arr is not None:
+                    gf.flow_rate.value = arr * _SCCM_TO_M3S
+                if arr_sp is not None:
+                    gf.flow_rate.set_value = arr_sp * _SCCM_TO_M3S
+
+            env.gas_flow.append(gf)
+
+        entry.chamber_environment = env
+
+        # --- Sources 1–4 ---
+        # Columns that reveal which power supply type is wired to each source
+        _ps_switch_cols = {
+            1: ('PC Source 1 Switch-RF-PWS1', 'PC Source 1 Switch-PDC-PWS4'),
+            2: (None, None),
+            3: ('PC Source 3 Switch-RF-PWS3', 'PC Source 3 Switch-PDC-PWS4'),
+            4: ('PC Source 4 Switch-RF-PWS3', 'PC Source 4 Switch-PDC-PWS4'),
+        }
+
+        for src_idx in [1, 2, 3, 4]:
+            src = SputteringSource()
+            src.source_index = src_idx
+
+            # Scalar identity fields (read first non-empty value)
+            for attr, csv_col in [
+                ('material', f'PC Source {src_idx} Material'),
+                ('loaded_target', f'PC Source {src_idx} Loaded Target'),
+            ]:
+                if csv_col in reduced:
+                    setattr(src, attr, reduced[csv_col].strip())
+
+            # Final thickness setpoint (scalar, Å → nm, last recorded value)
+            value = reduced.get(f'PC Source {src_idx} Final Thickness Setpoint')
+            if value is not None:
+                src.final_thickness_setpoint = value * self._ANG_TO_NM
+
+            # Time-series arrays
+            arr = col_bool(f'PC Source {src_idx} Active')
+            if arr is not None:
+                set_steps(src, 'active', arr)
+
+            arr = col_bool(f'PC Source {src_idx} Shutter Open')
+            if arr is not None:
+                set_steps(src, 'shutter_open', arr)
+
+            arr = col(f'PC Source {src_idx} Rate')
+            if arr is not None:
+                src.deposition_rate = arr * self._ANG_TO_NM  # Å/s → nm/s
+
+            arr = col(f'PC Source {src_idx} Thickness')
+            if arr is not None:
+                src.thickness = arr * self._ANG_TO_NM  # Å → nm
+
+            arr = col(f'PC Source {src_idx} Accumulate Thickness')
+            if arr is not None:
+                src.accumulated_thickness = arr * self._ANG_TO_NM  # Å → nm
+
+            # Determine power supply type from Switch columns
+            rf_col, dc_col = _ps_switch_cols.get(src_idx, (None, None))
+            ps_type = 'unknown'
+            if rf_col and reduced.get(rf_col):
+                ps_type = 'RF'
+            if dc_col and reduced.get(dc_col):
+                ps_type = 'DC-pulsed'
+            src.power_supply_type = ps_type
+
+            entry.sources.append(src)
+
+        # --- RF Power Supplies PS1, PS3, PS5 ---
+        for ps_idx in [1, 3, 5]:
+            ps = SputteringRFPowerSupply()
+            ps.supply_index = ps_idx
+            for attr, csv_col in [
+                ('forward_power', f'Power Supply {ps_idx} Fwd Power'),
+                ('reflected_power', f'Power Supply {ps_idx} Rfl Power'),
+                ('dc_bias', f'Power Supply {ps_idx} DC Bias'),
+                ('load_cap_position', f'Power Supply {ps_idx} Load Cap Position'),
+                ('tune_cap_position', f'Power Supply {ps_idx} Tune Cap Position'),
+            ]:
+                arr = col(csv_col)
+                if arr is not None:
+                    setattr(ps, attr, arr)
+            arr = col(f'Power Supply {ps_idx} Output Setpoint')
+            if arr is not None:
+                set_steps(ps, 'output_setpoint', arr)
+            entry.rf_power_supplies.append(ps)
+
+        # --- DC Pulsed Power Supply PS4 ---
+        ps4 = SputteringDCPowerSupply()
+        for attr, csv_col in [
+            ('current', 'Power Supply 4 Current'),
+            ('voltage', 'Power Supply 4 Voltage'),
+            ('power', 'Power Supply 4 Power'),
+            ('pulse_frequency', 'Power Supply 4 Pulse Frequency'),
+        ]:
+            arr = col(csv_col)
+            if arr is not None:
+                setattr(ps4, attr, arr)
+        for attr, csv_col in [
+            ('output_setpoint', 'Power Supply 4 Output Setpoint'),
+            ('current_setpoint', 'Power Supply 4 Current Setpoint'),
+            ('voltage_setpoint', 'Power Supply 4 Voltage Setpoint'),
+        ]:
+            arr = col(csv_col)
+            if arr is not None:
+                set_steps(ps4, attr, arr)
+        for attr, csv_col in [
+            ('arc_count', 'Power Supply 4 DC Count'),
+            ('spark_count', 'Power Supply 4 Spark Count'),
+        ]:
+            arr = col_int(csv_col)
+            if arr is not None:
+                set_steps(ps4, attr, arr)
+        entry.dc_power_supply = ps4
+
+        # --- Anomalies, on the rows kept by normalize (see _feed_detector) ---
+        active = _active_rows(df)
+        if active.any():
+            kept = timestamps[active]
+            entry.add_anomalies(detector.finish(), kept - kept[0])
+            entry.anomalies_detected = True
+
+        archive.data = entry
+        data_file = mainfile.rsplit('/', maxsplit=1)[-1].rsplit('.', maxsplit=1)[0]
+        archive.metadata.entry_name = data_file
+
+
+class PC03CathodeChamberParser(_BaseSputteringChamberParser):
+    """Parser for PC03 CathodeChamber CSV log files."""
+
+    _ENTRY_CLASS = 'PC03CathodeChamberDeposition'
+    _ENTRY_POINT_ID = 'nomad_inl_base.parsers:pc03_parser_entry_point'
+
+
+class PC04ElectrolyteChamberParser(_BaseSputteringChamberParser):
+    """Parser for PC04 ElectrolyteChamber CSV log files (sputtering path only)."""
+
+    _ENTRY_CLASS = 'PC04ElectrolyteChamberDeposition'
+    _ENTRY_POINT_ID = 'nomad_inl_base.parsers:pc04_parser_entry_point'
+
+
+class PC04ChamberParser(_BaseSputteringChamberParser):
+    """
+    Smart dispatcher for PC04 ElectrolyteChamber CSV log files.
+
+    Detects the recording type from the column headers at parse time:
+    - If sputtering source columns are present → :class:`PC04ElectrolyteChamberDeposition`
+    - Otherwise (heater-only log) → :class:`PC04SubstrateAnnealing`
+    """
+
+    # Entry class of sputtering logs
+    _ENTRY_CLASS = 'PC04ElectrolyteChamberDeposition'
+    _ENTRY_POINT_ID = 'nomad_inl_base.parsers:pc04_parser_entry_point'
+    _KELVIN_OFFSET = 273.15
+
+    # Column that unambiguously identifies a sputtering log
+    _SPUTTERING_MARKER = 'PC Source 1 Active'
+
+    @instrumented
+    def parse(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        # Peek at column headers only (nrows=0 is fast)
+        df_head = pd.read_csv(mainfile, skiprows=3, nrows=0, low_memory=False)
+        if self._SPUTTERING_MARKER in df_head.columns:
+            self._parse_deposition(mainfile, archive, logger, self._ENTRY_CLASS)
+        else:
+            self._parse_annealing(mainfile, archive, logger)
+
+    def _parse_annealing(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        """Parse a heater-only PC04 CSV into a :class:`PC04SubstrateAnnealing` entry."""
+        from datetime import datetime
+
+        from nomad_inl_base.schema_packages.batteries import (
+            _TORR_TO_PA,
+            PC04SubstrateAnnealing,
+            StepSignal,
+        )
+
+        # --- Read preamble (recording metadata) ---
+        with open(mainfile, encoding='utf-8', errors='replace') as fh:
+            meta_keys = [k.strip() for k in fh.readline().rstrip('\n').split(',')]
+            meta_values = [v.strip() for v in fh.readline().rstrip('\n').split(',')]
+        meta = dict(zip(meta_keys, meta_values))
+
+        start_datetime = None
+        date_str = meta.get('Date Started', '')
+        for fmt in ('%Y-%m-%d %H-%M-%S', '%Y-%m-%d %H:%M:%S'):
+            try:
+                start_datetime = datetime.strptime(date_str, fmt)
+                break
+            except ValueError:
+                continue
+
+        # --- Read time-series data ---
+        with parse_phase('read'):
+            df, reduced, _ = self._read_rows(mainfile, archive, logger)
+        record_parse(rows=len(df))
+
+        def col(name):
+            if name not in df.columns:
+                return None
+            with parse_phase('decode'):
+                arr = pd.to_numeric(df[name], errors='coerce')
+                arr = arr.to_numpy(dtype=np.float64)
+            return arr if not np.all(np.isnan(arr)) else None
+
+        def col_temp(name):
+            arr = col(name)
+            return arr + self._KELVIN_OFFSET if arr is not None else None
+
+        def col_str(name):
+            if name not in df.columns:
+                return None
+            arr = df[name].fillna('').astype(str).to_numpy(dtype=str)
+            return arr if not np.all(arr == '') else None
+
+        # --- Timestamps ---
+        ts_fmt = '%b-%d-%Y %I:%M:%S.%f %p'
+        try:
+            ts = pd.to_datetime(df['Time Stamp'], format=ts_fmt)
+            t0 = ts.iloc[0]
+            timestamps = (ts - t0).dt.total_seconds().to_numpy(dtype=np.float64)
+        except Exception:
+            timestamps = np.arange(len(df), dtype=np.float64)
+
+        # --- Build entry ---
+        entry = PC04SubstrateAnnealing()
+        entry.recording_name = meta.get('Recording Name', '')
+        entry.operator = meta.get('User', '')
+        if start_datetime:
+            entry.start_datetime = start_datetime
+        entry.timestamps = timestamps
+
+        sample_name = _extract_sample_name(mainfile)
+        if sample_name:
+            entry.sample_name = sample_name
+        else:
+            logger.warning(
+                f'PC04ChamberParser: could not extract a sample name from '
+                f'filename {mainfile.rsplit("/", maxsplit=1)[-1]!r} '
+                "(expected 'PC0X_All Signals_[Sample Name] Date.csv'). "
+                'Skipping automatic sample linking.'
+            )
+
+        ph = col_str('Process Phase')
+        if ph is not None:
+            entry.step_signals.append(StepSignal.from_array('process_phase', ph))
+
+        # Substrate type (last non-empty value)
+        if 'Substrate Type' in reduced:
+            entry.substrate_type = reduced['Substrate Type']
+
+        # Pressure
+        arr = col('PC Wide Range Gauge')
+        if arr is not None:
+            entry.wide_range_pressure = arr * _TORR_TO_PA
+
+        # Heater temperatures
+        for attr, csv_col in [
+            ('substrate_temperature', 'Substrate Heater Temperature'),
+            ('substrate_temperature_2', 'Substrate Heater Temperature 2'),
+        ]:
+            arr = col_temp(csv_col)
+            if arr is not None:
+                setattr(entry, attr, arr)
+        arr = col_temp('Substrate Heater Temperature Setpoint')
+        if arr is not None:
+            entry.step_signals.append(
+                StepSignal.from_array('substrate_temperature_setpoint', arr)
+            )
+
+        arr = col('Substrate Heater Current')
+        if arr is not None:
+            entry.substrate_heater_current = arr
+
+        # Thermocouples TC1–6
+        for i in range(1, 7):
+            arr = col_temp(f'TC{i} Temperature')
+            if arr is not None:
+                setattr(entry, f'tc{i}_temperature', arr)
+
+        archive.data = entry
+        data_file = mainfile.rsplit('/', maxsplit=1)[-1].rsplit('.', maxsplit=1)[0]
+        archive.metadata.entry_name = data_file
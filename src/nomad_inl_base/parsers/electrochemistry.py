@@ -0,0 +1,178 @@
+"""Parsers for chronoamperometry (ED) and cyclic voltammetry (CV) Excel exports."""
+
+import pandas as pd
+from nomad.datamodel.datamodel import EntryArchive, EntryMetadata
+from nomad.parsing.parser import MatchingParser
+from nomad.units import ureg
+
+from nomad_inl_base.parsers.parser import RawFile_
+from nomad_inl_base.profiling import instrumented, parse_phase
+from nomad_inl_base.utils import create_archive, fill_quantity, get_hash_ref
+
+
+class EDParser(MatchingParser):
+    @instrumented
+    def parse(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        from nomad_inl_base.schema_packages.characterization import (
+            ChronoamperometryMeasurement,
+            CurrentTimeSeries,
+        )
+
+        filetype = 'yaml'
+        data_file = (
+            mainfile.rsplit('/', maxsplit=1)[-1]
+            .split('.xlsx', maxsplit=1)[0]
+            .replace(' ', '_')
+        )
+        xlsx = pd.ExcelFile(mainfile)
+
+        data = pd.read_excel(xlsx)
+        if 'WE(1).Current (A)' in data.columns:
+            data.rename(
+                columns={'Corrected time (s)': 'Time', 'WE(1).Current (A)': 'Current'},
+                inplace=True,
+            )
+        else:
+            data.rename(
+                columns={
+                    'Column 1': 't',
+                    'Column 2': 'Current',
+                    'Column 3': 'Time',
+                    'Column 4': 'Index',
+                    'Column 5': 'Current range',
+                },
+                inplace=True,
+            )
+
+        # Dummy archive for the data file
+        file_reference = get_hash_ref(archive.m_context.upload_id, data_file)
+
+        # create a ED archive
+        ED_measurement = ChronoamperometryMeasurement()
+        ED_measurement.current = CurrentTimeSeries()
+        ED_measurement.current.value = fill_quantity(data, 'Current', 'ampere')
+        ED_measurement.current.time = fill_quantity(data, 'Time', 'seconds')
+
+        # create a ED archive
+        ED_filename = f'{data_file}.ED_measurement.archive.{filetype}'
+
+        if not archive.m_context.raw_path_exists(ED_filename):
+            ED_archive = EntryArchive(
+                data=ED_measurement,
+                metadata=EntryMetadata(upload_id=archive.m_context.upload_id),
+            )
+            with parse_phase('serialize'):
+                ED_dict = ED_archive.m_to_dict()
+            create_archive(
+                ED_dict,
+                archive.m_context,
+                ED_filename,
+                filetype,
+                logger,
+            )
+
+        archive.data = RawFile_(
+            name=data_file + '_raw',
+            file_=file_reference,
+        )
+        archive.metadata.entry_name = data_file.replace('.xlsx', '')
+
+
+class CVParser(MatchingParser):
+    @instrumented
+    def parse(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        from nomad_inl_base.schema_packages.characterization import (
+            CurrentTimeSeries,
+            PotentiostatMeasurement,
+            ScanTimeSeries,
+            VoltageTimeSeries,
+        )
+
+        filetype = 'yaml'
+        data_file = (
+            mainfile.rsplit('/', maxsplit=1)[-1]
+            .split('.xlsx', maxsplit=1)[0]
+            .replace(' ', '_')
+        )
+        xlsx = pd.ExcelFile(mainfile)
+
+        data = pd.read_excel(xlsx)
+        if 'WE(1).Potential (V)' in data.columns:
+            data.rename(
+                columns={
+                    'WE(1).Potential (V)': 'Potential',
+                    'WE(1).Current (A)': 'Current',
+                },
+                inplace=True,
+            )
+        else:
+            data.rename(
+                columns={
+                    'Column 1': 'Potential applied (V)',
+                    'Column 2': 'Time (s)',
+                    'Column 3': 'Current',
+                    'Column 4': 'Potential',
+                    'Column 5': 'Scan',
+                    'Column 6': 'Index',
+                    'Column 7': 'Q+',
+                    'Column 8': 'Q-',
+                },
+                inplace=True,
+            )
+
+        rate = float(
+            mainfile.split('.xlsx', maxsplit=1)[0]
+            .rsplit('-', maxsplit=1)[-1]
+            .replace(' ', '')
+            .replace('mVs', '')
+        )
+
+        # create a CV archive
+
+        CV_measurement = PotentiostatMeasurement()
+        CV_measurement.voltage = VoltageTimeSeries()
+        CV_measurement.current = CurrentTimeSeries()
+        CV_measurement.scan = ScanTimeSeries()
+        CV_measurement.rate = ureg.Quantity(
+            rate,
+            ureg('millivolt/second'),
+        )
+
+        # Dummy archive for the data file
+        file_reference = get_hash_ref(archive.m_context.upload_id, data_file)
+
+        # CV_measurement.data_file = file_reference
+
+        CV_measurement.voltage.value = fill_quantity(data, 'Potential', 'volt')
+        CV_measurement.current.value = fill_quantity(data, 'Current', 'ampere')
+        CV_measurement.scan.value = fill_quantity(data, 'Scan')
+        for values in [
+            CV_measurement.voltage,
+            CV_measurement.current,
+            CV_measurement.scan,
+        ]:
+            values.time = fill_quantity(data, 'Time (s)', 'seconds')
+
+        # create a CV archive
+        CV_filename = f'{data_file}.CV_measurement.archive.{filetype}'
+
+        if not archive.m_context.raw_path_exists(CV_filename):
+            CV_archive = EntryArchive(
+                data=CV_measurement,
+                metadata=EntryMetadata(upload_id=archive.m_context.upload_id),
+            )
+            with parse_phase('serialize'):
+                CV_dict = CV_archive.m_to_dict()
+            create_archive(
+                CV_dict,
+                archive.m_context,
+                CV_filename,
+                filetype,
+                logger,
+            )
+
+        archive.data = RawFile_(
+            name=data_file + '_raw',
+            file_=file_reference,
+        )
+        archive.metadata.entry_name = data_file.replace('.xlsx', '')
@@ -0,0 +1,133 @@
+"""Parser for external quantum efficiency (EQE) text files."""
+
+import numpy as np
+from nomad.datamodel.datamodel import EntryArchive
+from nomad.parsing.parser import MatchingParser
+from nomad.units import ureg
+
+from nomad_inl_base.profiling import instrumented
+from nomad_inl_base.utils import create_child_entry, get_hash_ref
+
+
+class EQEParser(MatchingParser):
+    @instrumented
+    def parse(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        import re
+
+        filetype = 'yaml'
+        data_file = (
+            mainfile.rsplit('/', maxsplit=1)[-1]
+            .rsplit('.', maxsplit=1)[0]
+            .replace(' ', '_')
+        )
+
+        # Read the file: data lines are tab-separated, footer starts after a
+        # line that doesn't have numeric first column or is blank after data.
+        data_lines = []
+        footer_lines = []
+        in_footer = False
+        with open(mainfile, encoding='utf-8', errors='replace') as fh:
+            header = fh.readline()  # noqa: F841 — column header line
+            for line in fh:
+                stripped = line.strip()
+                if not stripped:
+                    in_footer = True
+                    continue
+                if not in_footer:
+                    parts = stripped.split('\t')
+                    try:
+                        float(parts[0])
+                        data_lines.append(parts)
+                    except (ValueError, IndexError):
+                        in_footer = True
+                        footer_lines.append(stripped)
+                else:
+                    footer_lines.append(stripped)
+
+        # Parse data columns
+        wavelength = np.array([float(row[0]) for row in data_lines], dtype=np.float64)
+        qe = np.array([float(row[1]) for row in data_lines], dtype=np.float64)
+        # Normalise: if values look like percentages (>1), convert to fraction
+        if np.nanmax(qe) > 1.0:
+            qe = qe / 100.0
+
+        # Parse footer metadata.
+        # Format: "Key [optional_unit]:  value(s)" — one entry per line.
+        # Jsc has multiple tab-separated values; first value = AM1.5G.
+        # Replace tabs with spaces so every line is flat for regex matching.
+        footer_flat = re.sub(r'\t+', ' ', '\n'.join(footer_lines))
+
+        def footer_float(key_pattern):
+            """Return the first float after 'Key [unit]: ...' in the footer."""
+            m = re.search(
+                key_pattern + r'(?:[^\n:]*:)?\s*([-+]?\d+\.?\d*(?:[Ee][+-]?\d+)?)',
+                footer_flat,
+                re.IGNORECASE,
+            )
+            if m:
+                try:
+                    return float(m.group(1))
+                except ValueError:
+                    return None
+            return None
+
+        def footer_str(key_pattern):
+            """Return the string value after 'Key: value' (to end of line)."""
+            m = re.search(
+                key_pattern + r'\s*:\s*([^\n\r]+)',
+                footer_flat,
+                re.IGNORECASE,
+            )
+            if m:
+                return m.group(1).strip()
+            return None
+
+        from nomad_inl_base.schema_packages.characterization import INLEQE, EQEResult
+
+        eqe_entry = INLEQE()
+        eqe_entry.wavelength = ureg.Quantity(wavelength, ureg.nanometer)
+        eqe_entry.quantum_efficiency = qe
+
+        eqe_result = EQEResult()
+
+        jsc_val = footer_float(r'Jsc')
+        if jsc_val is not None:
+            eqe_result.jsc = ureg.Quantity(jsc_val, ureg('milliampere/centimeter**2'))
+
+        bg_val = footer_float(r'[Bb]andgap')
+        if bg_val is not None:
+            eqe_result.bandgap = ureg.Quantity(bg_val, ureg.eV)
+
+        dev_id = footer_str(r'[Dd]evice\s*ID')
+        if dev_id is not None:
+            eqe_result.device_id = dev_id
+
+        chop_val = footer_float(r'[Cc]hopping\s*[Ff]requency')
+        if chop_val is not None:
+            eqe_result.chopping_frequency = ureg.Quantity(chop_val, ureg.hertz)
+
+        lb_val = footer_float(r'[Ll]ight\s*[Bb]ias\s*[Cc]urrent')
+        if lb_val is not None:
+            eqe_result.light_bias_current = ureg.Quantity(lb_val, ureg.milliampere)
+
+        vb_val = footer_float(r'[Vv]oltage\s*[Bb]ias')
+        if vb_val is not None:
+            eqe_result.voltage_bias = ureg.Quantity(vb_val, ureg.volt)
+
+        eqe_entry.results = [eqe_result]
+
+        # Optional date from footer
+        date_val = footer_str(r'Date')
+        if date_val:
+            eqe_entry.datetime = date_val
+
+        create_child_entry(
+            eqe_entry,
+            archive,
+            child_filename=f'{data_file}.EQE.archive.{filetype}',
+            filetype=filetype,
+            raw_name=data_file + '_raw',
+            raw_ref=get_hash_ref(archive.m_context.upload_id, data_file),
+            logger=logger,
+        )
+        archive.metadata.entry_name = data_file
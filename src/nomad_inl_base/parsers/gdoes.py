@@ -0,0 +1,99 @@
+"""Parser for GDOES depth profiles."""
+
+import numpy as np
+import pandas as pd
+from nomad.datamodel.datamodel import EntryArchive
+from nomad.parsing.parser import MatchingParser
+from nomad.units import ureg
+
+from nomad_inl_base.profiling import instrumented
+from nomad_inl_base.utils import create_child_entry, get_hash_ref
+
+
+class GDOESParser(MatchingParser):
+    @instrumented
+    def parse(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        import re
+
+        filetype = 'yaml'
+        data_file = (
+            mainfile.rsplit('/', maxsplit=1)[-1]
+            .rsplit('.', maxsplit=1)[0]
+            .replace(' ', '_')
+        )
+
+        # GDOES files: row 0 = sample/title info, row 1 = column names
+        # (Depth [µm], C 166, Se 196, ..., *Se/Sb!), data from row 2 on.
+        # Read with header=0 (title row) so column alignment is stable, then
+        # rename columns using the actual element-name row.
+        df = pd.read_csv(
+            mainfile, sep='\t', encoding='utf-8', engine='python', header=0
+        )
+
+        # Extract proper column names from row 1 of the raw file
+        with open(mainfile, encoding='utf-8', errors='replace') as _fh:
+            _fh.readline()  # skip title row
+            _name_line = _fh.readline()
+        _elem_names = [s.strip() for s in _name_line.rstrip('\n\r').split('\t')]
+        # Rename columns up to however many names we got
+        _n = min(len(df.columns), len(_elem_names))
+        df.columns = list(_elem_names[:_n]) + list(df.columns[_n:])
+
+        # Convert all columns to numeric; -nan(ind) and other non-numeric
+        # strings become NaN via errors='coerce'
+        df_numeric = df.apply(lambda c: pd.to_numeric(c, errors='coerce'))
+
+        # Detect depth column (first column, may contain unit info like "µm")
+        depth_col = df.columns[0]
+        depth_raw = df_numeric[depth_col].values.astype(np.float64)
+
+        # Use a consistent row mask: only rows where depth is finite
+        # This keeps all columns aligned to the same index
+        valid_mask = np.isfinite(depth_raw)
+        depth_values = depth_raw[valid_mask]
+
+        from nomad_inl_base.schema_packages.characterization import (
+            INLGDOES,
+            GDOESElementProfile,
+        )
+
+        gdoes_entry = INLGDOES()
+        gdoes_entry.depth = ureg.Quantity(depth_values, ureg.micrometer)
+
+        profiles = []
+        for col_name in df.columns[1:]:
+            col_str = str(col_name).strip()
+            values = df_numeric[col_name].values.astype(np.float64)[valid_mask]
+            # Skip columns that are entirely NaN or all-zero (no real data)
+            if np.all(~np.isfinite(values)) or np.all(values == 0.0):
+                continue
+            # Skip ratio/derived columns: name contains '*' or '/', or
+            # finite values exceed 100 mol% (not a real concentration)
+            finite_vals = values[np.isfinite(values)]
+            if (
+                '*' in col_str
+                or '/' in col_str
+                or (len(finite_vals) > 0 and np.max(finite_vals) > 100)
+            ):
+                continue
+            # Replace remaining non-finite values (NaN/inf mid-column) with 0.0
+            values = np.where(np.isfinite(values), values, 0.0)
+            profile = GDOESElementProfile()
+            # Strip wavelength suffix (e.g. 'Se 196' → 'Se')
+            elem_match = re.match(r'^([A-Z][a-z]?)', col_str)
+            profile.element_name = elem_match.group(1) if elem_match else col_str
+            profile.concentration = values
+            profiles.append(profile)
+
+        gdoes_entry.element_profiles = profiles
+
+        create_child_entry(
+            gdoes_entry,
+            archive,
+            child_filename=f'{data_file}.GDOES.archive.{filetype}',
+            filetype=filetype,
+            raw_name=data_file + '_raw',
+            raw_ref=get_hash_ref(archive.m_context.upload_id, data_file),
+            logger=logger,
+        )
+        archive.metadata.entry_name = data_file
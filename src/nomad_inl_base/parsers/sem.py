@@ -0,0 +1,194 @@
+"""Parser for SEM image sets (TFS/FEI TIFF files)."""
+
+import numpy as np
+from nomad.datamodel.datamodel import EntryArchive
+from nomad.parsing.parser import MatchingParser
+
+from nomad_inl_base.profiling import instrumented
+from nomad_inl_base.utils import create_child_entry, get_hash_ref
+
+
+def _parse_tfs_tiff_metadata(path: str) -> dict:
+    """Extract FEI/TFS SEM metadata from TIFF tag 34682.
+
+    Returns a flat dict with keys like ``'EBeam/HV'``, ``'Scan/PixelWidth'``.
+    Values are ``np.float64``, ``np.int64``, or ``str``.
+    Returns an empty dict when tag 34682 is absent (not an FEI/TFS TIFF).
+    """
+    import re
+
+    from PIL import Image
+
+    meta = {}
+    with Image.open(path) as img:
+        if 34682 not in img.tag_v2:
+            return meta
+        blob = img.tag_v2[34682]
+        text = (
+            blob.decode('utf-8', errors='replace')
+            if isinstance(blob, bytes)
+            else str(blob)
+        )
+    current_section = None
+    for line in (ln.strip() for ln in re.split(r'\r\n|\r|\n', text)):
+        if not line:
+            continue
+        section_match = re.match(r'^\[(\w+)\]$', line)
+        if section_match:
+            current_section = section_match.group(1)
+            continue
+        if current_section and '=' in line:
+            key, _, value = line.partition('=')
+            key = key.strip()
+            value = value.strip()
+            if not value:
+                continue
+            flat_key = f'{current_section}/{key}'
+            try:
+                meta[flat_key] = np.int64(value)
+            except ValueError:
+                try:
+                    meta[flat_key] = np.float64(value)
+                except ValueError:
+                    meta[flat_key] = value
+    return meta
+
+
+class SEMZipParser(MatchingParser):
+    """Parse FEI/TFS SEM TIFF images.
+
+    NOMAD auto-extracts ZIP uploads, so this parser matches the "base" TIFF
+    (no _NNN suffix) for each sample group and collects all related images
+    (same filename prefix) into a single INLSEMSession archive entry.
+    """
+
+    @instrumented
+    def parse(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        import glob
+        import os
+
+        from nomad_inl_base.schema_packages.characterization import (
+            INLSEMImage,
+            INLSEMSession,
+        )
+
+        # Base name prefix (without extension) — used to collect _NNN sibling files
+        base_name = os.path.splitext(os.path.basename(mainfile))[0]
+        raw_dir_abs = os.path.dirname(mainfile)
+        raw_root = archive.m_context.raw_path()
+        raw_dir_rel = os.path.relpath(raw_dir_abs, raw_root)
+
+        # Collect all TIF files in the same directory that share this base prefix
+        tif_paths = sorted(
+            p
+            for ext in ('*.tif', '*.tiff', '*.TIF', '*.TIFF')
+            for p in glob.glob(os.path.join(raw_dir_abs, ext))
+            if os.path.basename(p).startswith(base_name)
+        )
+
+        session = INLSEMSession()
+        microscope_model = None
+        source_type = None
+        images = []
+
+        for tif_path in tif_paths:
+            tif_name = os.path.basename(tif_path)
+            meta = _parse_tfs_tiff_metadata(tif_path)
+            if not meta:
+                logger.warning(
+                    f'SEMZipParser: {tif_name} has no FEI metadata (tag 34682), skipping'
+                )
+                continue
+
+            # Capture session-level info from the first TIFF
+            if microscope_model is None:
+                microscope_model = meta.get('System/SystemType') or meta.get(
+                    'System/Type'
+                )
+                source_type = meta.get('System/Source')
+
+            res_x = int(meta.get('Image/ResolutionX', 0)) or None
+            res_y = int(meta.get('Image/ResolutionY', 0)) or None
+
+            # Compute nominal magnification: canvas_width / HFW
+            magnification = None
+            hfw = meta.get('EBeam/HFW')
+            canvas_w = meta.get('Image/MagCanvasRealWidth')
+            if hfw and canvas_w:
+                try:
+                    hfw_f = float(hfw)
+                    if hfw_f > 0:
+                        magnification = float(canvas_w) / hfw_f
+                except (TypeError, ValueError):
+                    pass
+
+            date_str = str(meta.get('User/Date') or '')
+            time_str = str(meta.get('User/Time') or '')
+            acq_dt = f'{date_str} {time_str}'.strip() or None
+
+            def _f(key, _meta=meta):
+                v = _meta.get(key)
+                if v is None:
+                    return None
+                try:
+                    return float(v)
+                except (TypeError, ValueError):
+                    return None
+
+            # image_array is intentionally omitted here — it is loaded from
+            # the TIFF file in INLSEMSession.normalize to keep the sidecar
+            # YAML small (numpy arrays would serialize as millions of ints).
+            images.append(
+                INLSEMImage(
+                    file_name=tif_name,
+                    width_pixels=np.int64(res_x) if res_x else None,
+                    height_pixels=np.int64(res_y) if res_y else None,
+                    accelerating_voltage=_f('EBeam/HV'),
+                    magnification=magnification,
+                    horizontal_field_width=_f('EBeam/HFW'),
+                    pixel_width=_f('Scan/PixelWidth') or _f('EScan/PixelWidth'),
+                    working_distance=_f('EBeam/WD'),
+                    detector_name=meta.get('Detectors/Name'),
+                    detector_mode=meta.get('Detectors/Mode'),
+                    emission_current=_f('EBeam/EmissionCurrent'),
+                    dwell_time=_f('Scan/Dwelltime'),
+                    stage_x=_f('Stage/StageX'),
+                    stage_y=_f('Stage/StageY'),
+                    stage_z=_f('Stage/StageZ'),
+                    stage_tilt=_f('Stage/StageT'),
+                    acquisition_datetime=acq_dt,
+                    operator=str(meta.get('User/User') or '') or None,
+                )
+            )
+
+        # ----------------------------------------------------------------
+        # Write a sidecar archive for the INLSEMSession on first parse only.
+        # On subsequent reprocesses (e.g. after user edits sample references)
+        # the file already exists and is left untouched, preserving all ELN edits.
+        # image_array is NOT stored in the sidecar — normalize reloads it.
+        # ----------------------------------------------------------------
+        session.microscope_model = microscope_model
+        session.source_type = source_type
+        session.raw_dir = raw_dir_rel
+        session.images = images
+
+        # Set session-level datetime from the first image that has one.
+        first_dt = next(
+            (img.acquisition_datetime for img in images if img.acquisition_datetime),
+            None,
+        )
+        if first_dt:
+            session.datetime = first_dt
+
+        sidecar_filename = f'{base_name}.SEMSession.archive.yaml'
+        create_child_entry(
+            session,
+            archive,
+            child_filename=sidecar_filename,
+            filetype='yaml',
+            raw_name=base_name + '_sem_raw',
+            raw_ref=get_hash_ref(archive.m_context.upload_id, base_name),
+            logger=logger,
+            guard=True,
+        )
+        archive.metadata.entry_name = base_name
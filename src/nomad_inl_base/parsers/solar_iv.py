@@ -0,0 +1,208 @@
+"""Parser for solar simulator IV curves and results tables."""
+
+import numpy as np
+import pandas as pd
+from nomad.datamodel.datamodel import EntryArchive
+from nomad.parsing.parser import MatchingParser
+from nomad.units import ureg
+
+from nomad_inl_base.profiling import instrumented
+from nomad_inl_base.utils import create_child_entry, get_hash_ref
+
+
+class SolarCellIVParser(MatchingParser):
+    """
+    Matches on 'Results Table' .txt files.  For each matched file, looks up
+    all sibling Results Table and IV Graph files sharing the same sample
+    prefix and combines them into a single INLSolarCellIV archive entry.
+    """
+
+    @instrumented
+    def parse(self, mainfile: str, archive: EntryArchive, logger) -> None:
+        import os
+        import re
+
+        basename = mainfile.rsplit('/', maxsplit=1)[-1]
+        directory = mainfile.rsplit('/', maxsplit=1)[0] if '/' in mainfile else '.'
+
+        # Extract sample prefix: everything before "Results Table" or "IV Graph"
+        match = re.match(
+            r'^(.+?)\s*(Results\s*Table|IV\s*Graph)',
+            basename,
+            re.IGNORECASE,
+        )
+        if not match:
+            logger.error(f'Could not extract sample prefix from {basename}')
+            return
+        sample_prefix = match.group(1).strip()
+
+        # Find all sibling Results Table and IV Graph files for this sample
+        results_files = []
+        iv_files = []
+        for fname in sorted(os.listdir(directory)):
+            if not fname.lower().endswith('.txt'):
+                continue
+            if fname.startswith(sample_prefix):
+                if re.search(r'Results\s*Table', fname, re.IGNORECASE):
+                    results_files.append(os.path.join(directory, fname))
+                elif re.search(r'IV\s*Graph', fname, re.IGNORECASE):
+                    iv_files.append(os.path.join(directory, fname))
+
+        from nomad_inl_base.schema_packages.characterization import (
+            INLSolarCellIV,
+            SolarCellIVCurve,
+            SolarCellIVResult,
+        )
+
+        entry = INLSolarCellIV()
+        all_results = []
+        all_curves = []
+
+        # Parse Results Table files
+        for rf in results_files:
+            try:
+                df = pd.read_csv(rf, sep='\t', encoding='utf-8', engine='python')
+            except Exception:
+                logger.warn(f'Could not read results table: {rf}')
+                continue
+
+            for _, row in df.iterrows():
+                result = SolarCellIVResult()
+                result.measurement_name = str(row.get('Measurement', ''))
+                if 'Voc V' in df.columns:
+                    result.voc = ureg.Quantity(float(row['Voc V']), ureg.volt)
+                if 'Isc A' in df.columns:
+                    result.isc = ureg.Quantity(float(row['Isc A']), ureg.ampere)
+                if 'Jsc mA/cm2' in df.columns:
+                    result.jsc = ureg.Quantity(
+                        float(row['Jsc mA/cm2']),
+                        ureg('milliampere/centimeter**2'),
+                    )
+                if 'Vmax V' in df.columns:
+                    result.vmax = ureg.Quantity(float(row['Vmax V']), ureg.volt)
+                if 'Imax A' in df.columns:
+                    result.imax = ureg.Quantity(float(row['Imax A']), ureg.ampere)
+                if 'Pmax mW' in df.columns:
+                    result.pmax = ureg.Quantity(float(row['Pmax mW']), ureg.milliwatt)
+                if 'Fill Factor' in df.columns:
+                    result.fill_factor = float(row['Fill Factor'])
+                if 'Efficiency' in df.columns:
+                    result.efficiency = float(row['Efficiency'])
+                if 'R at Voc' in df.columns:
+                    result.r_at_voc = ureg.Quantity(float(row['R at Voc']), ureg.ohm)
+                if 'R at Isc' in df.columns:
+                    result.r_at_isc = ureg.Quantity(float(row['R at Isc']), ureg.ohm)
+                if 'Exposure' in df.columns:
+                    result.exposure = ureg.Quantity(float(row['Exposure']), ureg.second)
+                if 'Time' in df.columns and 'Date' in df.columns:
+                    result.datetime = f'{row.get("Date", "")} {row.get("Time", "")}'
+
+                # Derived quantities -----------------------------------------
+                # Cell area [cm²] = Isc [A] / Jsc [mA/cm²] * 1000
+                isc_raw = float(row['Isc A']) if 'Isc A' in df.columns else None
+                jsc_raw = (
+                    float(row['Jsc mA/cm2']) if 'Jsc mA/cm2' in df.columns else None
+                )
+                area_cm2 = None
+                if isc_raw and jsc_raw and jsc_raw != 0:
+                    area_cm2 = (isc_raw / jsc_raw) * 1000.0
+                    result.cell_area = ureg.Quantity(area_cm2, ureg('centimeter**2'))
+
+                # Area-normalised resistances [Ω·cm²]
+                r_voc_raw = float(row['R at Voc']) if 'R at Voc' in df.columns else None
+                r_isc_raw = float(row['R at Isc']) if 'R at Isc' in df.columns else None
+                if area_cm2 is not None:
+                    if r_voc_raw is not None:
+                        result.r_series = ureg.Quantity(
+                            r_voc_raw * area_cm2, ureg('ohm * centimeter**2')
+                        )
+                    if r_isc_raw is not None:
+                        result.r_shunt = ureg.Quantity(
+                            r_isc_raw * area_cm2, ureg('ohm * centimeter**2')
+                        )
+
+                # Filter out unphysical measurements:
+                # Jsc and Voc must be > 0; fill factor must be ≤ 85 %
+                voc_val = float(row['Voc V']) if 'Voc V' in df.columns else None
+                jsc_val = (
+                    float(row['Jsc mA/cm2']) if 'Jsc mA/cm2' in df.columns else None
+                )
+                ff_val = (
+                    float(row['Fill Factor']) if 'Fill Factor' in df.columns else None
+                )
+                if voc_val is not None and voc_val <= 0:
+                    logger.warning(
+                        f'Skipping row {row.get("Measurement", "")}: Voc={voc_val} ≤ 0'
+                    )
+                    continue
+                if jsc_val is not None and jsc_val <= 0:
+                    logger.warning(
+                        f'Skipping row {row.get("Measurement", "")}: Jsc={jsc_val} ≤ 0'
+                    )
+                    continue
+                if ff_val is not None and ff_val > 85:
+                    logger.warning(
+                        f'Skipping row {row.get("Measurement", "")}: FF={ff_val} > 85 %'
+                    )
+                    continue
+                all_results.append(result)
+
+        # Parse IV Graph files
+        for ivf in iv_files:
+            try:
+                df = pd.read_csv(ivf, sep='\t', encoding='utf-8', engine='python')
+            except Exception:
+                logger.warn(f'Could not read IV graph: {ivf}')
+                continue
+
+            # File has two header rows: row 0 = measurement names, row 1 = Vmeas/Imeas
+            # Re-read with header=[0,1] for multi-level columns
+            try:
+                df = pd.read_csv(
+                    ivf, sep='\t', header=[0, 1], encoding='utf-8', engine='python'
+                )
+            except Exception:
+                logger.warn(f'Could not parse IV graph multi-header: {ivf}')
+                continue
+
+            # Iterate over measurement columns in pairs
+            cols = list(df.columns)
+            i = 0
+            while i < len(cols) - 1:
+                meas_name = cols[i][0] if isinstance(cols[i], tuple) else str(cols[i])
+                col_type = cols[i][1] if isinstance(cols[i], tuple) else ''
+                if 'Vmeas' in str(col_type) or 'Vmeas' in str(cols[i]):
+                    v_data = pd.to_numeric(df.iloc[:, i], errors='coerce').dropna()
+                    i_data = pd.to_numeric(df.iloc[:, i + 1], errors='coerce').dropna()
+                    if len(v_data) > 0 and len(i_data) > 0:
+                        min_len = min(len(v_data), len(i_data))
+                        curve = SolarCellIVCurve()
+                        curve.measurement_name = str(meas_name).strip()
+                        curve.voltage = ureg.Quantity(
+                            v_data.values[:min_len].astype(np.float64), ureg.volt
+                        )
+                        curve.current = ureg.Quantity(
+                            i_data.values[:min_len].astype(np.float64), ureg.ampere
+                        )
+                        all_curves.append(curve)
+                    i += 2
+                else:
+                    i += 1
+
+        entry.results = all_results
+        entry.iv_curves = all_curves
+
+        filetype = 'yaml'
+        safe_prefix = sample_prefix.replace(' ', '_')
+        data_file = basename.rsplit('.', maxsplit=1)[0].replace(' ', '_')
+        create_child_entry(
+            entry,
+            archive,
+            child_filename=f'{safe_prefix}.SolarCellIV.archive.{filetype}',
+            filetype=filetype,
+            raw_name=data_file + '_raw',
+            raw_ref=get_hash_ref(archive.m_context.upload_id, data_file),
+            logger=logger,
+            guard=True,
+        )
+        archive.metadata.entry_name = sample_prefix
@@ -0,0 +1,372 @@
+"""
+Lightweight performance instrumentation.
+
+Every parser's ``parse`` is wrapped with :func:`instrumented`, which logs one
+structured ``parser performance`` event per parsed mainfile::
+
+    {'parser': 'PC03CathodeChamberParser', 'mainfile': '…', 'input_bytes': …,
+     'rows': …, 'total': 1.92, 'phases': {'read': 0.41, 'decode': 0.62,
+     'build': 0.55, 'serialize': 0.21, 'write_child': 0.08, 'reprocess': 0.05},
+     'peak_memory': {…}, 'succeeded': True}
+
+Times are wall-clock seconds. Phases are exclusive: a phase entered inside
+another one (e.g. ``reprocess`` while writing a child archive during
+``build``) pauses the enclosing phase, so the phase times add up to the
+total. Time not spent in any explicit phase counts as ``build``.
+
+Peak memory per phase (bytes allocated by Python, from :mod:`tracemalloc`)
+is only recorded when tracing is on, e.g. when the worker is started with
+``PYTHONTRACEMALLOC=1``; the instrumentation never starts tracing itself, as
+that slows down every allocation.
+
+Normalizers decorated with :func:`profiled_normalize` can additionally be
+profiled on demand (``profile_normalize`` on their schema package entry
+point). They then log a ``normalize performance`` event per entry with the
+work that is otherwise hidden in a normalize: searches, archives loaded to
+resolve references, raw files opened and read, and the size of the figures
+produced, next to the time spent on each. With ``normalize_diagnostics`` the
+profile is also stored in the entry's hidden ``normalize_diagnostics``
+section.
+"""
+
+import contextlib
+import contextvars
+import functools
+import os
+import threading
+import time
+import tracemalloc
+
+PARSE_PHASES = ('read', 'decode', 'build', 'serialize', 'write_child', 'reprocess')
+_DEFAULT_PHASE = 'build'
+
+PARSE_EVENT = 'parser performance'
+
+
+class _PhaseClock:
+    """Exclusive wall-clock (and peak memory) accounting of nested phases."""
+
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+        self.peak_memory: dict[str, int] = {}
+        self.total = 0.0
+        self.succeeded = False
+        self._stack: list[str] = []
+        self._started = 0.0
+
+    def _stop(self, now: float) -> None:
+        """Book the time (and peak memory) since the last switch to the
+        running phase."""
+        phase = self._stack[-1]
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._started
+        if tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak_memory[phase] = max(self.peak_memory.get(phase, 0), peak)
+            tracemalloc.reset_peak()
+
+    def _switch(self, push: str | None) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            self._stop(now)
+        if push is None:
+            self._stack.pop()
+        else:
+            self._stack.append(push)
+        self._started = now
+
+
+class ParseStats(_PhaseClock):
+    """Phase timings and sizes of one parse."""
+
+    def __init__(self, parser: str, mainfile: str):
+        super().__init__()
+        self.parser = parser
+        self.mainfile = mainfile
+        self.input_bytes: int | None = None
+        self.rows: int | None = None
+
+    def event(self) -> dict:
+        event = {
+            'parser': self.parser,
+            'mainfile': self.mainfile,
+            'input_bytes': self.input_bytes,
+            'rows': self.rows,
+            'total': round(self.total, 6),
+            'phases': {k: round(v, 6) for k, v in self.phases.items()},
+            'succeeded': self.succeeded,
+        }
+        if self.peak_memory:
+            event['peak_memory'] = self.peak_memory
+        return event
+
+
+_current_parse: contextvars.ContextVar[ParseStats | None] = contextvars.ContextVar(
+    '_current_parse', default=None
+)
+
+
+@contextlib.contextmanager
+def parse_phase(name: str):
+    """Book the time spent in the block to phase *name* of the running parse
+    (a no-op outside of an instrumented parse)."""
+    stats = _current_parse.get()
+    if stats is None:
+        yield
+        return
+    stats._switch(name)
+    try:
+        yield
+    finally:
+        stats._switch(None)
+
+
+def record_parse(*, rows: int | None = None, input_bytes: int | None = None) -> None:
+    """Record the number of data rows (or input bytes, if not the mainfile
+    size) of the running parse."""
+    stats = _current_parse.get()
+    if stats is None:
+        return
+    if rows is not None:
+        stats.rows = int(rows)
+    if input_bytes is not None:
+        stats.input_bytes = int(input_bytes)
+
+
+def instrumented(parse):
+    """Decorator for ``MatchingParser.parse`` logging a :data:`PARSE_EVENT`
+    with the phase timings of every call."""
+
+    @functools.wraps(parse)
+    def wrapper(self, mainfile, archive, logger=None, *args, **kwargs):
+        if _current_parse.get() is not None:
+            # e.g. a subclass ``parse`` calling ``super().parse``
+            return parse(self, mainfile, archive, logger, *args, **kwargs)
+        stats = ParseStats(type(self).__name__, mainfile)
+        try:
+            stats.input_bytes = os.path.getsize(mainfile)
+        except (OSError, TypeError):
+            pass
+        token = _current_parse.set(stats)
+        start = time.perf_counter()
+        stats._switch(_DEFAULT_PHASE)
+        try:
+            result = parse(self, mainfile, archive, logger, *args, **kwargs)
+            stats.succeeded = True
+            return result
+        finally:
+            stats._switch(None)
+            stats.total = time.perf_counter() - start
+            _current_parse.reset(token)
+            if logger is not None:
+                logger.info(PARSE_EVENT, **stats.event())
+
+    return wrapper
+
+
+NORMALIZE_EVENT = 'normalize performance'
+_NORMALIZE_PHASE = 'normalize'
+NORMALIZE_COUNTS = (
+    'searches',
+    'dereferences',
+    'archive_loads',
+    'raw_files',
+    'raw_bytes',
+    'figure_bytes',
+)
+
+
+class NormalizeStats(_PhaseClock):
+    """Hidden work and its timing in one normalize."""
+
+    def __init__(self, section: str):
+        super().__init__()
+        self.section = section
+        self.counts = dict.fromkeys(NORMALIZE_COUNTS, 0)
+
+    def event(self) -> dict:
+        event = {
+            'section': self.section,
+            'total': round(self.total, 6),
+            'phases': {k: round(v, 6) for k, v in self.phases.items()},
+            **self.counts,
+            'succeeded': self.succeeded,
+        }
+        if self.peak_memory:
+            event['peak_memory'] = self.peak_memory
+        return event
+
+
+_current_normalize: contextvars.ContextVar[NormalizeStats | None] = (
+    contextvars.ContextVar('_current_normalize', default=None)
+)
+
+
+@contextlib.contextmanager
+def normalize_phase(name: str, **counts: int):
+    """Book the time spent in the block to phase *name* of the running
+    normalize profile and add *counts* to its counters (a no-op unless a
+    normalize is being profiled)."""
+    stats = _current_normalize.get()
+    if stats is None:
+        yield
+        return
+    for key, value in counts.items():
+        stats.counts[key] += value
+    stats._switch(name)
+    try:
+        yield
+    finally:
+        stats._switch(None)
+
+
+def record_figure(figure: dict) -> None:
+    """Add the JSON size of a newly built *figure* to the running normalize
+    profile (its measurement is booked as ``profiling`` time)."""
+    stats = _current_normalize.get()
+    if stats is None:
+        return
+    import json
+
+    from plotly.utils import PlotlyJSONEncoder
+
+    with normalize_phase('profiling'):
+        stats.counts['figure_bytes'] += len(json.dumps(figure, cls=PlotlyJSONEncoder))
+
+
+class _CountingFile:
+    """File proxy booking reads to the ``raw_io`` phase of *stats*."""
+
+    def __init__(self, file, stats: NormalizeStats):
+        self._file = file
+        self._stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._file.__exit__(*exc_info)
+
+    def _read(self, method, *args):
+        with normalize_phase('raw_io'):
+            data = method(*args)
+        self._stats.counts['raw_bytes'] += (
+            sum(map(len, data)) if isinstance(data, list) else len(data)
+        )
+        return data
+
+    def read(self, *args):
+        return self._read(self._file.read, *args)
+
+    def readline(self, *args):
+        return self._read(self._file.readline, *args)
+
+    def readlines(self, *args):
+        return self._read(self._file.readlines, *args)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self._read(self._file.readline)
+        if not line:
+            raise StopIteration
+        return line
+
+
+_WATCHED = ('resolve_archive_url', 'load_archive', 'raw_file')
+_watch_lock = threading.Lock()
+
+
+def _watch_context(context) -> None:
+    """
+    Count and time archive loads, reference resolution and raw file access
+    through *context*, booked to the normalize profiled in the calling thread
+    (see :data:`_current_normalize`). The wrappers are installed once per
+    context and left in place: processing contexts are shared by all entries
+    of a run, possibly normalized concurrently, and outside a profiled
+    normalize the wrappers only delegate.
+    """
+    with _watch_lock:
+        if vars(context).get('_normalize_watched'):
+            return
+        original = {name: getattr(context, name) for name in _WATCHED}
+
+        def resolve_archive_url(url):
+            stats = _current_normalize.get()
+            if stats is not None:
+                stats.counts['dereferences'] += 1
+            return original['resolve_archive_url'](url)
+
+        def load_archive(*args, **kwargs):
+            with normalize_phase('archive_load', archive_loads=1):
+                return original['load_archive'](*args, **kwargs)
+
+        def raw_file(path, mode='r', *args, **kwargs):
+            with normalize_phase('raw_io', raw_files=1):
+                file = original['raw_file'](path, mode, *args, **kwargs)
+            stats = _current_normalize.get()
+            if stats is None or 'r' not in mode:
+                return file
+            return _CountingFile(file, stats)
+
+        context.resolve_archive_url = resolve_archive_url
+        context.load_archive = load_archive
+        context.raw_file = raw_file
+        context._normalize_watched = True
+
+
+def _store_diagnostics(section, stats: NormalizeStats) -> None:
+    sub_section = section.m_def.all_sub_sections.get('normalize_diagnostics')
+    if sub_section is None:
+        return
+    event = stats.event()
+    diagnostics = sub_section.sub_section.section_cls(
+        total_time=event['total'],
+        phase_times=event['phases'],
+        **{key: event[key] for key in NORMALIZE_COUNTS},
+    )
+    section.m_set(sub_section, diagnostics)
+
+
+def profiled_normalize(entry_point_id: str):
+    """
+    Decorator for ``normalize(self, archive, logger)`` that profiles the
+    normalize when ``profile_normalize`` is set on the schema package entry
+    point *entry_point_id*, logging a :data:`NORMALIZE_EVENT`, and stores the
+    profile in the section's ``normalize_diagnostics`` sub-section when
+    ``normalize_diagnostics`` is set as well.
+    """
+
+    def decorator(normalize):
+        @functools.wraps(normalize)
+        def wrapper(self, archive, logger):
+            from nomad_inl_base.utils import plugin_option
+
+            if _current_normalize.get() is not None or not plugin_option(
+                entry_point_id, 'profile_normalize', False
+            ):
+                return normalize(self, archive, logger)
+            stats = NormalizeStats(type(self).__name__)
+            if archive.m_context is not None:
+                _watch_context(archive.m_context)
+            token = _current_normalize.set(stats)
+            start = time.perf_counter()
+            stats._switch(_NORMALIZE_PHASE)
+            try:
+                normalize(self, archive, logger)
+                stats.succeeded = True
+            finally:
+                stats._switch(None)
+                stats.total = time.perf_counter() - start
+                _current_normalize.reset(token)
+                logger.info(NORMALIZE_EVENT, **stats.event())
+            if plugin_option(entry_point_id, 'normalize_diagnostics', False):
+                _store_diagnostics(self, stats)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,291 @@
+"""
+Cross-run Parquet index of deposition runs for fleet analytics.
+
+When enabled (``run_index_path`` on the batteries or METEOR schema package
+entry point), every PC03/PC04/METEOR deposition writes one row of scalar
+summaries — base pressure, deposition time, arc count, source materials,
+anomaly counts … — plus pointers to its full data (upload, entry, mainfile,
+HDF5 sidecar) to a Parquet dataset on a shared filesystem during normalize.
+Comparing hundreds of runs is then a columnar scan of a few kB per run
+instead of loading every archive::
+
+    from nomad_inl_base.run_index import load_run_index
+
+    df = load_run_index(
+        '/data/run_index', chamber='PC03', material='LiCoO2', start='2026-01-01'
+    )
+
+The dataset is hive-partitioned by chamber (``chamber=PC03/`` …). Each run
+writes its own small file, replacing the file of its previous normalization,
+so writers never contend for a shared file; :func:`compact_run_index` merges
+the per-run files of each partition when they pile up.
+"""
+
+import os
+import re
+import uuid
+from datetime import datetime, timezone
+
+from nomad_inl_base.utils import plugin_option
+
+_PARTITION = 'chamber'
+
+# Column name → Arrow type name (see _schema); ``chamber`` is the partition key
+COLUMNS = {
+    'entry_id': 'string',
+    'upload_id': 'string',
+    'mainfile': 'string',
+    'entry_type': 'string',
+    'start_time': 'timestamp',
+    'operator': 'string',
+    'sample_name': 'string',
+    'materials': 'list<string>',
+    'base_pressure': 'float64',  # Pa
+    'deposition_time': 'float64',  # s
+    'duration': 'float64',  # s
+    'delivered_energy': 'float64',  # J
+    'thickness': 'float64',  # nm
+    'arc_count': 'int64',
+    'anomaly_count': 'int64',
+    'critical_anomaly_count': 'int64',
+    'hdf5_file': 'string',
+    'indexed_at': 'timestamp',
+}
+
+
+def run_index_path(entry_point_id: str) -> str | None:
+    """Root directory of the run index configured on *entry_point_id*, if any."""
+    return plugin_option(entry_point_id, 'run_index_path', None) or None
+
+
+def _schema():
+    import pyarrow as pa
+
+    types = {
+        'string': pa.string(),
+        'float64': pa.float64(),
+        'int64': pa.int64(),
+        'timestamp': pa.timestamp('us', tz='UTC'),
+        'list<string>': pa.list_(pa.string()),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in COLUMNS.items()])
+
+
+def _utc(value):
+    if value is None:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _file_stem(entry_id: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_-]', '_', entry_id)
+
+
+def write_run(root: str, chamber: str, row: dict) -> str:
+    """
+    Write the summary *row* of one run to the partition *chamber* below
+    *root*, replacing the rows previously written for the same ``entry_id``.
+    Missing columns are stored as nulls. Returns the path of the new file.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    row = {name: row.get(name) for name in COLUMNS}
+    row['indexed_at'] = datetime.now(timezone.utc)
+    for name, kind in COLUMNS.items():
+        if kind == 'timestamp':
+            row[name] = _utc(row[name])
+    table = pa.Table.from_pylist([row], schema=_schema())
+
+    directory = os.path.join(root, f'{_PARTITION}={chamber}')
+    os.makedirs(directory, exist_ok=True)
+    stem = _file_stem(row['entry_id'])
+    path = os.path.join(directory, f'{stem}.{uuid.uuid4().hex}.parquet')
+    # Write under a hidden name (skipped by dataset discovery), then rename
+    tmp = os.path.join(directory, f'.{uuid.uuid4().hex}.tmp')
+    pq.write_table(table, tmp)
+    os.replace(tmp, path)
+    for name in os.listdir(directory):
+        if name.startswith(f'{stem}.') and name.endswith('.parquet'):
+            if os.path.join(directory, name) != path:
+                _remove(os.path.join(directory, name))
+    return path
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def index_run(archive, chamber: str, row: dict, entry_point_id: str, logger) -> bool:
+    """
+    Add the run summarized by *row* to the index configured on
+    *entry_point_id* (no-op if none is). ``entry_id``, ``upload_id`` and
+    ``mainfile`` default to the archive metadata. Failures are logged and do
+    not affect the entry.
+    """
+    root = run_index_path(entry_point_id)
+    if not root:
+        return False
+    metadata = archive.metadata
+    row = {
+        'entry_id': metadata.entry_id or metadata.mainfile,
+        'upload_id': metadata.upload_id,
+        'mainfile': metadata.mainfile,
+        **row,
+    }
+    try:
+        write_run(root, chamber, row)
+    except Exception as exc:
+        logger.warning(
+            f'Could not write run {row["entry_id"]!r} to the run index at {root!r}.',
+            exc_info=exc,
+        )
+        return False
+    return True
+
+
+def _dataset_schema():
+    import pyarrow as pa
+
+    return _schema().append(pa.field(_PARTITION, pa.string()))
+
+
+def _dataset(root: str):
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    return ds.dataset(
+        root,
+        format='parquet',
+        schema=_dataset_schema(),
+        partitioning=ds.partitioning(
+            pa.schema([(_PARTITION, pa.string())]), flavor='hive'
+        ),
+    )
+
+
+def _timestamp(value):
+    import pandas as pd
+
+    value = pd.Timestamp(value)
+    return value.tz_localize('UTC') if value.tzinfo is None else value.tz_convert('UTC')
+
+
+def _latest(table):
+    """Keep the most recently indexed row of every ``entry_id``."""
+    import numpy as np
+
+    if table.num_rows == 0:
+        return table
+    table = table.sort_by([('indexed_at', 'descending')])
+    entry_ids = table['entry_id'].to_numpy(zero_copy_only=False).astype(str)
+    _, first = np.unique(entry_ids, return_index=True)
+    return table.take(np.sort(first))
+
+
+def load_run_index(
+    root: str,
+    chamber: str | list[str] | None = None,
+    material: str | list[str] | None = None,
+    operator: str | list[str] | None = None,
+    start=None,
+    end=None,
+    columns: list[str] | None = None,
+):
+    """
+    Runs in the index at *root* as a ``pandas.DataFrame``, one row per entry.
+
+    Filters are combined with AND; a list matches any of its values.
+    *material* matches runs that used any of the given source materials,
+    *start* / *end* (datetime or ISO string, UTC if naive) bound
+    ``start_time`` as ``[start, end)``. Chamber, operator and date filters
+    are pushed down to the Parquet scan; *columns* limits the columns read.
+    """
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+
+    if not os.path.isdir(root):
+        return _dataset_schema().empty_table().to_pandas()
+
+    expression = None
+
+    def _and(term):
+        nonlocal expression
+        expression = term if expression is None else expression & term
+
+    for name, value in ((_PARTITION, chamber), ('operator', operator)):
+        if value is not None:
+            values = [value] if isinstance(value, str) else list(value)
+            _and(ds.field(name).isin(values))
+    if start is not None:
+        _and(ds.field('start_time') >= _timestamp(start))
+    if end is not None:
+        _and(ds.field('start_time') < _timestamp(end))
+
+    read = None
+    if columns is not None:
+        read = [*columns, 'entry_id', 'indexed_at', 'start_time']
+        if material is not None:
+            read.append('materials')
+        read = list(dict.fromkeys(read))
+    dataset = _dataset(root)
+    # Rows superseded by a later normalization of the same entry (left behind
+    # in compacted files) must not match the filters in its stead
+    latest = (
+        dataset.to_table(columns=['entry_id', 'indexed_at'])
+        .group_by('entry_id')
+        .aggregate([('indexed_at', 'max')])
+        .select(['entry_id', 'indexed_at_max'])
+        .rename_columns(['entry_id', 'indexed_at'])
+    )
+    table = dataset.to_table(columns=read, filter=expression)
+    newest = latest['indexed_at'].take(
+        pc.index_in(table['entry_id'], value_set=latest['entry_id'])
+    )
+    table = table.filter(pc.equal(table['indexed_at'], newest))
+    table = table.sort_by('start_time')
+
+    if material is not None:
+        wanted = [material] if isinstance(material, str) else list(material)
+        materials = table['materials'].combine_chunks()
+        hits = pc.is_in(pc.list_flatten(materials), value_set=pc.cast(wanted, 'string'))
+        rows = pc.list_parent_indices(materials).filter(hits)
+        table = table.take(pc.unique(rows))
+
+    df = table.to_pandas()
+    if columns is not None:
+        df = df[columns]
+    return df.reset_index(drop=True)
+
+
+def compact_run_index(root: str) -> None:
+    """
+    Merge the per-run files of every partition below *root* into one file,
+    keeping only the latest row per entry. Runs indexed while compacting are
+    kept in their own files.
+    """
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    for partition in sorted(os.listdir(root)):
+        directory = os.path.join(root, partition)
+        if not partition.startswith(f'{_PARTITION}=') or not os.path.isdir(directory):
+            continue
+        files = [
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith('.parquet')
+        ]
+        if len(files) <= 1:
+            continue
+        table = _latest(
+            ds.dataset(files, format='parquet', schema=_schema()).to_table()
+        )
+        tmp = os.path.join(directory, f'.{uuid.uuid4().hex}.tmp')
+        pq.write_table(table.sort_by('start_time'), tmp)
+        os.replace(tmp, os.path.join(directory, f'part-{uuid.uuid4().hex}.parquet'))
+        for path in files:
+            _remove(path)
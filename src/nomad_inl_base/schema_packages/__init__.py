@@ -1,5 +1,50 @@
 from nomad.config.models.plugins import SchemaPackageEntryPoint
-from pydantic import Field
+from pydantic import BaseModel, Field
+
+
+# Options shared by several entry points (read with utils.plugin_option)
+class _FigureOptions(BaseModel):
+    binary_figures: bool = Field(
+        False,
+        description='Store Plotly figure arrays as base64 typed arrays '
+        '(float32 where precise enough) instead of decimal JSON lists.',
+    )
+
+
+class _SidecarOptions(BaseModel):
+    hdf5_sidecar: bool = Field(
+        False,
+        description='Write full-resolution time series to an HDF5 file in the '
+        'upload and keep only a decimated preview in the archive.',
+    )
+    preview_points: int = Field(
+        2000,
+        description='Approximate number of samples per time series kept in the '
+        'archive when hdf5_sidecar is enabled.',
+    )
+
+
+class _RunIndexOptions(BaseModel):
+    run_index_path: str | None = Field(
+        None,
+        description='Directory of the cross-run Parquet index of deposition runs '
+        '(see nomad_inl_base.run_index); each run writes its summary row there '
+        'during normalization. Disabled if unset.',
+    )
+
+
+class _ProfilingOptions(BaseModel):
+    profile_normalize: bool = Field(
+        False,
+        description='Log a "normalize performance" event per entry with the '
+        'searches, archive loads, raw file reads and figure sizes of its '
+        'normalization.',
+    )
+    normalize_diagnostics: bool = Field(
+        False,
+        description='With profile_normalize, also store the profile in the '
+        "entry's hidden normalize_diagnostics section.",
+    )
 
 
 class NewSchemaPackageEntryPoint(SchemaPackageEntryPoint):
@@ -17,7 +62,7 @@ schema_package_entry_point = NewSchemaPackageEntryPoint(
 )
 
 
-class StarPackageEntryPoint(SchemaPackageEntryPoint):
+class StarPackageEntryPoint(_ProfilingOptions, SchemaPackageEntryPoint):
     parameter: int = Field(0, description='Custom configuration parameter')
 
     def load(self):
@@ -60,7 +105,9 @@ wet_deposition_entry_point = WetDepositionPackageEntryPoint(
 )
 
 
-class INLCharacterizationPackageEntryPoint(SchemaPackageEntryPoint):
+class INLCharacterizationPackageEntryPoint(
+    _FigureOptions, _ProfilingOptions, SchemaPackageEntryPoint
+):
     def load(self):
         from nomad_inl_base.schema_packages.characterization import m_package
 
@@ -99,7 +146,21 @@ cleaning_entry_point = INLCleaningPackageEntryPoint(
 )
 
 
-class BatteriesPackageEntryPoint(SchemaPackageEntryPoint):
+class BatteriesPackageEntryPoint(
+    _FigureOptions,
+    _SidecarOptions,
+    _RunIndexOptions,
+    _ProfilingOptions,
+    SchemaPackageEntryPoint,
+):
+    trim_as_range: bool = Field(
+        False,
+        description='Record the trim of inactive time steps of a sputtering run as '
+        'an index range (time_index_start/time_index_stop) when the active steps '
+        'are contiguous, instead of copying every time series. The archive then '
+        'keeps the whole log.',
+    )
+
     def load(self):
         from nomad_inl_base.schema_packages.batteries import m_package
 
@@ -125,7 +186,9 @@ annealing_entry_point = INLAnnealingPackageEntryPoint(
 )
 
 
-class METEORPackageEntryPoint(SchemaPackageEntryPoint):
+class METEORPackageEntryPoint(
+    _FigureOptions, _SidecarOptions, _RunIndexOptions, SchemaPackageEntryPoint
+):
     def load(self):
         from nomad_inl_base.schema_packages.meteor import m_package
 
@@ -138,7 +201,9 @@ meteor_entry_point = METEORPackageEntryPoint(
 )
 
 
-class INLTestoPackageEntryPoint(SchemaPackageEntryPoint):
+class INLTestoPackageEntryPoint(
+    _FigureOptions, _SidecarOptions, _ProfilingOptions, SchemaPackageEntryPoint
+):
     def load(self):
         from nomad_inl_base.schema_packages.testo import m_package
 
@@ -6,12 +6,9 @@ if TYPE_CHECKING:
     from structlog.stdlib import BoundLogger
 
 import numpy as np
-import plotly.graph_objects as go
-import yaml
-from nomad.datamodel.context import ClientContext
 from nomad.datamodel.data import ArchiveSection, EntryData
 from nomad.datamodel.metainfo.annotations import ELNAnnotation
-from nomad.datamodel.metainfo.plot import PlotlyFigure, PlotSection
+from nomad.datamodel.metainfo.plot import PlotSection
 from nomad.metainfo import Datetime, MEnum, Quantity, SchemaPackage, Section, SubSection
 from nomad_material_processing.general import Annealing
 from nomad_material_processing.vapor_deposition.general import (
@@ -20,8 +17,8 @@ from nomad_material_processing.vapor_deposition.general import (
     Pressure,
     VolumetricFlowRate,
 )
-from plotly.subplots import make_subplots
 
+from nomad_inl_base.profiling import profiled_normalize
 from nomad_inl_base.schema_packages.entities import (
     INLSampleReference,
     INLSubstrateReference,
@@ -29,11 +26,36 @@ from nomad_inl_base.schema_packages.entities import (
     INLThinFilmReference,
     INLThinFilmStack,
     INLThinFilmStackReference,
+    NormalizeDiagnostics,
+)
+from nomad_inl_base.sidecar import offload_time_series, read_series
+from nomad_inl_base.utils import (
+    ArchiveBatch,
+    apply_time_index,
+    cached_figure,
+    change_points,
+    create_filename,
+    expand_change_points,
+    figure_digest,
+    find_samples,
+    get_hash_ref,
+    interval_integrals,
+    make_figure,
+    plugin_option,
+    segment_deltas,
+    segment_extrema,
+    segment_means,
+    segment_starts,
+    time_index,
+    time_index_range,
+    true_intervals,
+    yaml_write_back,
 )
-from nomad_inl_base.utils import create_archive, create_filename, get_hash_ref
 
 m_package = SchemaPackage()
 
+_ENTRY_POINT_ID = 'nomad_inl_base.schema_packages:batteries_entry_point'
+
 # Unit conversion constants
 _TORR_TO_PA = 133.322368  # 1 torr = 133.322368 Pa
 _SCCM_TO_M3S = 1.66667e-8  # 1 sccm = 1 cm³(STP)/min = 1e-6 m³ / 60 s
@@ -71,6 +93,13 @@ class SputteringGasFlow(GasFlow):
         description='MFC channel index (1, 2, or 3).',
         a_eln=ELNAnnotation(component='NumberEditQuantity'),
     )
+    gas_consumption = Quantity(
+        type=np.float64,
+        unit='m**3',
+        description='Gas volume (at standard conditions) delivered during the run, '
+        'integrated from the measured flow (auto-computed).',
+        a_eln=ELNAnnotation(defaultDisplayUnit='cm**3'),
+    )
 
     flow_rate = SubSection(section_def=SputteringVolumetricFlowRate)
 
@@ -112,7 +141,130 @@ class SputteringChamberEnvironment(ChamberEnvironment):
     )
 
 
-class SputteringSource(ArchiveSection):
+class StepSignal(ArchiveSection):
+    """
+    Change-point encoding of a piecewise-constant time series (phase labels,
+    shutter and activity flags, setpoints, event counters).
+
+    Only the time step at which each run of equal values starts and the value
+    of that run are stored; ``expand()`` rebuilds the per-time-step array.
+    """
+
+    m_def = Section(label='Step Signal')
+
+    name = Quantity(
+        type=str,
+        description='Name of the time series quantity of the parent section.',
+    )
+    dtype = Quantity(
+        type=str,
+        description='numpy dtype of the expanded array (e.g. "bool", "int64").',
+    )
+    n_points = Quantity(
+        type=int,
+        description='Number of time steps of the expanded array.',
+    )
+    change_index = Quantity(
+        type=np.dtype(np.int64),
+        shape=['*'],
+        description='Time step index at which each run starts (the first is 0).',
+    )
+    values = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='Value of each run of a numeric or boolean series.',
+    )
+    labels = Quantity(
+        type=str,
+        shape=['*'],
+        description='Value of each run of a string series.',
+    )
+
+    @classmethod
+    def from_array(cls, name: str, arr) -> 'StepSignal':
+        """Encode the per-time-step array *arr* of the quantity *name*."""
+        arr = np.asarray(arr)
+        change_index, runs = change_points(arr)
+        signal = cls(name=name, n_points=len(arr), change_index=change_index)
+        if arr.dtype.kind in 'OUS':
+            signal.dtype = 'str'
+            signal.labels = runs.astype(str)
+        else:
+            signal.dtype = arr.dtype.name
+            signal.values = runs.astype(np.float64)
+        return signal
+
+    def runs(self) -> np.ndarray:
+        """Value of each run, in the dtype of the expanded array."""
+        if self.dtype == 'str':
+            return np.asarray(self.labels if self.labels is not None else [], str)
+        runs = self.values if self.values is not None else np.zeros(0)
+        return np.asarray(runs).astype(self.dtype or np.float64)
+
+    def expand(self) -> np.ndarray:
+        """Full array with one value per time step."""
+        return expand_change_points(self.change_index, self.runs(), self.n_points)
+
+    def intervals(self) -> tuple[np.ndarray, np.ndarray]:
+        """``(starts, stops)`` time step indices of the runs with a true value."""
+        return true_intervals(self.change_index, self.runs(), self.n_points)
+
+    def window(self, rows: slice) -> 'StepSignal':
+        """The signal over the contiguous time steps *rows* only, as a new
+        section (the runs overlapping them, not the expanded array)."""
+        start, stop, _ = rows.indices(self.n_points)
+        stop = max(start, stop)
+        change_index = np.asarray(self.change_index, dtype=np.int64)
+        first = max(0, int(np.searchsorted(change_index, start, side='right')) - 1)
+        last = int(np.searchsorted(change_index, stop, side='left'))
+        runs = slice(first, max(first, last))
+        signal = StepSignal(
+            name=self.name,
+            dtype=self.dtype,
+            n_points=stop - start,
+            change_index=np.maximum(change_index[runs] - start, 0),
+        )
+        if self.dtype == 'str':
+            signal.labels = self.runs()[runs]
+        else:
+            signal.values = np.asarray(self.values)[runs]
+        return signal
+
+    def take_time_index(self, index) -> None:
+        """Keep only the time steps *index*, see ``apply_time_index``."""
+        arr = self.expand()[index]
+        self.n_points = len(arr)
+        self.change_index, runs = change_points(arr)
+        if self.dtype == 'str':
+            self.labels = runs
+        else:
+            self.values = runs.astype(np.float64)
+
+
+class StepSignalSeries(ArchiveSection):
+    """
+    Section with time series that the parsers may store change-point encoded
+    in ``step_signals`` rather than in the quantity itself.
+    """
+
+    def series(self, name: str) -> np.ndarray | None:
+        """
+        Per-time-step array of the time series quantity *name*, or ``None`` if
+        it was not recorded.
+
+        Works for series stored in the quantity *name* and for series stored
+        as a ``StepSignal`` in ``step_signals``, which are expanded here.
+        Values are magnitudes in the unit of the quantity. The array covers
+        the time steps in view (see ``time_index_range``) and is decimated
+        like ``timestamps`` if the entry was offloaded to an HDF5 sidecar.
+        """
+        value = _signal(self, name, _preview_stride(self))
+        if value is None:
+            return None
+        return value.magnitude if hasattr(value, 'magnitude') else np.asarray(value)
+
+
+class SputteringSource(StepSignalSeries):
     """Sputtering source (target + magnetron) time-series data."""
 
     m_def = Section(label='Sputtering Source')
@@ -147,12 +299,20 @@ class SputteringSource(ArchiveSection):
     active = Quantity(
         type=np.dtype(np.bool_),
         shape=['*'],
-        description='Whether this source is active (energised) at each time step.',
+        description=(
+            'Whether this source is active (energised) at each time step. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('active')``."
+        ),
     )
     shutter_open = Quantity(
         type=np.dtype(np.bool_),
         shape=['*'],
-        description='Whether the source shutter is open at each time step.',
+        description=(
+            'Whether the source shutter is open at each time step. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('shutter_open')``."
+        ),
     )
     deposition_rate = Quantity(
         type=np.dtype(np.float64),
@@ -176,8 +336,48 @@ class SputteringSource(ArchiveSection):
         a_eln=ELNAnnotation(defaultDisplayUnit='nm'),
     )
 
+    # --- Derived over the shutter-open intervals (auto-computed) ---
+    shutter_open_time = Quantity(
+        type=np.float64,
+        unit='s',
+        description='Total time the source shutter was open.',
+    )
+    delivered_energy = Quantity(
+        type=np.float64,
+        unit='J',
+        description='Energy delivered by the matched power supply while the shutter '
+        'was open (RF: forward minus reflected power; DC: output power).',
+        a_eln=ELNAnnotation(defaultDisplayUnit='kJ'),
+    )
+    mean_reflected_power_ratio = Quantity(
+        type=np.float64,
+        description='Reflected over forward RF energy while the shutter was open.',
+    )
+    integrated_thickness = Quantity(
+        type=np.float64,
+        unit='nm',
+        description='Thickness obtained by integrating the QCM rate while the '
+        'shutter was open.',
+    )
+    reported_thickness = Quantity(
+        type=np.float64,
+        unit='nm',
+        description='Increase of the QCM-reported thickness while the shutter was '
+        'open, for comparison with integrated_thickness.',
+    )
+    mean_deposition_rate = Quantity(
+        type=np.float64,
+        unit='nm/s',
+        description='Time-averaged QCM rate while the shutter was open.',
+    )
+    step_signals = SubSection(
+        section_def=StepSignal,
+        repeats=True,
+        description='Change-point encoded piecewise-constant time series.',
+    )
+
 
-class SputteringRFPowerSupply(ArchiveSection):
+class SputteringRFPowerSupply(StepSignalSeries):
     """RF power supply (PS1, PS3, or PS5) time-series data."""
 
     m_def = Section(label='RF Power Supply')
@@ -209,7 +409,11 @@ class SputteringRFPowerSupply(ArchiveSection):
         type=np.dtype(np.float64),
         shape=['*'],
         unit='W',
-        description='Requested RF power output setpoint as a time series.',
+        description=(
+            'Requested RF power output setpoint as a time series. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('output_setpoint')``."
+        ),
     )
     load_cap_position = Quantity(
         type=np.dtype(np.float64),
@@ -221,9 +425,14 @@ class SputteringRFPowerSupply(ArchiveSection):
         shape=['*'],
         description='Tune capacitor position (matching network) as a time series.',
     )
+    step_signals = SubSection(
+        section_def=StepSignal,
+        repeats=True,
+        description='Change-point encoded piecewise-constant time series.',
+    )
 
 
-class SputteringDCPowerSupply(ArchiveSection):
+class SputteringDCPowerSupply(StepSignalSeries):
     """DC pulsed power supply (PS4) time-series data."""
 
     m_def = Section(label='DC Pulsed Power Supply')
@@ -250,19 +459,31 @@ class SputteringDCPowerSupply(ArchiveSection):
         type=np.dtype(np.float64),
         shape=['*'],
         unit='W',
-        description='Requested power output setpoint as a time series.',
+        description=(
+            'Requested power output setpoint as a time series. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('output_setpoint')``."
+        ),
     )
     current_setpoint = Quantity(
         type=np.dtype(np.float64),
         shape=['*'],
         unit='A',
-        description='Requested current setpoint as a time series.',
+        description=(
+            'Requested current setpoint as a time series. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('current_setpoint')``."
+        ),
     )
     voltage_setpoint = Quantity(
         type=np.dtype(np.float64),
         shape=['*'],
         unit='V',
-        description='Requested voltage setpoint as a time series.',
+        description=(
+            'Requested voltage setpoint as a time series. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('voltage_setpoint')``."
+        ),
     )
     pulse_frequency = Quantity(
         type=np.dtype(np.float64),
@@ -273,12 +494,142 @@ class SputteringDCPowerSupply(ArchiveSection):
     arc_count = Quantity(
         type=np.dtype(np.int64),
         shape=['*'],
-        description='Cumulative arc (DC count) events as a time series.',
+        description=(
+            'Cumulative arc (DC count) events as a time series. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('arc_count')``."
+        ),
     )
     spark_count = Quantity(
         type=np.dtype(np.int64),
         shape=['*'],
-        description='Cumulative spark events as a time series.',
+        description=(
+            'Cumulative spark events as a time series. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('spark_count')``."
+        ),
+    )
+    step_signals = SubSection(
+        section_def=StepSignal,
+        repeats=True,
+        description='Change-point encoded piecewise-constant time series.',
+    )
+
+
+class SputteringSegment(ArchiveSection):
+    """
+    Summary statistics of one segment of a sputtering run, i.e. a stretch of
+    time steps with the same process phase, substrate shutter state and set
+    of active sources.
+    """
+
+    m_def = Section(label='Process Segment')
+
+    process_phase = Quantity(
+        type=str,
+        description='Process phase label during this segment.',
+    )
+    substrate_shutter_open = Quantity(
+        type=bool,
+        description='Whether the substrate shutter was open during this segment.',
+    )
+    active_sources = Quantity(
+        type=str,
+        description='Comma-separated indices of the sources active in this segment.',
+    )
+    start_time = Quantity(
+        type=np.float64,
+        unit='s',
+        description='Time of the first time step of the segment.',
+    )
+    duration = Quantity(
+        type=np.float64,
+        unit='s',
+        description='Time until the start of the next segment (or the last row).',
+    )
+    mean_pressure = Quantity(
+        type=np.float64,
+        unit='pascal',
+        description='Mean process (Capman) pressure.',
+        a_eln=ELNAnnotation(defaultDisplayUnit='mbar'),
+    )
+    min_pressure = Quantity(
+        type=np.float64,
+        unit='pascal',
+        description='Minimum process (Capman) pressure.',
+        a_eln=ELNAnnotation(defaultDisplayUnit='mbar'),
+    )
+    max_pressure = Quantity(
+        type=np.float64,
+        unit='pascal',
+        description='Maximum process (Capman) pressure.',
+        a_eln=ELNAnnotation(defaultDisplayUnit='mbar'),
+    )
+    mean_forward_power = Quantity(
+        type=np.float64,
+        unit='W',
+        description='Mean total forward power of the RF power supplies.',
+    )
+    mean_reflected_power = Quantity(
+        type=np.float64,
+        unit='W',
+        description='Mean total reflected power of the RF power supplies.',
+    )
+    mean_dc_bias = Quantity(
+        type=np.float64,
+        unit='V',
+        description='Mean DC self-bias of the RF supply delivering the most power.',
+    )
+    mean_deposition_rate = Quantity(
+        type=np.float64,
+        unit='nm/s',
+        description='Mean QCM deposition rate, summed over the sources.',
+    )
+    thickness_delta = Quantity(
+        type=np.float64,
+        unit='nm',
+        description='QCM thickness deposited during the segment, summed over sources.',
+    )
+    arc_count_delta = Quantity(
+        type=np.int64,
+        description='Number of PS4 arc events during the segment.',
+    )
+
+
+class ProcessAnomaly(ArchiveSection):
+    """
+    A flagged interval of a sputtering run (pressure excursion, arc burst or
+    high reflected RF power), see :mod:`nomad_inl_base.anomalies`.
+    """
+
+    m_def = Section(label='Process Anomaly')
+
+    kind = Quantity(
+        type=MEnum('pressure_excursion', 'arc_burst', 'reflected_power'),
+        description='Detector that flagged the interval.',
+    )
+    channel = Quantity(
+        type=str,
+        description='Signal the anomaly was found on (Capman, PS1/PS3/PS5, PS4).',
+    )
+    severity = Quantity(
+        type=MEnum('warning', 'critical'),
+        description='Highest severity reached within the interval.',
+    )
+    start_time = Quantity(
+        type=np.float64,
+        unit='s',
+        description='Time of the first flagged time step.',
+    )
+    end_time = Quantity(
+        type=np.float64,
+        unit='s',
+        description='Time of the last flagged time step.',
+    )
+    peak_value = Quantity(
+        type=np.float64,
+        description='Peak detector score: robust z-score of the pressure, arc and '
+        'spark events per window, or reflected/forward power ratio.',
     )
 
 
@@ -331,6 +682,208 @@ class PlotConfig(ArchiveSection):
         description='Add MFC gas-flow rows to the Pressure figure.',
         a_eln=ELNAnnotation(component='BoolEditQuantity'),
     )
+    refresh_figures_only = Quantity(
+        type=bool,
+        default=False,
+        description=(
+            'Only rebuild the figures on the next normalization. Trimming, scalar '
+            'computation, thin film/stack creation and the sample lookup are '
+            'skipped, so plot setting edits are cheap and free of side effects. '
+            'Switch off again to re-run the full normalization.'
+        ),
+        a_eln=ELNAnnotation(component='BoolEditQuantity'),
+    )
+
+
+def _append_figure(section, previous, label: str, inputs: tuple, build) -> None:
+    """Append the figure *label* to ``section.figures``.
+
+    The figure is reused from *previous* when it was built from the same
+    *inputs* (arrays and plot settings); otherwise ``build()`` is called to
+    create the ``go.Figure``.
+    """
+    digest = figure_digest(label, *inputs)
+    figure = cached_figure(previous, label, digest, _ENTRY_POINT_ID)
+    if figure is None:
+        figure = make_figure(label, build().to_plotly_json(), digest, _ENTRY_POINT_ID)
+    section.figures.append(figure)
+
+
+def _stacked_figure(ts_raw, rows, colours=None, overlays=()):
+    """One shared-x subplot row per ``(array, y_label, log_scale)`` in *rows*.
+
+    *overlays* are ``(t_start, t_end, colour)`` time ranges shaded across all
+    rows (flagged anomalies).
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    n_rows = len(rows)
+    fig = make_subplots(rows=n_rows, cols=1, shared_xaxes=True)
+    for x0, x1, colour in overlays:
+        fig.add_vrect(
+            x0=x0,
+            x1=x1,
+            fillcolor=colour,
+            opacity=0.2,
+            line_width=0,
+            layer='below',
+            row='all',
+            col=1,
+        )
+    for r_i, (arr, lbl, log_scale) in enumerate(rows, start=1):
+        line = dict(color=colours[(r_i - 1) % len(colours)]) if colours else None
+        fig.add_trace(
+            go.Scatter(x=ts_raw, y=arr, name=lbl, showlegend=False, line=line),
+            row=r_i,
+            col=1,
+        )
+        fig.update_yaxes(title_text=lbl, row=r_i, col=1)
+        if log_scale:
+            fig.update_yaxes(type='log', row=r_i, col=1)
+    fig.update_xaxes(title_text='Time (s)', row=n_rows, col=1)
+    fig.update_layout(
+        template='plotly_white',
+        height=max(300, 200 * n_rows),
+        showlegend=False,
+    )
+    return fig
+
+
+def _temperature_figure(ts_raw, rows, height: int):
+    """Overlay of ``(array_celsius, name, visible)`` temperature traces."""
+    import plotly.graph_objects as go
+
+    fig = go.Figure(
+        data=[
+            go.Scatter(x=ts_raw, y=arr, name=label, visible=visible)
+            for arr, label, visible in rows
+        ]
+    )
+    fig.update_layout(
+        template='plotly_white',
+        height=height,
+        xaxis_title='Time (s)',
+        yaxis_title='Temperature (°C)',
+        showlegend=True,
+    )
+    return fig
+
+
+def _full_series(section, archive: 'EntryArchive', path: str, value):
+    """Full-resolution magnitude of the time series at *path*.
+
+    Read lazily from the HDF5 sidecar if the entry was offloaded (the
+    in-archive array is then only a preview), otherwise taken from *value*.
+    Only the rows in view are returned, see ``time_index_range``.
+    """
+    rows = time_index_range(section)
+    if section.hdf5_file and archive is not None:
+        data = read_series(archive, section.hdf5_file, path, rows)
+        if data is not None:
+            return data
+    if value is None:
+        return None
+    value = value.magnitude if hasattr(value, 'magnitude') else np.asarray(value)
+    return value[rows]
+
+
+def _full_series_of_length(section, archive: 'EntryArchive', path: str, value, n: int):
+    """:func:`_full_series`, or ``None`` unless it has *n* samples (one per
+    timestamp)."""
+    arr = _full_series(section, archive, path, value)
+    return arr if arr is not None and len(arr) == n else None
+
+
+def _offload_time_series(
+    section, archive: 'EntryArchive', logger: 'BoundLogger'
+) -> None:
+    """Move the entry's time series to an HDF5 sidecar (opt-in, see
+    :mod:`nomad_inl_base.sidecar`), keeping a decimated preview in the archive."""
+    if section.hdf5_file or section.timestamps is None:
+        return
+    offload_time_series(
+        archive,
+        section,
+        len(section.timestamps),
+        archive.metadata.mainfile.rsplit('.', maxsplit=1)[0],
+        _ENTRY_POINT_ID,
+        logger,
+    )
+
+
+def _matched_supply(entry, src):
+    """``(supply, path)`` of the power supply wired to the source *src*.
+
+    DC-pulsed sources run on PS4; RF sources 1-2 on PS1 and 3-4 on PS3.
+    *path* is the section path of the supply (for sidecar reads); both are
+    ``None`` if the supply was not logged.
+    """
+    ps_type = (src.power_supply_type or '').upper()
+    if 'DC' in ps_type or 'PULSED' in ps_type:
+        if entry.dc_power_supply is None:
+            return None, None
+        return entry.dc_power_supply, 'dc_power_supply/'
+    _SOURCES_ON_PS1 = 2
+    rf_idx = 1 if (src.source_index or 0) <= _SOURCES_ON_PS1 else 3
+    for i, ps in enumerate(entry.rf_power_supplies or []):
+        if ps.supply_index == rf_idx:
+            return ps, f'rf_power_supplies/{i}/'
+    return None, None
+
+
+def _intervals(section, name: str, n: int):
+    """``(starts, stops)`` of the time steps where the flag *name* is true, or
+    ``None`` if *section* has no such series of length *n*."""
+    signal = _step_signal(section, name)
+    if signal is not None:
+        return signal.intervals() if signal.n_points == n else None
+    arr = _signal(section, name)
+    if arr is None or len(arr) != n:
+        return None
+    return true_intervals(*change_points(np.asarray(arr)), n)
+
+
+def _nansum_rows(rows: np.ndarray) -> np.ndarray:
+    """Column sums of *rows* ignoring NaNs; NaN where a column is all NaN."""
+    all_nan = np.all(np.isnan(rows), axis=0)
+    return np.where(all_nan, np.nan, np.nansum(rows, axis=0))
+
+
+def _step_signal(section, name: str) -> StepSignal | None:
+    """The change-point encoding of *name* in ``section.step_signals``, if any,
+    over the time steps in view (see ``time_index_range``)."""
+    signal = next((s for s in section.step_signals if s.name == name), None)
+    rows = time_index_range(section)
+    if signal is None or rows == slice(None):
+        return signal
+    return signal.window(rows)
+
+
+def _preview_stride(section) -> int:
+    """``preview_stride`` of the entry containing *section* (1 unless it was
+    offloaded to an HDF5 sidecar)."""
+    while section is not None:
+        stride = getattr(section, 'preview_stride', None)
+        if stride:
+            return int(stride)
+        section = section.m_parent
+    return 1
+
+
+def _signal(section, name: str, stride: int = 1):
+    """Per-time-step array of the quantity *name* of *section*, over the time
+    steps in view (see ``time_index_range``).
+
+    Series stored by the parser as a ``StepSignal`` in ``step_signals`` are
+    expanded on demand; *stride* decimates the expansion to match the preview
+    of an entry offloaded to an HDF5 sidecar (``preview_stride``).
+    """
+    value = getattr(section, name, None)
+    if value is not None:
+        return value[time_index_range(section)]
+    signal = _step_signal(section, name)
+    return None if signal is None else signal.expand()[:: max(1, stride)]
 
 
 def _resolve_or_create_sample_stack(
@@ -339,6 +892,7 @@ def _resolve_or_create_sample_stack(
     sample_name,
     data_file: str,
     new_film_ref=None,
+    batch: ArchiveBatch | None = None,
 ):
     """
     Search the current upload for an existing INL sample (substrate, thin film
@@ -357,6 +911,10 @@ def _resolve_or_create_sample_stack(
       create a brand-new ``INLThinFilmStack`` (no substrate) named after
       ``sample_name``, with ``new_film_ref`` (if given) as its first layer.
 
+    New stacks are added to *batch*, to be written together with the run's
+    other entries when the caller commits it; without a batch they are
+    written right away.
+
     Returns a ``(INLSampleReference, is_stack)`` tuple, where ``is_stack`` is
     ``True`` iff the reference target is an actual ``INLThinFilmStack`` entry
     (as opposed to a matched ``INLSampleFragment`` linked as-is). Returns
@@ -365,28 +923,39 @@ def _resolve_or_create_sample_stack(
     if not sample_name:
         return None, False
 
-    filetype = 'yaml'
+    own_batch = batch is None
+    if own_batch:
+        batch = ArchiveBatch(archive.m_context, logger)
+
+    def add_stack(new_stack):
+        new_stack.name = sample_name
+        if new_film_ref:
+            new_stack.layers.append(INLThinFilmReference(reference=new_film_ref))
+        stack_filename, stack_archive = create_filename(
+            f'{data_file}_{sample_name}_sample',
+            new_stack,
+            'ThinFilmStack',
+            archive,
+            logger,
+        )
+        if batch.exists(stack_filename):
+            stack_ref = get_hash_ref(archive.m_context.upload_id, stack_filename)
+        else:
+            stack_ref = batch.add(stack_archive.m_to_dict(), stack_filename, 'yaml')
+        if own_batch:
+            batch.commit()
+        return INLSampleReference(reference=stack_ref, name=sample_name), True
+
     match = None
 
-    if not isinstance(archive.m_context, ClientContext):
-        from nomad.search import search
-
-        search_result = search(
-            owner='visible',
-            query={
-                'upload_id': archive.m_context.upload_id,
-                'entry_type': ['INLSubstrate', 'INLThinFilmStack', 'INLSampleFragment'],
-                'results.eln.names': sample_name,
-            },
-            user_id=archive.metadata.main_author.user_id,
-        )
-        if search_result.pagination.total > 0:
-            match = search_result.data[0]
-            if search_result.pagination.total > 1:
-                logger.warning(
-                    f'Found {search_result.pagination.total} samples named '
-                    f'"{sample_name}" in this upload. Using the first one found.'
-                )
+    matches = find_samples(archive, sample_name)
+    if matches:
+        match = matches[0]
+        if len(matches) > 1:
+            logger.warning(
+                f'Found {len(matches)} samples named "{sample_name}" in this '
+                'upload. Using the first one found.'
+            )
 
     if match is not None:
         entry_id = match['entry_id']
@@ -396,48 +965,21 @@ def _resolve_or_create_sample_stack(
 
         if entry_type == 'INLThinFilmStack':
             stack_path = match.get('mainfile')
-            if new_film_ref and stack_path and archive.m_context.raw_path_exists(stack_path):
-                with archive.m_context.raw_file(stack_path, 'r') as _f:
-                    stack_dict = yaml.safe_load(_f) or {}
-                stack_data = stack_dict.setdefault('data', {})
-                layers = stack_data.get('layers') or []
-                layers.append({'reference': new_film_ref})
-                stack_data['layers'] = layers
-                with archive.m_context.raw_file(stack_path, 'w') as _f:
-                    yaml.dump(stack_dict, _f)
-                archive.m_context.upload.process_updated_raw_file(
-                    stack_path, allow_modify=True
-                )
-                logger.info(
-                    f'Appended new thin film layer to existing sample '
-                    f'"{sample_name}" ({stack_path!r}).'
-                )
+            if new_film_ref and stack_path:
+                # Flushed at the end of the caller's batch, if any
+                with yaml_write_back(archive.m_context).batch(logger) as write_back:
+                    write_back.append(
+                        stack_path,
+                        'layers',
+                        {'reference': new_film_ref},
+                        unique=('reference',),
+                    )
             return INLSampleReference(reference=match_ref, name=sample_name), True
 
         if entry_type == 'INLSubstrate':
-            new_stack = INLThinFilmStack()
-            new_stack.name = sample_name
-            new_stack.substrate = INLSubstrateReference(reference=match_ref)
-            if new_film_ref:
-                new_stack.layers.append(INLThinFilmReference(reference=new_film_ref))
-            stack_filename, stack_archive = create_filename(
-                f'{data_file}_{sample_name}_sample',
-                new_stack,
-                'ThinFilmStack',
-                archive,
-                logger,
+            return add_stack(
+                INLThinFilmStack(substrate=INLSubstrateReference(reference=match_ref))
             )
-            if not archive.m_context.raw_path_exists(stack_filename):
-                stack_ref = create_archive(
-                    stack_archive.m_to_dict(),
-                    archive.m_context,
-                    stack_filename,
-                    filetype,
-                    logger,
-                )
-            else:
-                stack_ref = get_hash_ref(archive.m_context.upload_id, stack_filename)
-            return INLSampleReference(reference=stack_ref, name=sample_name), True
 
         # INLSampleFragment: cannot append a layer to a fragment.
         logger.warning(
@@ -447,29 +989,17 @@ def _resolve_or_create_sample_stack(
         return INLSampleReference(reference=match_ref, name=sample_name), False
 
     # --- No match: create a brand-new stack ---
-    new_stack = INLThinFilmStack()
-    new_stack.name = sample_name
-    if new_film_ref:
-        new_stack.layers.append(INLThinFilmReference(reference=new_film_ref))
-    stack_filename, stack_archive = create_filename(
-        f'{data_file}_{sample_name}_sample', new_stack, 'ThinFilmStack', archive, logger
-    )
-    if not archive.m_context.raw_path_exists(stack_filename):
-        stack_ref = create_archive(
-            stack_archive.m_to_dict(), archive.m_context, stack_filename, filetype, logger
-        )
-    else:
-        stack_ref = get_hash_ref(archive.m_context.upload_id, stack_filename)
-    return INLSampleReference(reference=stack_ref, name=sample_name), True
+    return add_stack(INLThinFilmStack())
 
 
-class BatteryChamberSputteringDeposition(PlotSection, EntryData):
+class BatteryChamberSputteringDeposition(PlotSection, EntryData, StepSignalSeries):
     """
     Base class for parsed log entries from INL Battery Chamber sputtering systems
     (PC03 CathodeChamber, PC04 ElectrolyteChamber, …).
 
-    Subclasses override only ``m_def`` to supply the correct label; all quantities,
-    subsections, and normalisation logic are inherited from here.
+    Subclasses override only ``m_def`` to supply the correct label and
+    ``_CHAMBER``; all quantities, subsections, and normalisation logic are
+    inherited from here.
     All time-series columns are stored as NumPy arrays sampled at ~1 Hz.
 
     Sample auto-linking: if the log filename follows the convention
@@ -485,6 +1015,9 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
     stack creation below.
     """
 
+    # Chamber partition of the cross-run index (see nomad_inl_base.run_index)
+    _CHAMBER = None
+
     # --- Metadata (scalar, auto-populated from file header) ---
     recording_name = Quantity(
         type=str,
@@ -531,6 +1064,41 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
         a_eln=ELNAnnotation(component='StringEditQuantity'),
     )
 
+    anomalies_detected = Quantity(
+        type=bool,
+        description=(
+            'Whether ``anomalies`` holds the result of the anomaly detectors, run '
+            'by the parser while reading the log or by the first normalization. '
+            'Normalization only runs them if not, so a clean run is not scanned '
+            'again.'
+        ),
+    )
+    hdf5_file = Quantity(
+        type=str,
+        description=(
+            'Upload path of the HDF5 sidecar holding the full-resolution time '
+            'series (opt-in, ``hdf5_sidecar`` plugin option). When set, the arrays '
+            'in this entry are decimated previews (every ``preview_stride``-th '
+            'sample); scalars are computed from the sidecar.'
+        ),
+    )
+    preview_stride = Quantity(
+        type=np.int64,
+        description='Decimation stride of the in-archive time series previews.',
+    )
+    time_index_start = Quantity(
+        type=np.int64,
+        description=(
+            'First time step kept by the trim of inactive time steps when it is '
+            'recorded as an index range (``trim_as_range`` plugin option) '
+            'instead of applied to the arrays, which then hold the whole log.'
+        ),
+    )
+    time_index_stop = Quantity(
+        type=np.int64,
+        description='End (exclusive) of the time steps kept, see ``time_index_start``.',
+    )
+
     # --- User-set reference fields ---
     substrate = SubSection(
         section_def=INLSubstrateReference,
@@ -569,7 +1137,11 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
     process_phase = Quantity(
         type=str,
         shape=['*'],
-        description='Process phase name (string label) at each time step.',
+        description=(
+            'Process phase name (string label) at each time step. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('process_phase')``."
+        ),
     )
     process_time = Quantity(
         type=np.dtype(np.float64),
@@ -582,7 +1154,11 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
     substrate_shutter_open = Quantity(
         type=np.dtype(np.bool_),
         shape=['*'],
-        description='Whether the substrate shutter is open at each time step.',
+        description=(
+            'Whether the substrate shutter is open at each time step. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('substrate_shutter_open')``."
+        ),
     )
 
     # --- Substrate heater ---
@@ -604,7 +1180,11 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
         type=np.dtype(np.float64),
         shape=['*'],
         unit='kelvin',
-        description='Substrate heater temperature setpoint as a time series.',
+        description=(
+            'Substrate heater temperature setpoint as a time series. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('substrate_temperature_setpoint')``."
+        ),
         a_eln=ELNAnnotation(defaultDisplayUnit='celsius'),
     )
     substrate_heater_current = Quantity(
@@ -627,7 +1207,11 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
     substrate_bias_active = Quantity(
         type=np.dtype(np.bool_),
         shape=['*'],
-        description='Whether substrate bias is active at each time step.',
+        description=(
+            'Whether substrate bias is active at each time step. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('substrate_bias_active')``."
+        ),
     )
     substrate_bias_voltage = Quantity(
         type=np.dtype(np.float64),
@@ -711,19 +1295,103 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
         section_def=SputteringDCPowerSupply,
         description='DC pulsed power supply (PS4).',
     )
+    anomalies = SubSection(
+        section_def=ProcessAnomaly,
+        repeats=True,
+        description='Flagged pressure excursions, arc bursts and reflected-power '
+        'intervals, shaded in the pressure and source figures.',
+    )
+    segments = SubSection(
+        section_def=SputteringSegment,
+        repeats=True,
+        description=(
+            'Per-segment summary statistics, split at every change of process '
+            'phase, substrate shutter state or active sources.'
+        ),
+    )
+    step_signals = SubSection(
+        section_def=StepSignal,
+        repeats=True,
+        description='Change-point encoded piecewise-constant time series.',
+    )
 
     plot_config = SubSection(
         section_def=PlotConfig,
         description='Controls which figures are generated during normalization.',
     )
 
+    normalize_diagnostics = SubSection(
+        section_def=NormalizeDiagnostics,
+        description='Profile of the last normalization (opt-in, see the '
+        '``profile_normalize`` plugin option).',
+    )
+
+    @profiled_normalize(_ENTRY_POINT_ID)
     def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
         super().normalize(archive, logger)
-        self._trim_inactive()
-        self._compute_scalars()
+        if self.plot_config is not None and self.plot_config.refresh_figures_only:
+            self._build_figures()
+            return
+        if not self.hdf5_file:
+            # Offloaded entries were trimmed before their series were moved
+            self._trim_inactive()
+        self._compute_scalars(archive)
+        self._compute_segments(archive)
+        self._detect_anomalies(archive)
+        _offload_time_series(self, archive, logger)
         self._build_figures()
-        thin_film_ref, data_file = self._create_thin_film(archive, logger)
-        self._resolve_sample_from_filename(archive, logger, thin_film_ref, data_file)
+        # The film and all stacks are written and processed together; stack
+        # layers are written back once they exist
+        with yaml_write_back(archive.m_context).batch(logger):
+            batch = ArchiveBatch(archive.m_context, logger)
+            thin_film_ref, data_file = self._create_thin_film(archive, logger, batch)
+            self._resolve_sample_from_filename(
+                archive, logger, thin_film_ref, data_file, batch
+            )
+            batch.commit()
+        self._index_run(archive, logger)
+
+    def _index_run(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
+        """Write the run's scalar summary to the cross-run Parquet index
+        (opt-in, see :mod:`nomad_inl_base.run_index`)."""
+        from nomad_inl_base.run_index import index_run
+
+        if self._CHAMBER is None:
+            return
+
+        def magnitude(value, unit):
+            return None if value is None else float(value.to(unit).magnitude)
+
+        def total(values):
+            values = [v for v in values if v is not None]
+            return float(np.sum(values)) if values else None
+
+        sources = list(self.sources or [])
+        segments = list(self.segments or [])
+        arcs = [s.arc_count_delta for s in segments if s.arc_count_delta is not None]
+        row = {
+            'entry_type': type(self).__name__,
+            'start_time': self.start_datetime,
+            'operator': self.operator,
+            'sample_name': self.sample_name,
+            'materials': list(
+                dict.fromkeys(s.material.strip() for s in sources if s.material)
+            ),
+            'base_pressure': magnitude(self.base_pressure, 'Pa'),
+            'deposition_time': magnitude(self.deposition_time, 's'),
+            'duration': total(magnitude(s.duration, 's') for s in segments),
+            'delivered_energy': total(
+                magnitude(s.delivered_energy, 'J') for s in sources
+            ),
+            'thickness': total(magnitude(s.reported_thickness, 'nm') for s in sources),
+            'arc_count': int(np.sum(arcs)) if arcs else None,
+            'anomaly_count': len(self.anomalies),
+            'critical_anomaly_count': sum(
+                a.severity == 'critical' for a in self.anomalies
+            ),
+            'hdf5_file': self.hdf5_file,
+        }
+        index_run(archive, self._CHAMBER, row, _ENTRY_POINT_ID, logger)
 
     def _resolve_sample_from_filename(
         self,
@@ -731,23 +1399,32 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
         logger: 'BoundLogger',
         thin_film_ref,
         data_file: str,
+        batch: ArchiveBatch,
     ) -> None:
         """Link/create a sample entry named after ``self.sample_name`` and add it
         to ``samples`` (skips if a sample with that name is already listed, so
-        reprocessing doesn't append duplicates)."""
+        reprocessing doesn't append duplicates). A new stack is added to
+        *batch*."""
         if not self.sample_name:
             return
         if any(ref.name == self.sample_name for ref in self.samples):
             return
         sample_ref, _is_stack = _resolve_or_create_sample_stack(
-            archive, logger, self.sample_name, data_file, thin_film_ref
+            archive, logger, self.sample_name, data_file, thin_film_ref, batch
         )
         if sample_ref is not None:
             self.samples.append(sample_ref)
 
     def _trim_inactive(self) -> None:
-        """Remove time steps where all sources are inactive (silently, no logging)."""
-        if not self.sources:
+        """Remove time steps where all sources are inactive (silently, no logging).
+
+        Every time series of the entry (including those in subsections) whose
+        length matches ``timestamps`` is trimmed, see ``apply_time_index``.
+        With the ``trim_as_range`` plugin option, a contiguous run of active
+        time steps is only recorded as ``time_index_start``/``time_index_stop``
+        and no array is copied.
+        """
+        if not self.sources or self.time_index_stop is not None:
             return
 
         # Build mask: True at each timestep where at least one source is active
@@ -757,118 +1434,370 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
 
         mask = np.zeros(n, dtype=bool)
         for src in self.sources:
-            if src.active is not None and len(src.active) == n:
-                mask |= src.active.astype(bool)
+            active = _signal(src, 'active')
+            if active is not None and len(active) == n:
+                mask |= np.asarray(active).astype(bool)
 
         # If nothing is active at all, skip trimming
         if not np.any(mask):
             return
 
-        def trim(arr):
-            if arr is None:
-                return None
-            if isinstance(arr, np.ndarray) and len(arr) == n:
-                return arr[mask]
-            return arr
-
-        # --- Top-level arrays ---
-        self.timestamps = trim(self.timestamps)
-        self.process_time = trim(self.process_time)
-        self.substrate_shutter_open = trim(self.substrate_shutter_open)
-        self.substrate_temperature = trim(self.substrate_temperature)
-        self.substrate_temperature_2 = trim(self.substrate_temperature_2)
-        self.substrate_temperature_setpoint = trim(self.substrate_temperature_setpoint)
-        self.substrate_heater_current = trim(self.substrate_heater_current)
-        self.substrate_rotation_speed = trim(self.substrate_rotation_speed)
-        self.substrate_bias_active = trim(self.substrate_bias_active)
-        self.substrate_bias_voltage = trim(self.substrate_bias_voltage)
-        self.substrate_bias_current = trim(self.substrate_bias_current)
-        self.substrate_bias_power = trim(self.substrate_bias_power)
-        for i in range(1, 7):
-            attr = f'tc{i}_temperature'
-            setattr(self, attr, trim(getattr(self, attr)))
-        # process_phase is a string array — trim manually
-        if self.process_phase is not None and len(self.process_phase) == n:
-            self.process_phase = self.process_phase[mask]
-
-        # --- Chamber environment ---
-        env = self.chamber_environment
-        if env is not None:
-            for p_attr in (
-                'pressure',
-                'ion_gauge_pressure',
-                'wide_range_gauge_pressure',
-                'roughing_pressure',
-            ):
-                p = getattr(env, p_attr, None)
-                if p is not None:
-                    p.value = trim(p.value)
-                    p.set_value = trim(p.set_value)
-            for gf in env.gas_flow or []:
-                if gf.flow_rate is not None:
-                    gf.flow_rate.value = trim(gf.flow_rate.value)
-                    gf.flow_rate.set_value = trim(gf.flow_rate.set_value)
-
-        # --- Sources ---
-        for src in self.sources or []:
-            src.active = trim(src.active)
-            src.shutter_open = trim(src.shutter_open)
-            src.deposition_rate = trim(src.deposition_rate)
-            src.thickness = trim(src.thickness)
-            src.accumulated_thickness = trim(src.accumulated_thickness)
-
-        # --- RF power supplies ---
-        for ps in self.rf_power_supplies or []:
-            ps.forward_power = trim(ps.forward_power)
-            ps.reflected_power = trim(ps.reflected_power)
-            ps.dc_bias = trim(ps.dc_bias)
-            ps.output_setpoint = trim(ps.output_setpoint)
-            ps.load_cap_position = trim(ps.load_cap_position)
-            ps.tune_cap_position = trim(ps.tune_cap_position)
-
-        # --- DC power supply ---
-        ps4 = self.dc_power_supply
-        if ps4 is not None:
-            ps4.current = trim(ps4.current)
-            ps4.voltage = trim(ps4.voltage)
-            ps4.power = trim(ps4.power)
-            ps4.output_setpoint = trim(ps4.output_setpoint)
-            ps4.current_setpoint = trim(ps4.current_setpoint)
-            ps4.voltage_setpoint = trim(ps4.voltage_setpoint)
-            ps4.pulse_frequency = trim(ps4.pulse_frequency)
-            ps4.arc_count = trim(ps4.arc_count)
-            ps4.spark_count = trim(ps4.spark_count)
+        index = time_index(mask, n)
+        view = isinstance(index, slice) and plugin_option(
+            _ENTRY_POINT_ID, 'trim_as_range', False
+        )
+        apply_time_index(self, n, index, view=view)
 
         # Re-zero timestamps so x-axis always starts at 0 after trimming
         if self.timestamps is not None and len(self.timestamps) > 0:
-            t0 = self.timestamps[0]
+            t0 = self.timestamps[time_index_range(self)][0]
             self.timestamps = self.timestamps - t0
 
-    def _compute_scalars(self) -> None:
-        """Recompute base_pressure from trimmed ion gauge data and compute deposition_time."""
+    def _compute_scalars(self, archive: 'EntryArchive' = None) -> None:
+        """Recompute base_pressure from trimmed ion gauge data, compute
+        deposition_time and the per-source/per-MFC throughput metrics.
+
+        Uses the full-resolution series from the HDF5 sidecar when the entry
+        was offloaded (``archive`` is needed to read it).
+        """
         env = self.chamber_environment
         if env is not None and env.ion_gauge_pressure is not None:
-            arr = env.ion_gauge_pressure.value
-            if arr is not None and len(arr) > 0:
-                raw = arr.magnitude if hasattr(arr, 'magnitude') else np.asarray(arr)
+            raw = _full_series(
+                self,
+                archive,
+                'chamber_environment/ion_gauge_pressure/value',
+                env.ion_gauge_pressure.value,
+            )
+            if raw is not None and len(raw) > 0:
                 valid = raw[~np.isnan(raw)]
                 if len(valid) > 0:
                     self.base_pressure = float(np.min(valid))
 
-        ts = self.timestamps
-        shutter = self.substrate_shutter_open
-        if (
-            ts is not None
-            and shutter is not None
-            and len(ts) > 1
-            and len(shutter) == len(ts)
-        ):
-            ts_raw = ts.magnitude if hasattr(ts, 'magnitude') else np.asarray(ts)
-            dt = np.diff(ts_raw)
-            self.deposition_time = float(np.sum(dt[shutter[:-1].astype(bool)]))
+        ts_raw = _full_series(self, archive, 'timestamps', self.timestamps)
+        if ts_raw is None or len(ts_raw) <= 1:
+            return
+        n = len(ts_raw)
+        if _step_signal(self, 'substrate_shutter_open') is not None:
+            # Shutter-open time straight from the open intervals
+            shutter_open = _intervals(self, 'substrate_shutter_open', n)
+            if shutter_open is not None:
+                self.deposition_time = float(
+                    np.sum(interval_integrals(np.ones(n), ts_raw, *shutter_open))
+                )
+        else:
+            shutter = _full_series(
+                self, archive, 'substrate_shutter_open', self.substrate_shutter_open
+            )
+            if shutter is not None and len(shutter) == n:
+                dt = np.diff(ts_raw)
+                self.deposition_time = float(np.sum(dt[shutter[:-1].astype(bool)]))
+
+        self._compute_throughput(archive, ts_raw)
+
+    def _compute_throughput(self, archive: 'EntryArchive', ts_raw) -> None:
+        """Per-source energy, reflected-power ratio, thickness and rate over the
+        source's shutter-open intervals, and per-MFC gas consumption over the
+        run. Each is one cumulative-sum integration of the full series."""
+        n = len(ts_raw)
+
+        def integral(values, starts, stops):
+            return float(np.sum(interval_integrals(values, ts_raw, starts, stops)))
+
+        for i, src in enumerate(self.sources):
+            shutter_open = _intervals(src, 'shutter_open', n)
+            if shutter_open is None:
+                continue
+            starts, stops = shutter_open
+            open_time = integral(np.ones(n), starts, stops)
+            src.shutter_open_time = open_time
+
+            supply, prefix = _matched_supply(self, src)
+            if isinstance(supply, SputteringDCPowerSupply):
+                power = _full_series_of_length(
+                    self, archive, prefix + 'power', supply.power, n
+                )
+                if power is not None:
+                    src.delivered_energy = integral(power, starts, stops)
+            elif supply is not None:
+                fwd = _full_series_of_length(
+                    self, archive, prefix + 'forward_power', supply.forward_power, n
+                )
+                rfl = _full_series_of_length(
+                    self, archive, prefix + 'reflected_power', supply.reflected_power, n
+                )
+                if fwd is not None:
+                    fwd_energy = integral(fwd, starts, stops)
+                    rfl_energy = 0.0 if rfl is None else integral(rfl, starts, stops)
+                    src.delivered_energy = fwd_energy - rfl_energy
+                    if rfl is not None and fwd_energy > 0:
+                        src.mean_reflected_power_ratio = rfl_energy / fwd_energy
+
+            rate = _full_series_of_length(
+                self, archive, f'sources/{i}/deposition_rate', src.deposition_rate, n
+            )
+            if rate is not None:
+                grown = integral(rate, starts, stops)
+                src.integrated_thickness = grown
+                if open_time > 0:
+                    src.mean_deposition_rate = grown / open_time
+            thickness = _full_series_of_length(
+                self, archive, f'sources/{i}/thickness', src.thickness, n
+            )
+            if thickness is not None and len(starts) > 0:
+                ends = np.minimum(stops, n - 1)
+                src.reported_thickness = float(
+                    np.nansum(thickness[ends] - thickness[starts])
+                )
+
+        env = self.chamber_environment
+        for i, gf in enumerate(env.gas_flow if env is not None else []):
+            if gf.flow_rate is None:
+                continue
+            flow = _full_series_of_length(
+                self,
+                archive,
+                f'chamber_environment/gas_flow/{i}/flow_rate/value',
+                gf.flow_rate.value,
+                n,
+            )
+            if flow is not None:
+                gf.gas_consumption = integral(flow, [0], [n])
+
+    def _compute_segments(self, archive: 'EntryArchive' = None) -> None:
+        """Split the run at every change of process phase, substrate shutter or
+        source ``active`` flag and store per-segment statistics in ``segments``.
+
+        All statistics are computed with one ``reduceat`` pass per series over
+        the full-resolution data.
+        """
+        self.segments = []
+        ts_raw = _full_series(self, archive, 'timestamps', self.timestamps)
+        if ts_raw is None or len(ts_raw) == 0:
+            return
+        n = len(ts_raw)
+
+        def change_index(section, name):
+            signal = _step_signal(section, name)
+            if signal is not None:
+                return signal.change_index if signal.n_points == n else None
+            arr = _signal(section, name)
+            return change_points(arr)[0] if arr is not None and len(arr) == n else None
+
+        keyed = [(self, 'process_phase'), (self, 'substrate_shutter_open')]
+        keyed += [(src, 'active') for src in self.sources]
+        cuts = [change_index(sec, name) for sec, name in keyed]
+        starts = segment_starts(n, *[c for c in cuts if c is not None])
+        stops = np.append(starts[1:], n - 1)
+
+        def at_starts(section, name):
+            arr = _signal(section, name)
+            if arr is None or len(arr) != n:
+                return None
+            return np.asarray(arr.magnitude if hasattr(arr, 'magnitude') else arr)[
+                starts
+            ]
+
+        phases = at_starts(self, 'process_phase')
+        shutter = at_starts(self, 'substrate_shutter_open')
+        active = {src.source_index: at_starts(src, 'active') for src in self.sources}
+
+        env = self.chamber_environment
+        pressure = None
+        if env is not None and env.pressure is not None:
+            pressure = _full_series_of_length(
+                self,
+                archive,
+                'chamber_environment/pressure/value',
+                env.pressure.value,
+                n,
+            )
+        p_mean = p_min = p_max = None
+        if pressure is not None:
+            p_mean = segment_means(pressure, starts)
+            p_min, p_max = segment_extrema(pressure, starts)
+
+        # RF supplies: total forward/reflected power, DC bias of the supply
+        # delivering the most forward power in each segment.
+        fwd_means, rfl_means, bias_means = [], [], []
+        for i, ps in enumerate(self.rf_power_supplies):
+            prefix = f'rf_power_supplies/{i}/'
+            fwd = _full_series_of_length(
+                self, archive, prefix + 'forward_power', ps.forward_power, n
+            )
+            if fwd is None:
+                continue
+            fwd_means.append(segment_means(fwd, starts))
+            rfl = _full_series_of_length(
+                self, archive, prefix + 'reflected_power', ps.reflected_power, n
+            )
+            bias = _full_series_of_length(
+                self, archive, prefix + 'dc_bias', ps.dc_bias, n
+            )
+            nan = np.full(len(starts), np.nan)
+            rfl_means.append(nan if rfl is None else segment_means(rfl, starts))
+            bias_means.append(nan if bias is None else segment_means(bias, starts))
+        fwd_total = rfl_total = dominant_bias = None
+        if fwd_means:
+            fwd_means = np.vstack(fwd_means)
+            fwd_total = _nansum_rows(fwd_means)
+            rfl_total = _nansum_rows(np.vstack(rfl_means))
+            dominant = np.argmax(np.nan_to_num(fwd_means, nan=-np.inf), axis=0)
+            dominant_bias = np.vstack(bias_means)[dominant, np.arange(len(starts))]
+
+        rate_means, thickness_deltas = [], []
+        for i, src in enumerate(self.sources):
+            rate = _full_series_of_length(
+                self, archive, f'sources/{i}/deposition_rate', src.deposition_rate, n
+            )
+            if rate is not None:
+                rate_means.append(segment_means(rate, starts))
+            thickness = _full_series_of_length(
+                self, archive, f'sources/{i}/thickness', src.thickness, n
+            )
+            if thickness is not None:
+                thickness_deltas.append(segment_deltas(thickness, starts))
+        rate_total = _nansum_rows(np.vstack(rate_means)) if rate_means else None
+        thickness_total = (
+            _nansum_rows(np.vstack(thickness_deltas)) if thickness_deltas else None
+        )
+
+        arcs = None
+        if self.dc_power_supply is not None:
+            arc_count = _signal(self.dc_power_supply, 'arc_count')
+            if arc_count is not None and len(arc_count) == n:
+                arcs = segment_deltas(np.asarray(arc_count), starts)
+
+        def pick(values, j):
+            if values is None or np.isnan(values[j]):
+                return None
+            return float(values[j])
+
+        for j, start in enumerate(starts):
+            segment = SputteringSegment(
+                start_time=float(ts_raw[start]),
+                duration=float(ts_raw[stops[j]] - ts_raw[start]),
+                active_sources=', '.join(
+                    str(idx)
+                    for idx, flags in active.items()
+                    if flags is not None and flags[j]
+                ),
+            )
+            if phases is not None:
+                segment.process_phase = str(phases[j])
+            if shutter is not None:
+                segment.substrate_shutter_open = bool(shutter[j])
+            for name, values in [
+                ('mean_pressure', p_mean),
+                ('min_pressure', p_min),
+                ('max_pressure', p_max),
+                ('mean_forward_power', fwd_total),
+                ('mean_reflected_power', rfl_total),
+                ('mean_dc_bias', dominant_bias),
+                ('mean_deposition_rate', rate_total),
+                ('thickness_delta', thickness_total),
+            ]:
+                value = pick(values, j)
+                if value is not None:
+                    setattr(segment, name, value)
+            if arcs is not None and not np.isnan(arcs[j]):
+                segment.arc_count_delta = int(arcs[j])
+            self.segments.append(segment)
+
+    def _detect_anomalies(self, archive: 'EntryArchive' = None) -> None:
+        """Flag pressure excursions, arc bursts and high reflected RF power in
+        ``anomalies`` (rolling-window detectors, see
+        :mod:`nomad_inl_base.anomalies`), unless they already ran on this entry
+        (``anomalies_detected``, e.g. in the parser while reading the log)."""
+        from nomad_inl_base.anomalies import detect_anomalies
+
+        if self.anomalies_detected:
+            return
+        ts_raw = _full_series(self, archive, 'timestamps', self.timestamps)
+        if ts_raw is None or len(ts_raw) == 0:
+            return
+        n = len(ts_raw)
+
+        env = self.chamber_environment
+        pressure = None
+        if env is not None and env.pressure is not None:
+            pressure = _full_series_of_length(
+                self,
+                archive,
+                'chamber_environment/pressure/value',
+                env.pressure.value,
+                n,
+            )
+
+        arc_count = None
+        if self.dc_power_supply is not None:
+            counts = [
+                _signal(self.dc_power_supply, name)
+                for name in ('arc_count', 'spark_count')
+            ]
+            counts = [np.asarray(c, np.float64) for c in counts if c is not None]
+            counts = [c for c in counts if len(c) == n]
+            if counts:
+                arc_count = np.sum(counts, axis=0)
+
+        rf_power = [
+            (
+                f'PS{ps.supply_index}',
+                _full_series_of_length(
+                    self,
+                    archive,
+                    f'rf_power_supplies/{i}/forward_power',
+                    ps.forward_power,
+                    n,
+                ),
+                _full_series_of_length(
+                    self,
+                    archive,
+                    f'rf_power_supplies/{i}/reflected_power',
+                    ps.reflected_power,
+                    n,
+                ),
+            )
+            for i, ps in enumerate(self.rf_power_supplies)
+        ]
+
+        self.add_anomalies(detect_anomalies(n, pressure, arc_count, rf_power), ts_raw)
+        self.anomalies_detected = True
+
+    def add_anomalies(self, anomalies: list, timestamps: np.ndarray) -> None:
+        """Append the :class:`~nomad_inl_base.anomalies.Anomaly` intervals
+        *anomalies*, whose rows index *timestamps*, to ``anomalies``."""
+        for anomaly in anomalies:
+            self.anomalies.append(
+                ProcessAnomaly(
+                    kind=anomaly.kind,
+                    channel=anomaly.channel,
+                    severity=anomaly.severity,
+                    start_time=float(timestamps[anomaly.start]),
+                    end_time=float(timestamps[anomaly.stop - 1]),
+                    peak_value=anomaly.peak,
+                )
+            )
+
+    def _anomaly_overlays(self, kind: str, channel: str | None = None) -> list:
+        """``(t_start, t_end, colour)`` of the anomalies of *kind* (on *channel*)."""
+        colours = {'warning': 'orange', 'critical': 'red'}
+        return [
+            (
+                a.start_time.magnitude,
+                a.end_time.magnitude,
+                colours.get(a.severity, 'orange'),
+            )
+            for a in self.anomalies
+            if a.kind == kind and (channel is None or a.channel == channel)
+        ]
 
     def _build_figures(self) -> None:
-        """Build Plotly figures controlled by plot_config settings."""
+        """Build Plotly figures controlled by plot_config settings.
+
+        Figures whose input arrays and settings are unchanged since the last
+        normalization are reused instead of being rebuilt.
+        """
+        previous = list(self.figures or [])
         self.figures = []
         ts = self.timestamps
         if ts is None or len(ts) == 0:
@@ -891,13 +1820,19 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
         _PA_TO_MBAR = 1e-2
         _M3S_TO_SCCM = 1.0 / _SCCM_TO_M3S
 
+        rows = time_index_range(self)
+        n_points = len(ts)
+
         def mag(arr):
-            """Return plain numpy array, stripping pint units if present."""
+            """Return plain numpy array, stripping pint units if present, over
+            the time steps in view (series from ``_signal`` already are)."""
             if arr is None:
                 return None
-            return arr.magnitude if hasattr(arr, 'magnitude') else np.asarray(arr)
+            arr = arr.magnitude if hasattr(arr, 'magnitude') else np.asarray(arr)
+            return arr[rows] if len(arr) == n_points else arr
 
         ts_raw = mag(ts)
+        stride = self.preview_stride or 1
         env = self.chamber_environment
 
         # ── Figure: Pressure [+ MFC flows] ────────────────────────────────────────────
@@ -927,45 +1862,21 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
                 pressure_rows.append((fv, f'{lbl} (sccm)', False))
 
             if pressure_rows:
-                n_rows = len(pressure_rows)
                 colours = ['steelblue', 'darkorange', '#2ca02c', '#9467bd', '#8c564b']
-                fig = make_subplots(rows=n_rows, cols=1, shared_xaxes=True)
-                for r_i, (arr, lbl, log_scale) in enumerate(pressure_rows, start=1):
-                    fig.add_trace(
-                        go.Scatter(
-                            x=ts_raw,
-                            y=arr,
-                            name=lbl,
-                            showlegend=False,
-                            line=dict(color=colours[(r_i - 1) % len(colours)]),
-                        ),
-                        row=r_i,
-                        col=1,
-                    )
-                    fig.update_yaxes(title_text=lbl, row=r_i, col=1)
-                    if log_scale:
-                        fig.update_yaxes(type='log', row=r_i, col=1)
-                fig.update_xaxes(title_text='Time (s)', row=n_rows, col=1)
-                fig.update_layout(
-                    template='plotly_white',
-                    height=max(300, 200 * n_rows),
-                    showlegend=False,
-                )
-                self.figures.append(
-                    PlotlyFigure(label='Pressure', figure=fig.to_plotly_json())
+                overlays = self._anomaly_overlays('pressure_excursion')
+                _append_figure(
+                    self,
+                    previous,
+                    'Pressure',
+                    (ts_raw, pressure_rows, overlays),
+                    lambda: _stacked_figure(ts_raw, pressure_rows, colours, overlays),
                 )
 
         # ── Figures: one per active sputtering source ──────────────────────────────────
         if show_sources:
-            rf_by_index = {
-                ps.supply_index: ps
-                for ps in (self.rf_power_supplies or [])
-                if ps.supply_index is not None
-            }
-            ps4 = self.dc_power_supply
-
             for src in self.sources or []:
-                if src.active is None or not np.any(src.active.astype(bool)):
+                active = _signal(src, 'active', stride)
+                if active is None or not np.any(np.asarray(active).astype(bool)):
                     continue
 
                 src_label = f'Source {src.source_index}'
@@ -973,68 +1884,55 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
                     src_label += f' \u2013 {src.material}'
 
                 supply_rows = []  # (array, y_label, use_log)
-                ps_type = (src.power_supply_type or '').upper()
-
-                if 'DC' in ps_type or 'PULSED' in ps_type:
-                    if ps4 is not None:
-                        for arr, lbl in [
-                            (mag(ps4.power), 'Power (W)'),
-                            (mag(ps4.voltage), 'Voltage (V)'),
-                            (mag(ps4.current), 'Current (A)'),
-                            (mag(ps4.pulse_frequency), 'Pulse Freq (Hz)'),
-                        ]:
-                            if arr is not None and len(arr) == len(ts_raw):
-                                supply_rows.append((arr, lbl, False))
-                        for arr, lbl in [
-                            (mag(ps4.arc_count), 'Arc Count'),
-                            (mag(ps4.spark_count), 'Spark Count'),
-                        ]:
-                            if arr is not None and len(arr) == len(ts_raw):
-                                supply_rows.append((arr.astype(float), lbl, False))
-                else:
-                    # RF supply: sources 1-2 → PS1, sources 3-4 → PS3
-                    _SOURCES_ON_PS1 = 2
-                    si = src.source_index or 0
-                    rf_idx = 1 if si <= _SOURCES_ON_PS1 else 3
-                    ps = rf_by_index.get(rf_idx)
-                    if ps is not None:
-                        for arr, lbl in [
-                            (mag(ps.forward_power), 'Fwd Power (W)'),
-                            (mag(ps.reflected_power), 'Rfl Power (W)'),
-                            (mag(ps.dc_bias), 'RF DC Self-Bias (V)'),
-                            (mag(ps.load_cap_position), 'Load Cap Position'),
-                            (mag(ps.tune_cap_position), 'Tune Cap Position'),
-                        ]:
-                            if arr is not None and len(arr) == len(ts_raw):
-                                supply_rows.append((arr, lbl, False))
+                supply, _ = _matched_supply(self, src)
+                overlays = []
+
+                if isinstance(supply, SputteringDCPowerSupply):
+                    overlays = self._anomaly_overlays('arc_burst')
+                    for arr, lbl in [
+                        (mag(supply.power), 'Power (W)'),
+                        (mag(supply.voltage), 'Voltage (V)'),
+                        (mag(supply.current), 'Current (A)'),
+                        (mag(supply.pulse_frequency), 'Pulse Freq (Hz)'),
+                    ]:
+                        if arr is not None and len(arr) == len(ts_raw):
+                            supply_rows.append((arr, lbl, False))
+                    for arr, lbl in [
+                        (mag(_signal(supply, 'arc_count', stride)), 'Arc Count'),
+                        (mag(_signal(supply, 'spark_count', stride)), 'Spark Count'),
+                    ]:
+                        if arr is not None and len(arr) == len(ts_raw):
+                            supply_rows.append((arr.astype(float), lbl, False))
+                elif supply is not None:
+                    overlays = self._anomaly_overlays(
+                        'reflected_power', f'PS{supply.supply_index}'
+                    )
+                    for arr, lbl in [
+                        (mag(supply.forward_power), 'Fwd Power (W)'),
+                        (mag(supply.reflected_power), 'Rfl Power (W)'),
+                        (mag(supply.dc_bias), 'RF DC Self-Bias (V)'),
+                        (mag(supply.load_cap_position), 'Load Cap Position'),
+                        (mag(supply.tune_cap_position), 'Tune Cap Position'),
+                    ]:
+                        if arr is not None and len(arr) == len(ts_raw):
+                            supply_rows.append((arr, lbl, False))
 
                 if not supply_rows:
                     continue
 
-                n_rows = len(supply_rows)
-                fig = make_subplots(rows=n_rows, cols=1, shared_xaxes=True)
-                for r_i, (arr, lbl, log_scale) in enumerate(supply_rows, start=1):
-                    fig.add_trace(
-                        go.Scatter(x=ts_raw, y=arr, name=lbl, showlegend=False),
-                        row=r_i,
-                        col=1,
-                    )
-                    fig.update_yaxes(title_text=lbl, row=r_i, col=1)
-                    if log_scale:
-                        fig.update_yaxes(type='log', row=r_i, col=1)
-                fig.update_xaxes(title_text='Time (s)', row=n_rows, col=1)
-                fig.update_layout(
-                    template='plotly_white',
-                    height=max(300, 200 * n_rows),
-                    showlegend=False,
-                )
-                self.figures.append(
-                    PlotlyFigure(label=src_label, figure=fig.to_plotly_json())
+                _append_figure(
+                    self,
+                    previous,
+                    src_label,
+                    (ts_raw, supply_rows, overlays),
+                    lambda rows=supply_rows, shaded=overlays: _stacked_figure(
+                        ts_raw, rows, overlays=shaded
+                    ),
                 )
 
         # ── Figure: Substrate Bias (only if bias was active) ──────────────────────────
         if show_substrate_bias:
-            b_active = mag(self.substrate_bias_active)
+            b_active = mag(_signal(self, 'substrate_bias_active', stride))
             if b_active is not None and np.any(b_active.astype(bool)):
                 bias_rows = []
                 for arr, lbl in [
@@ -1043,37 +1941,24 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
                     (mag(self.substrate_bias_power), 'Power (W)'),
                 ]:
                     if arr is not None and len(arr) == len(ts_raw):
-                        bias_rows.append((arr, lbl))
+                        bias_rows.append((arr, lbl, False))
                 if bias_rows:
-                    n_rows = len(bias_rows)
-                    fig = make_subplots(rows=n_rows, cols=1, shared_xaxes=True)
-                    for r_i, (arr, lbl) in enumerate(bias_rows, start=1):
-                        fig.add_trace(
-                            go.Scatter(x=ts_raw, y=arr, name=lbl, showlegend=False),
-                            row=r_i,
-                            col=1,
-                        )
-                        fig.update_yaxes(title_text=lbl, row=r_i, col=1)
-                    fig.update_xaxes(title_text='Time (s)', row=n_rows, col=1)
-                    fig.update_layout(
-                        template='plotly_white',
-                        height=max(300, 200 * n_rows),
-                        showlegend=False,
-                    )
-                    self.figures.append(
-                        PlotlyFigure(
-                            label='Substrate Bias', figure=fig.to_plotly_json()
-                        )
+                    _append_figure(
+                        self,
+                        previous,
+                        'Substrate Bias',
+                        (ts_raw, bias_rows),
+                        lambda: _stacked_figure(ts_raw, bias_rows),
                     )
 
         # ── Figure: Temperatures ──────────────────────────────────────────────────────
         if show_temperatures:
-            temp_traces = []
+            temp_rows = []
             temp_series = [
                 (self.substrate_temperature, 'Substrate T', True),
                 (self.substrate_temperature_2, 'Substrate T2', 'legendonly'),
                 (
-                    self.substrate_temperature_setpoint,
+                    _signal(self, 'substrate_temperature_setpoint', stride),
                     'Substrate T setpoint',
                     'legendonly',
                 ),
@@ -1081,29 +1966,21 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
             for arr, label, visible in temp_series:
                 raw = mag(arr)
                 if raw is not None and len(raw) == len(ts_raw):
-                    temp_traces.append(
-                        go.Scatter(
-                            x=ts_raw,
-                            y=raw - _KELVIN_TO_C,
-                            name=label,
-                            visible=visible,
-                        )
-                    )
-            if temp_traces:
-                fig = go.Figure(data=temp_traces)
-                fig.update_layout(
-                    template='plotly_white',
-                    height=350,
-                    xaxis_title='Time (s)',
-                    yaxis_title='Temperature (°C)',
-                    showlegend=True,
-                )
-                self.figures.append(
-                    PlotlyFigure(label='Temperatures', figure=fig.to_plotly_json())
+                    temp_rows.append((raw - _KELVIN_TO_C, label, visible))
+            if temp_rows:
+                _append_figure(
+                    self,
+                    previous,
+                    'Temperatures',
+                    (ts_raw, temp_rows),
+                    lambda: _temperature_figure(ts_raw, temp_rows, height=350),
                 )
 
-    def _create_thin_film(self, archive: 'EntryArchive', logger: 'BoundLogger'):
-        """Create the deposited INLThinFilm entry and any per-substrate stacks.
+    def _create_thin_film(
+        self, archive: 'EntryArchive', logger: 'BoundLogger', batch: ArchiveBatch
+    ):
+        """Add the deposited INLThinFilm entry and any per-substrate stacks to
+        *batch*, which the caller commits.
 
         Returns a ``(thin_film_ref, data_file)`` tuple; ``thin_film_ref`` is
         ``None`` if no thin film could be created (e.g. no source materials).
@@ -1117,10 +1994,11 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
         # Collect materials from sources whose shutter was open at any point
         active_materials = []
         for source in self.sources:
+            shutter_open = _signal(source, 'shutter_open')
             if (
-                source.shutter_open is not None
-                and len(source.shutter_open) > 0
-                and bool(np.any(source.shutter_open))
+                shutter_open is not None
+                and len(shutter_open) > 0
+                and bool(np.any(shutter_open))
                 and source.material
             ):
                 mat = source.material.strip()
@@ -1164,13 +2042,9 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
             logger,
         )
 
-        if not archive.m_context.raw_path_exists(thinFilm_filename):
-            thinFilmRef = create_archive(
-                thinFilm_archive.m_to_dict(),
-                archive.m_context,
-                thinFilm_filename,
-                filetype,
-                logger,
+        if not batch.exists(thinFilm_filename):
+            thinFilmRef = batch.add(
+                thinFilm_archive.m_to_dict(), thinFilm_filename, filetype
             )
         else:
             thinFilmRef = get_hash_ref(archive.m_context.upload_id, thinFilm_filename)
@@ -1215,14 +2089,8 @@ class BatteryChamberSputteringDeposition(PlotSection, EntryData):
                 logger,
             )
 
-            if not archive.m_context.raw_path_exists(stack_filename):
-                create_archive(
-                    stack_archive.m_to_dict(),
-                    archive.m_context,
-                    stack_filename,
-                    filetype,
-                    logger,
-                )
+            if not batch.exists(stack_filename):
+                batch.add(stack_archive.m_to_dict(), stack_filename, filetype)
 
         return thinFilmRef, data_file
 
@@ -1239,6 +2107,8 @@ class PC03CathodeChamberDeposition(BatteryChamberSputteringDeposition):
 
     m_def = Section(label='PC03 Cathode Chamber Deposition')
 
+    _CHAMBER = 'PC03'
+
 
 class PC04ElectrolyteChamberDeposition(BatteryChamberSputteringDeposition):
     """
@@ -1252,8 +2122,10 @@ class PC04ElectrolyteChamberDeposition(BatteryChamberSputteringDeposition):
 
     m_def = Section(label='PC04 Electrolyte Chamber Deposition')
 
+    _CHAMBER = 'PC04'
+
 
-class PC04SubstrateAnnealing(PlotSection, Annealing):
+class PC04SubstrateAnnealing(PlotSection, Annealing, StepSignalSeries):
     """
     Parsed log entry for a PC04 ElectrolyteChamber substrate annealing/heating run.
 
@@ -1318,6 +2190,20 @@ class PC04SubstrateAnnealing(PlotSection, Annealing):
         ),
     )
 
+    hdf5_file = Quantity(
+        type=str,
+        description=(
+            'Upload path of the HDF5 sidecar holding the full-resolution time '
+            'series (opt-in, ``hdf5_sidecar`` plugin option). When set, the arrays '
+            'in this entry are decimated previews (every ``preview_stride``-th '
+            'sample); scalars are computed from the sidecar.'
+        ),
+    )
+    preview_stride = Quantity(
+        type=np.int64,
+        description='Decimation stride of the in-archive time series previews.',
+    )
+
     # --- Sample references (user-set) ---
     thin_film = SubSection(
         section_def=INLThinFilmReference,
@@ -1344,7 +2230,11 @@ class PC04SubstrateAnnealing(PlotSection, Annealing):
     process_phase = Quantity(
         type=str,
         shape=['*'],
-        description='Process phase name (string label) at each time step.',
+        description=(
+            'Process phase name (string label) at each time step. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('process_phase')``."
+        ),
     )
 
     # --- Pressure ---
@@ -1375,7 +2265,11 @@ class PC04SubstrateAnnealing(PlotSection, Annealing):
         type=np.dtype(np.float64),
         shape=['*'],
         unit='kelvin',
-        description='Substrate heater temperature setpoint as a time series.',
+        description=(
+            'Substrate heater temperature setpoint as a time series. '
+            'Parsed logs store it change-point encoded in ``step_signals``; '
+            "read it with ``series('substrate_temperature_setpoint')``."
+        ),
         a_eln=ELNAnnotation(defaultDisplayUnit='celsius'),
     )
     substrate_heater_current = Quantity(
@@ -1429,6 +2323,12 @@ class PC04SubstrateAnnealing(PlotSection, Annealing):
         a_eln=ELNAnnotation(defaultDisplayUnit='celsius'),
     )
 
+    step_signals = SubSection(
+        section_def=StepSignal,
+        repeats=True,
+        description='Change-point encoded piecewise-constant time series.',
+    )
+
     plot_config = SubSection(
         section_def=PlotConfig,
         description='Controls which figures are generated during normalization.',
@@ -1439,7 +2339,11 @@ class PC04SubstrateAnnealing(PlotSection, Annealing):
         if self.plot_config is None:
             self.plot_config = PlotConfig(plot_mode='Thermal Treatment')
         super().normalize(archive, logger)
-        self._compute_scalars()
+        if self.plot_config.refresh_figures_only:
+            self._build_figures()
+            return
+        self._compute_scalars(archive)
+        _offload_time_series(self, archive, logger)
         self._build_figures()
         self._resolve_sample_from_filename(archive, logger)
 
@@ -1467,22 +2371,31 @@ class PC04SubstrateAnnealing(PlotSection, Annealing):
                 'was left unset. Link it manually if needed.'
             )
 
-    def _compute_scalars(self) -> None:
-        """Derive peak_temperature and fill the inherited duration quantity."""
-        ts = self.timestamps
-        if ts is not None and len(ts) > 1:
-            ts_raw = ts.magnitude if hasattr(ts, 'magnitude') else np.asarray(ts)
+    def _compute_scalars(self, archive: 'EntryArchive' = None) -> None:
+        """Derive peak_temperature and fill the inherited duration quantity.
+
+        Uses the full-resolution series from the HDF5 sidecar when the entry
+        was offloaded (``archive`` is needed to read it).
+        """
+        ts_raw = _full_series(self, archive, 'timestamps', self.timestamps)
+        if ts_raw is not None and len(ts_raw) > 1:
             self.duration = float(ts_raw[-1] - ts_raw[0])
 
-        temp = self.substrate_temperature
-        if temp is not None and len(temp) > 0:
-            raw = temp.magnitude if hasattr(temp, 'magnitude') else np.asarray(temp)
+        raw = _full_series(
+            self, archive, 'substrate_temperature', self.substrate_temperature
+        )
+        if raw is not None and len(raw) > 0:
             valid = raw[~np.isnan(raw)]
             if len(valid) > 0:
                 self.peak_temperature = float(np.max(valid))
 
     def _build_figures(self) -> None:
-        """Build Plotly figures: Temperatures, Pressure, Heater Current."""
+        """Build Plotly figures: Temperatures, Pressure, Heater Current.
+
+        Figures whose inputs are unchanged since the last normalization are
+        reused instead of being rebuilt.
+        """
+        previous = list(self.figures or [])
         self.figures = []
         ts = self.timestamps
         if ts is None or len(ts) == 0:
@@ -1503,15 +2416,16 @@ class PC04SubstrateAnnealing(PlotSection, Annealing):
             return arr.magnitude if hasattr(arr, 'magnitude') else np.asarray(arr)
 
         ts_raw = mag(ts)
+        stride = self.preview_stride or 1
 
         # ── Figure: Temperatures ──────────────────────────────────────────────────────
         if cfg.show_temperatures:
-            temp_traces = []
+            temp_rows = []
             temp_series = [
                 (self.substrate_temperature, 'Substrate T', True),
                 (self.substrate_temperature_2, 'Substrate T2', 'legendonly'),
                 (
-                    self.substrate_temperature_setpoint,
+                    _signal(self, 'substrate_temperature_setpoint', stride),
                     'Substrate T setpoint',
                     'legendonly',
                 ),
@@ -1519,72 +2433,73 @@ class PC04SubstrateAnnealing(PlotSection, Annealing):
             for arr, label, visible in temp_series:
                 raw = mag(arr)
                 if raw is not None and len(raw) == len(ts_raw):
-                    temp_traces.append(
-                        go.Scatter(
-                            x=ts_raw,
-                            y=raw - _KELVIN_TO_C,
-                            name=label,
-                            visible=visible,
-                        )
-                    )
-            if temp_traces:
-                fig = go.Figure(data=temp_traces)
-                fig.update_layout(
-                    template='plotly_white',
-                    height=400,
-                    xaxis_title='Time (s)',
-                    yaxis_title='Temperature (°C)',
-                    showlegend=True,
-                )
-                self.figures.append(
-                    PlotlyFigure(label='Temperatures', figure=fig.to_plotly_json())
+                    temp_rows.append((raw - _KELVIN_TO_C, label, visible))
+            if temp_rows:
+                _append_figure(
+                    self,
+                    previous,
+                    'Temperatures',
+                    (ts_raw, temp_rows),
+                    lambda: _temperature_figure(ts_raw, temp_rows, height=400),
                 )
 
         # ── Figure: Pressure ─────────────────────────────────────────────────────────
         if cfg.show_pressure:
             p_raw = mag(self.wide_range_pressure)
             if p_raw is not None and len(p_raw) == len(ts_raw):
+
+                def pressure_figure():
+                    import plotly.graph_objects as go
+
+                    fig = go.Figure()
+                    fig.add_trace(
+                        go.Scatter(
+                            x=ts_raw,
+                            y=p_raw * _PA_TO_MBAR,
+                            name='Wide Range Gauge',
+                            line=dict(color='darkorange'),
+                        )
+                    )
+                    fig.update_yaxes(type='log', title_text='Pressure (mbar)')
+                    fig.update_layout(
+                        template='plotly_white',
+                        height=300,
+                        xaxis_title='Time (s)',
+                        showlegend=False,
+                    )
+                    return fig
+
+                _append_figure(
+                    self, previous, 'Pressure', (ts_raw, p_raw), pressure_figure
+                )
+
+        # ── Figure: Heater Current ────────────────────────────────────────────────────
+        i_raw = mag(self.substrate_heater_current)
+        if i_raw is not None and len(i_raw) == len(ts_raw):
+
+            def heater_current_figure():
+                import plotly.graph_objects as go
+
                 fig = go.Figure()
                 fig.add_trace(
                     go.Scatter(
                         x=ts_raw,
-                        y=p_raw * _PA_TO_MBAR,
-                        name='Wide Range Gauge',
-                        line=dict(color='darkorange'),
+                        y=i_raw,
+                        name='Heater Current',
+                        line=dict(color='crimson'),
                     )
                 )
-                fig.update_yaxes(type='log', title_text='Pressure (mbar)')
+                fig.update_yaxes(title_text='Current (A)')
                 fig.update_layout(
                     template='plotly_white',
-                    height=300,
+                    height=280,
                     xaxis_title='Time (s)',
                     showlegend=False,
                 )
-                self.figures.append(
-                    PlotlyFigure(label='Pressure', figure=fig.to_plotly_json())
-                )
+                return fig
 
-        # ── Figure: Heater Current ────────────────────────────────────────────────────
-        i_raw = mag(self.substrate_heater_current)
-        if i_raw is not None and len(i_raw) == len(ts_raw):
-            fig = go.Figure()
-            fig.add_trace(
-                go.Scatter(
-                    x=ts_raw,
-                    y=i_raw,
-                    name='Heater Current',
-                    line=dict(color='crimson'),
-                )
-            )
-            fig.update_yaxes(title_text='Current (A)')
-            fig.update_layout(
-                template='plotly_white',
-                height=280,
-                xaxis_title='Time (s)',
-                showlegend=False,
-            )
-            self.figures.append(
-                PlotlyFigure(label='Heater Current', figure=fig.to_plotly_json())
+            _append_figure(
+                self, previous, 'Heater Current', (ts_raw, i_raw), heater_current_figure
             )
 
 
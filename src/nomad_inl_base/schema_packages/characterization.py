@@ -5,7 +5,6 @@ if TYPE_CHECKING:
     from structlog.stdlib import BoundLogger
 
 import numpy as np
-import plotly.express as px
 from nomad.datamodel.data import ArchiveSection, EntryData, EntryDataCategory
 from nomad.datamodel.metainfo.annotations import ELNAnnotation, ELNComponentEnum
 from nomad.datamodel.metainfo.basesections import Measurement, MeasurementResult
@@ -21,12 +20,19 @@ from nomad_material_processing.general import TimeSeries
 from nomad_material_processing.solution.general import Solution
 from nomad_measurements.transmission.schema import ELNUVVisNirTransmission
 from nomad_measurements.xrd.schema import ELNXRayDiffraction
-from plotly.subplots import make_subplots
 
-from nomad_inl_base.schema_packages.entities import INLSampleReference, INLThinFilmStack
+from nomad_inl_base.profiling import profiled_normalize
+from nomad_inl_base.schema_packages.entities import (
+    INLSampleReference,
+    INLThinFilmStack,
+    NormalizeDiagnostics,
+)
+from nomad_inl_base.utils import encode_figure
 
 m_package = SchemaPackage()
 
+_ENTRY_POINT_ID = 'nomad_inl_base.schema_packages:characterization_entry_point'
+
 
 def _coerce_string_floats(dct: dict, handle_comma_decimals: bool = True) -> dict:
     """Return a copy of *dct* with numeric-string values converted to Python floats.
@@ -254,6 +260,9 @@ class ChronoamperometryMeasurement(INLCharacterization, PlotSection):
         if self.area_electrode is not None:
             y_current /= self.area_electrode
             y_label = 'Current density (mA cm' + r'$^{-2}$' + ')'
+        import plotly.express as px
+        from plotly.subplots import make_subplots
+
         first_line = px.scatter(x=x_time, y=y_current)
         figure1 = make_subplots(rows=1, cols=1)
         figure1.add_trace(first_line.data[0], row=1, col=1)
@@ -266,7 +275,10 @@ class ChronoamperometryMeasurement(INLCharacterization, PlotSection):
             title_text='ED curve',
         )
         self.figures.append(
-            PlotlyFigure(label='figure 1', figure=figure1.to_plotly_json())
+            PlotlyFigure(
+                label='figure 1',
+                figure=encode_figure(figure1.to_plotly_json(), _ENTRY_POINT_ID),
+            )
         )
 
 
@@ -330,6 +342,9 @@ class PotentiostatMeasurement(INLCharacterization, PlotSection):
                 f', scan {int(scan_plotted)}' if scan_plotted is not None else ''
             )
 
+        import plotly.express as px
+        from plotly.subplots import make_subplots
+
         first_line = px.scatter(x=x_voltage, y=y_current)
         figure1 = make_subplots(rows=1, cols=1)
         figure1.add_trace(first_line.data[0], row=1, col=1)
@@ -342,7 +357,10 @@ class PotentiostatMeasurement(INLCharacterization, PlotSection):
             title_text=title,
         )
         self.figures.append(
-            PlotlyFigure(label='figure 1', figure=figure1.to_plotly_json())
+            PlotlyFigure(
+                label='figure 1',
+                figure=encode_figure(figure1.to_plotly_json(), _ENTRY_POINT_ID),
+            )
         )
 
 
@@ -507,7 +525,10 @@ class INLFourPointProbeResults(MeasurementResult, PlotSection):
             title='Sheet Resistance Map',
         )
         self.figures.append(
-            PlotlyFigure(label='Sheet Resistance Map', figure=fig.to_plotly_json())
+            PlotlyFigure(
+                label='Sheet Resistance Map',
+                figure=encode_figure(fig.to_plotly_json(), _ENTRY_POINT_ID),
+            )
         )
 
     def m_update_from_dict(self, dct, **kwargs):
@@ -882,7 +903,10 @@ class INLEQE(INLCharacterization, PlotSection):
                 yaxis=dict(fixedrange=False),
             )
             self.figures.append(
-                PlotlyFigure(label='EQE', figure=json.loads(pio.to_json(fig)))
+                PlotlyFigure(
+                    label='EQE',
+                    figure=encode_figure(json.loads(pio.to_json(fig)), _ENTRY_POINT_ID),
+                )
             )
 
 
@@ -1016,21 +1040,23 @@ class INLSolarCellIV(INLCharacterization, PlotSection):
 
         import plotly.graph_objects as go
         import plotly.io as pio
+        from plotly.subplots import make_subplots
 
         super().normalize(archive, logger)
         self.figures = []
 
+        best_idx = 0
+        if self.results:
+            effs = [
+                r.efficiency if r.efficiency is not None else 0.0 for r in self.results
+            ]
+            best_idx = int(np.argmax(effs))
+            self._set_solar_cell_results(archive, self.results[best_idx])
+
         # Plot best-cell JV curve (highest efficiency)
         if self.iv_curves:
-            best_idx = 0
-            if self.results:
-                effs = [
-                    r.efficiency if r.efficiency is not None else 0.0
-                    for r in self.results
-                ]
-                best_idx = int(np.argmax(effs))
-                if best_idx >= len(self.iv_curves):
-                    best_idx = 0
+            if best_idx >= len(self.iv_curves):
+                best_idx = 0
 
             curve = self.iv_curves[best_idx]
             if curve.voltage is not None and curve.current is not None:
@@ -1080,13 +1106,18 @@ class INLSolarCellIV(INLCharacterization, PlotSection):
                     yaxis=dict(fixedrange=False),
                 )
                 self.figures.append(
-                    PlotlyFigure(label='Best JV', figure=json.loads(pio.to_json(fig)))
+                    PlotlyFigure(
+                        label='Best JV',
+                        figure=encode_figure(
+                            json.loads(pio.to_json(fig)), _ENTRY_POINT_ID
+                        ),
+                    )
                 )
 
         # Plot all JV curves overlaid
         if self.iv_curves:
             fig_all = go.Figure()
-            
+
             # Build a mapping of measurement_name → cell_area for unit conversion
             area_map = {}
             if self.results:
@@ -1136,7 +1167,12 @@ class INLSolarCellIV(INLCharacterization, PlotSection):
                 hovermode='x unified',
             )
             self.figures.append(
-                PlotlyFigure(label='All JV Curves', figure=json.loads(pio.to_json(fig_all)))
+                PlotlyFigure(
+                    label='All JV Curves',
+                    figure=encode_figure(
+                        json.loads(pio.to_json(fig_all)), _ENTRY_POINT_ID
+                    ),
+                )
             )
 
         # Boxplots of key parameters
@@ -1175,15 +1211,51 @@ class INLSolarCellIV(INLCharacterization, PlotSection):
                 title_text='Solar Cell Parameters',
             )
             self.figures.append(
-                PlotlyFigure(label='Parameters', figure=json.loads(pio.to_json(fig)))
+                PlotlyFigure(
+                    label='Parameters',
+                    figure=encode_figure(json.loads(pio.to_json(fig)), _ENTRY_POINT_ID),
+                )
             )
 
+    @staticmethod
+    def _set_solar_cell_results(archive: 'EntryArchive', best: SolarCellIVResult):
+        """Copy the best cell's parameters to ``results.properties.optoelectronic
+        .solar_cell`` so they can be searched without loading the archive."""
+        solar_cell = archive.m_setdefault(
+            'results.properties.optoelectronic.solar_cell'
+        )
+        solar_cell.efficiency = best.efficiency
+        if best.fill_factor is not None:
+            # results expects a fraction (0–1), the cell results store %
+            solar_cell.fill_factor = best.fill_factor / 100.0
+        solar_cell.open_circuit_voltage = best.voc
+        solar_cell.short_circuit_current_density = best.jsc
+        solar_cell.device_area = best.cell_area
+
 
 # ---------------------------------------------------------------------------
 # GDOES (Glow Discharge Optical Emission Spectroscopy)
 # ---------------------------------------------------------------------------
 
 
+def _peak_width(depth: np.ndarray, values: np.ndarray) -> float | None:
+    """Depth span (full width at half maximum) of the contiguous run of
+    samples around the maximum of *values* that stay above half of it."""
+    n = min(len(depth), len(values))
+    depth, values = depth[:n], values[:n]
+    finite = np.isfinite(depth) & np.isfinite(values)
+    if not finite.any():
+        return None
+    values = np.where(finite, values, -np.inf)
+    peak = int(np.argmax(values))
+    if values[peak] <= 0:
+        return None
+    below = np.flatnonzero(values < values[peak] / 2)
+    first = below[below < peak].max() + 1 if (below < peak).any() else 0
+    last = below[below > peak].min() - 1 if (below > peak).any() else n - 1
+    return float(abs(depth[last] - depth[first]))
+
+
 class GDOESElementProfile(ArchiveSection):
     """Concentration profile for a single element."""
 
@@ -1196,6 +1268,15 @@ class GDOESElementProfile(ArchiveSection):
         description='Concentration values (mol %).',
         shape=['*'],
     )
+    layer_thickness = Quantity(
+        type=np.float64,
+        description=(
+            'Full width at half maximum of the concentration peak along the '
+            'depth axis — an estimate of the thickness of the layer rich in this '
+            'element (auto-computed).'
+        ),
+        unit='micrometer',
+    )
 
     def m_update_from_dict(self, dct, **kwargs):
         return super().m_update_from_dict(_coerce_string_floats(dct), **kwargs)
@@ -1217,6 +1298,14 @@ class INLGDOES(INLCharacterization, PlotSection):
     def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
         super().normalize(archive, logger)
         self.figures = []
+        if self.depth is not None:
+            for profile in self.element_profiles:
+                if profile.concentration is not None:
+                    thickness = _peak_width(
+                        np.array(self.depth), np.array(profile.concentration)
+                    )
+                    if thickness is not None:
+                        profile.layer_thickness = thickness
         if self.depth is not None and self.element_profiles:
             import json
 
@@ -1274,7 +1363,7 @@ class INLGDOES(INLCharacterization, PlotSection):
             self.figures.append(
                 PlotlyFigure(
                     label='Depth Profile',
-                    figure=json.loads(pio.to_json(fig)),
+                    figure=encode_figure(json.loads(pio.to_json(fig)), _ENTRY_POINT_ID),
                 )
             )
 
@@ -1438,6 +1527,8 @@ class INLSEMImage(MeasurementResult, PlotSection):
         self.figures = []
         if self.image_array is None:
             return
+        import plotly.express as px
+
         arr = np.array(self.image_array)
         h, w = arr.shape
         if self.pixel_width is not None:
@@ -1474,7 +1565,11 @@ class INLSEMImage(MeasurementResult, PlotSection):
             coloraxis_showscale=False,
         )
         lbl = self.label or self.file_name or 'SEM Image'
-        self.figures.append(PlotlyFigure(label=lbl, figure=fig.to_plotly_json()))
+        self.figures.append(
+            PlotlyFigure(
+                label=lbl, figure=encode_figure(fig.to_plotly_json(), _ENTRY_POINT_ID)
+            )
+        )
 
 
 class INLSEMSession(INLCharacterization, PlotSection):
@@ -1506,6 +1601,13 @@ class INLSEMSession(INLCharacterization, PlotSection):
 
     images = SubSection(section_def=INLSEMImage, repeats=True)
 
+    normalize_diagnostics = SubSection(
+        section_def=NormalizeDiagnostics,
+        description='Profile of the last normalization (opt-in, see the '
+        '``profile_normalize`` plugin option).',
+    )
+
+    @profiled_normalize(_ENTRY_POINT_ID)
     def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
         super().normalize(archive, logger)
 
@@ -1572,6 +1674,7 @@ class INLSEMSession(INLCharacterization, PlotSection):
 
         import plotly.graph_objects as go
         import plotly.io as pio
+        from plotly.subplots import make_subplots
 
         n = len(self.images)
         # One column, one row per image — compute per-image height to match aspect ratio
@@ -1661,7 +1764,10 @@ class INLSEMSession(INLCharacterization, PlotSection):
             dragmode=False,
         )
         self.figures.append(
-            PlotlyFigure(label='Gallery', figure=json.loads(pio.to_json(fig)))
+            PlotlyFigure(
+                label='Gallery',
+                figure=encode_figure(json.loads(pio.to_json(fig)), _ENTRY_POINT_ID),
+            )
         )
 
 
@@ -1777,6 +1883,7 @@ class INLAFMSession(INLCharacterization, PlotSection):
         import re
         import types
 
+        import plotly.express as px
         import pySPM
 
         raw_root = archive.m_context.raw_path()
@@ -1869,7 +1976,10 @@ class INLAFMSession(INLCharacterization, PlotSection):
                         title_text=z_label,
                     )
                     self.figures.append(
-                        PlotlyFigure(label=z_label, figure=fig.to_plotly_json())
+                        PlotlyFigure(
+                            label=z_label,
+                            figure=encode_figure(fig.to_plotly_json(), _ENTRY_POINT_ID),
+                        )
                     )
                 except Exception as exc:
                     logger.warning(
@@ -2079,7 +2189,10 @@ class INLEDXSpectrum(INLCharacterization, PlotSection):
             yaxis=dict(fixedrange=False),
         )
         self.figures.append(
-            PlotlyFigure(label='EDX Spectrum', figure=json.loads(pio.to_json(fig)))
+            PlotlyFigure(
+                label='EDX Spectrum',
+                figure=encode_figure(json.loads(pio.to_json(fig)), _ENTRY_POINT_ID),
+            )
         )
 
 
@@ -2193,6 +2306,9 @@ class EISMeasurement(INLCharacterization, PlotSection):
 
         if self.frequency is None or self.real_impedance is None:
             return
+        import plotly.express as px
+        from plotly.subplots import make_subplots
+
 
         freq = np.array(self.frequency)
         re_z = np.array(self.real_impedance)
@@ -2219,7 +2335,10 @@ class EISMeasurement(INLCharacterization, PlotSection):
             yaxis=dict(scaleanchor='x', scaleratio=1),
         )
         self.figures.append(
-            PlotlyFigure(label='Nyquist', figure=fig_nyquist.to_plotly_json())
+            PlotlyFigure(
+                label='Nyquist',
+                figure=encode_figure(fig_nyquist.to_plotly_json(), _ENTRY_POINT_ID),
+            )
         )
 
         # --- Bode plot (|Z| and Phase vs log-frequency) ---
@@ -2253,7 +2372,10 @@ class EISMeasurement(INLCharacterization, PlotSection):
                 showlegend=False,
             )
             self.figures.append(
-                PlotlyFigure(label='Bode', figure=fig_bode.to_plotly_json())
+                PlotlyFigure(
+                    label='Bode',
+                    figure=encode_figure(fig_bode.to_plotly_json(), _ENTRY_POINT_ID),
+                )
             )
 
 
@@ -21,7 +21,7 @@ from nomad_inl_base.schema_packages.entities import (
     INLSubstrate,
     INLSubstrateReference,
 )
-from nomad_inl_base.utils import create_archive, create_filename, get_hash_ref
+from nomad_inl_base.utils import ArchiveBatch, create_filename, get_hash_ref
 
 m_package = SchemaPackage()
 
@@ -244,6 +244,8 @@ class INLCleaning(Cleaning):
                     val = getattr(proxy, 'm_proxy_value', None) or str(proxy)
                     existing_refs.add(val)
 
+        # Written and registered with the upload together after the loop
+        batch = ArchiveBatch(archive.m_context, logger)
         for i in range(1, n + 1):
             substrate_name = f'{base}-S{i:02d}'
 
@@ -279,13 +281,7 @@ class INLCleaning(Cleaning):
                     substrate_name, substrate, 'Substrate', archive, logger
                 )
 
-                ref = create_archive(
-                    sub_archive.m_to_dict(),
-                    archive.m_context,
-                    sub_filename,
-                    'yaml',
-                    logger,
-                )
+                ref = batch.add(sub_archive.m_to_dict(), sub_filename)
 
             if ref is None:
                 continue
@@ -295,6 +291,7 @@ class INLCleaning(Cleaning):
             self.substrates.append(INLSubstrateReference(reference=ref))
             existing_refs.add(ref)
 
+        batch.commit()
         self.create_substrates = False
 
     # ------------------------------------------------------------------
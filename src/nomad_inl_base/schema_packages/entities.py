@@ -15,6 +15,7 @@ from nomad.datamodel.metainfo.basesections import (
     SystemComponent,
 )
 from nomad.metainfo import (
+    JSON,
     Category,
     Datetime,
     MEnum,
@@ -35,6 +36,8 @@ from nomad_material_processing.general import (
     ThinFilmStackReference,
 )
 
+from nomad_inl_base.utils import prefetch_references
+
 m_package = SchemaPackage()
 
 
@@ -217,6 +220,15 @@ class INLThinFilmStack(ThinFilmStack, INLSample, EntryData):
         if self.name is None and archive.metadata and archive.metadata.entry_name:
             self.name = archive.metadata.entry_name
 
+        # Load all layer and substrate archives in one pass instead of one
+        # dereference at a time below
+        prefetch_references(
+            archive,
+            [layer.reference for layer in self.layers],
+            self.substrate.reference if self.substrate is not None else None,
+            logger=logger,
+        )
+
         self.components = []
         if self.layers:
             self.components = [
@@ -299,6 +311,36 @@ class INLMaintenanceLog(ArchiveSection):
     )
 
 
+class NormalizeDiagnostics(ArchiveSection):
+    """
+    Profile of the last normalization of the parent entry, stored when the
+    ``profile_normalize`` and ``normalize_diagnostics`` plugin options are
+    set (see :func:`nomad_inl_base.profiling.profiled_normalize`).
+    """
+
+    m_def = Section(label='Normalize Diagnostics', a_display={'visible': False})
+
+    total_time = Quantity(type=np.float64, unit='s', description='Normalize time.')
+    phase_times = Quantity(
+        type=JSON,
+        description='Seconds spent searching (``search``), loading referenced '
+        'archives (``archive_load``), reading raw files (``raw_io``), measuring '
+        '(``profiling``) and on everything else (``normalize``).',
+    )
+    searches = Quantity(type=int, description='Search calls.')
+    dereferences = Quantity(
+        type=int, description='References to other archives that were resolved.'
+    )
+    archive_loads = Quantity(
+        type=int, description='Archives loaded to resolve references or merge data.'
+    )
+    raw_files = Quantity(type=int, description='Raw files opened.')
+    raw_bytes = Quantity(
+        type=int, description='Characters (bytes for binary files) read from raw files.'
+    )
+    figure_bytes = Quantity(type=int, description='JSON size of the figures built.')
+
+
 class INLInstrument(Instrument, EntryData):
     """INL instrument entity with supplier information."""
 
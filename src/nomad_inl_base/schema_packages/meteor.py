@@ -8,7 +8,7 @@ import numpy as np
 from nomad.datamodel.data import ArchiveSection, EntryData, EntryDataCategory
 from nomad.datamodel.metainfo.annotations import ELNAnnotation, ELNComponentEnum
 from nomad.datamodel.metainfo.basesections import Process, PureSubstanceSection
-from nomad.datamodel.metainfo.plot import PlotlyFigure, PlotSection
+from nomad.datamodel.metainfo.plot import PlotSection
 from nomad.metainfo import (
     Category,
     Datetime,
@@ -25,10 +25,21 @@ from nomad_inl_base.schema_packages.entities import (
     INLThinFilmReference,
     INLThinFilmStack,
 )
-from nomad_inl_base.utils import create_archive, create_filename, get_hash_ref
+from nomad_inl_base.sidecar import read_series
+from nomad_inl_base.utils import (
+    ArchiveBatch,
+    cached_figure,
+    create_filename,
+    figure_digest,
+    get_hash_ref,
+    interval_integrals,
+    make_figure,
+)
 
 m_package = SchemaPackage()
 
+_ENTRY_POINT_ID = 'nomad_inl_base.schema_packages:meteor_entry_point'
+
 _ANGSTROM_TO_M = 1e-10
 
 
@@ -272,6 +283,19 @@ class METEORDeposition(Process, EntryData, PlotSection):
         unit='s',
         description='Elapsed time from the first log entry (Time column minus first value).',
     )
+    hdf5_file = Quantity(
+        type=str,
+        description=(
+            'Upload path of the HDF5 sidecar holding the full-resolution time '
+            'series (opt-in, ``hdf5_sidecar`` plugin option). When set, the arrays '
+            'in this entry are decimated previews (every ``preview_stride``-th '
+            'sample).'
+        ),
+    )
+    preview_stride = Quantity(
+        type=np.int64,
+        description='Decimation stride of the in-archive time series previews.',
+    )
 
     # ── Sub-sections ──────────────────────────────────────────────────────────
 
@@ -298,13 +322,25 @@ class METEORDeposition(Process, EntryData, PlotSection):
         super().normalize(archive, logger)
 
         # ── Figures ────────────────────────────────────────────────────────────
+        # Figures whose inputs are unchanged since the last normalization are
+        # reused from the previous ``figures`` instead of being rebuilt.
         import json
 
         import plotly.graph_objects as go
         import plotly.io as pio
 
+        previous = list(self.figures or [])
         self.figures = []
 
+        def _append_figure(label, inputs, build):
+            digest = figure_digest(label, *inputs)
+            figure = cached_figure(previous, label, digest, _ENTRY_POINT_ID)
+            if figure is None:
+                figure = make_figure(
+                    label, json.loads(pio.to_json(build())), digest, _ENTRY_POINT_ID
+                )
+            self.figures.append(figure)
+
         # Data was already trimmed at the venting cutoff by the parser.
         t = np.array(self.elapsed_time).tolist() if self.elapsed_time is not None else None
         pc = self.process_conditions
@@ -315,45 +351,53 @@ class METEORDeposition(Process, EntryData, PlotSection):
 
         # 1. Chamber pressure vs time (log scale)
         if t is not None and pc is not None and pc.chamber_pressure is not None:
-            pressure_mbar = _to_list(np.array(pc.chamber_pressure) * 0.01)
-            fig_p = go.Figure()
-            fig_p.add_trace(go.Scatter(x=t, y=pressure_mbar, mode='lines', name='Pressure'))
-            fig_p.update_layout(
-                template='plotly_white',
-                height=400,
-                width=716,
-                xaxis_title='Time (s)',
-                yaxis_title='Pressure (mbar)',
-                title_text='Chamber Pressure',
-                yaxis_type='log',
-            )
-            self.figures.append(
-                PlotlyFigure(label='Chamber Pressure', figure=json.loads(pio.to_json(fig_p)))
+
+            def _pressure_figure():
+                pressure_mbar = _to_list(np.array(pc.chamber_pressure) * 0.01)
+                fig_p = go.Figure()
+                fig_p.add_trace(
+                    go.Scatter(x=t, y=pressure_mbar, mode='lines', name='Pressure')
+                )
+                fig_p.update_layout(
+                    template='plotly_white',
+                    height=400,
+                    width=716,
+                    xaxis_title='Time (s)',
+                    yaxis_title='Pressure (mbar)',
+                    title_text='Chamber Pressure',
+                    yaxis_type='log',
+                )
+                return fig_p
+
+            _append_figure(
+                'Chamber Pressure',
+                (self.elapsed_time, pc.chamber_pressure),
+                _pressure_figure,
             )
 
         # 2. Pocket power vs time — interactive legend (click to toggle)
-        if t is not None and self.pockets:
-            fig_pw = go.Figure()
-            for pocket in self.pockets:
-                idx = pocket.pocket_index or ''
-                label = pocket.name or f'Pocket {idx}'
-                # Uncomment the following lines if you want to plot the set power as well
-                #if pocket.set_power is not None:
-                #    fig_pw.add_trace(go.Scatter(
-                #        x=t,
-                #        y=_to_list(pocket.set_power),
-                #        mode='lines',
-                #        name=f'{label} set',
-                #    ))
-                if pocket.measured_power is not None:
-                    fig_pw.add_trace(go.Scatter(
-                        x=t,
-                        y=_to_list(pocket.measured_power),
-                        mode='lines',
-                        name=f'{label}',
-                        line=dict(dash='dash'),
-                    ))
-            if fig_pw.data:
+        pockets = [
+            (
+                pocket.name or f'Pocket {pocket.pocket_index or ""}',
+                pocket.measured_power,
+            )
+            for pocket in self.pockets or []
+            if pocket.measured_power is not None
+        ]
+        if t is not None and pockets:
+
+            def _power_figure():
+                fig_pw = go.Figure()
+                for label, measured_power in pockets:
+                    fig_pw.add_trace(
+                        go.Scatter(
+                            x=t,
+                            y=_to_list(measured_power),
+                            mode='lines',
+                            name=f'{label}',
+                            line=dict(dash='dash'),
+                        )
+                    )
                 fig_pw.update_layout(
                     template='plotly_white',
                     height=400,
@@ -370,36 +414,52 @@ class METEORDeposition(Process, EntryData, PlotSection):
                         borderwidth=1,
                     ),
                 )
-                self.figures.append(
-                    PlotlyFigure(label='Pocket Power', figure=json.loads(pio.to_json(fig_pw)))
-                )
+                return fig_pw
+
+            _append_figure('Pocket Power', (self.elapsed_time, pockets), _power_figure)
 
         # 3. Deposition rate vs time — outliers removed via IQR clipping
-        if t is not None and self.qcm is not None and self.qcm.deposition_rate is not None:
-            rate_arr = _to_list(self.qcm.deposition_rate)  # already in Å/s
-            rate_np = np.array(rate_arr, dtype=np.float64)
-            # Remove outliers: values outside [Q1 - 3*IQR, Q3 + 3*IQR]
-            if len(rate_np) > 4:
-                q1, q3 = np.percentile(rate_np, [25, 75])
-                iqr = q3 - q1
-                lo, hi = q1 - 3 * iqr, q3 + 3 * iqr
-                rate_clean = [None if not (lo <= v <= hi) else float(v) for v in rate_np]
-            else:
-                rate_clean = rate_arr
-            fig_r = go.Figure()
-            fig_r.add_trace(go.Scatter(x=t, y=rate_clean, mode='lines', name='Rate'))
-            fig_r.update_layout(
-                template='plotly_white',
-                height=400,
-                width=716,
-                xaxis_title='Time (s)',
-                yaxis_title='Deposition Rate (Å/s)',
-                title_text='Deposition Rate',
-            )
-            self.figures.append(
-                PlotlyFigure(label='Deposition Rate', figure=json.loads(pio.to_json(fig_r)))
+        if (
+            t is not None
+            and self.qcm is not None
+            and self.qcm.deposition_rate is not None
+        ):
+
+            def _rate_figure():
+                rate_arr = _to_list(self.qcm.deposition_rate)  # already in Å/s
+                rate_np = np.array(rate_arr, dtype=np.float64)
+                # Remove outliers: values outside [Q1 - 3*IQR, Q3 + 3*IQR]
+                if len(rate_np) > 4:
+                    q1, q3 = np.percentile(rate_np, [25, 75])
+                    iqr = q3 - q1
+                    lo, hi = q1 - 3 * iqr, q3 + 3 * iqr
+                    rate_clean = [
+                        None if not (lo <= v <= hi) else float(v) for v in rate_np
+                    ]
+                else:
+                    rate_clean = rate_arr
+                fig_r = go.Figure()
+                fig_r.add_trace(
+                    go.Scatter(x=t, y=rate_clean, mode='lines', name='Rate')
+                )
+                fig_r.update_layout(
+                    template='plotly_white',
+                    height=400,
+                    width=716,
+                    xaxis_title='Time (s)',
+                    yaxis_title='Deposition Rate (Å/s)',
+                    title_text='Deposition Rate',
+                )
+                return fig_r
+
+            _append_figure(
+                'Deposition Rate',
+                (self.elapsed_time, self.qcm.deposition_rate),
+                _rate_figure,
             )
 
+        self._index_run(archive, logger)
+
         if not self.creates_new_thin_film:
             return
 
@@ -457,14 +517,10 @@ class METEORDeposition(Process, EntryData, PlotSection):
             logger,
         )
 
-        if not archive.m_context.raw_path_exists(film_filename):
-            film_ref = create_archive(
-                film_archive.m_to_dict(),
-                archive.m_context,
-                film_filename,
-                filetype,
-                logger,
-            )
+        # The film and its stack are written and registered together
+        batch = ArchiveBatch(archive.m_context, logger)
+        if not batch.exists(film_filename):
+            film_ref = batch.add(film_archive.m_to_dict(), film_filename, filetype)
         else:
             film_ref = get_hash_ref(archive.m_context.upload_id, film_filename)
 
@@ -487,19 +543,77 @@ class METEORDeposition(Process, EntryData, PlotSection):
                 archive,
                 logger,
             )
-            stack_ref = create_archive(
-                stack_archive.m_to_dict(),
-                archive.m_context,
-                stack_filename,
-                filetype,
-                logger,
-            )
+            stack_ref = batch.add(stack_archive.m_to_dict(), stack_filename, filetype)
             self.samples.append(INLSampleReference(reference=stack_ref))
         else:
             logger.warning(
                 'METEORDeposition.normalize: creates_new_thin_film=True but no '
                 'substrate set and no existing samples — skipping stack creation.'
             )
+        batch.commit()
+
+    def _index_run(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
+        """Write the run's scalar summary to the cross-run Parquet index
+        (opt-in, see :mod:`nomad_inl_base.run_index`)."""
+        from nomad_inl_base.run_index import index_run, run_index_path
+
+        if not run_index_path(_ENTRY_POINT_ID):
+            return
+
+        def full(path, value):
+            # Full resolution from the HDF5 sidecar if the entry was offloaded
+            if self.hdf5_file:
+                data = read_series(archive, self.hdf5_file, path)
+                if data is not None:
+                    return data
+            return None if value is None else np.asarray(value.magnitude)
+
+        t = full('elapsed_time', self.elapsed_time)
+        pc = self.process_conditions
+        base_pressure = None
+        if pc is not None and pc.chamber_pressure is not None:
+            pressure = full('process_conditions/chamber_pressure', pc.chamber_pressure)
+            pressure = pressure[pressure > 0]
+            if len(pressure):
+                base_pressure = float(np.min(pressure))
+
+        energy = None
+        if t is not None and len(t) > 1:
+            powers = [
+                full(f'pockets/{i}/measured_power', pocket.measured_power)
+                for i, pocket in enumerate(self.pockets or [])
+                if pocket.measured_power is not None
+            ]
+            energy = sum(
+                float(interval_integrals(p, t, [0], [len(t)])[0])
+                for p in powers
+                if len(p) == len(t)
+            )
+
+        thickness = None
+        if self.qcm is not None:
+            value = self.qcm.thickness_override
+            if value is None:
+                value = self.qcm.thickness
+            if value is not None:
+                thickness = float(value.to('nm').magnitude)
+
+        row = {
+            'entry_type': type(self).__name__,
+            'start_time': self.log_datetime or self.datetime,
+            'sample_name': self.name,
+            'materials': [
+                pocket.material.name
+                for pocket in self.pockets or []
+                if pocket.material is not None and pocket.material.name
+            ],
+            'base_pressure': base_pressure,
+            'duration': float(t[-1] - t[0]) if t is not None and len(t) else None,
+            'delivered_energy': energy,
+            'thickness': thickness,
+            'hdf5_file': self.hdf5_file,
+        }
+        index_run(archive, 'METEOR', row, _ENTRY_POINT_ID, logger)
 
 
 m_package.__init_metainfo__()
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 
 from datetime import date as _date
+from datetime import datetime as _datetime
+from datetime import time as _time
+from datetime import timezone as _timezone
 
 import numpy as np
 from nomad.config import config
@@ -62,6 +65,7 @@ from nomad_material_processing.vapor_deposition.pvd.general import (
 )
 from nomad_material_processing.vapor_deposition.pvd.sputtering import SputterDeposition
 
+from nomad_inl_base.profiling import profiled_normalize
 from nomad_inl_base.schema_packages.entities import (
     INLSampleReference,
     INLSubstrate,
@@ -70,6 +74,7 @@ from nomad_inl_base.schema_packages.entities import (
     INLThinFilmReference,
     INLThinFilmStack,
     INLThinFilmStackReference,
+    NormalizeDiagnostics,
 )
 from nomad_inl_base.utils import *
 
@@ -115,6 +120,8 @@ configuration = config.get_plugin_entry_point(
 
 m_package = SchemaPackage()
 
+_ENTRY_POINT_ID = 'nomad_inl_base.schema_packages:star_entry_point'
+
 
 class STARCategory(EntryDataCategory):
     m_def = Category(label='STAR', categories=[EntryDataCategory])
@@ -203,6 +210,16 @@ class TargetDepositionRecord(ArchiveSection):
         ),
     )
 
+    start_time = Quantity(
+        type=Datetime,
+        description='Start time of the experiment, copied from it so that the '
+        'target does not have to resolve the reference.',
+        a_eln=ELNAnnotation(
+            component=ELNComponentEnum.DateEditQuantity,
+            label='Start time',
+        ),
+    )
+
     deposition_time = Quantity(
         type=np.float64,
         description='Total duration of all powered steps in this experiment.',
@@ -414,6 +431,51 @@ class SputteringTarget(CompositeSystem, EntryData):
         ),
     )
 
+    ledger_size = Quantity(
+        type=int,
+        description='Number of deposition records included in the running totals '
+        '(set automatically).',
+    )
+
+    ledger_calibration_date = Quantity(
+        type=Datetime,
+        description='Calibration date the "since last calibration" totals were '
+        'accumulated for (set automatically).',
+    )
+
+    def _rebuild_ledger(self) -> None:
+        """Recompute the running totals from all deposition records."""
+        records = self.deposition_records or []
+        self.total_deposition_time = sum(
+            r.deposition_time for r in records if r.deposition_time is not None
+        )
+        self.total_deposition_energy = sum(
+            r.deposition_energy for r in records if r.deposition_energy is not None
+        )
+
+        since_time = 0.0
+        since_energy = 0.0
+        for record in records:
+            exp_start = record.start_time
+            if exp_start is None and record.experiment is not None:
+                # Records written before start_time was stored
+                exp_start = getattr(record.experiment, 'start_time', None)
+            # Count record if no calibration date set, or experiment is after it.
+            if (
+                self.last_calibration_date is None
+                or exp_start is None
+                or exp_start >= self.last_calibration_date
+            ):
+                if record.deposition_time is not None:
+                    since_time += record.deposition_time
+                if record.deposition_energy is not None:
+                    since_energy += record.deposition_energy
+
+        self.time_since_last_calibration = since_time
+        self.energy_since_last_calibration = since_energy
+        self.ledger_size = len(records)
+        self.ledger_calibration_date = self.last_calibration_date
+
     def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
         super().normalize(archive, logger)
 
@@ -443,40 +505,19 @@ class SputteringTarget(CompositeSystem, EntryData):
                 if self.calibration_data not in self.old_calibration_data:
                     self.old_calibration_data.append(self.calibration_data)
 
-        # Accumulate deposition time and energy from records.
+        # The totals are kept up to date in the target file as records are
+        # appended (see _add_to_target_ledger); they are only rebuilt here if
+        # records were added or removed by hand or the calibration date changed.
         if self.deposition_records:
-            total_time = sum(
-                r.deposition_time
-                for r in self.deposition_records
-                if r.deposition_time is not None
-            )
-            total_energy = sum(
-                r.deposition_energy
-                for r in self.deposition_records
-                if r.deposition_energy is not None
-            )
-            self.total_deposition_time = total_time
-            self.total_deposition_energy = total_energy
-
-            since_time = 0.0
-            since_energy = 0.0
-            for record in self.deposition_records:
-                exp_start = None
-                if record.experiment is not None:
-                    exp_start = getattr(record.experiment, 'start_time', None)
-                # Count record if no calibration date set, or experiment is after it.
-                if (
-                    self.last_calibration_date is None
-                    or exp_start is None
-                    or exp_start >= self.last_calibration_date
-                ):
-                    if record.deposition_time is not None:
-                        since_time += record.deposition_time
-                    if record.deposition_energy is not None:
-                        since_energy += record.deposition_energy
-
-            self.time_since_last_calibration = since_time
-            self.energy_since_last_calibration = since_energy
+            if (
+                self.ledger_size != len(self.deposition_records)
+                or self.ledger_calibration_date != self.last_calibration_date
+                or self.total_deposition_time is None
+                or self.time_since_last_calibration is None
+            ):
+                self._rebuild_ledger()
+            since_time = self.time_since_last_calibration
+            since_energy = self.energy_since_last_calibration
 
             if (
                 self.calibration_interval_time is not None
@@ -498,6 +539,70 @@ class SputteringTarget(CompositeSystem, EntryData):
         # self.message = f'Hello {self.name}!'
 
 
+def _as_utc(value):
+    """A datetime (or date, or ISO string) from a raw YAML file as an aware UTC
+    datetime. Unquoted dates (``2026-02-01``) load as dates: midnight UTC."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        value = _datetime.fromisoformat(value.replace('Z', '+00:00'))
+    elif isinstance(value, _date) and not isinstance(value, _datetime):
+        return _datetime.combine(value, _time.min, tzinfo=_timezone.utc)
+    if value.tzinfo is None:
+        return value.replace(tzinfo=_timezone.utc)
+    return value.astimezone(_timezone.utc)
+
+
+def _add_to_target_ledger(data: dict, record: dict) -> None:
+    """
+    Fold a deposition *record* just appended to the raw ``data`` of a
+    SputteringTarget file into the running totals stored next to it, so the
+    target's normalization does not have to sum all of its records again.
+
+    If the stored totals do not cover exactly the previous records for the
+    current calibration date (e.g. an older file, or records edited by hand)
+    they are rebuilt from all records first.
+    """
+    records = data['deposition_records']
+    calibrated = data.get('last_calibration_date')
+    if data.get('ledger_size') == len(records) - 1 and _as_utc(
+        data.get('ledger_calibration_date')
+    ) == _as_utc(calibrated):
+        folded = [record]
+    else:
+        folded = records
+        for key in (
+            'total_deposition_time',
+            'total_deposition_energy',
+            'time_since_last_calibration',
+            'energy_since_last_calibration',
+        ):
+            data[key] = 0.0
+
+    for rec in folded:
+        if not isinstance(rec, dict):
+            continue
+        time = rec.get('deposition_time') or 0.0
+        energy = rec.get('deposition_energy') or 0.0
+        data['total_deposition_time'] = (
+            data.get('total_deposition_time') or 0.0
+        ) + time
+        data['total_deposition_energy'] = (
+            data.get('total_deposition_energy') or 0.0
+        ) + energy
+        start = _as_utc(rec.get('start_time'))
+        if calibrated is None or start is None or start >= _as_utc(calibrated):
+            data['time_since_last_calibration'] = (
+                data.get('time_since_last_calibration') or 0.0
+            ) + time
+            data['energy_since_last_calibration'] = (
+                data.get('energy_since_last_calibration') or 0.0
+            ) + energy
+
+    data['ledger_size'] = len(records)
+    data['ledger_calibration_date'] = calibrated
+
+
 class SputteringTargetComponent(SystemComponent):
     m_def = Section(a_eln={'hide': ['mass_fraction', 'mass']})
 
@@ -1255,6 +1360,12 @@ class StarSputtering(SputterDeposition, EntryData):
         a_eln=ELNAnnotation(component=ELNComponentEnum.BoolEditQuantity),
     )
 
+    normalize_diagnostics = SubSection(
+        section_def=NormalizeDiagnostics,
+        description='Profile of the last normalization (opt-in, see the '
+        '``profile_normalize`` plugin option).',
+    )
+
     def _get_or_create_target_stacks(
         self, archive: 'EntryArchive', logger: 'BoundLogger'
     ) -> list:
@@ -1278,6 +1389,7 @@ class StarSputtering(SputterDeposition, EntryData):
         filetype = 'yaml'
 
         created_stacks = []
+        batch = ArchiveBatch(archive.m_context, logger)
         for substrate in self.substrates:
             new_stack = StarStack()
             new_stack.substrate = substrate
@@ -1290,21 +1402,31 @@ class StarSputtering(SputterDeposition, EntryData):
                 logger,
             )
 
-            stackRef = create_archive(
-                stack_archive.m_to_dict(),
-                archive.m_context,
-                stack_filename,
-                filetype,
-                logger,
-            )
+            stackRef = batch.add(stack_archive.m_to_dict(), stack_filename, filetype)
 
             sample_ref = INLSampleReference(reference=stackRef)
             self.samples.append(sample_ref)
             created_stacks.append(sample_ref)
 
+        batch.commit()
         return created_stacks
 
+    @profiled_normalize(_ENTRY_POINT_ID)
     def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
+        # Targets, samples and the recipe are dereferenced throughout; load
+        # their archives in one pass up front
+        prefetch_references(
+            archive,
+            [
+                getattr(c, 'system', None)
+                for s in self.sources or []
+                for c in s.material or []
+            ],
+            [s.reference for s in self.samples or []],
+            [s.reference for s in self.substrates or []],
+            self.recipe.reference if self.recipe is not None else None,
+            logger=logger,
+        )
         super().normalize(archive, logger)
 
         # Apply recipe defaults (set_* values) once and only if no steps exist yet.
@@ -1368,6 +1490,8 @@ class StarSputtering(SputterDeposition, EntryData):
         # Resolve target stacks once, at the start of the step loop
         target_stacks = self._get_or_create_target_stacks(archive, logger)
 
+        # Thin films of all steps are written and registered together
+        batch = ArchiveBatch(archive.m_context, logger)
         for idx, step in enumerate(self.steps):
             step.name = str(idx + 1) + '_' + step.m_def.label.replace(' ', '_')
             if step.environment is not None:
@@ -1429,13 +1553,9 @@ class StarSputtering(SputterDeposition, EntryData):
                     logger,
                 )
 
-                if not archive.m_context.raw_path_exists(thinFilm_filename):
-                    thinFilmRef = create_archive(
-                        thinFilm_archive.m_to_dict(),
-                        archive.m_context,
-                        thinFilm_filename,
-                        filetype,
-                        logger,
+                if not batch.exists(thinFilm_filename):
+                    thinFilmRef = batch.add(
+                        thinFilm_archive.m_to_dict(), thinFilm_filename, filetype
                     )
                 else:
                     thinFilmRef = get_hash_ref(
@@ -1468,6 +1588,7 @@ class StarSputtering(SputterDeposition, EntryData):
 
                 if step.sample_parameters is None:
                     step.sample_parameters = sample_parameters
+        batch.commit()
 
         # --- Update target deposition records ---
         # Compute total powered time and energy across all steps.
@@ -1488,76 +1609,68 @@ class StarSputtering(SputterDeposition, EntryData):
                     )
             if _step_power is not None:
                 _total_energy += _step_power * _step.duration
+        # Plain numbers in the record units: the records are written to YAML
+        if hasattr(_total_time, 'to'):
+            _total_time = float(_total_time.to('s').magnitude)
+        if hasattr(_total_energy, 'to'):
+            _total_energy = float(_total_energy.to('J').magnitude)
 
         _mainfile = (
             getattr(archive.metadata, 'mainfile', None) if archive.metadata else None
         )
-        for _src_idx, _source in enumerate(self.sources or []):
-            for _mat_comp in _source.material or []:
-                _target = getattr(_mat_comp, 'system', None)
-                if not isinstance(_target, SputteringTarget):
-                    continue
+        with yaml_write_back(archive.m_context).batch(logger) as _write_back:
+            for _src_idx, _source in enumerate(self.sources or []):
+                for _mat_comp in _source.material or []:
+                    _target = getattr(_mat_comp, 'system', None)
+                    if not isinstance(_target, SputteringTarget):
+                        continue
+
+                    _target_path = getattr(_target, 'target_raw_path', None)
+                    if not _target_path:
+                        logger.warning(
+                            f'StarSputtering.normalize: target for source {_src_idx} '
+                            'has no target_raw_path — normalize the target entry first. '
+                            'Skipping deposition record update.'
+                        )
+                        continue
 
-                _target_path = getattr(_target, 'target_raw_path', None)
-                if not _target_path:
-                    logger.warning(
-                        f'StarSputtering.normalize: target for source {_src_idx} '
-                        'has no target_raw_path — normalize the target entry first. '
-                        'Skipping deposition record update.'
-                    )
-                    continue
+                    if isinstance(archive.m_context, ClientContext):
+                        logger.warning(
+                            'StarSputtering.normalize: running in ClientContext, '
+                            'cannot update target deposition records.'
+                        )
+                        continue
 
-                if isinstance(archive.m_context, ClientContext):
-                    logger.warning(
-                        'StarSputtering.normalize: running in ClientContext, '
-                        'cannot update target deposition records.'
-                    )
-                    continue
+                    if not archive.m_context.raw_path_exists(_target_path):
+                        logger.warning(
+                            f'StarSputtering.normalize: target file {_target_path!r} '
+                            'not found in upload. Skipping record update.'
+                        )
+                        continue
 
-                if not archive.m_context.raw_path_exists(_target_path):
-                    logger.warning(
-                        f'StarSputtering.normalize: target file {_target_path!r} '
-                        'not found in upload. Skipping record update.'
+                    _this_ref = (
+                        get_hash_ref(archive.m_context.upload_id, _mainfile)
+                        if _mainfile
+                        else None
                     )
-                    continue
-
-                _this_ref = (
-                    get_hash_ref(archive.m_context.upload_id, _mainfile)
-                    if _mainfile
-                    else None
-                )
-
-                with archive.m_context.raw_file(_target_path, 'r') as _f:
-                    _target_dict = yaml.safe_load(_f) or {}
-
-                _data = _target_dict.setdefault('data', {})
-                _records = _data.get('deposition_records') or []
-
-                _already_recorded = any(
-                    rec.get('experiment') == _this_ref
-                    and rec.get('source_index') == _src_idx
-                    for rec in _records
-                )
-
-                if not _already_recorded:
-                    _records.append(
+                    # Applied when the batch exits: sources sharing a target
+                    # update its file once
+                    _write_back.append(
+                        _target_path,
+                        'deposition_records',
                         {
                             'experiment': _this_ref,
                             'source_index': _src_idx,
+                            'start_time': (
+                                self.start_time.isoformat()
+                                if self.start_time is not None
+                                else None
+                            ),
                             'deposition_time': _total_time,
                             'deposition_energy': _total_energy,
-                        }
-                    )
-                    _data['deposition_records'] = _records
-
-                    with archive.m_context.raw_file(_target_path, 'w') as _f:
-                        yaml.dump(_target_dict, _f)
-                    archive.m_context.upload.process_updated_raw_file(
-                        _target_path, allow_modify=True
-                    )
-                    logger.info(
-                        f'StarSputtering.normalize: added deposition record to '
-                        f'target {_target_path!r} (source {_src_idx}).'
+                        },
+                        unique=('experiment', 'source_index'),
+                        on_append=_add_to_target_ledger,
                     )
 
         logger.info(
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -5,20 +6,24 @@ if TYPE_CHECKING:
     from structlog.stdlib import BoundLogger
 
 import numpy as np
-import plotly.graph_objects as go
 from nomad.datamodel.context import ClientContext
 from nomad.datamodel.metainfo.annotations import ELNAnnotation, ELNComponentEnum
-from nomad.datamodel.metainfo.plot import PlotlyFigure, PlotSection
-from nomad.metainfo import Datetime, Quantity, SchemaPackage, Section
+from nomad.datamodel.metainfo.plot import PlotSection
+from nomad.metainfo import Datetime, Quantity, SchemaPackage, Section, SubSection
 
+from nomad_inl_base.profiling import normalize_phase, profiled_normalize
 from nomad_inl_base.schema_packages.entities import (
     INLEntityCategory,
     INLInstrument,
     INLInstrumentReference,
+    NormalizeDiagnostics,
 )
+from nomad_inl_base.utils import cached_figure, figure_digest, make_figure
 
 m_package = SchemaPackage()
 
+_ENTRY_POINT_ID = 'nomad_inl_base.schema_packages:testo_entry_point'
+
 _KELVIN_TO_C = 273.15
 
 
@@ -91,6 +96,27 @@ class INLTestoLogger(INLInstrument, PlotSection):
         a_eln=ELNAnnotation(label='Relative Humidity (%)'),
     )
 
+    hdf5_file = Quantity(
+        type=str,
+        description=(
+            'Upload path of the HDF5 sidecar holding the full-resolution records '
+            '(opt-in, ``hdf5_sidecar`` plugin option). When set, the arrays in this '
+            'entry, and therefore the merged trend plots, are decimated previews '
+            '(every ``preview_stride``-th record).'
+        ),
+    )
+
+    preview_stride = Quantity(
+        type=np.int64,
+        description='Decimation stride of the in-archive record previews.',
+    )
+
+    normalize_diagnostics = SubSection(
+        section_def=NormalizeDiagnostics,
+        description='Profile of the last normalization (opt-in, see the '
+        '``profile_normalize`` plugin option).',
+    )
+
     @staticmethod
     def _records_from_arrays(section) -> list:
         """Zip a section's ``timestamps``/``temperature``/``humidity`` array
@@ -126,15 +152,16 @@ class INLTestoLogger(INLInstrument, PlotSection):
             from nomad.search import MetadataPagination, search
 
             try:
-                search_result = search(
-                    owner='all',
-                    query={
-                        'results.eln.lab_ids': self.lab_id,
-                        'entry_type': 'INLTestoLogger',
-                    },
-                    pagination=MetadataPagination(page_size=1000),
-                    user_id=archive.metadata.main_author.user_id,
-                )
+                with normalize_phase('search', searches=1):
+                    search_result = search(
+                        owner='all',
+                        query={
+                            'results.eln.lab_ids': self.lab_id,
+                            'entry_type': 'INLTestoLogger',
+                        },
+                        pagination=MetadataPagination(page_size=1000),
+                        user_id=archive.metadata.main_author.user_id,
+                    )
             except Exception as exc:
                 logger.warning(
                     'INLTestoLogger: search for related entries failed.',
@@ -152,9 +179,11 @@ class INLTestoLogger(INLInstrument, PlotSection):
                         )
                         other = other_archive.data
                         other_records = self._records_from_arrays(other)
-                        candidates.append(
-                            (hit.get('upload_create_time'), other_records)
-                        )
+                        created = hit.get('upload_create_time')
+                        if isinstance(created, str):
+                            # search hits hold ISO strings
+                            created = datetime.fromisoformat(created)
+                        candidates.append((created, other_records))
                     except Exception as exc:
                         logger.warning(
                             'INLTestoLogger: failed to load related entry '
@@ -171,8 +200,10 @@ class INLTestoLogger(INLInstrument, PlotSection):
                     merged[ts] = (temp, hum)
         return merged
 
+    @profiled_normalize(_ENTRY_POINT_ID)
     def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
         super().normalize(archive, logger)
+        previous = list(self.figures or [])
         self.figures = []
 
         merged = self._collect_history(archive, logger)
@@ -191,33 +222,29 @@ class INLTestoLogger(INLInstrument, PlotSection):
 
         title_suffix = f' ({self.lab_id})' if self.lab_id else ''
 
-        temp_fig = go.Figure(
-            data=[go.Scatter(x=sorted_ts, y=temps_c, mode='lines+markers')]
-        )
-        temp_fig.update_layout(
-            template='plotly_white',
-            height=350,
-            xaxis_title='Time',
-            yaxis_title='Temperature (°C)',
-            title_text=f'Temperature Trend{title_suffix}',
-        )
-        self.figures.append(
-            PlotlyFigure(label='Temperature Trend', figure=temp_fig.to_plotly_json())
-        )
-
-        hum_fig = go.Figure(
-            data=[go.Scatter(x=sorted_ts, y=hums, mode='lines+markers')]
-        )
-        hum_fig.update_layout(
-            template='plotly_white',
-            height=350,
-            xaxis_title='Time',
-            yaxis_title='Relative Humidity (%)',
-            title_text=f'Humidity Trend{title_suffix}',
-        )
-        self.figures.append(
-            PlotlyFigure(label='Humidity Trend', figure=hum_fig.to_plotly_json())
-        )
+        for label, values, y_title in (
+            ('Temperature Trend', temps_c, 'Temperature (°C)'),
+            ('Humidity Trend', hums, 'Relative Humidity (%)'),
+        ):
+            digest = figure_digest(label, title_suffix, sorted_ts, values)
+            figure = cached_figure(previous, label, digest, _ENTRY_POINT_ID)
+            if figure is None:
+                import plotly.graph_objects as go
+
+                fig = go.Figure(
+                    data=[go.Scatter(x=sorted_ts, y=values, mode='lines+markers')]
+                )
+                fig.update_layout(
+                    template='plotly_white',
+                    height=350,
+                    xaxis_title='Time',
+                    yaxis_title=y_title,
+                    title_text=f'{label}{title_suffix}',
+                )
+                figure = make_figure(
+                    label, fig.to_plotly_json(), digest, _ENTRY_POINT_ID
+                )
+            self.figures.append(figure)
 
 
 class INLTestoLoggerReference(INLInstrumentReference):
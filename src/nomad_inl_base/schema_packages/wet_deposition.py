@@ -11,7 +11,6 @@ if TYPE_CHECKING:
         BoundLogger,
     )
 
-import yaml
 from baseclasses.atmosphere import Atmosphere
 from baseclasses.wet_chemical_deposition.blade_coating import BladeCoatingProperties
 from baseclasses.wet_chemical_deposition.dip_coating import DipCoatingProperties
@@ -59,7 +58,13 @@ from nomad_inl_base.schema_packages.entities import (
     INLThinFilmStack,
     INLThinFilmStackReference,
 )
-from nomad_inl_base.utils import create_archive, create_filename, get_hash_ref
+from nomad_inl_base.utils import (
+    create_archive,
+    create_filename,
+    get_hash_ref,
+    prefetch_references,
+    yaml_write_back,
+)
 
 m_package = SchemaPackage()
 
@@ -806,23 +811,10 @@ class INLThinFilmDeposition(SampleDeposition, EntryData):
                 film_ref = get_hash_ref(archive.m_context.upload_id, film_filename)
 
             # Write-back: append new layer reference to the stack's raw yaml file
-            with archive.m_context.raw_file(stack_path, 'r') as _f:
-                stack_dict = yaml.safe_load(_f) or {}
-
-            stack_data = stack_dict.setdefault('data', {})
-            layers = stack_data.get('layers') or []
-            layers.append({'reference': film_ref})
-            stack_data['layers'] = layers
-
-            with archive.m_context.raw_file(stack_path, 'w') as _f:
-                yaml.dump(stack_dict, _f)
-
-            archive.m_context.upload.process_updated_raw_file(
-                stack_path, allow_modify=True
-            )
-            logger.info(
-                f'INLThinFilmDeposition: appended new layer to existing stack {stack_path!r}.'
-            )
+            with yaml_write_back(archive.m_context).batch(logger) as write_back:
+                write_back.append(
+                    stack_path, 'layers', {'reference': film_ref}, unique=('reference',)
+                )
             return
 
         # --- Case B: first layer on bare substrate — create new stack ---
@@ -924,6 +916,17 @@ class INLThinFilmDeposition(SampleDeposition, EntryData):
     def normalize(self, archive: 'EntryArchive', logger: 'BoundLogger') -> None:
         if not self.method:
             self.method = 'Wet Deposition'
+        # Load the sample, substrate and recipe archives in one pass up front
+        prefetch_references(
+            archive,
+            [s.reference for s in self.samples or []],
+            [
+                section.reference
+                for section in (self.sample, self.substrate, self.recipe)
+                if section is not None
+            ],
+            logger=logger,
+        )
         super().normalize(archive, logger)
 
         if (
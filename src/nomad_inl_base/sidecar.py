@@ -0,0 +1,191 @@
+"""
+Optional HDF5 sidecar storage for long per-second process time series.
+
+When enabled (``hdf5_sidecar: true`` on the batteries, METEOR or Testo schema
+package entry point), every time series of an entry is written at full
+resolution to a chunked, gzip-compressed HDF5 file next to the mainfile in the
+upload, and the arrays in the archive are replaced by a decimated preview
+(every ``stride``-th sample). The entry records the sidecar filename and the
+stride so that scalars can be recomputed from the full-resolution data, read
+lazily through h5py slicing.
+
+Dataset paths mirror the section tree of the entry, e.g. ``timestamps`` or
+``chamber_environment/ion_gauge_pressure/value`` (see
+:func:`nomad_inl_base.utils.iter_time_series`).
+"""
+
+import io
+import math
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from nomad_inl_base.utils import (
+    apply_time_index,
+    iter_time_series,
+    plugin_option,
+    time_index_range,
+)
+
+if TYPE_CHECKING:
+    from nomad.datamodel.datamodel import EntryArchive
+
+_DEFAULT_PREVIEW_POINTS = 2000
+_CHUNK_ROWS = 16384
+
+
+def sidecar_filename(data_file: str) -> str:
+    """Upload-relative filename of the sidecar for the log ``data_file``."""
+    return f'{data_file}.timeseries.h5'
+
+
+def sidecar_enabled(entry_point_id: str) -> bool:
+    """Whether the entry point *entry_point_id* opted into HDF5 sidecar storage."""
+    return bool(plugin_option(entry_point_id, 'hdf5_sidecar', False))
+
+
+def preview_points(entry_point_id: str) -> int:
+    """Number of samples kept per time series in the archive preview."""
+    return int(
+        plugin_option(entry_point_id, 'preview_points', _DEFAULT_PREVIEW_POINTS)
+        or _DEFAULT_PREVIEW_POINTS
+    )
+
+
+def _as_dataset(value):
+    """Return ``(data, attrs)`` suitable for ``h5py.create_dataset``."""
+    import h5py
+
+    attrs = {}
+    if hasattr(value, 'magnitude'):
+        attrs['unit'] = str(value.units)
+        value = value.magnitude
+    if isinstance(value, list) and value and isinstance(value[0], datetime):
+        attrs['datetime'] = True
+        seconds = [
+            (ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)).timestamp()
+            for ts in value
+        ]
+        return np.array(seconds, dtype=np.float64), attrs
+    arr = np.asarray(value)
+    if arr.dtype.kind == 'M':
+        attrs['datetime'] = True
+        return arr.astype('datetime64[us]').astype(np.int64) / 1e6, attrs
+    if arr.dtype.kind in 'OUS':
+        return arr.astype(object), {**attrs, 'dtype': h5py.string_dtype()}
+    return arr, attrs
+
+
+def write_sidecar(
+    archive: 'EntryArchive',
+    section,
+    n: int,
+    filename: str,
+    n_preview: int = _DEFAULT_PREVIEW_POINTS,
+) -> int:
+    """
+    Write every time series of length *n* below *section* to the HDF5 file
+    *filename* in the upload and replace it in *section* by a decimated
+    preview. Returns the decimation stride.
+
+    If *section* records an index range (view-mode ``apply_time_index``), only
+    the rows in it are written and the range is cleared: the sidecar and the
+    previews hold the trimmed series.
+    """
+    import h5py
+
+    rows = time_index_range(section)
+    if rows != slice(None):
+        section.time_index_start = section.time_index_stop = None
+        # Slices of the arrays (views), taken in place of the range
+        rows = apply_time_index(section, n, rows)
+        n = rows.stop - rows.start
+
+    stride = max(1, math.ceil(n / max(1, n_preview)))
+    targets = list(iter_time_series(section, n))
+
+    buffer = io.BytesIO()
+    with h5py.File(buffer, 'w') as h5:
+        h5.attrs['n_points'] = n
+        h5.attrs['preview_stride'] = stride
+        for path, child, quantity in targets:
+            data, attrs = _as_dataset(child.m_get(quantity))
+            dtype = attrs.pop('dtype', None)
+            ds = h5.create_dataset(
+                path,
+                data=data,
+                dtype=dtype,
+                chunks=(min(n, _CHUNK_ROWS),),
+                compression='gzip',
+                compression_opts=4,
+                shuffle=dtype is None,
+            )
+            ds.attrs.update(attrs)
+
+    with archive.m_context.raw_file(filename, 'wb') as fh:
+        fh.write(buffer.getvalue())
+
+    if stride > 1:
+        for _, child, quantity in targets:
+            value = child.m_get(quantity)
+            child.m_set(quantity, value[::stride])
+    return stride
+
+
+def read_series(
+    archive: 'EntryArchive', filename: str, path: str, index=slice(None)
+) -> np.ndarray | None:
+    """
+    Read ``index`` (slice or index array) of the dataset *path* from the sidecar
+    *filename*. Only the requested chunks are read. Returns ``None`` if the
+    dataset does not exist. Datetime series are returned as ``datetime64``.
+    """
+    import h5py
+
+    with (
+        archive.m_context.raw_file(filename, 'rb') as fh,
+        h5py.File(fh, 'r') as h5,
+    ):
+        if path not in h5:
+            return None
+        ds = h5[path]
+        data = ds[index]
+        if ds.attrs.get('datetime'):
+            # Stored as UTC epoch seconds; naive datetimes were taken as UTC.
+            return np.round(data * 1e6).astype(np.int64).astype('datetime64[us]')
+        if ds.dtype.kind == 'O':
+            return np.array([v.decode() if isinstance(v, bytes) else v for v in data])
+        return data
+
+
+def offload_time_series(
+    archive: 'EntryArchive',
+    section,
+    n: int,
+    data_file: str,
+    entry_point_id: str,
+    logger,
+) -> bool:
+    """
+    Move the time series of *section* to the sidecar of ``data_file`` if
+    *entry_point_id* opted in, and record ``hdf5_file``/``preview_stride`` on
+    *section*. Failures are logged and leave the full arrays in place.
+    """
+    if not sidecar_enabled(entry_point_id) or n == 0:
+        return False
+    filename = sidecar_filename(data_file)
+    try:
+        stride = write_sidecar(
+            archive, section, n, filename, preview_points(entry_point_id)
+        )
+    except Exception as exc:
+        logger.warning(
+            f'Could not write HDF5 sidecar {filename!r}; keeping full-resolution '
+            'arrays in the archive.',
+            exc_info=exc,
+        )
+        return False
+    section.hdf5_file = filename
+    section.preview_stride = stride
+    return True
@@ -0,0 +1,1217 @@
+"""
+Synthetic instrument files at configurable size.
+
+The sample files in ``tests/data`` are small, so they do not show how parsing
+and normalization scale. The writers below produce files in the same formats
+the parsers read, at any size, with plausible signals and without lab data:
+
+============================  ==============================================
+``write_chamber_log``         PC03/PC04 ``All Signals`` CSV, ~460 columns at
+                              1 Hz for ``hours`` (PC04 heater-only logs with
+                              ``sputtering=False``)
+``write_meteor_log``          METEOR ``.nbl`` log ending in a venting tail
+``write_testo_vi2``           Testo ``.vi2`` OLE file with ``records``
+                              temperature/humidity records
+``write_solar_iv``            IV Graph and Results Table of ``cells`` cells
+``write_gdoes``               GDOES depth profile of ``elements`` elements
+``write_emsa``                EMSA/MAS EDX spectrum of ``channels`` channels
+``write_sem_set``             FEI/TFS SEM TIFF set of ``images`` images
+                              carrying the tag 34682 metadata
+``write_bruker_afm``          Bruker NanoScope ``.001`` image of ``pixels``
+                              × ``pixels`` samples per channel
+============================  ==============================================
+
+Every writer takes the output directory first, returns the path of the file
+to parse (the mainfile), and is deterministic for a given ``seed``::
+
+    from nomad_inl_base.synthetic import write_chamber_log
+
+    mainfile = write_chamber_log(tmp_path, 'PC03', hours=8)
+
+The same files can be written from the command line, e.g. to reproduce a
+production-size load on a laptop::
+
+    python -m nomad_inl_base.synthetic pc03 /tmp/upload --hours 8
+"""
+
+import argparse
+import math
+import os
+import struct
+import sys
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+_START = datetime(2026, 3, 18, 14, 15, 53)
+# Rows generated and written at a time, so that memory stays flat in ``hours``
+_CHUNK_ROWS = 3600
+
+# ---------------------------------------------------------------------------
+# PC03/PC04 All Signals CSV
+# ---------------------------------------------------------------------------
+
+_CHAMBER_MATERIALS = {
+    'PC03': ('LiCoO2', '', 'LiMn2O4', ''),
+    'PC04': ('Li3PO4', '', 'LiNbO3', ''),
+}
+_CHAMBER_COLUMNS = 460
+# Signals the parser does not read, logged by the chamber PLC all the same
+_SOURCE_EXTRAS = (
+    'Water Flow',
+    'Water Temperature',
+    'Crystal Life',
+    'Crystal Frequency',
+    'Tooling',
+    'Density',
+    'Z-Ratio',
+    'Power Setpoint',
+    'Ramp Time',
+    'Soak Time',
+    'Interlock OK',
+    'Cover Position',
+)
+_SUPPLY_EXTRAS = ('Interlock', 'Mode', 'Ramp Rate', 'Status', 'Fault', 'Hours')
+_CHAMBER_EXTRAS = (
+    'PC Turbo Speed',
+    'PC Turbo Current',
+    'PC Turbo Temperature',
+    'PC Gate Valve Open',
+    'PC Vent Valve Open',
+    'PC Rough Valve Open',
+    'PC Foreline Pressure',
+    'LL Pressure',
+    'LL Vent Valve Open',
+    'LL Rough Valve Open',
+    'LL Gate Valve Open',
+    'LL Door Closed',
+    'LL Turbo Speed',
+    'Chiller Supply Temperature',
+    'Chiller Return Temperature',
+    'Chiller Flow',
+    'Compressed Air OK',
+    'Cabinet Temperature',
+)
+
+
+def _phases(t, n, bounds=(0.1, 0.15, 0.85)):
+    """Process phase (0-3) of the rows *t* of a log of *n* rows."""
+    return np.searchsorted(np.asarray(bounds) * n, t, side='right')
+
+
+def _noise(rng, t, scale):
+    return rng.normal(0.0, scale, len(t))
+
+
+def _chamber_columns(sputtering: bool) -> list[str]:
+    columns = [
+        'Time Stamp',
+        'Process Phase',
+        'Process Time',
+        'PC Capman Pressure',
+        'PC Capman Pressure Setpoint',
+        'PC Ion Gauge Pressure',
+        'PC Wide Range Gauge',
+        'PC Roughing Pressure',
+        'PC Substrate Shutter Open',
+        'Substrate Heater Temperature',
+        'Substrate Heater Temperature 2',
+        'Substrate Heater Temperature Setpoint',
+        'Substrate Heater Current',
+        'Substrate Rotation_Speed',
+        'Substrate Bias Active',
+        'Rigel DC Voltage',
+        'Rigel DC Current',
+        'Rigel DC Power',
+        *(f'TC{i} Temperature' for i in range(1, 7)),
+        'Substrate Type',
+    ]
+    for i in (1, 2, 3):
+        columns += [f'PC MFC {i} Gas', f'PC MFC {i} Flow', f'PC MFC {i} Setpoint']
+    if sputtering:
+        for i in (1, 2, 3, 4):
+            columns += [
+                f'PC Source {i} {name}'
+                for name in (
+                    'Material',
+                    'Loaded Target',
+                    'Final Thickness Setpoint',
+                    'Active',
+                    'Shutter Open',
+                    'Rate',
+                    'Thickness',
+                    'Accumulate Thickness',
+                    *_SOURCE_EXTRAS,
+                )
+            ]
+        columns += [
+            'PC Source 1 Switch-RF-PWS1',
+            'PC Source 1 Switch-PDC-PWS4',
+            'PC Source 3 Switch-RF-PWS3',
+            'PC Source 3 Switch-PDC-PWS4',
+            'PC Source 4 Switch-RF-PWS3',
+            'PC Source 4 Switch-PDC-PWS4',
+        ]
+    for i in (1, 3, 5):
+        columns += [
+            f'Power Supply {i} {name}'
+            for name in (
+                'Fwd Power',
+                'Rfl Power',
+                'DC Bias',
+                'Load Cap Position',
+                'Tune Cap Position',
+                'Output Setpoint',
+            )
+        ]
+    columns += [
+        f'Power Supply 4 {name}'
+        for name in (
+            'Current',
+            'Voltage',
+            'Power',
+            'Pulse Frequency',
+            'Output Setpoint',
+            'Current Setpoint',
+            'Voltage Setpoint',
+            'DC Count',
+            'Spark Count',
+        )
+    ]
+    columns += [
+        f'Power Supply {i} {name}' for i in (1, 3, 4, 5) for name in _SUPPLY_EXTRAS
+    ]
+    columns += _CHAMBER_EXTRAS
+    # Spare analog and digital channels pad the header to the real width
+    spare = max(0, _CHAMBER_COLUMNS - len(columns))
+    columns += [f'Spare AI {i:03d}' for i in range(1, spare // 2 + 1)]
+    columns += [f'Spare DI {i:03d}' for i in range(1, spare - spare // 2 + 1)]
+    return columns
+
+
+def _chamber_rows(t, n, start, rng, chamber, sputtering):
+    """Values of the rows *t* (row indices of a log of *n* rows) by column."""
+    if sputtering:
+        names = np.array(['Pump Down', 'Pre-Sputter', 'Deposition', 'Cool Down'])
+        setpoint = 200.0
+    else:
+        names = np.array(['Pump Down', 'Heating', 'Annealing', 'Cool Down'])
+        setpoint = 400.0
+    phase = _phases(t, n)
+    running = (phase == 1) | (phase == 2)
+    depositing = phase == 2
+    cooling = phase == 3
+    t0, t1, t2 = 0.1 * n, 0.15 * n, 0.85 * n
+
+    # Heater: first-order approach to the setpoint, exponential cool down
+    tau = max(0.02 * n, 1.0)
+    heated = 25.0 + (setpoint - 25.0) * (1 - np.exp(-np.clip(t - t0, 0, None) / tau))
+    at_stop = 25.0 + (setpoint - 25.0) * (1 - math.exp(-(t2 - t0) / tau))
+    cooled = 25.0 + (at_stop - 25.0) * np.exp(-np.clip(t - t2, 0, None) / tau)
+    heater = np.where(cooling, cooled, np.where(t >= t0, heated, 25.0))
+    heater += _noise(rng, t, 0.2)
+
+    ion_gauge = 1e-3 * np.exp(-t / tau) + 5e-7 * (1 + 0.05 * rng.random(len(t)))
+    capman = np.where(running, 3e-3, 0.0) + np.abs(_noise(rng, t, 2e-5))
+    timestamps = [
+        (start + timedelta(seconds=float(s))).strftime('%b-%d-%Y %I:%M:%S.000 %p')
+        for s in t
+    ]
+    elapsed = np.clip(t - t1, 0, t2 - t1)
+    rows = {
+        'Time Stamp': timestamps,
+        'Process Phase': names[phase],
+        'Process Time': t.astype(np.float64),
+        'PC Capman Pressure': capman,
+        'PC Capman Pressure Setpoint': np.where(running, 3e-3, 0.0),
+        'PC Ion Gauge Pressure': ion_gauge,
+        'PC Wide Range Gauge': np.maximum(ion_gauge, capman),
+        'PC Roughing Pressure': 1e-2 + np.abs(_noise(rng, t, 1e-4)),
+        'PC Substrate Shutter Open': depositing.astype(int),
+        'Substrate Heater Temperature': heater,
+        'Substrate Heater Temperature 2': heater - 3.0,
+        'Substrate Heater Temperature Setpoint': np.where(running, setpoint, 25.0),
+        'Substrate Heater Current': np.clip((heater - 25.0) / 40.0, 0, None),
+        'Substrate Rotation_Speed': np.where(running, 10.0, 0.0),
+        'Substrate Bias Active': np.zeros(len(t), dtype=int),
+        'Rigel DC Voltage': np.abs(_noise(rng, t, 0.01)),
+        'Rigel DC Current': np.abs(_noise(rng, t, 1e-4)),
+        'Rigel DC Power': np.zeros(len(t)),
+        'Substrate Type': np.full(len(t), 'Si'),
+    }
+    for i in range(1, 7):
+        rows[f'TC{i} Temperature'] = 25.0 + (heater - 25.0) / (i + 1)
+    for i, (gas, flow) in enumerate((('Ar', 20.0), ('O2', 2.0), ('N2', 0.0)), 1):
+        on = running if i == 1 else depositing
+        rows[f'PC MFC {i} Gas'] = np.full(len(t), gas)
+        rows[f'PC MFC {i} Setpoint'] = np.where(on, flow, 0.0)
+        rows[f'PC MFC {i} Flow'] = np.where(on, flow, 0.0) + _noise(rng, t, 0.05)
+    if sputtering:
+        for i, material in enumerate(_CHAMBER_MATERIALS[chamber], 1):
+            active = running & bool(material)
+            rate = 0.5 / i if material else 0.0
+            rows[f'PC Source {i} Material'] = np.full(len(t), material)
+            rows[f'PC Source {i} Loaded Target'] = np.full(
+                len(t), f'{material}-0{i}' if material else ''
+            )
+            rows[f'PC Source {i} Final Thickness Setpoint'] = np.full(len(t), 1000.0)
+            rows[f'PC Source {i} Active'] = active.astype(int)
+            rows[f'PC Source {i} Shutter Open'] = (depositing & active).astype(int)
+            rows[f'PC Source {i} Rate'] = np.where(
+                depositing & active, rate + _noise(rng, t, 0.02 * rate), 0.0
+            )
+            rows[f'PC Source {i} Thickness'] = rate * elapsed
+            rows[f'PC Source {i} Accumulate Thickness'] = 5000.0 + rate * elapsed
+        rows['PC Source 1 Switch-RF-PWS1'] = np.ones(len(t), dtype=int)
+        rows['PC Source 3 Switch-PDC-PWS4'] = np.ones(len(t), dtype=int)
+        rf_on = running
+        dc_on = running & bool(_CHAMBER_MATERIALS[chamber][2])
+    else:
+        rf_on = dc_on = np.zeros(len(t), dtype=bool)
+    for i in (1, 3, 5):
+        on = rf_on if i == 1 else np.zeros(len(t), dtype=bool)
+        rows[f'Power Supply {i} Fwd Power'] = np.where(on, 100.0, 0.0) + np.abs(
+            _noise(rng, t, 0.5)
+        )
+        rows[f'Power Supply {i} Rfl Power'] = np.where(on, 1.0, 0.0)
+        rows[f'Power Supply {i} DC Bias'] = np.where(on, -150.0, 0.0)
+        rows[f'Power Supply {i} Load Cap Position'] = np.full(len(t), 45.0)
+        rows[f'Power Supply {i} Tune Cap Position'] = np.full(len(t), 60.0)
+        rows[f'Power Supply {i} Output Setpoint'] = np.where(on, 100.0, 0.0)
+    rows['Power Supply 4 Power'] = np.where(dc_on, 200.0, 0.0) + np.abs(
+        _noise(rng, t, 0.5)
+    )
+    rows['Power Supply 4 Current'] = rows['Power Supply 4 Power'] / 500.0
+    rows['Power Supply 4 Voltage'] = np.where(dc_on, 500.0, 0.0)
+    rows['Power Supply 4 Pulse Frequency'] = np.where(dc_on, 100.0, 0.0)
+    rows['Power Supply 4 Output Setpoint'] = np.where(dc_on, 200.0, 0.0)
+    rows['Power Supply 4 Current Setpoint'] = np.where(dc_on, 0.4, 0.0)
+    rows['Power Supply 4 Voltage Setpoint'] = np.where(dc_on, 500.0, 0.0)
+    # Arcs and sparks accumulate at a steady rate while the supply is on
+    rows['Power Supply 4 DC Count'] = (elapsed // 437).astype(int) * dc_on
+    rows['Power Supply 4 Spark Count'] = (elapsed // 1999).astype(int) * dc_on
+    return rows
+
+
+def write_chamber_log(
+    directory,
+    chamber: str = 'PC03',
+    hours: float = 1.0,
+    *,
+    sputtering: bool = True,
+    sample: str = 'Synthetic_001',
+    start: datetime = _START,
+    seed: int = 0,
+) -> str:
+    """
+    PC03/PC04 ``All Signals`` CSV of a run of *hours* at 1 Hz: the three-line
+    preamble, the ~460-column header of the chamber PLC and one row per
+    second through pump down, pre-sputter, deposition and cool down. With
+    ``sputtering=False`` the source columns are left out, which makes it a
+    heater-only PC04 annealing log.
+    """
+    import pandas as pd
+
+    if chamber not in _CHAMBER_MATERIALS:
+        raise ValueError(f'Unknown chamber {chamber!r}.')
+    rng = np.random.default_rng(seed)
+    n = max(int(round(hours * 3600)), 1)
+    columns = _chamber_columns(sputtering)
+    path = os.path.join(
+        directory, f'{chamber}_All Signals_{sample} {start:%Y.%m.%d-%H.%M.%S}.csv'
+    )
+    with open(path, 'w', encoding='utf-8', newline='') as fh:
+        fh.write('Recording Name,Date Started,User\n')
+        fh.write(
+            f'All Signals,{start.year}-{start.month}-{start.day} '
+            f'{start:%H-%M-%S},Synthetic\n\n'
+        )
+        fh.write(','.join(columns) + '\n')
+        for first in range(0, n, _CHUNK_ROWS):
+            t = np.arange(first, min(first + _CHUNK_ROWS, n))
+            rows = _chamber_rows(t, n, start, rng, chamber, sputtering)
+            frame = pd.DataFrame({name: rows.get(name, 0) for name in columns}, index=t)
+            frame.to_csv(fh, header=False, index=False, float_format='%.6g')
+    return path
+
+
+# ---------------------------------------------------------------------------
+# METEOR .nbl
+# ---------------------------------------------------------------------------
+
+
+def _meteor_columns() -> list[str]:
+    pockets = range(1, 5)
+    return [
+        'Time',
+        'Pressure(mBar)',
+        'Temp(C)',
+        'Power(W)',
+        '% Current(%)',
+        'Rotation speed(RPM)',
+        *(f'Fil {i}(A)' for i in pockets),
+        *(f'Power {i}(W)' for i in pockets),
+        # The second set of Power N(W) columns is the measured power
+        *(f'Power {i}(W)' for i in pockets),
+        *(f'Flux {i}(nA)' for i in pockets),
+        *(f'Enable {i}' for i in pockets),
+        'Frequency(Hz)',
+        'Rate(A/s)',
+        'Thickness(A)',
+        'Density(g/cm3)',
+        'Tooling factor(%)',
+    ]
+
+
+def write_meteor_log(
+    directory,
+    hours: float = 1.0,
+    *,
+    vent_seconds: int = 600,
+    name: str = 'Synthetic METEOR run',
+    start: datetime = _START,
+    seed: int = 0,
+) -> str:
+    """
+    Korvus METEOR ``.nbl`` log of an e-beam evaporation of *hours* at 1 Hz,
+    followed by *vent_seconds* of venting in which the pressure rises to
+    atmosphere (the rows the parser cuts off). Pocket 1 evaporates; the
+    others stay disabled.
+    """
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    n_run = max(int(round(hours * 3600)), 1)
+    n = n_run + vent_seconds
+    columns = _meteor_columns()
+    path = os.path.join(directory, f'{name}.nbl')
+    with open(path, 'w', encoding='utf-8', newline='') as fh:
+        # Only the data rows end in a comma
+        fh.write(
+            f'Korvus Technology Log File  {start:%d/%m/%Y %H:%M:%S}'
+            + ', '.join(columns)
+            + '\n'
+        )
+        clock = start.hour * 3600 + start.minute * 60 + start.second
+        for first in range(0, n, _CHUNK_ROWS):
+            t = np.arange(first, min(first + _CHUNK_ROWS, n))
+            m = len(t)
+            venting = t >= n_run
+            evaporating = (t >= 0.1 * n_run) & ~venting
+            vent = np.logspace(-5, 3, max(vent_seconds, 1))
+            pressure = np.where(
+                venting,
+                vent[np.clip(t - n_run, 0, len(vent) - 1)],
+                2e-6 * (1 + 0.05 * rng.random(m)),
+            )
+            power = np.where(evaporating, 450.0, 0.0) + np.abs(_noise(rng, t, 1.0))
+            rate = np.where(evaporating, 1.2 + _noise(rng, t, 0.05), 0.0)
+            thickness = 1.2 * np.clip(t - 0.1 * n_run, 0, 0.9 * n_run)
+            rows = [
+                clock + t,
+                pressure,
+                25.0 + 5.0 * evaporating + _noise(rng, t, 0.1),
+                power,
+                power / 10.0,
+                np.full(m, 5.0),
+            ]
+            for i in range(1, 5):
+                rows.append(np.where(evaporating & (i == 1), 18.0, 0.0))
+            for _ in range(2):
+                for i in range(1, 5):
+                    rows.append(power if i == 1 else np.zeros(m))
+            for i in range(1, 5):
+                rows.append(np.where(evaporating & (i == 1), 35.0, 0.0))
+            for i in range(1, 5):
+                rows.append(np.full(m, 'True' if i == 1 else 'False'))
+            rows += [
+                5.98e6 - 0.002 * thickness,
+                rate,
+                thickness,
+                np.full(m, 5.32),
+                np.full(m, 100.0),
+                np.full(m, ''),
+            ]
+            frame = pd.DataFrame(dict(enumerate(rows)))
+            frame.to_csv(fh, header=False, index=False, float_format='%.6g')
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Testo .vi2 (OLE compound file)
+# ---------------------------------------------------------------------------
+
+_SECTOR = 512
+_MINI_SECTOR = 64
+_MINI_CUTOFF = 4096
+_FREE, _END, _FAT, _DIFAT = 0xFFFFFFFF, 0xFFFFFFFE, 0xFFFFFFFD, 0xFFFFFFFC
+# Ticks of the Testo logger clock per second, see _parse_testo_vi2
+_TESTO_TICKS = 9.63857262
+_TESTO_FOLDER = 54302
+
+
+def _ole_name_key(name: str):
+    # Directory siblings are ordered by name length, then case-insensitively
+    return len(name), name.upper()
+
+
+def _ole_entry(name: bytes, kind: int, right: int, child: int, start, size):
+    return struct.pack(
+        '<64sHBBIII16sI16sIII',
+        name,
+        len(name) + 2 if name else 0,
+        kind,
+        1,  # black
+        _FREE,
+        right,
+        child,
+        b'\0' * 16,
+        0,
+        b'\0' * 16,
+        start,
+        size,
+        0,
+    )
+
+
+def _write_ole(path: str, streams: dict[str, bytes]) -> None:
+    """
+    Write *streams* (``'storage/stream'`` paths → contents) to a version 3
+    OLE compound file. Streams below 4096 bytes go to the mini stream.
+    Siblings are chained in name order rather than balanced into a
+    red-black tree, which readers do not check.
+    """
+    # Directory entries: [name, type, children, stream bytes]; 0 is the root
+    entries = [['Root Entry', 5, [], b'']]
+    storages = {(): 0}
+    for stream_path, data in streams.items():
+        parts = tuple(stream_path.split('/'))
+        for depth in range(1, len(parts)):
+            if parts[:depth] not in storages:
+                storages[parts[:depth]] = len(entries)
+                entries[storages[parts[: depth - 1]]][2].append(len(entries))
+                entries.append([parts[depth - 1], 1, [], b''])
+        entries[storages[parts[:-1]]][2].append(len(entries))
+        entries.append([parts[-1], 2, [], data])
+
+    # Mini stream (kept in the root entry's sector chain) and mini FAT
+    mini_stream, mini_fat, starts = bytearray(), [], {}
+    for sid, (_, kind, _, data) in enumerate(entries):
+        if kind == 2 and 0 < len(data) < _MINI_CUTOFF:
+            first = len(mini_stream) // _MINI_SECTOR
+            count = -(-len(data) // _MINI_SECTOR)
+            mini_fat += [*range(first + 1, first + count), _END]
+            mini_stream += data.ljust(count * _MINI_SECTOR, b'\0')
+            starts[sid] = first
+
+    # Regular sectors: mini stream, large streams, mini FAT, directory
+    sectors, chains = bytearray(), []
+
+    def allocate(data: bytes) -> int:
+        if not data:
+            return _END
+        first = len(sectors) // _SECTOR
+        count = -(-len(data) // _SECTOR)
+        chains.append((first, count))
+        sectors.extend(data.ljust(count * _SECTOR, b'\0'))
+        return first
+
+    root_start = allocate(bytes(mini_stream))
+    for sid, (_, kind, _, data) in enumerate(entries):
+        if kind == 2 and len(data) >= _MINI_CUTOFF:
+            starts[sid] = allocate(data)
+    mini_fat_bytes = struct.pack(f'<{len(mini_fat)}I', *mini_fat)
+    mini_fat_start = allocate(mini_fat_bytes)
+
+    siblings = {}
+    for _, _, children, _ in entries:
+        ordered = sorted(children, key=lambda sid: _ole_name_key(entries[sid][0]))
+        for left, right in zip(ordered, ordered[1:]):
+            siblings[left] = right
+    directory = bytearray()
+    for sid, (name, kind, children, data) in enumerate(entries):
+        encoded = name.encode('utf-16-le')
+        if sid == 0:
+            start, size = root_start, len(mini_stream)
+        else:
+            start, size = starts.get(sid, _END if kind == 2 else 0), len(data)
+        directory += _ole_entry(
+            encoded,
+            kind,
+            siblings.get(sid, _FREE),
+            min(children, key=lambda c: _ole_name_key(entries[c][0]))
+            if children
+            else _FREE,
+            start,
+            size,
+        )
+    # Unused slots of the last directory sector are empty entries
+    while len(directory) % _SECTOR:
+        directory += _ole_entry(b'', 0, _FREE, _FREE, 0, 0)
+    directory_start = allocate(bytes(directory))
+
+    # FAT (and DIFAT beyond the 109 FAT sectors listed in the header)
+    data_sectors = len(sectors) // _SECTOR
+    n_fat = n_difat = 0
+    while True:
+        n_difat = max(0, -(-(n_fat - 109) // 127))
+        if n_fat * 128 >= data_sectors + n_fat + n_difat:
+            break
+        n_fat += 1
+    fat = [_FREE] * (n_fat * 128)
+    for first, count in chains:
+        fat[first : first + count] = [*range(first + 1, first + count), _END]
+    fat_sectors = list(range(data_sectors, data_sectors + n_fat))
+    difat_sectors = list(range(data_sectors + n_fat, data_sectors + n_fat + n_difat))
+    for sid in fat_sectors:
+        fat[sid] = _FAT
+    for sid in difat_sectors:
+        fat[sid] = _DIFAT
+    sectors += struct.pack(f'<{len(fat)}I', *fat)
+    overflow = fat_sectors[109:]
+    for i, sid in enumerate(difat_sectors):
+        listed = overflow[i * 127 : (i + 1) * 127]
+        following = difat_sectors[i + 1] if i + 1 < n_difat else _END
+        sectors += struct.pack(
+            '<128I', *listed, *([_FREE] * (127 - len(listed))), following
+        )
+
+    header = struct.pack(
+        '<8s16sHHHHH6sIIIIIIIII',
+        bytes.fromhex('D0CF11E0A1B11AE1'),
+        b'\0' * 16,
+        0x3E,
+        3,
+        0xFFFE,
+        9,
+        6,
+        b'\0' * 6,
+        0,
+        n_fat,
+        directory_start,
+        0,
+        _MINI_CUTOFF,
+        mini_fat_start,
+        -(-len(mini_fat_bytes) // _SECTOR),
+        difat_sectors[0] if difat_sectors else _END,
+        n_difat,
+    )
+    listed = fat_sectors[:109]
+    header += struct.pack('<109I', *listed, *([_FREE] * (109 - len(listed))))
+    with open(path, 'wb') as fh:
+        fh.write(header)
+        fh.write(sectors)
+
+
+def _property_set(fmtid: bytes, properties: list[tuple[int, int, bytes]]) -> bytes:
+    """An OLE property set stream with one section of ``(id, type, value)``."""
+    offsets, values = [], b''
+    start = 8 + 8 * len(properties)
+    for pid, vtype, value in properties:
+        offsets.append(struct.pack('<II', pid, start + len(values)))
+        values += struct.pack('<I', vtype) + value.ljust(-(-len(value) // 4) * 4, b'\0')
+    section = struct.pack('<II', start + len(values), len(properties))
+    section += b''.join(offsets) + values
+    return (
+        struct.pack('<HHI16sI', 0xFFFE, 0, 0x0002000A, b'\0' * 16, 1)
+        + struct.pack('<16sI', fmtid, 48)
+        + section
+    )
+
+
+def _lpstr(text: str) -> bytes:
+    encoded = text.encode('latin1') + b'\0'
+    return struct.pack('<I', len(encoded)) + encoded
+
+
+def _timezone_utc() -> bytes:
+    def zone(name: str) -> bytes:
+        return name.encode('utf-16-le').ljust(64, b'\0') + b'\0' * 16 + b'\0' * 4
+
+    return struct.pack('<5I', 188, 1, 1, 1, 0) + zone('UTC') + zone('UTC')
+
+
+def write_testo_vi2(
+    directory,
+    records: int = 10000,
+    *,
+    interval: int = 300,
+    lab: str = 'STAR LAB',
+    serial: str = '44675156',
+    start: datetime = _START,
+    seed: int = 0,
+) -> str:
+    """
+    Testo 175H1 ``.vi2`` export of *records* temperature/humidity readings
+    taken every *interval* seconds from *start* on: an OLE compound file with
+    the ``summary``, ``t17c``, ``data/values`` and ``SummaryInformation``
+    streams the parser reads, plus the schema, timezone and folder streams
+    of the logger software.
+    """
+    rng = np.random.default_rng(seed)
+    # Programmed a day before the first reading; the logger clock counts ticks
+    start_epoch = start.replace(tzinfo=timezone.utc).timestamp()
+    prog_time = int(start_epoch) - 86400
+    first_tick = round((start_epoch - prog_time) * _TESTO_TICKS)
+    step = round(320 * interval / 300)
+    hours = np.arange(records) * interval / 3600
+    values = np.empty(
+        records, dtype=[('ticker', '<u4'), ('humidity', '<f4'), ('temperature', '<f4')]
+    )
+    values['ticker'] = first_tick + step * np.arange(records, dtype=np.uint32)
+    values['temperature'] = np.round(
+        22.0 + 2.0 * np.sin(2 * np.pi * hours / 24) + rng.normal(0, 0.1, records), 1
+    )
+    values['humidity'] = np.round(
+        45.0 - 8.0 * np.sin(2 * np.pi * hours / 24) + rng.normal(0, 0.5, records), 1
+    )
+    last_tick = int(values['ticker'][-1]) if records else first_tick
+    folder = str(_TESTO_FOLDER)
+    summary_information = _property_set(
+        bytes.fromhex('e0859ff2f94f6810ab9108002b27b3d9'),
+        [
+            (1, 2, struct.pack('<H', 1252)),
+            (0x80000000, 19, struct.pack('<I', 0x409)),
+            (2, 30, _lpstr(lab)),
+            (4, 30, _lpstr(f't17c: SN {serial}\n')),
+            (6, 30, _lpstr('')),
+        ],
+    )
+    t17c = (
+        'DeviceType\t4\r\n'
+        f'SerialNumber\t{serial}\r\n'
+        + ''.join(f'SensorType\t{i} 1\r\n' for i in range(5))
+        + f'ProgTime\t{prog_time}\r\n'
+    )
+    path = os.path.join(directory, f'{lab}_{serial}_{start:%Y_%m_%d_%H_%M_%S}.vi2')
+    _write_ole(
+        path,
+        {
+            f'{folder}/\x05SummaryInformation': summary_information,
+            f'{folder}/data/schema': b'\x02\x00\x03\x00\x01\x00',
+            f'{folder}/data/timezone': _timezone_utc(),
+            f'{folder}/data/values': values.tobytes(),
+            f'{folder}/summary': struct.pack(
+                '<9I',
+                first_tick,
+                last_tick,
+                3,
+                records,
+                48,
+                0,
+                0,
+                interval * 1000,
+                first_tick,
+            ),
+            f'{folder}/t17c': t17c.encode('latin1'),
+            'org': b'\x00\x05\x00\x00\x01\x00\x00\x00'
+            + struct.pack('<I', _TESTO_FOLDER)
+            + folder.encode()
+            + b'\0',
+        },
+    )
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Solar cell IV (IV Graph + Results Table)
+# ---------------------------------------------------------------------------
+
+_IV_AREA = 0.181  # cm²
+_IV_THERMAL_VOLTAGE = 0.0257 * 1.5  # V, ideality factor 1.5
+
+
+def write_solar_iv(
+    directory,
+    cells: int = 15,
+    *,
+    points: int = 300,
+    sample: str = 'Synthetic',
+    start: datetime = _START,
+    seed: int = 0,
+) -> str:
+    """
+    ``<sample>_IV Graph.txt`` with the light IV curves of *cells* cells
+    (*points* voltages from -0.1 V to 0.6 V each) and the matching
+    ``<sample>_Results Table.txt``, as exported by the IV setup for one
+    sample. Returns the Results Table path.
+    """
+    rng = np.random.default_rng(seed)
+    voltage = np.linspace(-0.1, 0.6, points)
+    names, curves, results = [], [], []
+    for k in range(cells):
+        measured = start + timedelta(seconds=70 * k)
+        names.append(f'{sample}_c{k + 1} {measured:%Y-%m-%d %H-%M-%S}')
+        jsc = 25.0 + rng.normal(0, 0.5)  # mA/cm²
+        isc = jsc * _IV_AREA / 1000
+        dark = isc / np.expm1(0.58 / _IV_THERMAL_VOLTAGE)
+        shunt = 2000.0 + rng.normal(0, 200)
+        current = isc - dark * np.expm1(voltage / _IV_THERMAL_VOLTAGE) - voltage / shunt
+        current += rng.normal(0, 2e-6, points)
+        curves.append(current)
+        power = voltage * current
+        best = int(np.argmax(power))
+        voc = float(np.interp(0.0, -current, voltage))
+        pmax = float(power[best]) * 1000
+        fill_factor = 100 * pmax / (voc * isc * 1000)
+        results.append(
+            [
+                names[-1],
+                f'{voc:.8f}',
+                f'{isc:.8f}',
+                f'{jsc:.8f}',
+                f'{current[best]:.8f}',
+                f'{voltage[best]:.8f}',
+                f'{pmax:.8f}',
+                f'{fill_factor:.4f}',
+                f'{pmax / (100 * _IV_AREA) * 100:.4f}',
+                f'{_IV_THERMAL_VOLTAGE / (isc - current[-1] + 1e-9):.6f}',
+                f'{shunt:.3f}',
+                f'{pmax / 1000 * 1.44:.8f}',
+                'NaN',
+                'NaN',
+                'NaN',
+                f'{22.25 + 0.1 * k:.3f}',
+                f'{measured:%H:%M:%S}',
+                f'{measured:%m/%d/%Y}',
+            ]
+        )
+    graph = os.path.join(directory, f'{sample}_IV Graph.txt')
+    with open(graph, 'w', encoding='utf-8', newline='') as fh:
+        fh.write('\t\t'.join(names) + '\t\n')
+        fh.write('\t'.join(['Vmeas\tImeas'] * cells) + '\n')
+        table = np.empty((points, 2 * cells))
+        table[:, 0::2] = voltage[:, None]
+        table[:, 1::2] = np.array(curves).T
+        np.savetxt(fh, table, fmt='%.8f', delimiter='\t')
+    path = os.path.join(directory, f'{sample}_Results Table.txt')
+    with open(path, 'w', encoding='utf-8', newline='') as fh:
+        fh.write(
+            'Measurement\tVoc V\tIsc A\tJsc mA/cm2\tImax A\tVmax V\tPmax mW\t'
+            'Fill Factor\tEfficiency\tR at Voc\tR at Isc\tPower W\tRShunt ohms\t'
+            'Cell Temp start\tCell Temp end\tExposure\tTime\tDate\n'
+        )
+        fh.writelines('\t'.join(row) + '\n' for row in results)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# GDOES depth profile
+# ---------------------------------------------------------------------------
+
+# Element and emission line (nm) of the GDOES channels
+_GDOES_LINES = (
+    ('C', 166),
+    ('Se', 196),
+    ('Sb', 207),
+    ('Mo', 386),
+    ('Na', 589),
+    ('Zn', 330),
+    ('Al', 396),
+    ('Si', 288),
+    ('Cd', 228),
+    ('S', 181),
+    ('O', 777),
+    ('Cu', 325),
+    ('In', 451),
+    ('Ga', 417),
+    ('H', 122),
+    ('N', 149),
+    ('Fe', 372),
+    ('Ti', 365),
+    ('Li', 670),
+    ('Nb', 309),
+    ('P', 178),
+    ('K', 766),
+    ('Mg', 285),
+    ('Ca', 393),
+    ('Mn', 403),
+    ('Co', 345),
+    ('Ni', 341),
+    ('Cr', 425),
+    ('Sn', 317),
+    ('Ag', 328),
+)
+
+
+def write_gdoes(
+    directory,
+    elements: int = 11,
+    *,
+    points: int = 2100,
+    depth: float = 2.0,
+    sample: str = 'Synthetic_1_1',
+    start: datetime = _START,
+    seed: int = 0,
+) -> str:
+    """
+    GDOES export of the molar concentration depth profile of *elements*
+    elements (at most 30) over *points* depths down to *depth* µm, through a
+    stack of layers, with the ``*A/B!`` ratio column the instrument appends.
+    """
+    if not 2 <= elements <= len(_GDOES_LINES):
+        raise ValueError(f'elements must be between 2 and {len(_GDOES_LINES)}.')
+    rng = np.random.default_rng(seed)
+    lines = _GDOES_LINES[:elements]
+    depths = np.linspace(depth / points, depth, points)
+    # Each element peaks in one of the layers, the profiles sum to 100 %
+    centres = (np.arange(elements) % 4 + 0.5) / 4 * depth
+    widths = depth / 6 * (1 + np.arange(elements) % 3)
+    weights = np.exp(-(((depths[:, None] - centres) / widths) ** 2))
+    weights *= 1 + 0.02 * rng.standard_normal(weights.shape)
+    concentrations = 100 * np.clip(weights, 0, None) / weights.sum(axis=1)[:, None]
+    ratio = concentrations[:, 1] / np.where(
+        concentrations[:, 2] > 0, concentrations[:, 2], np.nan
+    )
+
+    path = os.path.join(directory, f'{sample} gdoes.txt')
+    with open(path, 'w', encoding='utf-8-sig', newline='') as fh:
+        fh.write(
+            '\t'.join(
+                [
+                    sample,
+                    'Mol Conc. [%]',
+                    *([''] * (elements - 2)),
+                    f'{start:%d/%m/%Y %H:%M:%S}',
+                    f'{sample} 2.5mm RF pulse',
+                    'Synthetic',
+                ]
+            )
+            + '\n'
+        )
+        ratio_name = f'*{lines[1][0]}/{lines[2][0]}!'
+        fh.write(
+            '\t'.join(['Depth [μm]', *(f'{e} {nm}' for e, nm in lines), ratio_name])
+            + '\n'
+        )
+        for x, row, r in zip(depths, concentrations, ratio):
+            fields = [f'{x:.4f}', *(f'{c:.4g}' for c in row)]
+            fields.append('-nan(ind)' if np.isnan(r) else f'{r:.3f}')
+            fh.write('\t'.join(fields) + '\t\n')
+    return path
+
+
+# ---------------------------------------------------------------------------
+# EMSA/MAS EDX spectrum
+# ---------------------------------------------------------------------------
+
+# Characteristic lines (keV) and relative intensities of the synthetic sample
+_EDX_PEAKS = ((0.277, 0.3), (0.525, 1.0), (1.486, 0.4), (1.740, 0.6), (6.403, 0.8))
+
+
+def write_emsa(
+    directory,
+    channels: int = 2048,
+    *,
+    energy_per_channel: float = 0.01,
+    name: str = 'Synthetic spectrum',
+    start: datetime = _START,
+    seed: int = 0,
+) -> str:
+    """
+    EMSA/MAS ``.msa`` EDX spectrum of *channels* channels: a bremsstrahlung
+    background with Gaussian peaks and Poisson counting noise, the standard
+    ``#KEY : value`` header and a few vendor ``##`` lines.
+    """
+    rng = np.random.default_rng(seed)
+    energy = np.arange(channels) * energy_per_channel
+    beam = 15.0
+    expected = 200 * np.clip(beam - energy, 0, None) / beam * np.exp(-energy / 4)
+    for centre, height in _EDX_PEAKS:
+        sigma = 0.03 + 0.004 * centre
+        expected += 5000 * height * np.exp(-0.5 * ((energy - centre) / sigma) ** 2)
+    counts = rng.poisson(expected)
+
+    header = {
+        'FORMAT': 'EMSA/MAS Spectral Data File',
+        'VERSION': '1.0',
+        'TITLE': name,
+        'DATE': f'{start:%d-%b-%Y}'.upper(),
+        'TIME': f'{start:%H:%M}',
+        'OWNER': 'Synthetic',
+        'NPOINTS': f'{channels}.',
+        'NCOLUMNS': '1.',
+        'XUNITS': 'keV',
+        'YUNITS': 'counts',
+        'DATATYPE': 'XY',
+        'XPERCHAN': f'{energy_per_channel}',
+        'OFFSET': '0.0',
+        'SIGNALTYPE': 'EDS',
+        'BEAMKV': f'{beam:.2f}',
+        'PROBECUR': '1.0',
+        'MAGCAM': '1000.0',
+        'LIVETIME': '60.0',
+        'REALTIME': '65.3',
+        'XTILTSTGE': '0.0',
+        'ELEVANGLE': '35.0',
+        'AZIMANGLE': '45.0',
+        'XPOSITION': '12.345',
+        'YPOSITION': '23.456',
+        'ZPOSITION': '10.000',
+    }
+    path = os.path.join(directory, f'{name}.msa')
+    with open(path, 'w', encoding='utf-8', newline='') as fh:
+        fh.writelines(f'#{key:<12}: {value}\n' for key, value in header.items())
+        fh.write('##OXINSTPT  : 5\n##OXINSTSTROBE: 24.5\n')
+        fh.write('#SPECTRUM    : Spectral Data Starts Here\n')
+        fh.writelines(f'{e:.5f}, {c}\n' for e, c in zip(energy, counts))
+        fh.write('#ENDOFDATA   : End Of Data and File\n')
+    return path
+
+
+# ---------------------------------------------------------------------------
+# FEI/TFS SEM TIFF set
+# ---------------------------------------------------------------------------
+
+_TFS_TAG = 34682
+
+
+def _tfs_metadata(index, width, height, start) -> str:
+    hfw = 2.76e-4 / (index + 1)
+    sections = {
+        'User': {
+            'Date': f'{start:%m/%d/%Y}',
+            'Time': f'{start:%I:%M:%S %p}',
+            'User': 'synthetic',
+        },
+        'System': {'Type': 'SEM', 'SystemType': 'Quanta FEG 650', 'Source': 'FEG'},
+        'EBeam': {
+            'HV': 15000,
+            'HFW': hfw,
+            'WD': 0.0101,
+            'EmissionCurrent': 0.000183,
+        },
+        'Scan': {'PixelWidth': hfw / width, 'Dwelltime': 3e-06},
+        'Stage': {
+            'StageX': 0.001 * index,
+            'StageY': -0.002,
+            'StageZ': 0.0101,
+            'StageT': 0,
+        },
+        'Detectors': {'Name': 'ETD', 'Mode': 'SE'},
+        'Image': {
+            'ResolutionX': width,
+            'ResolutionY': height,
+            'MagCanvasRealWidth': 0.127,
+        },
+    }
+    return ''.join(
+        f'[{section}]\r\n'
+        + ''.join(f'{key}={value}\r\n' for key, value in values.items())
+        + '\r\n'
+        for section, values in sections.items()
+    )
+
+
+def write_sem_set(
+    directory,
+    images: int = 3,
+    *,
+    width: int = 1536,
+    height: int = 1024,
+    name: str = '260318 - Synthetic',
+    start: datetime = _START,
+    seed: int = 0,
+) -> str:
+    """
+    *images* 8-bit FEI/TFS SEM TIFFs of ``width`` × ``height`` pixels (plus
+    the instrument's data bar below) sharing the prefix *name*: the base
+    image ``<name>.tif`` and ``<name>_001.tif`` …, each carrying its
+    acquisition metadata in TIFF tag 34682. Returns the base image path.
+    """
+    from PIL import Image, TiffImagePlugin
+
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    databar = np.full((max(height // 14, 1), width), 32, dtype=np.uint8)
+    paths = []
+    for index in range(images):
+        # Grains: a smooth pattern with shot noise on top
+        scale = 40.0 / (index + 1)
+        pattern = np.sin(x / scale) * np.cos(y / (1.3 * scale))
+        pixels = 128 + 60 * pattern + rng.normal(0, 12, (height, width))
+        pixels = np.clip(pixels, 0, 255).astype(np.uint8)
+        info = TiffImagePlugin.ImageFileDirectory_v2()
+        info[_TFS_TAG] = _tfs_metadata(
+            index, width, height, start + timedelta(minutes=index)
+        )
+        info.tagtype[_TFS_TAG] = 2  # ASCII
+        suffix = f'_{index:03d}' if index else ''
+        path = os.path.join(directory, f'{name}{suffix}.tif')
+        Image.fromarray(np.vstack([pixels, databar])).save(path, tiffinfo=info)
+        paths.append(path)
+    return paths[0]
+
+
+# ---------------------------------------------------------------------------
+# Bruker NanoScope AFM image
+# ---------------------------------------------------------------------------
+
+# Channel name, scanner sensitivity (unit per volt) and Z range (V) of the
+# synthetic AFM channels, in the order they are written
+_AFM_CHANNELS = (
+    ('Height Sensor', 'Sens. ZsensSens', 'V 8.0 nm/V', 2.5),
+    ('Peak Force Error', 'Sens. Deflection', 'V 30.0 nm/V', 0.5),
+    ('Adhesion', 'Sens. Adhesion', 'V 1.0 nN/V', 5.0),
+    ('Potential', 'Sens. Potential', 'V 1.0 V/V', 1.0),
+)
+_AFM_HEADER_BYTES = 40960
+
+
+def write_bruker_afm(
+    directory,
+    pixels: int = 512,
+    *,
+    channels: int = 2,
+    name: str = 'Synthetic',
+    start: datetime = _START,
+    seed: int = 0,
+) -> str:
+    """
+    Bruker NanoScope ``.001`` image of *pixels* × *pixels* samples and the
+    first *channels* of Height Sensor, Peak Force Error, Adhesion and
+    Potential (which makes it a KPFM session): the ``\\*File list`` text
+    header padded to 40 kB, followed by the 32-bit images of the channels.
+    """
+    if not 1 <= channels <= len(_AFM_CHANNELS):
+        raise ValueError(f'channels must be between 1 and {len(_AFM_CHANNELS)}.')
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:pixels, 0:pixels] * (2 * np.pi / pixels)
+    image_bytes = pixels * pixels * 4
+    header = [
+        '\\*File list',
+        '\\Version: 0x09300201',
+        f'\\Date: {start:%I:%M:%S %p %a %b %d %Y}',
+        f'\\Data length: {_AFM_HEADER_BYTES}',
+        '\\*Scanner list',
+        *(f'\\@{sens}: {value}' for _, sens, value, _ in _AFM_CHANNELS[:channels]),
+        '\\*Ciao scan list',
+        '\\Scan Rate: 0.996',
+        '\\Scan Size: 5 5 ~m',
+    ]
+    images = []
+    for index, (channel, sens, _, z_range) in enumerate(_AFM_CHANNELS[:channels]):
+        # Grains with noise on top, spanning about half the Z range
+        grains = np.sin((index + 3) * x) * np.cos((index + 2) * y)
+        signal = 0.4 * grains + rng.normal(0, 0.05, (pixels, pixels))
+        images.append(np.round(signal * 2**31).astype('<i4').tobytes())
+        lsb = z_range / 2**32
+        header += [
+            '\\*Ciao image list',
+            f'\\Data offset: {_AFM_HEADER_BYTES + index * image_bytes}',
+            f'\\Data length: {image_bytes}',
+            '\\Bytes/pixel: 4',
+            f'\\Samps/line: {pixels}',
+            f'\\Number of lines: {pixels}',
+            '\\Aspect Ratio: 1:1',
+            '\\Line Direction: Trace',
+            '\\Scan Size: 5 5 ~m',
+            f'\\@2:Image Data: S [{channel.split()[0]}] "{channel}"',
+            f'\\@2:Z scale: V [{sens}] ({lsb:.12f} V/LSB) {z_range} V',
+            f'\\@2:Z offset: V [{sens}] ({lsb:.12f} V/LSB) 0 V',
+        ]
+    header.append('\\*File list end')
+    text = ('\r\n'.join(header) + '\r\n').encode('latin1')
+    path = os.path.join(directory, f'{name}.001')
+    with open(path, 'wb') as fh:
+        fh.write(text.ljust(_AFM_HEADER_BYTES, b'\x1a'))
+        fh.writelines(images)
+    return path
+
+
+# ---------------------------------------------------------------------------
+# Command line
+# ---------------------------------------------------------------------------
+
+# Format → (writer, size option, type, help)
+GENERATORS = {
+    'pc03': (
+        lambda directory, hours, seed: write_chamber_log(
+            directory, 'PC03', hours, seed=seed
+        ),
+        'hours',
+        float,
+        'PC03 All Signals CSV; hours at 1 Hz.',
+    ),
+    'pc04': (
+        lambda directory, hours, seed: write_chamber_log(
+            directory, 'PC04', hours, seed=seed
+        ),
+        'hours',
+        float,
+        'PC04 All Signals CSV of a sputtering run; hours at 1 Hz.',
+    ),
+    'pc04-annealing': (
+        lambda directory, hours, seed: write_chamber_log(
+            directory, 'PC04', hours, sputtering=False, seed=seed
+        ),
+        'hours',
+        float,
+        'PC04 heater-only All Signals CSV; hours at 1 Hz.',
+    ),
+    'meteor': (
+        lambda directory, hours, seed: write_meteor_log(directory, hours, seed=seed),
+        'hours',
+        float,
+        'METEOR .nbl log; hours at 1 Hz before venting.',
+    ),
+    'testo': (
+        lambda directory, records, seed: write_testo_vi2(directory, records, seed=seed),
+        'records',
+        int,
+        'Testo .vi2 file; number of records.',
+    ),
+    'iv': (
+        lambda directory, cells, seed: write_solar_iv(directory, cells, seed=seed),
+        'cells',
+        int,
+        'IV Graph and Results Table; number of cells.',
+    ),
+    'gdoes': (
+        lambda directory, elements, seed: write_gdoes(directory, elements, seed=seed),
+        'elements',
+        int,
+        'GDOES depth profile; number of elements.',
+    ),
+    'emsa': (
+        lambda directory, channels, seed: write_emsa(directory, channels, seed=seed),
+        'channels',
+        int,
+        'EMSA EDX spectrum; number of channels.',
+    ),
+    'sem': (
+        lambda directory, images, seed: write_sem_set(directory, images, seed=seed),
+        'images',
+        int,
+        'FEI/TFS SEM TIFF set; number of images.',
+    ),
+    'afm': (
+        lambda directory, pixels, seed: write_bruker_afm(directory, pixels, seed=seed),
+        'pixels',
+        int,
+        'Bruker NanoScope .001 image; pixels per line and per column.',
+    ),
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m nomad_inl_base.synthetic',
+        description='Write synthetic instrument files of a given size.',
+    )
+    formats = parser.add_subparsers(dest='format', required=True)
+    for name, (_, option, kind, help_text) in GENERATORS.items():
+        sub = formats.add_parser(name, help=help_text)
+        sub.add_argument('directory', help='Directory to write to.')
+        sub.add_argument(f'--{option}', type=kind, required=True)
+        sub.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    writer, option, _, _ = GENERATORS[args.format]
+    os.makedirs(args.directory, exist_ok=True)
+    print(writer(args.directory, getattr(args, option), args.seed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
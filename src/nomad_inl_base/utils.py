@@ -1,10 +1,20 @@
+import base64
+import contextlib
+import functools
+import hashlib
 import json
 import math
+import os
+import re
+import weakref
 
+import numpy as np
 import yaml
 from nomad.datamodel.context import ClientContext
 from nomad.units import ureg
 
+from nomad_inl_base.profiling import normalize_phase, parse_phase, record_figure
+
 
 def get_reference(upload_id, entry_id):
     return f'../uploads/{upload_id}/archive/{entry_id}'
@@ -79,59 +89,128 @@ def create_filename(
     return filename, archive
 
 
+# Custom YAML dumper that guarantees all floats are written with a decimal
+# point so that PyYAML safe_load always reads them back as float, not str.
+# e.g.  -4e-13  →  -4.0e-13
+class _SafeFloatDumper(yaml.SafeDumper):
+    pass
+
+
+def _represent_float(dumper, value):
+    if math.isnan(value):
+        return dumper.represent_scalar('tag:yaml.org,2002:float', '.nan')
+    if value == float('inf'):
+        return dumper.represent_scalar('tag:yaml.org,2002:float', '.inf')
+    if value == float('-inf'):
+        return dumper.represent_scalar('tag:yaml.org,2002:float', '-.inf')
+    text = repr(value)
+    # Insert .0 before 'e' only when the mantissa has no decimal point.
+    # e.g. '-4e-13' → '-4.0e-13', '8e-13' → '8.0e-13'
+    # but '2.4e-12' and '7.6e-12' are left unchanged (already have decimal).
+    if re.search(r'^-?[0-9]+[eE]', text):
+        text = text.replace('e', '.0e', 1).replace('E', '.0E', 1)
+    return dumper.represent_scalar('tag:yaml.org,2002:float', text)
+
+
+_SafeFloatDumper.add_representer(float, _represent_float)
+
+
+def _write_archive(entry_dict, context, filename, file_type, logger, overwrite) -> bool:
+    """Write *entry_dict* to *filename* unless a file with different content
+    exists (and *overwrite* is off). Returns whether the file was written."""
+    with parse_phase('write_child'):
+        file_exists = context.raw_path_exists(filename)
+        dicts_are_equal = None
+        if file_exists:
+            with context.raw_file(filename, 'r') as file:
+                existing_dict = yaml.safe_load(file)
+                dicts_are_equal = dict_nan_equal(existing_dict, entry_dict)
+        if not file_exists or overwrite or dicts_are_equal:
+            with context.raw_file(filename, 'w') as newfile:
+                if file_type == 'json':
+                    json.dump(entry_dict, newfile)
+                elif file_type == 'yaml':
+                    yaml.dump(entry_dict, newfile, Dumper=_SafeFloatDumper)
+            return True
+    logger.error(
+        f'{filename} archive file already exists. '
+        f'You are trying to overwrite it with a different content. '
+        f'To do so, remove the existing archive and click reprocess again.'
+    )
+    return False
+
+
 def create_archive(
     entry_dict, context, filename, file_type, logger, *, overwrite: bool = False
 ):
-    import re as _re
-
-    # Custom YAML dumper that guarantees all floats are written with a decimal
-    # point so that PyYAML safe_load always reads them back as float, not str.
-    # e.g.  -4e-13  →  -4.0e-13
-    class _SafeFloatDumper(yaml.SafeDumper):
-        pass
-
-    def _represent_float(dumper, value):
-        import math
-
-        if math.isnan(value):
-            return dumper.represent_scalar('tag:yaml.org,2002:float', '.nan')
-        if value == float('inf'):
-            return dumper.represent_scalar('tag:yaml.org,2002:float', '.inf')
-        if value == float('-inf'):
-            return dumper.represent_scalar('tag:yaml.org,2002:float', '-.inf')
-        text = repr(value)
-        # Insert .0 before 'e' only when the mantissa has no decimal point.
-        # e.g. '-4e-13' → '-4.0e-13', '8e-13' → '8.0e-13'
-        # but '2.4e-12' and '7.6e-12' are left unchanged (already have decimal).
-        if _re.search(r'^-?[0-9]+[eE]', text):
-            text = text.replace('e', '.0e', 1).replace('E', '.0E', 1)
-        return dumper.represent_scalar('tag:yaml.org,2002:float', text)
-
-    _SafeFloatDumper.add_representer(float, _represent_float)
-    file_exists = context.raw_path_exists(filename)
-    dicts_are_equal = None
     if isinstance(context, ClientContext):
         return None
-    if file_exists:
-        with context.raw_file(filename, 'r') as file:
-            existing_dict = yaml.safe_load(file)
-            dicts_are_equal = dict_nan_equal(existing_dict, entry_dict)
-    if not file_exists or overwrite or dicts_are_equal:
-        with context.raw_file(filename, 'w') as newfile:
-            if file_type == 'json':
-                json.dump(entry_dict, newfile)
-            elif file_type == 'yaml':
-                yaml.dump(entry_dict, newfile, Dumper=_SafeFloatDumper)
-        context.upload.process_updated_raw_file(filename, allow_modify=True)
-    elif file_exists and not overwrite and not dicts_are_equal:
-        logger.error(
-            f'{filename} archive file already exists. '
-            f'You are trying to overwrite it with a different content. '
-            f'To do so, remove the existing archive and click reprocess again.'
-        )
+    if _write_archive(entry_dict, context, filename, file_type, logger, overwrite):
+        with parse_phase('reprocess'):
+            context.upload.process_updated_raw_file(filename, allow_modify=True)
+    _register_sample_entry(context, filename, entry_dict)
     return get_hash_ref(context.upload_id, filename)
 
 
+class ArchiveBatch:
+    """
+    Child archives that are written together and then registered with the
+    upload in one pass, e.g. the substrates of a cleaning run::
+
+        batch = ArchiveBatch(archive.m_context, logger)
+        refs = [batch.add(entry_dict, filename) for ...]
+        batch.commit()
+
+    :meth:`add` returns the same reference as :func:`create_archive` and
+    :meth:`commit` applies its skip / equality semantics to every archive.
+    All files are on disk before the first one is processed, so children
+    referencing each other resolve, and nothing is written or processed for
+    a batch that fails before :meth:`commit`. Under a ``ClientContext``
+    nothing is written and :meth:`add` returns ``None``.
+    """
+
+    def __init__(self, context, logger):
+        self.context = context
+        self.logger = logger
+        self._archives: dict[str, tuple[dict, str, bool]] = {}
+
+    def exists(self, filename: str) -> bool:
+        """Whether *filename* is in the batch or already in the upload."""
+        return filename in self._archives or self.context.raw_path_exists(filename)
+
+    def add(self, entry_dict, filename, file_type='yaml', *, overwrite=False):
+        if isinstance(self.context, ClientContext):
+            return None
+        pending = self._archives.get(filename)
+        if pending and not overwrite and not dict_nan_equal(pending[0], entry_dict):
+            self.logger.error(
+                f'{filename} is already part of this batch with a different '
+                'content. Keeping the first one.'
+            )
+        else:
+            self._archives[filename] = (entry_dict, file_type, overwrite)
+        return get_hash_ref(self.context.upload_id, filename)
+
+    def commit(self) -> list[str]:
+        """Write and register the archives; returns the written filenames."""
+        archives, self._archives = self._archives, {}
+        written = [
+            filename
+            for filename, (entry_dict, file_type, overwrite) in archives.items()
+            if _write_archive(
+                entry_dict, self.context, filename, file_type, self.logger, overwrite
+            )
+        ]
+        with parse_phase('reprocess'):
+            for filename in written:
+                self.context.upload.process_updated_raw_file(
+                    filename, allow_modify=True
+                )
+        for filename, (entry_dict, _, _) in archives.items():
+            _register_sample_entry(self.context, filename, entry_dict)
+        return written
+
+
 def create_child_entry(
     entry,
     archive,
@@ -171,8 +250,10 @@ def create_child_entry(
             data=entry,
             metadata=EntryMetadata(upload_id=archive.m_context.upload_id),
         )
+        with parse_phase('serialize'):
+            child_dict = child_archive.m_to_dict()
         create_archive(
-            child_archive.m_to_dict(),
+            child_dict,
             archive.m_context,
             child_filename,
             filetype,
@@ -221,3 +302,828 @@ def fill_quantity(dataframe, column_header, read_unit=None):
                 pint_value = None
 
     return pint_value if read_unit is not None else value
+
+
+# ---------------------------------------------------------------------------
+# Plotly figure encoding
+# ---------------------------------------------------------------------------
+
+# Arrays shorter than this stay as plain JSON lists: the base64 wrapper would
+# not save anything and small traces remain readable in the raw archive.
+_TYPED_ARRAY_MIN_SIZE = 16
+# float32 is used when the round-trip error stays below this fraction of the
+# data span (guards against e.g. epoch-second axes losing their resolution).
+_FLOAT32_RTOL = 1e-5
+_INT32 = np.iinfo(np.int32)
+# Trace attributes that are labels even when their values happen to be numbers.
+_LABEL_KEYS = {'text', 'hovertext', 'ids', 'labels', 'legendgroup', 'name'}
+
+
+def _as_numeric_array(values):
+    """Return *values* as a 1-D/2-D numeric ndarray, or ``None`` if not numeric."""
+    if isinstance(values, np.ndarray):
+        arr = values
+    elif isinstance(values, list | tuple) and values:
+        flat = values
+        if isinstance(values[0], list | tuple):
+            flat = [v for row in values for v in row]
+        if not all(
+            v is None or (isinstance(v, int | float) and not isinstance(v, bool))
+            for v in flat
+        ):
+            return None
+        try:
+            arr = np.asarray(values, dtype=np.float64)
+        except ValueError:
+            return None
+        if all(isinstance(v, int) for v in flat):
+            arr = arr.astype(np.int64)
+    else:
+        return None
+    if arr.dtype.kind not in 'fiu' or arr.ndim not in (1, 2):
+        return None
+    if arr.size < _TYPED_ARRAY_MIN_SIZE:
+        return None
+    return arr
+
+
+def _typed_array_dtype(arr) -> str:
+    """Pick the narrowest Plotly typed-array dtype that represents *arr* faithfully."""
+    if arr.dtype.kind in 'iu':
+        if arr.size == 0 or (arr.min() >= _INT32.min and arr.max() <= _INT32.max):
+            return 'i4'
+        return 'f8'
+    finite = arr[np.isfinite(arr)]
+    if finite.size == 0:
+        return 'f4'
+    peak = np.abs(finite).max()
+    if peak >= np.finfo(np.float32).max:
+        return 'f8'
+    error = np.abs(finite.astype(np.float32).astype(np.float64) - finite).max()
+    span = np.ptp(finite) or peak
+    return 'f4' if error <= _FLOAT32_RTOL * span else 'f8'
+
+
+def _to_typed_array(arr) -> dict:
+    dtype = _typed_array_dtype(arr)
+    spec = {
+        'dtype': dtype,
+        'bdata': base64.b64encode(arr.astype(f'<{dtype}').tobytes()).decode('ascii'),
+    }
+    if arr.ndim == 2:
+        spec['shape'] = f'{arr.shape[0]}, {arr.shape[1]}'
+    return spec
+
+
+def _encode_value(value):
+    if isinstance(value, dict):
+        if 'bdata' in value:
+            return value
+        return {
+            k: v if k in _LABEL_KEYS else _encode_value(v) for k, v in value.items()
+        }
+    arr = _as_numeric_array(value)
+    if arr is not None:
+        return _to_typed_array(arr)
+    return value
+
+
+def encode_figure_arrays(figure: dict) -> dict:
+    """
+    Return a copy of a Plotly figure dict with numeric trace arrays stored as
+    base64 typed arrays (``{'dtype': 'f4', 'bdata': ...}``).
+
+    Only ``figure['data']`` is rewritten; the layout is left untouched. Floats
+    are narrowed to ``f4`` when the float32 round-trip is accurate to
+    ``_FLOAT32_RTOL`` of the data span, otherwise ``f8`` is kept. Non-numeric
+    arrays (text, datetimes, colour names) and short arrays are kept as lists.
+    """
+    out = dict(figure)
+    out['data'] = [_encode_value(trace) for trace in figure.get('data', [])]
+    return out
+
+
+def decode_figure_arrays(figure: dict) -> dict:
+    """Inverse of ``encode_figure_arrays``: expand typed arrays back to lists."""
+
+    def _decode(value):
+        if isinstance(value, dict):
+            if 'bdata' in value and 'dtype' in value:
+                arr = np.frombuffer(
+                    base64.b64decode(value['bdata']), dtype=f'<{value["dtype"]}'
+                )
+                if 'shape' in value:
+                    shape = tuple(int(n) for n in str(value['shape']).split(','))
+                    arr = arr.reshape(shape)
+                return arr.tolist()
+            return {k: _decode(v) for k, v in value.items()}
+        return value
+
+    out = dict(figure)
+    out['data'] = [_decode(trace) for trace in figure.get('data', [])]
+    return out
+
+
+def plugin_option(entry_point_id: str, name: str, default=None):
+    """
+    Value of the configuration field *name* of the entry point
+    *entry_point_id*, or *default* if the entry point is not registered (e.g.
+    when the schemas are used outside of a configured NOMAD installation).
+    """
+    from nomad.config import config
+
+    try:
+        entry_point = config.get_plugin_entry_point(entry_point_id)
+    except Exception:
+        return default
+    return getattr(entry_point, name, default)
+
+
+def binary_figures_enabled(entry_point_id: str) -> bool:
+    """
+    Whether the schema package entry point *entry_point_id* opted into binary
+    figure arrays (``binary_figures: true`` in the plugin configuration).
+    """
+    return bool(plugin_option(entry_point_id, 'binary_figures', False))
+
+
+def encode_figure(figure: dict, entry_point_id: str) -> dict:
+    """Apply the figure encoding configured for *entry_point_id* to *figure*."""
+    if binary_figures_enabled(entry_point_id):
+        figure = encode_figure_arrays(figure)
+    record_figure(figure)
+    return figure
+
+
+# ---------------------------------------------------------------------------
+# Figure digest cache
+# ---------------------------------------------------------------------------
+
+_DIGEST_META_KEY = 'input_digest'
+
+
+@functools.lru_cache(maxsize=1)
+def _package_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version('nomad-inl-base')
+    except PackageNotFoundError:
+        return ''
+
+
+def _update_digest(h, item) -> None:
+    if item is None:
+        h.update(b'N')
+    elif hasattr(item, 'magnitude') and hasattr(item, 'units'):
+        _update_digest(h, item.magnitude)
+        h.update(str(item.units).encode())
+    elif isinstance(item, np.ndarray):
+        h.update(f'A{item.dtype}{item.shape}'.encode())
+        if item.dtype.kind in 'OUS':
+            h.update(json.dumps(item.tolist(), default=str).encode())
+        else:
+            h.update(np.ascontiguousarray(item).tobytes())
+    elif isinstance(item, list | tuple):
+        h.update(b'L')
+        for value in item:
+            _update_digest(h, value)
+        h.update(b'l')
+    elif isinstance(item, dict):
+        h.update(b'D')
+        for key in sorted(item, key=str):
+            _update_digest(h, key)
+            _update_digest(h, item[key])
+        h.update(b'd')
+    else:
+        h.update(f'{type(item).__name__}:{item!r}'.encode())
+
+
+def figure_digest(*inputs) -> str:
+    """
+    Stable digest of the arrays and settings a figure is built from.
+
+    Accepts any mix of numpy arrays, pint quantities, scalars, strings and
+    nested lists/tuples/dicts. The plugin version is mixed in so that figure
+    layout changes shipped in a new release invalidate cached figures.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_package_version().encode())
+    for item in inputs:
+        _update_digest(h, item)
+    return h.hexdigest()
+
+
+def _digest_key(digest: str, entry_point_id: str) -> str:
+    return f'{digest}-b' if binary_figures_enabled(entry_point_id) else digest
+
+
+def cached_figure(previous, label: str, digest: str, entry_point_id: str):
+    """
+    Return a copy of the figure labelled *label* from *previous* (the
+    ``figures`` of the last normalize) if it was built from the same *digest*,
+    otherwise ``None``.
+    """
+    from nomad.datamodel.metainfo.plot import PlotlyFigure
+
+    key = _digest_key(digest, entry_point_id)
+    for fig in previous or []:
+        if fig.label != label or not isinstance(fig.figure, dict):
+            continue
+        meta = (fig.figure.get('layout') or {}).get('meta')
+        if isinstance(meta, dict) and meta.get(_DIGEST_META_KEY) == key:
+            return PlotlyFigure(label=label, figure=fig.figure)
+    return None
+
+
+def make_figure(label: str, figure: dict, digest: str, entry_point_id: str):
+    """
+    Wrap a Plotly figure dict in a ``PlotlyFigure``, applying the configured
+    encoding and stamping *digest* into ``layout.meta`` for ``cached_figure``.
+    """
+    from nomad.datamodel.metainfo.plot import PlotlyFigure
+
+    figure = encode_figure(figure, entry_point_id)
+    layout = dict(figure.get('layout') or {})
+    meta = layout.get('meta')
+    meta = dict(meta) if isinstance(meta, dict) else {}
+    meta[_DIGEST_META_KEY] = _digest_key(digest, entry_point_id)
+    layout['meta'] = meta
+    return PlotlyFigure(label=label, figure={**figure, 'layout': layout})
+
+
+# ---------------------------------------------------------------------------
+# Time-base masking
+# ---------------------------------------------------------------------------
+
+
+def iter_time_series(section, n: int, path: str = ''):
+    """
+    Yield ``(path, section, quantity)`` for every set ``shape=['*']`` quantity
+    of length *n* in the section tree rooted at *section* (the time base
+    length). ``path`` is slash-separated relative to the root, with the index
+    of repeating subsections, e.g. ``'sources/0/active'``.
+    """
+    for name, quantity in section.m_def.all_quantities.items():
+        if list(quantity.shape) != ['*'] or not section.m_is_set(quantity):
+            continue
+        value = section.m_get(quantity)
+        if value is not None and len(value) == n:
+            yield f'{path}{name}', section, quantity
+    for name, sub_section in section.m_def.all_sub_sections.items():
+        children = section.m_get_sub_sections(sub_section)
+        for i, child in enumerate(children):
+            if hasattr(child, 'take_time_index'):
+                # Change-point encoded signals are not stored per time step
+                continue
+            prefix = f'{path}{name}/{i}/' if sub_section.repeats else f'{path}{name}/'
+            yield from iter_time_series(child, n, prefix)
+
+
+def time_index(index, n: int):
+    """
+    Normalise a boolean mask, integer index array or slice over *n* rows.
+
+    Contiguous selections are returned as a ``slice`` (numpy basic indexing,
+    i.e. views instead of copies); anything else as an integer index array.
+    """
+    if isinstance(index, slice):
+        start, stop, step = index.indices(n)
+        if step == 1:
+            return slice(start, max(start, stop))
+        index = np.arange(start, stop, step)
+    index = np.asarray(index)
+    if index.dtype == bool:
+        index = np.flatnonzero(index)
+    if len(index) == 0:
+        return slice(0, 0)
+    if index[-1] - index[0] + 1 == len(index) and np.all(np.diff(index) == 1):
+        return slice(int(index[0]), int(index[-1]) + 1)
+    return index
+
+
+def apply_time_index(section, n: int, index, *, view: bool = False):
+    """
+    Select the rows *index* (boolean mask, integer indices or slice) of every
+    time series of length *n* below *section* in a single pass. Returns the
+    normalised index.
+
+    With ``view=True`` nothing is copied: the selection, which must be
+    contiguous, is recorded as the index range ``time_index_start`` /
+    ``time_index_stop`` of *section* and the arrays are left whole. Readers
+    apply it with :func:`time_index_range`.
+    """
+    index = time_index(index, n)
+    if view:
+        if not isinstance(index, slice):
+            raise ValueError('view mode requires a contiguous selection')
+        section.time_index_start = index.start
+        section.time_index_stop = index.stop
+        return index
+    if isinstance(index, slice) and index == slice(0, n):
+        return index
+    for _, child, quantity in list(iter_time_series(section, n)):
+        value = child.m_get(quantity)
+        if isinstance(value, list):
+            child.m_set(quantity, np.asarray(value)[index].tolist())
+        else:
+            child.m_set(quantity, value[index])
+    for child in section.m_all_contents():
+        if hasattr(child, 'take_time_index') and child.n_points == n:
+            child.take_time_index(index)
+    return index
+
+
+def time_index_range(section) -> slice:
+    """
+    Rows of the time series of *section* in view: the index range recorded by
+    a view-mode :func:`apply_time_index` on *section* or the nearest parent
+    section that has one, else ``slice(None)`` (all rows).
+    """
+    while section is not None:
+        stop = getattr(section, 'time_index_stop', None)
+        if stop is not None:
+            return slice(section.time_index_start or 0, stop)
+        section = section.m_parent
+    return slice(None)
+
+
+# ---------------------------------------------------------------------------
+# Change-point encoding
+# ---------------------------------------------------------------------------
+
+
+def change_points(values) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Encode the piecewise-constant array *values* as ``(change_index, runs)``:
+    the index at which each run of equal values starts (always beginning with
+    0) and the value of that run. NaNs compare equal to each other.
+    """
+    values = np.asarray(values)
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.int64), values
+    if values.dtype.kind in 'biu':
+        changed = np.diff(values.astype(np.int64)) != 0
+    elif values.dtype.kind == 'f':
+        changed = np.diff(values) != 0
+        changed &= ~(np.isnan(values[1:]) & np.isnan(values[:-1]))
+    else:
+        changed = values[1:] != values[:-1]
+    change_index = np.concatenate(([0], np.flatnonzero(changed) + 1)).astype(np.int64)
+    return change_index, values[change_index]
+
+
+def expand_change_points(change_index, runs, n: int) -> np.ndarray:
+    """Expand ``(change_index, runs)`` back to the full array of length *n*."""
+    change_index = np.asarray(change_index, dtype=np.int64)
+    lengths = np.diff(np.append(change_index, n))
+    return np.repeat(np.asarray(runs), lengths)
+
+
+def true_intervals(change_index, runs, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ``(starts, stops)`` row indices (stop exclusive) of the runs whose value is
+    truthy, e.g. the time steps during which a shutter was open.
+    """
+    change_index = np.asarray(change_index, dtype=np.int64)
+    stops = np.append(change_index[1:], n)
+    on = np.asarray(runs).astype(bool)
+    return change_index[on], stops[on]
+
+
+# ---------------------------------------------------------------------------
+# Segment statistics
+# ---------------------------------------------------------------------------
+
+
+def segment_starts(n: int, *change_indices) -> np.ndarray:
+    """
+    Start row of every segment of an *n*-row time base cut at each index in
+    *change_indices* (e.g. the ``change_index`` of several step signals).
+    """
+    starts = np.union1d([0], np.concatenate([np.zeros(0), *change_indices]))
+    starts = starts.astype(np.int64)
+    return starts[(starts >= 0) & (starts < n)]
+
+
+def segment_means(values, starts) -> np.ndarray:
+    """NaN-ignoring mean of *values* over each segment beginning at *starts*."""
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts)
+    counts = np.add.reduceat(valid.astype(np.int64), starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / counts, np.nan)
+
+
+def segment_extrema(values, starts) -> tuple[np.ndarray, np.ndarray]:
+    """NaN-ignoring ``(min, max)`` of *values* over each segment."""
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    counts = np.add.reduceat(valid.astype(np.int64), starts)
+    lo = np.minimum.reduceat(np.where(valid, values, np.inf), starts)
+    hi = np.maximum.reduceat(np.where(valid, values, -np.inf), starts)
+    empty = counts == 0
+    lo[empty] = np.nan
+    hi[empty] = np.nan
+    return lo, hi
+
+
+def segment_deltas(values, starts) -> np.ndarray:
+    """
+    Change of *values* (e.g. a thickness or event counter) over each segment:
+    last minus first valid sample, NaN if the segment has no valid sample.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rows = np.arange(len(values))
+    valid = ~np.isnan(values)
+    first = np.minimum.reduceat(np.where(valid, rows, len(values)), starts)
+    last = np.maximum.reduceat(np.where(valid, rows, -1), starts)
+    ok = last >= first
+    deltas = np.full(len(starts), np.nan)
+    deltas[ok] = values[last[ok]] - values[first[ok]]
+    return deltas
+
+
+def interval_integrals(values, timestamps, starts, stops) -> np.ndarray:
+    """
+    Integral of *values* over time within each row interval ``[start, stop)``
+    of *timestamps*. Row ``i`` contributes ``values[i] * (t[i+1] - t[i])`` (the
+    last row has no following interval) and NaN samples contribute nothing.
+    A single cumulative sum serves all intervals.
+    """
+    t = np.asarray(timestamps, dtype=np.float64)
+    v = np.nan_to_num(np.asarray(values, dtype=np.float64), nan=0.0)
+    cumulative = np.concatenate(([0.0], np.cumsum(v[:-1] * np.diff(t))))
+    last = len(t) - 1
+    starts = np.minimum(np.asarray(starts, dtype=np.int64), last)
+    stops = np.minimum(np.asarray(stops, dtype=np.int64), last)
+    return cumulative[stops] - cumulative[starts]
+
+
+# ---------------------------------------------------------------------------
+# Upload-scoped sample name index
+# ---------------------------------------------------------------------------
+
+# Entry types that count as a complete sample when resolving a sample by name
+# (a bare INLThinFilm never does).
+SAMPLE_ENTRY_TYPES = ('INLSubstrate', 'INLThinFilmStack', 'INLSampleFragment')
+_SEARCH_PAGE_SIZE = 1000
+
+# Processing context -> {name: [search hit, ...]}. NOMAD creates a new context
+# for every processing run of an upload, so an index never outlives its run.
+_sample_indexes = weakref.WeakKeyDictionary()
+
+
+def _search_samples(archive) -> dict[str, list[dict]]:
+    """All samples of the archive's upload by name, from a single (paginated)
+    search."""
+    from nomad.search import MetadataPagination, MetadataRequired, search
+
+    index: dict[str, list[dict]] = {}
+    page_after_value = None
+    while True:
+        with normalize_phase('search', searches=1):
+            result = search(
+                owner='visible',
+                query={
+                    'upload_id': archive.m_context.upload_id,
+                    'entry_type': list(SAMPLE_ENTRY_TYPES),
+                },
+                pagination=MetadataPagination(
+                    page_size=_SEARCH_PAGE_SIZE, page_after_value=page_after_value
+                ),
+                required=MetadataRequired(
+                    include=[
+                        'entry_id',
+                        'upload_id',
+                        'entry_type',
+                        'mainfile',
+                        'results.eln.names',
+                    ]
+                ),
+                user_id=archive.metadata.main_author.user_id,
+            )
+        for hit in result.data:
+            names = hit.get('results', {}).get('eln', {}).get('names') or []
+            for name in names:
+                index.setdefault(name, []).append(hit)
+        page_after_value = result.pagination.next_page_after_value
+        if not result.data or not page_after_value:
+            return index
+
+
+def find_samples(archive, name: str, entry_types=SAMPLE_ENTRY_TYPES) -> list[dict]:
+    """
+    Samples (search hits with ``entry_id``, ``upload_id``, ``entry_type`` and
+    ``mainfile``) in the archive's upload whose ``name`` is *name*.
+
+    The first lookup of a processing run indexes all samples of the upload by
+    name with one search; later lookups in the same run (e.g. a batch of logs
+    for the same samples) are served from that index. Samples created through
+    :func:`create_archive` during the run are added to it, since the search
+    only sees them once they are indexed. Always empty under a
+    ``ClientContext`` (CLI/test parsing), where there is no search index.
+    """
+    context = archive.m_context
+    if not name or context is None or isinstance(context, ClientContext):
+        return []
+    index = _sample_indexes.get(context)
+    if index is None:
+        index = _search_samples(archive)
+        _sample_indexes[context] = index
+    return [hit for hit in index.get(name, []) if hit['entry_type'] in entry_types]
+
+
+def _register_sample_entry(context, filename: str, entry_dict: dict) -> None:
+    """Add a sample entry written to *filename* to the context's name index."""
+    index = _sample_indexes.get(context)
+    data = entry_dict.get('data') or {}
+    name = data.get('name')
+    entry_type = str(data.get('m_def', '')).rsplit('.', maxsplit=1)[-1]
+    if index is None or not name or entry_type not in SAMPLE_ENTRY_TYPES:
+        return
+    entry_id = get_entry_id(context.upload_id, filename)
+    hits = index.setdefault(name, [])
+    if all(hit['entry_id'] != entry_id for hit in hits):
+        hits.append(
+            {
+                'entry_id': entry_id,
+                'upload_id': context.upload_id,
+                'entry_type': entry_type,
+                'mainfile': filename,
+            }
+        )
+
+
+# ---------------------------------------------------------------------------
+# Coalesced YAML write-back
+# ---------------------------------------------------------------------------
+
+# Processing context -> YamlWriteBack (see _sample_indexes)
+_write_backs = weakref.WeakKeyDictionary()
+
+
+@contextlib.contextmanager
+def _raw_file_lock(context, path: str):
+    """Exclusive advisory lock on the raw file *path*, held across workers.
+    A no-op where the upload has no local raw directory or no ``fcntl``."""
+    try:
+        import fcntl
+
+        handle = open(os.path.join(context.raw_path(), path), 'a')
+    except (ImportError, AttributeError, NotImplementedError, OSError):
+        yield
+        return
+    with handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+class YamlWriteBack:
+    """
+    Appends to list quantities of YAML archive files in the upload (new stack
+    layers, target deposition records …), queued per file.
+
+    :meth:`flush` applies everything queued for a file in a single
+    read-modify-write under a file lock, so concurrent workers of the same
+    upload do not lose each other's appends, and reprocesses each changed file
+    once. Inside :meth:`batch` flushing is deferred to the end of the
+    outermost batch.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self._pending: dict[str, list[tuple]] = {}
+        self._batches = 0
+
+    def append(
+        self, path: str, key: str, item: dict, unique=(), on_append=None
+    ) -> None:
+        """
+        Queue appending *item* to the list ``data.<key>`` of the YAML file
+        *path*. The item is skipped if the list already holds one that equals
+        it on all *unique* keys (e.g. ``('reference',)``). ``on_append(data,
+        item)`` is called under the lock once the item is appended, to keep
+        aggregates stored next to the list up to date.
+        """
+        self._pending.setdefault(path, []).append((key, item, tuple(unique), on_append))
+
+    @contextlib.contextmanager
+    def batch(self, logger):
+        """
+        Defer :meth:`flush` until the outermost batch exits, e.g. around the
+        appends of one normalize. If the body raises, the appends queued in it
+        are dropped, so they are not written by an unrelated later flush.
+        """
+        marks = {path: len(appends) for path, appends in self._pending.items()}
+        self._batches += 1
+        try:
+            yield self
+        except BaseException:
+            for path in list(self._pending):
+                if path in marks:
+                    del self._pending[path][marks[path] :]
+                else:
+                    del self._pending[path]
+            raise
+        finally:
+            self._batches -= 1
+        if not self._batches:
+            self.flush(logger)
+
+    def flush(self, logger) -> list[str]:
+        """Apply the queued appends; returns the paths of the changed files.
+        A file that cannot be updated is logged and skipped."""
+        if self._batches:
+            return []
+        pending, self._pending = self._pending, {}
+        updated = []
+        for path, appends in pending.items():
+            try:
+                appended = self._apply(path, appends, logger)
+                # Reprocess outside the lock: the reprocessed entry may write
+                # back
+                if appended:
+                    self.context.upload.process_updated_raw_file(
+                        path, allow_modify=True
+                    )
+            except Exception as exc:
+                logger.error(f'Could not write back to {path!r}.', exc_info=exc)
+                continue
+            if appended:
+                logger.info(
+                    f'Appended {appended} item(s) to {path!r}.',
+                    keys=sorted({key for key, *_ in appends}),
+                )
+                updated.append(path)
+        return updated
+
+    def _apply(self, path: str, appends: list[tuple], logger) -> int:
+        """Append *appends* to the file *path* under its lock; returns the
+        number of items appended."""
+        if not self.context.raw_path_exists(path):
+            logger.warning(f'Cannot write back to {path!r}: file not found.')
+            return 0
+        with _raw_file_lock(self.context, path):
+            with self.context.raw_file(path, 'r') as f:
+                entry_dict = yaml.safe_load(f) or {}
+            data = entry_dict.setdefault('data', {})
+            appended = 0
+            # (key, unique) -> unique values already in the list
+            seen: dict[tuple, set] = {}
+            for key, item, unique, on_append in appends:
+                items = data.get(key) or []
+                if unique:
+                    values = seen.get((key, unique))
+                    if values is None:
+                        values = seen[(key, unique)] = {
+                            tuple(old.get(k) for k in unique)
+                            for old in items
+                            if isinstance(old, dict)
+                        }
+                    value = tuple(item.get(k) for k in unique)
+                    if value in values:
+                        continue
+                    values.add(value)
+                items.append(item)
+                data[key] = items
+                if on_append is not None:
+                    on_append(data, item)
+                appended += 1
+            if appended:
+                with self.context.raw_file(path, 'w') as f:
+                    yaml.dump(entry_dict, f, Dumper=_SafeFloatDumper)
+        return appended
+
+
+def yaml_write_back(context) -> YamlWriteBack:
+    """The write-back queue of the processing *context*."""
+    queue = _write_backs.get(context)
+    if queue is None:
+        queue = YamlWriteBack(context)
+        _write_backs[context] = queue
+    return queue
+
+
+# ---------------------------------------------------------------------------
+# Reference prefetch
+# ---------------------------------------------------------------------------
+
+_ARCHIVE_URL = re.compile(
+    r'(?:^|/)uploads/(?P<upload_id>[^/]+)/archive/(?P<entry_id>[^/]+)$'
+)
+
+
+def _unresolved_urls(references, urls: dict) -> None:
+    """Collect ``archive url -> entry_id`` of the unresolved proxies in
+    *references* (proxies, sections, ``None`` or nested lists of those)."""
+    from urllib.parse import urldefrag
+
+    from nomad.metainfo import MProxy
+
+    for reference in references:
+        if isinstance(reference, list | tuple):
+            _unresolved_urls(reference, urls)
+            continue
+        if not isinstance(reference, MProxy) or reference.m_proxy_resolved is not None:
+            continue
+        value = reference.m_proxy_value
+        if '#' not in value or '@' in value:
+            continue
+        url = urldefrag(value)[0]
+        if match := _ARCHIVE_URL.search(url):
+            urls[url] = match.group('entry_id')
+
+
+def prefetch_references(archive, *references, logger=None) -> int:
+    """
+    Load the archives behind *references* (reference values, or lists of
+    them) in one pass and put them in the processing context's archive cache,
+    so that dereferencing them afterwards (e.g. the layers of a stack) does
+    not load one archive after the other. Entries of the upload that are not
+    stored yet (written earlier in the same run) are looked up with a single
+    query instead of one per reference.
+
+    Only references into the archive's own upload on a server are
+    prefetched; anything else — and any archive that fails to load, which is
+    logged to *logger* — is left to the usual lazy resolution. Returns the
+    number of archives loaded.
+    """
+    context = archive.m_context
+    if context is None or isinstance(context, ClientContext):
+        return 0
+    from nomad.datamodel.context import ServerContext
+
+    if not isinstance(context, ServerContext):
+        return 0
+
+    urls: dict[str, str] = {}
+    _unresolved_urls(references, urls)
+    urls = {
+        url: entry_id
+        for url, entry_id in urls.items()
+        if url not in context.archives
+        and _ARCHIVE_URL.search(url).group('upload_id') == context.upload_id
+    }
+    if not urls:
+        return 0
+
+    from nomad.archive import to_json
+    from nomad.datamodel.datamodel import EntryArchive
+
+    loaded = {}
+    missing = []
+    upload_files = context.upload_files
+    entry_ids = set(urls.values())
+    with normalize_phase('archive_load', archive_loads=len(entry_ids)):
+        for entry_id in entry_ids:
+            try:
+                with upload_files.read_archive(entry_id) as reader:
+                    loaded[entry_id] = EntryArchive.m_from_dict(
+                        to_json(reader[entry_id]), m_context=context
+                    )
+            except KeyError:
+                missing.append(entry_id)
+            except Exception as exc:
+                if logger is not None:
+                    logger.warning(
+                        'Could not prefetch archive.', entry_id=entry_id, exc_info=exc
+                    )
+        if missing:
+            from nomad.processing import Entry
+
+            try:
+                entries = list(
+                    Entry.objects(
+                        upload_id=context.upload_id, entry_id__in=missing
+                    ).only('entry_id', 'mainfile')
+                )
+            except Exception as exc:
+                entries = []
+                if logger is not None:
+                    logger.warning(
+                        'Could not look up entries to prefetch.',
+                        entry_ids=missing,
+                        exc_info=exc,
+                    )
+            for entry in entries:
+                try:
+                    loaded[entry.entry_id] = context.load_raw_file(
+                        entry.mainfile, context.upload_id, context.installation_url
+                    )
+                except Exception as exc:
+                    if logger is not None:
+                        logger.warning(
+                            'Could not prefetch archive.',
+                            entry_id=entry.entry_id,
+                            exc_info=exc,
+                        )
+
+    for url, entry_id in urls.items():
+        if entry_id in loaded:
+            context.cache_archive(url, loaded[entry_id])
+    return len(loaded)
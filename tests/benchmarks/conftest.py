@@ -0,0 +1,35 @@
+import json
+import os
+
+import pytest
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--run-benchmarks'):
+        return
+    skip = pytest.mark.skip(reason='benchmarks only run with --run-benchmarks')
+    for item in items:
+        if 'benchmarks' in item.path.parts:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope='session')
+def baseline(request):
+    """
+    Stored results by benchmark id. With ``--update-baseline`` the results
+    measured in this session are written back to ``baseline.json`` instead.
+    """
+    try:
+        with open(BASELINE, encoding='utf-8') as file:
+            stored = json.load(file)
+    except FileNotFoundError:
+        stored = {}
+    measured = {}
+    yield stored, measured
+    if request.config.getoption('--update-baseline') and measured:
+        stored.update(measured)
+        with open(BASELINE, 'w', encoding='utf-8') as file:
+            json.dump(dict(sorted(stored.items())), file, indent=2)
+            file.write('\n')
@@ -0,0 +1,283 @@
+"""
+Wall time, peak RSS and archive size of the parsers and heavy normalizers.
+
+Run with ``pytest tests/benchmarks --run-benchmarks`` (needs
+``pytest-benchmark``). Every case is parsed (``test_parse``) and parsed and
+normalized (``test_normalize``, timing only the normalize) on the sample
+files in ``tests/data``, on scaled-up copies of them and on production-size
+synthetic files (see :mod:`nomad_inl_base.synthetic`). The median wall
+time (after a warm-up round), the peak RSS growth (Linux only) and the
+JSON size of the archive are compared against ``baseline.json``; a result
+more than ``TOLERANCE`` times its baseline fails.
+
+Wall time and peak RSS depend on the machine, so ``baseline.json`` stores
+them relative to the ``REFERENCE`` case (parsing and normalizing the sample
+EQE file), which is measured at the start of every run; only the archive
+sizes are absolute. After an intended change re-record the baseline with
+``--update-baseline``.
+"""
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from nomad.client import normalize_all, parse  # noqa: E402
+
+from nomad_inl_base import synthetic  # noqa: E402
+from nomad_inl_base.archive_size import archive_size  # noqa: E402
+
+DATA = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+
+TOLERANCE = {'time': 1.5, 'peak_rss': 1.5, 'archive_bytes': 1.1}
+# Absolute slack, so that timer and allocator noise does not fail small cases
+SLACK = {'time': 0.05, 'peak_rss': 20e6, 'archive_bytes': 1000}
+# The unit of the stored wall times and peak RSS, and its rounds
+REFERENCE = 'eqe'
+REFERENCE_ROUNDS = 20
+
+
+def _copy(name):
+    def make(directory):
+        return shutil.copy(os.path.join(DATA, name), directory)
+
+    return make
+
+
+def _tiled(name, factor, header_lines):
+    """*factor* copies of the data rows of a tab-separated file (the rows
+    below the header up to the first non-numeric one), the first column
+    continuing where the previous copy ended."""
+
+    def make(directory):
+        with open(os.path.join(DATA, name), encoding='utf-8') as file:
+            lines = file.read().splitlines()
+        header, rows, first = lines[:header_lines], [], []
+        for line in lines[header_lines:]:
+            row = line.split('\t')
+            try:
+                first.append(float(row[0]))
+            except ValueError:
+                break
+            rows.append(row)
+        footer = lines[header_lines + len(rows) :]
+        period = first[-1] - first[0] + (first[-1] - first[-2])
+        tiled = [
+            '\t'.join([f'{x + copy * period:.6g}', *row[1:]])
+            for copy in range(factor)
+            for x, row in zip(first, rows)
+        ]
+        path = os.path.join(directory, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join([*header, *tiled, *footer]) + '\n')
+        return path
+
+    return make
+
+
+def _synthetic(writer, *args, **kwargs):
+    def make(directory):
+        return writer(directory, *args, **kwargs)
+
+    return make
+
+
+def _afm_session(pixels, channels):
+    """The session entry the AFM parser writes next to a synthetic Bruker
+    image (it writes no child archives in a ``ClientContext``), whose
+    normalize reads the image and builds the channel figures."""
+
+    def make(directory):
+        image = synthetic.write_bruker_afm(directory, pixels, channels=channels)
+        path = os.path.join(directory, 'Synthetic.afm.archive.yaml')
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(
+                'data:\n'
+                '  m_def: nomad_inl_base.schema_packages.characterization.INLAFMSession\n'
+                f'  source_files: [{image}]\n'
+            )
+        return path
+
+    return make
+
+
+# Case id -> (input factory, benchmark rounds)
+CASES = {
+    'eqe': (_copy('sample EQE.txt'), 5),
+    'eqe_x10': (_tiled('sample EQE.txt', 10, 1), 3),
+    'solar_iv_graph': (_copy('Sample_IV Graph.txt'), 3),
+    'solar_iv_results': (_copy('Sample_Results Table.txt'), 3),
+    'gdoes': (_copy('sample gdoes.txt'), 3),
+    'gdoes_30_elements': (_synthetic(synthetic.write_gdoes, 30, points=21000), 1),
+    'eis': (_copy('sample EIS.mpr'), 3),
+    'four_point_probe': (_copy('sample 4pp.xlsx'), 3),
+    'kla_profiler': (_copy('sample profile.pdf'), 1),
+    'uvvis': (_copy('260401A2.Sample.Raw.asc'), 3),
+    'testo': (_copy('STAR LAB_44675156_2026_07_22_09_42_20.vi2'), 1),
+    'testo_500k': (_synthetic(synthetic.write_testo_vi2, 500_000), 1),
+    'pc03_1h': (_synthetic(synthetic.write_chamber_log, 'PC03', 1), 1),
+    'pc03_4h': (_synthetic(synthetic.write_chamber_log, 'PC03', 4), 1),
+    'pc04_annealing_1h': (
+        _synthetic(synthetic.write_chamber_log, 'PC04', 1, sputtering=False),
+        3,
+    ),
+    'meteor_1h': (_synthetic(synthetic.write_meteor_log, 1), 3),
+    'meteor_8h': (_synthetic(synthetic.write_meteor_log, 8), 1),
+    'solar_iv_60_cells': (_synthetic(synthetic.write_solar_iv, 60), 3),
+    'emsa': (_synthetic(synthetic.write_emsa, 4096), 3),
+    'sem_8_images': (_synthetic(synthetic.write_sem_set, 8), 1),
+    'afm_512px': (_synthetic(synthetic.write_bruker_afm, 512, channels=4), 3),
+    'afm_session_1024px': (_afm_session(1024, channels=4), 1),
+}
+
+
+# Peak RSS is measured in a fresh interpreter with the plugin already
+# imported, so that it does not depend on what earlier cases left on the heap
+_PEAK_RSS_SCRIPT = """
+import sys
+from nomad.client import normalize_all, parse
+import nomad_inl_base.parsers.parser
+
+def memory(field):
+    with open('/proc/self/status') as file:
+        for line in file:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) * 1024
+
+start = memory('VmRSS')
+archive = parse(sys.argv[1])[0]
+if sys.argv[2] == 'normalize':
+    normalize_all(archive)
+print(memory('VmHWM') - start)
+"""
+
+
+def _peak_rss(path: str, kind: str) -> int | None:
+    """Peak RSS growth while parsing (and normalizing) *path* (Linux only)."""
+    process = subprocess.run(
+        [sys.executable, '-c', _PEAK_RSS_SCRIPT, path, kind],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if process.returncode != 0:
+        return None
+    return max(int(process.stdout.split()[-1]), 0)
+
+
+def _fresh_input(tmp_path, case):
+    directory = tmp_path / uuid.uuid4().hex
+    directory.mkdir()
+    return str(CASES[case][0](str(directory)))
+
+
+def _normalized(archive):
+    normalize_all(archive)
+    return archive
+
+
+@pytest.fixture(scope='module')
+def reference(tmp_path_factory):
+    """Median wall time and peak RSS of parsing and normalizing the
+    ``REFERENCE`` case on this machine, the unit of the stored ones."""
+    tmp_path = tmp_path_factory.mktemp('reference')
+    times = []
+    for _ in range(REFERENCE_ROUNDS + 1):  # the first round warms up
+        path = _fresh_input(tmp_path, REFERENCE)
+        start = time.perf_counter()
+        normalize_all(parse(path)[0])
+        times.append(time.perf_counter() - start)
+    return {
+        'time': statistics.median(times[1:]),
+        'peak_rss': _peak_rss(_fresh_input(tmp_path, REFERENCE), 'normalize'),
+    }
+
+
+def _check(baseline, reference, key, result, update):
+    stored, measured = baseline
+    # Wall time and peak RSS in units of the reference, archive bytes as is
+    scale = {name: reference.get(name, 1) for name in result}
+    measured[key] = {
+        name: value if name not in reference else _relative(value, scale[name])
+        for name, value in result.items()
+    }
+    if update or key not in stored:
+        return
+    failures = []
+    for name, value in result.items():
+        if value is None or stored[key].get(name) is None or not scale[name]:
+            continue
+        expected = stored[key][name] * scale[name]
+        if value > expected * TOLERANCE[name] + SLACK[name]:
+            failures.append(
+                f'{name}: {value:.4g} > {TOLERANCE[name]} x baseline {expected:.4g}'
+            )
+    assert not failures, f'{key} regressed: ' + '; '.join(failures)
+
+
+def _relative(value, unit):
+    """*value* in units of *unit*, or ``None`` if either was not measured."""
+    return None if value is None or not unit else round(value / unit, 4)
+
+
+def _result(benchmark, peak_rss, archive):
+    stats = benchmark.stats.stats if benchmark.stats else None
+    result = {
+        'time': None if stats is None else stats.median,
+        'peak_rss': peak_rss,
+        'archive_bytes': archive_size(archive, yaml=False).json_bytes,
+    }
+    benchmark.extra_info.update(
+        peak_rss=peak_rss, archive_bytes=result['archive_bytes']
+    )
+    return result
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_parse(benchmark, baseline, reference, request, tmp_path, case):
+    rounds = CASES[case][1]
+    archives = benchmark.pedantic(
+        parse,
+        setup=lambda: ((_fresh_input(tmp_path, case),), {}),
+        rounds=rounds,
+        iterations=1,
+        warmup_rounds=1,
+    )
+    peak_rss = _peak_rss(_fresh_input(tmp_path, case), 'parse')
+    result = _result(benchmark, peak_rss, archives[0])
+    _check(
+        baseline,
+        reference,
+        f'parse[{case}]',
+        result,
+        request.config.getoption('--update-baseline'),
+    )
+
+
+@pytest.mark.parametrize('case', CASES)
+def test_normalize(benchmark, baseline, reference, request, tmp_path, case):
+    rounds = CASES[case][1]
+    archive = benchmark.pedantic(
+        _normalized,
+        setup=lambda: ((parse(_fresh_input(tmp_path, case))[0],), {}),
+        rounds=rounds,
+        iterations=1,
+        warmup_rounds=1,
+    )
+    # Includes the parse, which the normalize cannot run without
+    peak_rss = _peak_rss(_fresh_input(tmp_path, case), 'normalize')
+    result = _result(benchmark, peak_rss, archive)
+    _check(
+        baseline,
+        reference,
+        f'normalize[{case}]',
+        result,
+        request.config.getoption('--update-baseline'),
+    )
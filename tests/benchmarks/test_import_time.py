@@ -0,0 +1,63 @@
+"""
+Import time of every parser entry point's ``load()``, from ``python -X
+importtime`` in a fresh interpreter with NOMAD and the entry point
+definitions already imported (as in a worker). Loading one parser must not
+import the other parsers or the schema packages, which would blow the
+budget: importing all of them takes seconds.
+"""
+
+import subprocess
+import sys
+
+import pytest
+from nomad.config.models.plugins import ParserEntryPoint
+
+from nomad_inl_base import parsers
+
+# Seconds spent importing what a single load() needs
+BUDGET = 0.1
+
+_MARKER = '-- load --'
+_LOAD_SCRIPT = """
+import sys
+import nomad.config, nomad.datamodel.datamodel, nomad.parsing.parser
+import nomad_inl_base.parsers as entry_points
+sys.stderr.write('{marker}\\n')
+sys.stderr.flush()
+entry_points.{name}.load()
+"""
+
+ENTRY_POINTS = [
+    name for name, value in vars(parsers).items() if isinstance(value, ParserEntryPoint)
+]
+
+
+def _load_import_time(name: str) -> float:
+    """Seconds of module import (``self`` times summed) in the load() of the
+    entry point *name*."""
+    process = subprocess.run(
+        [
+            sys.executable,
+            '-X',
+            'importtime',
+            '-c',
+            _LOAD_SCRIPT.format(marker=_MARKER, name=name),
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = 0
+    for line in process.stderr.partition(_MARKER)[2].splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us = line.removeprefix('import time:').split('|')[0].strip()
+        if self_us.isdigit():
+            total += int(self_us)
+    return total / 1e6
+
+
+@pytest.mark.parametrize('name', ENTRY_POINTS)
+def test_load_import_time(name):
+    seconds = _load_import_time(name)
+    assert seconds < BUDGET, f'{name}.load() imports for {seconds:.3f} s'
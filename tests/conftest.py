@@ -109,3 +109,18 @@ def fixture_sem_zip(tmp_path):
     for p in (tif_path, archive_yaml, archive_json):
         if os.path.exists(p):
             os.remove(p)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('nomad-inl-base benchmarks')
+    group.addoption(
+        '--run-benchmarks',
+        action='store_true',
+        help='Run the parser and normalizer benchmarks in tests/benchmarks.',
+    )
+    group.addoption(
+        '--update-baseline',
+        action='store_true',
+        help='Write the measured benchmark results to tests/benchmarks/baseline.json '
+        'instead of comparing against it.',
+    )
@@ -3,6 +3,8 @@ from pathlib import Path
 import pytest
 from nomad.client import normalize_all, parse
 
+from nomad_inl_base.archive_size import archive_size, parse_size
+from nomad_inl_base.schema_packages.batteries import PlotConfig
 from nomad_inl_base.schema_packages.entities import INLSampleReference
 
 # ---------------------------------------------------------------------------
@@ -33,6 +35,129 @@ def test_pc03_parse(parsed_archive, caplog):
     assert len(parsed_archive.data.samples) == 0
 
 
+@pytest.fixture(name='synthetic_pc03')
+def fixture_synthetic_pc03(tmp_path):
+    """A parsed and normalized 12 minute synthetic PC03 sputtering run."""
+    from nomad_inl_base.synthetic import write_chamber_log
+
+    archive = parse(write_chamber_log(tmp_path, 'PC03', hours=0.2))[0]
+    normalize_all(archive)
+    return archive
+
+
+def test_pc03_figures_reused_and_refresh_only(caplog, synthetic_pc03):
+    data = synthetic_pc03.data
+    first = {f.label: f.figure for f in data.figures}
+    assert first
+    assert all('input_digest' in fig['layout']['meta'] for fig in first.values())
+
+    # Unchanged inputs: every figure is reused as-is.
+    normalize_all(synthetic_pc03)
+    assert {f.label: f.figure for f in data.figures} == first
+
+    # Plot-config edit in refresh-only mode: figures follow the config, the
+    # data arrays are left untouched.
+    n_timestamps = len(data.timestamps)
+    data.plot_config = PlotConfig(
+        plot_mode='Thermal Treatment', refresh_figures_only=True
+    )
+    normalize_all(synthetic_pc03)
+    labels = {f.label for f in data.figures}
+    assert not any(label.startswith('Source') for label in labels)
+    assert len(data.timestamps) == n_timestamps
+
+
+def test_pc03_step_signals_read_as_series(caplog, tmp_path):
+    """Series the parser stores change-point encoded read back as the full
+    per-time-step arrays of the log."""
+    import numpy as np
+    import pandas as pd
+
+    from nomad_inl_base.synthetic import write_chamber_log
+
+    log = write_chamber_log(tmp_path, 'PC03', hours=0.2)
+    rows = pd.read_csv(log, skiprows=3, low_memory=False)
+    entry = parse(log)[0].data
+
+    assert entry.process_phase is None
+    assert entry.series('process_phase').tolist() == rows['Process Phase'].tolist()
+    np.testing.assert_array_equal(
+        entry.sources[0].series('active'), rows['PC Source 1 Active'].astype(bool)
+    )
+    np.testing.assert_array_equal(
+        entry.dc_power_supply.series('arc_count'), rows['Power Supply 4 DC Count']
+    )
+    np.testing.assert_allclose(
+        entry.series('substrate_temperature_setpoint'),
+        rows['Substrate Heater Temperature Setpoint'] + 273.15,
+    )
+    # Series stored in the quantity itself are returned as they are
+    np.testing.assert_array_equal(
+        entry.series('process_time'), entry.process_time.magnitude
+    )
+    assert entry.series('tc9_temperature') is None
+
+
+def test_pc03_segments(caplog, synthetic_pc03):
+    data = synthetic_pc03.data
+    assert data.segments
+    ts = data.timestamps.magnitude
+    assert data.segments[0].start_time.magnitude == pytest.approx(ts[0])
+    total = sum(segment.duration.magnitude for segment in data.segments)
+    assert total == pytest.approx(ts[-1] - ts[0])
+    # Trimmed runs only keep time steps with at least one active source.
+    assert all(segment.active_sources for segment in data.segments)
+
+
+def test_pc03_throughput_metrics(caplog, synthetic_pc03):
+    data = synthetic_pc03.data
+    ts = data.timestamps.magnitude
+    for src in data.sources:
+        if src.shutter_open_time is None:
+            continue
+        assert 0 <= src.shutter_open_time.magnitude <= ts[-1] - ts[0]
+        if src.mean_reflected_power_ratio is not None:
+            assert 0 <= src.mean_reflected_power_ratio <= 1
+    for gf in data.chamber_environment.gas_flow:
+        if gf.flow_rate is not None and gf.flow_rate.value is not None:
+            assert gf.gas_consumption is not None
+
+
+def test_pc03_trim_as_range_matches_copied_trim(caplog, tmp_path, monkeypatch):
+    """Recording the trim as an index range keeps the whole log in the archive
+    and gives the same results as trimming every array."""
+    from nomad_inl_base.schema_packages import batteries
+    from nomad_inl_base.synthetic import write_chamber_log
+
+    log = write_chamber_log(tmp_path, 'PC03', hours=0.2)
+    copied = parse(log)[0]
+    normalize_all(copied)
+    monkeypatch.setattr(
+        batteries,
+        'plugin_option',
+        lambda entry_point, name, default=None: name == 'trim_as_range' or default,
+    )
+    viewed = parse(log)[0]
+    n = len(viewed.data.timestamps)
+    normalize_all(viewed)
+
+    data = viewed.data
+    assert len(data.timestamps) == n > len(copied.data.timestamps)
+    assert data.time_index_stop - data.time_index_start == len(copied.data.timestamps)
+    for section in ('segments', 'anomalies', 'figures'):
+        assert [s.m_to_dict() for s in getattr(data, section)] == [
+            s.m_to_dict() for s in getattr(copied.data, section)
+        ]
+
+    def scalars(section):
+        return {k: v for k, v in section.m_to_dict().items() if not isinstance(v, list)}
+
+    assert [scalars(s) for s in data.sources] == [
+        scalars(s) for s in copied.data.sources
+    ]
+    assert data.deposition_time == copied.data.deposition_time
+
+
 # ---------------------------------------------------------------------------
 # PC04 Electrolyte Chamber
 # ---------------------------------------------------------------------------
@@ -122,7 +247,7 @@ def test_pc03_parse_sample_name_from_filename(parsed_archive, caplog):
     ],
 )
 def test_extract_sample_name(filename, expected):
-    from nomad_inl_base.parsers.parser import _extract_sample_name
+    from nomad_inl_base.parsers.chambers import _extract_sample_name
 
     assert _extract_sample_name(filename) == expected
 
@@ -153,6 +278,10 @@ def test_solar_iv_results_table(parsed_archive, caplog):
     assert 0.0 < r0.fill_factor < 100.0
     assert r0.jsc is not None
     assert r0.jsc.magnitude > 0
+    best = max(results, key=lambda r: r.efficiency or 0.0)
+    solar_cell = parsed_archive.results.properties.optoelectronic.solar_cell
+    assert solar_cell.efficiency == pytest.approx(best.efficiency)
+    assert solar_cell.fill_factor == pytest.approx(best.fill_factor / 100.0)
 
 
 # ---------------------------------------------------------------------------
@@ -367,6 +496,12 @@ def test_gdoes(parsed_archive, caplog):
     for name in element_names:
         assert '*' not in name
         assert '/' not in name
+    thicknesses = [p.layer_thickness for p in profiles if p.layer_thickness is not None]
+    assert thicknesses
+    assert all(
+        0 <= t.magnitude <= max(parsed_archive.data.depth).magnitude
+        for t in thicknesses
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -486,6 +621,12 @@ def test_testo_vi2_star_lab(parsed_archive, caplog):
     assert 'Temperature Trend' in labels
     assert 'Humidity Trend' in labels
 
+    # The merged trend history is the largest archive we produce; YAML is not
+    # measured as it takes longer than the parse
+    report = archive_size(parsed_archive, budget='10MB', yaml=False)
+    assert not report.over_budget, report.format()
+    assert report.json_bytes < 30e6
+
 
 @pytest.mark.parametrize(
     'parsed_archive, caplog',
@@ -512,7 +653,7 @@ def test_testo_vi2_support(parsed_archive, caplog):
 
 
 def test_testo_lab_name_normalization():
-    from nomad_inl_base.parsers.parser import (
+    from nomad_inl_base.parsers.testo import (
         _TESTO_LAB_LOCATION_ALIASES,
         _normalize_testo_lab_name,
     )
@@ -560,3 +701,302 @@ def test_testo_merge_dedup_keeps_earliest_record():
     assert merged_ts.replace(tzinfo=None) == ts
     assert float(temp.magnitude) == 300.0
     assert hum == 50.0
+
+
+def test_pc03_incremental_read_rows(tmp_path, monkeypatch):
+    """Re-reading a growing log only parses appended rows and matches a full
+    read; a changed header falls back to a full parse."""
+    from types import SimpleNamespace
+
+    import numpy as np
+    import pandas as pd
+    import structlog
+
+    from nomad_inl_base.parsers import chambers
+
+    monkeypatch.setattr(chambers, 'plugin_option', lambda *args: True)
+    archive = SimpleNamespace(
+        m_context=SimpleNamespace(
+            raw_file=lambda path, mode='r': open(tmp_path / path, mode),
+            raw_path_exists=lambda path: (tmp_path / path).exists(),
+            raw_path=lambda: str(tmp_path),
+        )
+    )
+    preamble = 'Recording Name,Date Started,User\nAll Signals,2026-3-18 14-15-53,A\n\n'
+    header = (
+        'Time Stamp,Process Phase,PC Capman Pressure,PC Source 1 Material,'
+        'Water Flow\n'
+    )
+    rows = [
+        f'Mar-18-2026 02:15:{i:02d}.000 PM,{"Dep" if i > 3 else "Pre"},'
+        f'{0.001 * i},{"LFP" if i == 0 else ""},{i}\n'
+        for i in range(10)
+    ]
+    log = tmp_path / 'PC03_log.csv'
+    reader = chambers.PC03CathodeChamberParser()
+    logger = structlog.get_logger()
+
+    # The half-written last row is left for the next sync
+    log.write_text(preamble + header + ''.join(rows[:4]) + rows[4][:10])
+    df, reduced, _ = reader._read_rows(str(log), archive, logger)
+    assert len(df) == 4
+    assert reduced == {'PC Source 1 Material': 'LFP'}
+    cache = tmp_path / 'PC03_log.tail.npz'
+    # Only the series columns the parser stores are cached
+    with np.load(cache) as state:
+        assert state['columns'].tolist() == [
+            'Time Stamp',
+            'Process Phase',
+            'PC Capman Pressure',
+        ]
+
+    log.write_text(preamble + header + ''.join(rows[:8]))
+    df, reduced, _ = reader._read_rows(str(log), archive, logger)
+    full = pd.read_csv(log, skiprows=3, low_memory=False)
+    assert len(df) == 8
+    assert df['Process Phase'].tolist() == full['Process Phase'].tolist()
+    assert df['PC Capman Pressure'].tolist() == full['PC Capman Pressure'].tolist()
+    assert 'Water Flow' not in df.columns
+    assert reduced == {'PC Source 1 Material': 'LFP'}
+
+    log.write_text(preamble + header.replace('Material', 'Mat') + ''.join(rows[1:6]))
+    df, reduced, _ = reader._read_rows(str(log), archive, logger)
+    assert len(df) == 5
+    assert reduced == {}
+
+
+def test_pc03_tail_cache_per_log(tmp_path, monkeypatch):
+    """Same-named logs in different upload folders get their own cache, and a
+    cache is not reused for a log whose first rows were rewritten."""
+    from types import SimpleNamespace
+
+    import structlog
+
+    from nomad_inl_base.parsers import chambers
+
+    monkeypatch.setattr(chambers, 'plugin_option', lambda *args: True)
+    archive = SimpleNamespace(
+        m_context=SimpleNamespace(
+            raw_file=lambda path, mode='r': open(tmp_path / path, mode),
+            raw_path_exists=lambda path: (tmp_path / path).exists(),
+            raw_path=lambda: str(tmp_path),
+        )
+    )
+    preamble = 'Recording Name,Date Started,User\nAll Signals,2026-3-18 14-15-53,A\n\n'
+    header = 'Time Stamp,Process Phase,PC Capman Pressure\n'
+
+    def row(i, phase):
+        return f'Mar-18-2026 02:15:{i:02d}.000 PM,{phase},{0.001 * i}\n'
+
+    reader = chambers.PC03CathodeChamberParser()
+    logger = structlog.get_logger()
+    logs = []
+    for folder, phase in (('run_a', 'Dep'), ('run_b', 'Pre')):
+        (tmp_path / folder).mkdir()
+        log = tmp_path / folder / 'PC03_log.csv'
+        log.write_text(preamble + header + ''.join(row(i, phase) for i in range(4)))
+        reader._read_rows(str(log), archive, logger)
+        assert (tmp_path / folder / 'PC03_log.tail.npz').exists()
+        logs.append(log)
+    assert not (tmp_path / 'PC03_log.tail.npz').exists()
+
+    # Same length, header and last row, but other first rows: parsed anew
+    log = logs[0]
+    log.write_text(
+        preamble
+        + header
+        + ''.join(row(i, 'Pre') for i in range(3))
+        + row(3, 'Dep')
+        + row(4, 'Dep')
+    )
+    df, _, _ = reader._read_rows(str(log), archive, logger)
+    assert df['Process Phase'].tolist() == ['Pre', 'Pre', 'Pre', 'Dep', 'Dep']
+
+
+def _anomaly_fields(data):
+    return [
+        (
+            a.kind,
+            a.channel,
+            a.severity,
+            a.start_time.magnitude,
+            a.end_time.magnitude,
+            a.peak_value,
+        )
+        for a in data.anomalies
+    ]
+
+
+def test_pc03_anomalies_detected_while_reading(tmp_path, monkeypatch):
+    """The anomalies the parser finds chunk by chunk match those normalize
+    finds on the trimmed series, also when the log is read incrementally."""
+    from types import SimpleNamespace
+
+    import numpy as np
+    import pandas as pd
+    import structlog
+
+    from nomad_inl_base.parsers import chambers
+    from nomad_inl_base.synthetic import write_chamber_log
+
+    log = Path(write_chamber_log(tmp_path, 'PC03', hours=0.2))
+    lines = log.read_text().splitlines(keepends=True)
+    rows = pd.read_csv(log, skiprows=3, low_memory=False)
+    # A pressure spike and high reflected power while PS1 is on
+    on = rows.index[rows['Power Supply 1 Fwd Power'] > 50]
+    rows.loc[on[100:105], 'PC Capman Pressure'] *= 10
+    rows.loc[on[200:230], 'Power Supply 1 Rfl Power'] = 40.0
+    log.write_text(''.join(lines[:3]) + rows.to_csv(index=False))
+
+    archive = parse(str(log))[0]
+    found = _anomaly_fields(archive.data)
+    assert {(kind, channel) for kind, channel, *_ in found} >= {
+        ('pressure_excursion', 'Capman'),
+        ('reflected_power', 'PS1'),
+    }
+    assert archive.data.anomalies_detected
+    normalize_all(archive)
+    assert _anomaly_fields(archive.data) == found
+
+    # Detected by normalize when the parser did not run the detectors
+    archive = parse(str(log))[0]
+    archive.data.anomalies = []
+    archive.data.anomalies_detected = None
+    normalize_all(archive)
+    assert _anomaly_fields(archive.data) == found
+    assert archive.data.anomalies_detected
+
+    # Incremental reads: the detector is cached with the rows
+    reader = chambers.PC03CathodeChamberParser()
+    logger = structlog.get_logger()
+    _, _, expected = reader._read_rows(str(log), None, logger, detect=True)
+    monkeypatch.setattr(chambers, 'plugin_option', lambda *args: True)
+    cached = SimpleNamespace(
+        m_context=SimpleNamespace(
+            raw_file=lambda path, mode='r': open(tmp_path / path, mode),
+            raw_path_exists=lambda path: (tmp_path / path).exists(),
+            raw_path=lambda: str(tmp_path),
+        )
+    )
+    full = log.read_bytes()
+    for part in (1, 2, 3):
+        log.write_bytes(full[: len(full) * part // 3])
+        _, _, detector = reader._read_rows(str(log), cached, logger, detect=True)
+    with np.load(tmp_path / f'{log.stem}.tail.npz') as state:
+        assert 'detector_rows' in state
+    assert detector.finish() == expected.finish()
+
+
+def test_pc03_clean_run_not_scanned_again(caplog, tmp_path, monkeypatch):
+    """A run in which the parser found no anomalies is not re-scanned on
+    normalize."""
+    from nomad_inl_base import anomalies
+    from nomad_inl_base.synthetic import write_chamber_log
+
+    archive = parse(write_chamber_log(tmp_path, 'PC03', hours=0.2))[0]
+    assert archive.data.anomalies_detected
+    assert not archive.data.anomalies
+
+    def rescan(*args, **kwargs):
+        raise AssertionError('anomaly detectors ran again')
+
+    monkeypatch.setattr(anomalies, 'detect_anomalies', rescan)
+    normalize_all(archive)
+    normalize_all(archive)
+    assert not archive.data.anomalies
+
+
+def test_parser_entry_points_import_no_schema_packages():
+    """Loading the parser entry points imports none of the schema packages
+    (and so not plotly), and the parsers are still importable from
+    ``nomad_inl_base.parsers.parser``."""
+    import subprocess
+    import sys
+
+    script = (
+        'import sys\n'
+        'import nomad.config\n'
+        'from nomad.config.models.plugins import ParserEntryPoint\n'
+        'from nomad_inl_base import parsers\n'
+        'for value in list(vars(parsers).values()):\n'
+        '    if isinstance(value, ParserEntryPoint):\n'
+        '        value.load()\n'
+        "print(' '.join(name for name in sys.modules if name.startswith(\n"
+        "    ('nomad_inl_base.schema_packages.', 'plotly'))))\n"
+    )
+    process = subprocess.run(
+        [sys.executable, '-c', script], capture_output=True, text=True, check=True
+    )
+    assert process.stdout.split() == []
+
+    from nomad_inl_base.parsers import parser, testo
+
+    assert parser.TestoVI2Parser is testo.TestoVI2Parser
+    with pytest.raises(AttributeError):
+        parser.NoSuchParser  # noqa: B018
+
+
+# ---------------------------------------------------------------------------
+# Archive size budgets
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    'parsed_archive, budget, total',
+    [
+        ('tests/data/sample EQE.txt', '5kB', '10kB'),
+        ('tests/data/sample 4pp.xlsx', '5kB', '10kB'),
+        ('tests/data/sample EIS.mpr', '200kB', '600kB'),
+        ('tests/data/Sample_IV Graph.txt', '250kB', '600kB'),
+        ('tests/data/sample gdoes.txt', '1MB', '2MB'),
+    ],
+    indirect=['parsed_archive'],
+    ids=['EQE', '4pp', 'EIS', 'IV', 'GDOES'],
+)
+def test_archive_size_budget(parsed_archive, budget, total):
+    """No quantity or figure of the sample archives exceeds *budget* and the
+    whole archive stays below *total*, in JSON and YAML."""
+    normalize_all(parsed_archive)
+    report = archive_size(parsed_archive, budget=budget)
+    assert not report.over_budget, report.format()
+    assert max(report.json_bytes, report.yaml_bytes) < parse_size(total)
+
+
+def test_pc04_parser_instance_is_shared_safely(tmp_path):
+    """One PC04 parser instance parses sputtering and annealing logs from
+    several threads into the right entry types."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import structlog
+    from nomad.datamodel import EntryArchive, EntryMetadata
+    from nomad.datamodel.context import ClientContext
+
+    from nomad_inl_base.parsers.chambers import PC04ChamberParser
+    from nomad_inl_base.synthetic import write_chamber_log
+
+    mainfiles = {}
+    for index in range(4):
+        sputtering = index % 2 == 0
+        directory = tmp_path / str(index)
+        directory.mkdir()
+        mainfile = write_chamber_log(
+            directory, 'PC04', hours=0.05, sputtering=sputtering
+        )
+        mainfiles[mainfile] = (
+            'PC04ElectrolyteChamberDeposition'
+            if sputtering
+            else 'PC04SubstrateAnnealing'
+        )
+    parser = PC04ChamberParser()
+
+    def parse_file(mainfile):
+        archive = EntryArchive(
+            m_context=ClientContext(),
+            metadata=EntryMetadata(mainfile=mainfile),
+        )
+        parser.parse(mainfile, archive, structlog.get_logger())
+        return type(archive.data).__name__
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        parsed = dict(zip(mainfiles, pool.map(parse_file, mainfiles)))
+    assert parsed == mainfiles
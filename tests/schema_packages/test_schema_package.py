@@ -129,3 +129,130 @@ def test_star_target_resolution_prefers_existing_samples():
     # For unit test, we just verify the schema fields are set correctly
     assert len(deposition.samples) == 1
     assert len(deposition.substrates) == 1
+
+
+def test_target_ledger_folds_new_records():
+    """Test that target totals are updated per record and rebuilt when stale."""
+    from nomad_inl_base.schema_packages.star import _add_to_target_ledger
+
+    data = {'last_calibration_date': '2026-02-01T00:00:00+00:00'}
+    data['deposition_records'] = [
+        {'start_time': '2026-01-15T10:00:00+00:00', 'deposition_time': 60.0},
+        {'start_time': '2026-02-15T10:00:00+00:00', 'deposition_time': 30.0},
+    ]
+    # No ledger yet: rebuilt from all records
+    _add_to_target_ledger(data, data['deposition_records'][-1])
+    assert data['total_deposition_time'] == 90.0
+    assert data['time_since_last_calibration'] == 30.0
+    assert data['ledger_size'] == 2
+
+    data['total_deposition_time'] = 1000.0  # only the new record is added now
+    record = {
+        'start_time': '2026-03-01T10:00:00+00:00',
+        'deposition_time': 10.0,
+        'deposition_energy': 5.0,
+    }
+    data['deposition_records'].append(record)
+    _add_to_target_ledger(data, record)
+    assert data['total_deposition_time'] == 1010.0
+    assert data['time_since_last_calibration'] == 40.0
+    assert data['energy_since_last_calibration'] == 5.0
+    assert data['ledger_size'] == 3
+
+
+def test_target_ledger_accepts_unquoted_dates():
+    """Unquoted YAML dates load as ``datetime.date`` and count from midnight UTC."""
+    import yaml
+
+    from nomad_inl_base.schema_packages.star import _add_to_target_ledger
+
+    data = yaml.safe_load(
+        'last_calibration_date: 2026-02-01\n'
+        'deposition_records:\n'
+        '- {start_time: 2026-01-31, deposition_time: 60.0}\n'
+        "- {start_time: '2026-02-01T10:00:00+00:00', deposition_time: 30.0}\n"
+    )
+    _add_to_target_ledger(data, data['deposition_records'][-1])
+    assert data['total_deposition_time'] == 90.0
+    assert data['time_since_last_calibration'] == 30.0
+
+
+# ---------------------------------------------------------------------------
+# Deferred imports — NOMAD imports every schema package at startup
+# ---------------------------------------------------------------------------
+
+# Only needed to build figures or read particular raw files
+_DEFERRED_IMPORTS = ('plotly', 'scipy', 'pySPM', 'galvani', 'pdfplumber')
+
+
+def _imported_by(name: str) -> dict[str, str]:
+    """Deferred libraries imported when loading the schema package entry point
+    *name*, mapped to the module whose import triggered them (from the
+    ``python -X importtime`` import tree)."""
+    import subprocess
+    import sys
+
+    script = (
+        'import nomad.config\n'
+        'from nomad_inl_base import schema_packages\n'
+        f'schema_packages.{name}.load()\n'
+    )
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    tree = []  # (depth, module) in the order the imports finished
+    for line in process.stderr.splitlines():
+        if line.startswith('import time:') and not line.endswith('| imported package'):
+            module = line.rsplit('|', 1)[1]
+            tree.append((len(module) - len(module.lstrip()), module.strip()))
+
+    def deferred(module):
+        return module.split('.')[0] in _DEFERRED_IMPORTS
+
+    imported = {}
+    for index, (depth, module) in enumerate(tree):
+        if not deferred(module) or module.split('.')[0] in imported:
+            continue
+        # The parent is the next module finishing at a lower depth; skip the
+        # deferred library's own modules
+        level = depth
+        for parent_depth, parent in tree[index + 1 :]:
+            if parent_depth >= level:
+                continue
+            if not deferred(parent):
+                imported[module.split('.')[0]] = parent
+                break
+            level = parent_depth
+    return imported
+
+
+@pytest.mark.parametrize(
+    'name',
+    [
+        'schema_package_entry_point',
+        'star_entry_point',
+        'crystaLLM_entry_point',
+        'wet_deposition_entry_point',
+        'characterization_entry_point',
+        'entities_entry_point',
+        'cleaning_entry_point',
+        'batteries_entry_point',
+        'annealing_entry_point',
+        'meteor_entry_point',
+        'testo_entry_point',
+    ],
+)
+def test_schema_packages_defer_heavy_imports(name):
+    """Loading a schema package does not import plotly, scipy, pySPM, galvani
+    or pdfplumber itself. Libraries imported by NOMAD or by the schema plugins
+    we build on (nomad-measurements imports plotly) are outside our control."""
+    imported = _imported_by(name)
+    ours = {
+        library: module
+        for library, module in imported.items()
+        if module.startswith('nomad_inl_base')
+    }
+    assert not ours, f'imported at load time: {ours}'
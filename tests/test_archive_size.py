@@ -0,0 +1,52 @@
+import json
+
+from nomad_inl_base.archive_size import archive_size, main, parse_size
+
+
+def _archive():
+    return {
+        'data': {
+            'name': 'run',
+            'sources': [{'thickness': [1.0] * 100}, {'thickness': [2.0] * 100}],
+            'figures': [
+                {'label': 'Pressure', 'figure': {'data': [{'y': [0.5] * 500}]}},
+                {'figure': {'data': []}},
+            ],
+        }
+    }
+
+
+def test_archive_size_sums_repeats_and_splits_figures():
+    report = archive_size(_archive(), budget='2kB')
+
+    sizes = {entry.path: entry for entry in report.entries}
+    assert set(sizes) == {
+        'data.name',
+        'data.sources.thickness',
+        'data.figures[Pressure]',
+        'data.figures[1]',
+    }
+    thickness = sizes['data.sources.thickness']
+    assert thickness.json_bytes == 2 * len(json.dumps([1.0] * 100))
+    assert thickness.yaml_bytes > 0
+    assert report.entries[0].path == 'data.figures[Pressure]'
+    assert [entry.path for entry in report.over_budget] == ['data.figures[Pressure]']
+    assert report.json_bytes == len(json.dumps(_archive()))
+
+
+def test_parse_size():
+    assert parse_size('500kB') == 500_000
+    assert parse_size('1.5 MB') == 1_500_000
+    assert parse_size(42) == 42
+
+
+def test_cli_fails_over_budget(tmp_path, capsys):
+    path = tmp_path / 'run.archive.json'
+    path.write_text(json.dumps(_archive()))
+
+    assert main([str(path), '--budget', '1MB']) == 0
+    assert 'data.figures[Pressure]' in capsys.readouterr().out
+
+    assert main([str(path), '--budget', '100', '--json']) == 1
+    report = json.loads(capsys.readouterr().out)[str(path)]
+    assert 'data.sources.thickness' in report['over_budget']
@@ -0,0 +1,160 @@
+import os
+from datetime import datetime
+
+import pytest
+import yaml
+
+from nomad_inl_base.local_server import (
+    LocalUpload,
+    MetadataPagination,
+    MetadataRequired,
+)
+from nomad_inl_base.synthetic import write_chamber_log, write_testo_vi2
+from nomad_inl_base.utils import get_entry_id, get_hash_ref
+
+
+def _write(upload, path, data):
+    with upload.raw_file(path, 'w') as file:
+        yaml.dump({'data': data}, file)
+    return path
+
+
+def _data(upload, path):
+    return upload.archives[get_entry_id(upload.upload_id, path)]['data']
+
+
+def test_child_archive_is_written_and_processed(tmp_path):
+    upload = LocalUpload(tmp_path / 'upload')
+    mainfile = upload.add(write_testo_vi2(tmp_path, records=50))
+    archive = upload.process(mainfile)
+
+    child = mainfile.replace('.vi2', '.TestoLogger.archive.json')
+    assert upload.processed == [child, mainfile]
+    assert type(archive.data).__name__ == 'RawFile_'
+    assert _data(upload, child)['serial_number'] == '44675156'
+    with pytest.raises(ValueError):
+        upload.process_updated_raw_file(child)
+
+
+def test_testo_history_is_merged(tmp_path):
+    upload = LocalUpload(tmp_path / 'upload')
+    for hour in (0, 5):
+        source = write_testo_vi2(
+            tmp_path, records=100, start=datetime(2026, 1, 1, hour)
+        )
+        upload.process(upload.add(source))
+
+    assert not upload.failed
+    # 100 records every 5 minutes each, the last 40 of the first logger
+    # overlapping with the second one
+    first, second = (
+        _data(upload, path) for path in upload.processed if path.endswith('.json')
+    )
+    assert len(first['figures'][0]['figure']['data'][0]['x']) == 100
+    assert len(second['figures'][0]['figure']['data'][0]['x']) == 160
+
+
+def test_chamber_log_matches_sample_by_name(tmp_path):
+    upload = LocalUpload(tmp_path)
+    substrate = _write(
+        upload,
+        'substrate.archive.yaml',
+        {
+            'm_def': 'nomad_inl_base.schema_packages.entities.INLSubstrate',
+            'name': 'Synthetic_001',
+        },
+    )
+    upload.process(substrate)
+    log = os.path.basename(write_chamber_log(tmp_path, 'PC03', hours=0.1))
+    archive = upload.process(log)
+
+    assert not upload.failed
+    hits = upload.search(
+        query={'results.eln.names': 'Synthetic_001', 'entry_type': 'INLThinFilmStack'}
+    ).data
+    assert len(hits) == 1
+    assert archive.data.samples[0].reference.m_proxy_value.startswith(
+        f'../uploads/{upload.upload_id}/archive/{hits[0]["entry_id"]}'
+    )
+    stack = _data(upload, hits[0]['mainfile'])
+    substrate_id = get_entry_id(upload.upload_id, substrate)
+    assert f'/archive/{substrate_id}#' in stack['substrate']['reference']
+    assert len(stack['layers']) == 1
+
+
+def test_star_run_adds_target_records(tmp_path):
+    from nomad_inl_base.schema_packages.star import StarSputtering
+
+    if 'start_time' not in StarSputtering.m_def.all_quantities:
+        pytest.skip('needs a nomad-lab with Activity.start_time')
+    upload = LocalUpload(tmp_path)
+    target = _write(
+        upload,
+        'target.archive.yaml',
+        {
+            'm_def': 'nomad_inl_base.schema_packages.star.SputteringTarget',
+            'name': 'Cu target',
+            'lab_id': 'T1',
+        },
+    )
+    upload.process(target)
+    for run in range(2):
+        source = {
+            'm_def': 'nomad_inl_base.schema_packages.star.SputteringTargetComponent',
+            'system': get_hash_ref(upload.upload_id, target),
+        }
+        step = {'duration': 600.0, 'power': 100.0}
+        upload.process(
+            _write(
+                upload,
+                f'run{run}.archive.yaml',
+                {
+                    'm_def': 'nomad_inl_base.schema_packages.star.StarDCSputtering',
+                    'name': f'Run {run}',
+                    'sources': [{'material': [source]}],
+                    'steps': [step],
+                },
+            )
+        )
+
+    assert not upload.failed
+    with upload.raw_file(target) as file:
+        data = yaml.safe_load(file)['data']
+    assert [record['deposition_time'] for record in data['deposition_records']] == [
+        600.0,
+        600.0,
+    ]
+    assert data['total_deposition_energy'] == pytest.approx(120e3)
+    assert _data(upload, target)['ledger_size'] == 2
+
+
+def test_search(tmp_path):
+    upload = LocalUpload(tmp_path)
+    for name in ('A', 'B', 'C'):
+        upload.process(
+            _write(
+                upload,
+                f'{name}.archive.yaml',
+                {
+                    'm_def': 'nomad_inl_base.schema_packages.entities.INLSubstrate',
+                    'name': name,
+                },
+            )
+        )
+
+    names, page_after_value = [], None
+    while True:
+        result = upload.search(
+            query={'entry_type': ['INLSubstrate', 'INLThinFilmStack']},
+            pagination=MetadataPagination(
+                page_size=2, page_after_value=page_after_value
+            ),
+            required=MetadataRequired(include=['entry_id', 'results.eln.names']),
+        )
+        assert result.pagination.total == 3
+        names.extend(hit['results']['eln']['names'][0] for hit in result.data)
+        page_after_value = result.pagination.next_page_after_value
+        if not page_after_value:
+            break
+    assert sorted(names) == ['A', 'B', 'C']
+    assert upload.search(query={'results.eln.names': 'D'}).data == []
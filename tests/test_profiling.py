@@ -0,0 +1,176 @@
+import io
+import time
+from types import SimpleNamespace
+
+import pytest
+from nomad.datamodel.data import ArchiveSection
+from nomad.metainfo import SubSection
+
+from nomad_inl_base.profiling import (
+    NORMALIZE_EVENT,
+    PARSE_EVENT,
+    instrumented,
+    normalize_phase,
+    parse_phase,
+    profiled_normalize,
+    record_figure,
+    record_parse,
+)
+from nomad_inl_base.schema_packages.entities import NormalizeDiagnostics
+
+
+class _Logger:
+    def __init__(self):
+        self.events = []
+
+    def info(self, event, **kwargs):
+        self.events.append((event, kwargs))
+
+
+class _Parser:
+    @instrumented
+    def parse(self, mainfile, archive, logger):
+        with parse_phase('read'):
+            time.sleep(0.02)
+            with parse_phase('decode'):
+                time.sleep(0.02)
+        record_parse(rows=42)
+        with parse_phase('serialize'):
+            pass
+        if archive == 'fail':
+            raise ValueError(archive)
+
+
+class _SubParser(_Parser):
+    @instrumented
+    def parse(self, mainfile, archive, logger):
+        super().parse(mainfile, archive, logger)
+
+
+def test_instrumented_parse_logs_exclusive_phases(tmp_path):
+    mainfile = tmp_path / 'log.csv'
+    mainfile.write_text('a,b\n1,2\n')
+    logger = _Logger()
+
+    _SubParser().parse(str(mainfile), None, logger)
+
+    [(event, stats)] = logger.events
+    assert event == PARSE_EVENT
+    assert stats['parser'] == '_SubParser'
+    assert stats['input_bytes'] == 8
+    assert stats['rows'] == 42
+    assert stats['succeeded']
+    phases = stats['phases']
+    assert set(phases) == {'build', 'read', 'decode', 'serialize'}
+    # The nested decode phase pauses read instead of being counted twice
+    assert phases['read'] < 0.035
+    assert phases['decode'] >= 0.02
+    assert sum(phases.values()) == pytest.approx(stats['total'], abs=1e-4)
+
+
+def test_instrumented_parse_logs_failures():
+    logger = _Logger()
+    with pytest.raises(ValueError):
+        _Parser().parse('missing.csv', 'fail', logger)
+    [(_, stats)] = logger.events
+    assert not stats['succeeded']
+    assert stats['input_bytes'] is None
+
+
+def test_phases_outside_a_parse_are_noops():
+    with parse_phase('read'):
+        record_parse(rows=1)
+
+
+class _Context:
+    def resolve_archive_url(self, url):
+        return self.load_archive(url, None, None)
+
+    def load_archive(self, entry_id, upload_id, installation_url):
+        return entry_id
+
+    def raw_file(self, path, mode='r'):
+        return io.StringIO('line 1\nline 2\n')
+
+
+class _Section(ArchiveSection):
+    normalize_diagnostics = SubSection(section_def=NormalizeDiagnostics)
+
+    @profiled_normalize('profiled_entry_point')
+    def normalize(self, archive, logger):
+        archive.m_context.resolve_archive_url('../upload/archive/a')
+        with archive.m_context.raw_file('log.csv') as fh:
+            assert list(fh) == ['line 1\n', 'line 2\n']
+        with normalize_phase('search', searches=1):
+            pass
+        record_figure({'data': [{'y': [1, 2, 3]}]})
+
+
+@pytest.fixture
+def plugin_options(monkeypatch):
+    options = {}
+    monkeypatch.setattr(
+        'nomad_inl_base.utils.plugin_option',
+        lambda entry_point_id, name, default=None: options.get(name, default),
+    )
+    return options
+
+
+def test_profiled_normalize_counts_hidden_work(plugin_options):
+    plugin_options.update(profile_normalize=True, normalize_diagnostics=True)
+    context = _Context()
+    logger = _Logger()
+    section = _Section()
+
+    section.normalize(SimpleNamespace(m_context=context), logger)
+
+    [(event, stats)] = logger.events
+    assert event == NORMALIZE_EVENT
+    assert stats['section'] == '_Section'
+    assert stats['searches'] == 1
+    assert stats['dereferences'] == 1
+    assert stats['archive_loads'] == 1
+    assert stats['raw_files'] == 1
+    assert stats['raw_bytes'] == 14
+    assert stats['figure_bytes'] == len('{"data": [{"y": [1, 2, 3]}]}')
+    assert {'normalize', 'search', 'archive_load', 'raw_io'} <= set(stats['phases'])
+    # Outside a profiled normalize the watched context only delegates
+    assert context.resolve_archive_url('../upload/archive/b') == '../upload/archive/b'
+    assert len(logger.events) == 1
+    assert section.normalize_diagnostics.raw_files == 1
+    assert section.normalize_diagnostics.phase_times == stats['phases']
+
+
+def test_profiled_normalize_shares_the_context_between_threads(plugin_options):
+    """Concurrent normalizes on one context each count their own work."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    plugin_options.update(profile_normalize=True)
+    context = _Context()
+    barrier = threading.Barrier(2)
+
+    class _Waiting(ArchiveSection):
+        @profiled_normalize('profiled_entry_point')
+        def normalize(self, archive, logger):
+            barrier.wait()
+            for _ in range(archive.loads):
+                archive.m_context.resolve_archive_url('../upload/archive/a')
+            barrier.wait()
+
+    def normalize(loads):
+        logger = _Logger()
+        _Waiting().normalize(SimpleNamespace(m_context=context, loads=loads), logger)
+        [(_, stats)] = logger.events
+        return stats['archive_loads']
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        assert list(pool.map(normalize, [1, 3])) == [1, 3]
+
+
+def test_profiled_normalize_is_opt_in(plugin_options):
+    logger = _Logger()
+    section = _Section()
+    section.normalize(SimpleNamespace(m_context=_Context()), logger)
+    assert not logger.events
+    assert section.normalize_diagnostics is None
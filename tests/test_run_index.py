@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip('pyarrow')
+
+from nomad_inl_base.run_index import compact_run_index, load_run_index, write_run
+
+
+def test_run_index_query_and_reindex(tmp_path):
+    root = str(tmp_path)
+    write_run(
+        root,
+        'PC03',
+        {
+            'entry_id': 'a',
+            'operator': 'Ana',
+            'materials': ['LiCoO2'],
+            'start_time': datetime(2026, 1, 5),
+            'base_pressure': 1e-5,
+            'arc_count': 3,
+        },
+    )
+    write_run(
+        root,
+        'PC03',
+        {
+            'entry_id': 'b',
+            'operator': 'Bo',
+            'materials': ['LFP', 'Li3PO4'],
+            'start_time': datetime(2026, 2, 5),
+        },
+    )
+    write_run(
+        root,
+        'PC04',
+        {
+            'entry_id': 'c',
+            'operator': 'Ana',
+            'materials': ['LiPON'],
+            'start_time': datetime(2026, 3, 5),
+        },
+    )
+
+    df = load_run_index(root)
+    assert df['entry_id'].tolist() == ['a', 'b', 'c']
+    assert df['chamber'].tolist() == ['PC03', 'PC03', 'PC04']
+    assert df['start_time'].iloc[0] == datetime(2026, 1, 5, tzinfo=timezone.utc)
+    assert df['arc_count'].iloc[0] == 3
+
+    assert load_run_index(root, chamber='PC04')['entry_id'].tolist() == ['c']
+    assert load_run_index(root, operator='Ana')['entry_id'].tolist() == ['a', 'c']
+    by_material = load_run_index(
+        root, material=['Li3PO4', 'LiPON'], columns=['entry_id']
+    )
+    assert list(by_material.columns) == ['entry_id']
+    assert by_material['entry_id'].tolist() == ['b', 'c']
+    in_range = load_run_index(root, start='2026-01-01', end=datetime(2026, 3, 1))
+    assert in_range['entry_id'].tolist() == ['a', 'b']
+
+    # Re-normalizing a run replaces its row, also after compaction
+    compact_run_index(root)
+    assert len(list((tmp_path / 'chamber=PC03').glob('*.parquet'))) == 1
+    write_run(
+        root,
+        'PC03',
+        {
+            'entry_id': 'a',
+            'operator': 'Cy',
+            'materials': ['LiCoO2'],
+            'start_time': datetime(2026, 1, 5),
+        },
+    )
+    assert load_run_index(root, operator='Ana')['entry_id'].tolist() == ['c']
+    assert len(load_run_index(root)) == 3
+    compact_run_index(root)
+    assert load_run_index(root, chamber='PC03')['operator'].tolist() == ['Cy', 'Bo']
+
+
+def test_run_index_missing_root(tmp_path):
+    df = load_run_index(str(tmp_path / 'missing'))
+    assert len(df) == 0
+    assert 'base_pressure' in df.columns
@@ -0,0 +1,57 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from nomad_inl_base.sidecar import read_series, write_sidecar
+
+
+def _archive(tmp_path):
+    def raw_file(path, mode='r'):
+        return open(tmp_path / path, mode)
+
+    return SimpleNamespace(m_context=SimpleNamespace(raw_file=raw_file))
+
+
+def test_write_sidecar_keeps_preview_and_full_resolution(tmp_path):
+    from nomad_inl_base.schema_packages.batteries import PC04SubstrateAnnealing
+
+    n = 1000
+    entry = PC04SubstrateAnnealing(
+        timestamps=np.arange(n, dtype=float),
+        substrate_temperature=300.0 + np.arange(n, dtype=float),
+        process_phase=np.array(['Heat'] * 500 + ['Cool'] * 500),
+    )
+    archive = _archive(tmp_path)
+
+    stride = write_sidecar(archive, entry, n, 'run.timeseries.h5', 100)
+
+    assert stride == 10
+    assert len(entry.timestamps) == 100
+    assert entry.substrate_temperature.magnitude[1] == 310.0
+    full = read_series(archive, 'run.timeseries.h5', 'substrate_temperature')
+    np.testing.assert_array_equal(full, 300.0 + np.arange(n))
+    tail = read_series(archive, 'run.timeseries.h5', 'timestamps', slice(-2, None))
+    np.testing.assert_array_equal(tail, [998.0, 999.0])
+    phases = read_series(archive, 'run.timeseries.h5', 'process_phase')
+    assert phases[0] == 'Heat' and phases[-1] == 'Cool'
+    assert read_series(archive, 'run.timeseries.h5', 'tc1_temperature') is None
+
+
+def test_write_sidecar_writes_only_the_range_in_view(tmp_path):
+    from nomad_inl_base.schema_packages.batteries import (
+        BatteryChamberSputteringDeposition,
+    )
+    from nomad_inl_base.utils import apply_time_index
+
+    n = 1000
+    entry = BatteryChamberSputteringDeposition(timestamps=np.arange(n, dtype=float))
+    apply_time_index(entry, n, slice(100, 600), view=True)
+    archive = _archive(tmp_path)
+
+    stride = write_sidecar(archive, entry, n, 'run.timeseries.h5', 100)
+
+    assert stride == 5
+    assert entry.time_index_stop is None
+    assert entry.timestamps.magnitude[0] == 100.0
+    full = read_series(archive, 'run.timeseries.h5', 'timestamps')
+    np.testing.assert_array_equal(full, np.arange(100, 600))
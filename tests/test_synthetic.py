@@ -0,0 +1,123 @@
+import olefile
+import pySPM
+import pytest
+from nomad.client import normalize_all, parse
+
+from nomad_inl_base.parsers.afm import BrukerAFMParser
+from nomad_inl_base.synthetic import (
+    main,
+    write_bruker_afm,
+    write_chamber_log,
+    write_emsa,
+    write_gdoes,
+    write_meteor_log,
+    write_sem_set,
+    write_solar_iv,
+    write_testo_vi2,
+)
+
+
+@pytest.mark.parametrize('chamber', ['PC03', 'PC04'])
+def test_chamber_log(tmp_path, chamber):
+    mainfile = write_chamber_log(tmp_path, chamber, hours=0.25)
+    with open(mainfile, encoding='utf-8') as fh:
+        header = fh.readlines()[3]
+    assert len(header.split(',')) == 460
+
+    archive = parse(mainfile)[0]
+    data = archive.data
+    assert type(data).__name__.startswith(chamber)
+    assert data.sample_name == 'Synthetic_001'
+    assert len(data.timestamps) == 900
+    assert data.sources[0].power_supply_type == 'RF'
+    assert data.sources[2].power_supply_type == 'DC-pulsed'
+    normalize_all(archive)
+    assert data.deposition_time.magnitude == pytest.approx(0.7 * 900, abs=2)
+
+
+def test_chamber_log_annealing(tmp_path):
+    mainfile = write_chamber_log(tmp_path, 'PC04', hours=0.1, sputtering=False)
+    archive = parse(mainfile)[0]
+    assert type(archive.data).__name__ == 'PC04SubstrateAnnealing'
+    assert len(archive.data.timestamps) == 360
+
+
+def test_meteor_log_is_cut_at_venting(tmp_path):
+    mainfile = write_meteor_log(tmp_path, hours=0.1, vent_seconds=120)
+    data = parse(mainfile)[0].data
+    # The pressure passes 0.01 mbar a quarter of the way through venting
+    assert 360 < len(data.elapsed_time) < 360 + 60
+    assert all(data.pockets[0].enabled)
+    assert not any(data.pockets[1].enabled)
+
+
+def test_testo_vi2(tmp_path):
+    # Beyond the 109 FAT sectors listed in the OLE header
+    mainfile = write_testo_vi2(tmp_path, records=700_000)
+    with olefile.OleFileIO(mainfile, raise_defects=olefile.DEFECT_INCORRECT) as ole:
+        assert ole.get_size('54302/data/values') == 700_000 * 12
+
+    mainfile = write_testo_vi2(tmp_path, records=500, lab='SUPPORT')
+    data = parse(mainfile)[0].data
+    assert data.source_lab_name == 'SUPPORT'
+    assert data.serial_number == '44675156'
+    assert len(data.timestamps) == 500
+
+
+def test_solar_iv(tmp_path):
+    data = parse(write_solar_iv(tmp_path, cells=8))[0].data
+    assert len(data.results) == len(data.iv_curves) == 8
+    assert all(0 < result.fill_factor <= 85 for result in data.results)
+
+
+def test_gdoes(tmp_path):
+    data = parse(write_gdoes(tmp_path, elements=20, points=500))[0].data
+    assert len(data.depth) == 500
+    assert len(data.element_profiles) == 20
+    with pytest.raises(ValueError):
+        write_gdoes(tmp_path, elements=31)
+
+
+def test_emsa(tmp_path):
+    mainfile = write_emsa(tmp_path, channels=1024)
+    archive = parse(mainfile)[0]
+    assert archive.metadata.entry_name == 'Synthetic spectrum'
+
+
+def test_sem_set(tmp_path):
+    mainfile = write_sem_set(tmp_path, images=3, width=128, height=96)
+    archive = parse(mainfile)[0]
+    normalize_all(archive)
+    images = archive.data.images
+    assert [image.file_name for image in images] == [
+        '260318 - Synthetic.tif',
+        '260318 - Synthetic_001.tif',
+        '260318 - Synthetic_002.tif',
+    ]
+    assert images[0].width_pixels == 128
+    assert images[0].image_array.shape == (96, 128)
+
+
+def test_bruker_afm(tmp_path):
+    mainfile = write_bruker_afm(tmp_path, pixels=64, channels=4)
+    assert mainfile.endswith('Synthetic.001')
+    archive = parse(mainfile)[0]
+    assert archive.metadata.entry_name == 'Synthetic'
+
+    spm = pySPM.Bruker(mainfile)
+    assert [name for name, _ in BrukerAFMParser._channel_names(spm)] == [
+        'Height Sensor',
+        'Peak Force Error',
+        'Adhesion',
+        'Potential',
+    ]
+    height = spm.get_channel('Height Sensor')
+    assert height.pixels.shape == (64, 64)
+    assert height.zscale == 'nm'
+    assert 0 < abs(height.pixels).max() < 10
+    assert BrukerAFMParser._read_scan_rate(mainfile) == 0.996
+
+
+def test_main(tmp_path, capsys):
+    assert main(['gdoes', str(tmp_path), '--elements', '5']) == 0
+    assert capsys.readouterr().out.strip().endswith('Synthetic_1_1 gdoes.txt')
@@ -1,9 +1,29 @@
+import json
+
+import numpy as np
 import pytest
 
 from nomad_inl_base.utils import (
+    ArchiveBatch,
+    apply_time_index,
+    change_points,
+    decode_figure_arrays,
     dict_nan_equal,
+    encode_figure_arrays,
+    expand_change_points,
+    figure_digest,
+    find_samples,
+    interval_integrals,
     list_nan_equal,
     nan_equal,
+    segment_deltas,
+    segment_extrema,
+    segment_means,
+    segment_starts,
+    time_index,
+    time_index_range,
+    true_intervals,
+    yaml_write_back,
 )
 
 # ---------------------------------------------------------------------------
@@ -108,3 +128,435 @@ def test_create_filename_pattern(datafile, special_txt, filetype, expected_suffi
     result = f'{datafile}.{special_txt}.archive.{filetype}'
     assert result.endswith(expected_suffix)
     assert result == f'{datafile}.{special_txt}.archive.{filetype}'
+
+
+# ---------------------------------------------------------------------------
+# encode_figure_arrays / decode_figure_arrays
+# ---------------------------------------------------------------------------
+
+
+def _figure(**trace):
+    return {'data': [dict(type='scatter', **trace)], 'layout': {'title': 'x'}}
+
+
+@pytest.mark.parametrize(
+    'values, dtype',
+    [
+        pytest.param(np.linspace(0.0, 1.0, 100), 'f4', id='float32 is enough'),
+        pytest.param(1.7e9 + np.arange(100.0), 'f8', id='epoch seconds keep f8'),
+        pytest.param(np.arange(100), 'i4', id='integers'),
+        pytest.param(list(np.linspace(1e-6, 1e-3, 50)), 'f4', id='plain list'),
+    ],
+)
+def test_encode_figure_arrays_dtype(values, dtype):
+    encoded = encode_figure_arrays(_figure(x=values, y=values))
+    assert encoded['data'][0]['x']['dtype'] == dtype
+    assert encoded['layout'] == {'title': 'x'}
+    decoded = decode_figure_arrays(encoded)
+    np.testing.assert_allclose(decoded['data'][0]['y'], values, rtol=1e-6)
+
+
+def test_encode_figure_arrays_keeps_non_numeric_and_short():
+    figure = _figure(
+        x=['a'] * 20,
+        y=[1.0, 2.0],
+        marker={'color': list(np.arange(20.0))},
+        customdata=[None, 1.0] * 10,
+        text=list(range(20)),
+    )
+    encoded = encode_figure_arrays(figure)
+    trace = encoded['data'][0]
+    assert trace['x'] == ['a'] * 20
+    assert trace['y'] == [1.0, 2.0]
+    assert trace['marker']['color']['dtype'] == 'f4'
+    assert trace['customdata']['dtype'] == 'f4'
+    assert trace['text'] == list(range(20))
+    json.dumps(encoded)
+
+
+def test_encode_figure_arrays_2d_shape():
+    z = np.random.default_rng(0).random((8, 5))
+    encoded = encode_figure_arrays(_figure(z=z))
+    assert encoded['data'][0]['z']['shape'] == '8, 5'
+    decoded = decode_figure_arrays(encoded)
+    np.testing.assert_allclose(decoded['data'][0]['z'], z, rtol=1e-6)
+
+
+# ---------------------------------------------------------------------------
+# figure_digest
+# ---------------------------------------------------------------------------
+
+
+def test_figure_digest_tracks_arrays_and_settings():
+    ts = np.arange(10.0)
+    rows = [(np.ones(10), 'Capman (mbar)', False)]
+    digest = figure_digest('Pressure', ts, rows)
+    assert digest == figure_digest(
+        'Pressure', ts.copy(), [(np.ones(10), 'Capman (mbar)', False)]
+    )
+    assert digest != figure_digest(
+        'Pressure', ts, [(np.ones(10), 'Capman (mbar)', True)]
+    )
+    assert digest != figure_digest('Pressure', ts + 1, rows)
+    assert figure_digest(np.array(['a', 'b'])) != figure_digest(np.array(['a', 'c']))
+
+
+# ---------------------------------------------------------------------------
+# time_index / apply_time_index
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    'index, expected',
+    [
+        pytest.param(np.array([0, 1, 1, 0, 0], dtype=bool), slice(1, 3), id='mask'),
+        pytest.param(slice(None, 3), slice(0, 3), id='prefix slice'),
+        pytest.param(np.zeros(5, dtype=bool), slice(0, 0), id='empty'),
+    ],
+)
+def test_time_index_contiguous(index, expected):
+    assert time_index(index, 5) == expected
+
+
+def test_time_index_scattered():
+    result = time_index(np.array([1, 0, 1, 0, 1], dtype=bool), 5)
+    np.testing.assert_array_equal(result, [0, 2, 4])
+
+
+def test_apply_time_index_walks_subsections():
+    from nomad_inl_base.schema_packages.batteries import (
+        BatteryChamberSputteringDeposition,
+        SputteringRFPowerSupply,
+        SputteringSource,
+    )
+
+    n = 6
+    entry = BatteryChamberSputteringDeposition(
+        timestamps=np.arange(n, dtype=float),
+        process_phase=np.array(['a', 'b', 'c', 'd', 'e', 'f']),
+    )
+    entry.sources.append(
+        SputteringSource(source_index=1, active=np.array([0, 1, 1, 0, 1, 0], bool))
+    )
+    entry.rf_power_supplies.append(
+        SputteringRFPowerSupply(supply_index=1, forward_power=np.arange(n) * 10.0)
+    )
+
+    apply_time_index(entry, n, entry.sources[0].active.copy())
+
+    np.testing.assert_array_equal(entry.timestamps.magnitude, [1, 2, 4])
+    assert list(entry.process_phase) == ['b', 'c', 'e']
+    assert entry.sources[0].active.tolist() == [True, True, True]
+    np.testing.assert_array_equal(
+        entry.rf_power_supplies[0].forward_power.magnitude, [10, 20, 40]
+    )
+
+
+def test_apply_time_index_view_mode_records_range():
+    from nomad_inl_base.schema_packages.batteries import (
+        BatteryChamberSputteringDeposition,
+        SputteringSource,
+        StepSignal,
+        _signal,
+        _step_signal,
+    )
+
+    n = 6
+    entry = BatteryChamberSputteringDeposition(timestamps=np.arange(n, dtype=float))
+    entry.sources.append(SputteringSource(source_index=1))
+    source = entry.sources[0]
+    source.step_signals.append(
+        StepSignal.from_array('active', np.array([0, 1, 1, 1, 0, 0], bool))
+    )
+    source.deposition_rate = np.arange(n, dtype=float)
+
+    assert apply_time_index(entry, n, slice(1, 4), view=True) == slice(1, 4)
+    assert len(entry.timestamps) == n
+    assert (entry.time_index_start, entry.time_index_stop) == (1, 4)
+    # Readers of the subsections see only the rows in view
+    assert time_index_range(source) == slice(1, 4)
+    np.testing.assert_array_equal(
+        _signal(source, 'deposition_rate').magnitude, [1, 2, 3]
+    )
+    active = _step_signal(source, 'active')
+    assert active.n_points == 3
+    assert active.expand().tolist() == [True] * 3
+    with pytest.raises(ValueError):
+        apply_time_index(entry, n, np.array([1, 0, 1, 0, 0, 0], bool), view=True)
+
+
+@pytest.mark.parametrize('rows', [slice(0, 6), slice(2, 5), slice(3, 3), slice(5, 6)])
+def test_step_signal_window_matches_expansion(rows):
+    from nomad_inl_base.schema_packages.batteries import StepSignal
+
+    values = np.array(['a', 'a', 'b', 'c', 'c', 'd'])
+    window = StepSignal.from_array('process_phase', values).window(rows)
+    assert window.expand().tolist() == values[rows].tolist()
+
+
+# ---------------------------------------------------------------------------
+# Change-point encoding
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    'values, index',
+    [
+        pytest.param(np.array([1, 1, 0, 0, 1], dtype=bool), [0, 2, 4], id='bool'),
+        pytest.param(np.array([0, 0, 3, 3, 5]), [0, 2, 4], id='counter'),
+        pytest.param(np.array([1.0, np.nan, np.nan, 2.0]), [0, 1, 3], id='nan runs'),
+        pytest.param(np.array(['Heat', 'Heat', 'Dep', 'Heat']), [0, 2, 3], id='str'),
+    ],
+)
+def test_change_points_round_trip(values, index):
+    change_index, runs = change_points(values)
+    np.testing.assert_array_equal(change_index, index)
+    np.testing.assert_array_equal(
+        expand_change_points(change_index, runs, len(values)), values
+    )
+
+
+def test_true_intervals():
+    change_index, runs = change_points(np.array([0, 1, 1, 0, 1], dtype=bool))
+    starts, stops = true_intervals(change_index, runs, 5)
+    np.testing.assert_array_equal(starts, [1, 4])
+    np.testing.assert_array_equal(stops, [3, 5])
+
+
+def test_step_signals_follow_time_index():
+    from nomad_inl_base.schema_packages.batteries import (
+        BatteryChamberSputteringDeposition,
+        SputteringSource,
+        StepSignal,
+    )
+
+    n = 6
+    active = np.array([0, 1, 1, 0, 1, 1], bool)
+    entry = BatteryChamberSputteringDeposition(timestamps=np.arange(n, dtype=float))
+    entry.step_signals.append(
+        StepSignal.from_array('process_phase', np.array(['a'] * 3 + ['b'] * 3))
+    )
+    entry.sources.append(SputteringSource(source_index=1))
+    entry.sources[0].step_signals.append(StepSignal.from_array('active', active))
+
+    entry._trim_inactive()
+
+    phase = entry.step_signals[0]
+    assert phase.n_points == 4
+    assert phase.expand().tolist() == ['a', 'a', 'b', 'b']
+    assert entry.sources[0].step_signals[0].expand().tolist() == [True] * 4
+    assert len(entry.sources[0].step_signals[0].change_index) == 1
+
+
+# ---------------------------------------------------------------------------
+# Segment statistics
+# ---------------------------------------------------------------------------
+
+
+def test_segment_reductions_ignore_nan():
+    starts = segment_starts(8, np.array([0, 3]), np.array([0, 5, 9]))
+    np.testing.assert_array_equal(starts, [0, 3, 5])
+
+    values = np.array([1.0, 2.0, np.nan, 4.0, 5.0, np.nan, np.nan, np.nan])
+    np.testing.assert_array_equal(segment_means(values, starts), [1.5, 4.5, np.nan])
+    lo, hi = segment_extrema(values, starts)
+    np.testing.assert_array_equal(lo, [1.0, 4.0, np.nan])
+    np.testing.assert_array_equal(hi, [2.0, 5.0, np.nan])
+    np.testing.assert_array_equal(segment_deltas(values, starts), [1.0, 1.0, np.nan])
+
+
+def test_interval_integrals_use_rectangle_rule():
+    ts = np.array([0.0, 1.0, 3.0, 4.0, 7.0])
+    values = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
+    np.testing.assert_array_equal(
+        interval_integrals(values, ts, [0, 3], [2, 5]), [5.0, 12.0]
+    )
+
+
+def test_find_samples_searches_once_per_context(monkeypatch, tmp_path):
+    from types import SimpleNamespace
+
+    from nomad_inl_base import utils
+
+    searches = []
+
+    def fake_search(archive):
+        searches.append(archive)
+        return {
+            'LNbO_004': [
+                {
+                    'entry_id': 'sub',
+                    'upload_id': 'up',
+                    'entry_type': 'INLSubstrate',
+                    'mainfile': 'sub.archive.yaml',
+                }
+            ]
+        }
+
+    monkeypatch.setattr(utils, '_search_samples', fake_search)
+
+    class Context:
+        upload_id = 'up'
+        upload = SimpleNamespace(process_updated_raw_file=lambda *a, **k: None)
+
+        def raw_path_exists(self, path):
+            return (tmp_path / path).exists()
+
+        def raw_file(self, path, mode='r'):
+            return open(tmp_path / path, mode)
+
+    archive = SimpleNamespace(m_context=Context())
+
+    assert find_samples(archive, 'LNbO_004')[0]['entry_id'] == 'sub'
+    assert find_samples(archive, 'LNbO_005') == []
+    assert find_samples(archive, 'LNbO_004', ('INLThinFilmStack',)) == []
+    # A stack created during the run is found without another search
+    utils.create_archive(
+        {
+            'data': {
+                'm_def': 'nomad_inl_base.schema_packages.entities.INLThinFilmStack',
+                'name': 'LNbO_005',
+            }
+        },
+        archive.m_context,
+        'stack.archive.yaml',
+        'yaml',
+        None,
+    )
+    (stack,) = find_samples(archive, 'LNbO_005')
+    assert stack['entry_type'] == 'INLThinFilmStack'
+    assert stack['mainfile'] == 'stack.archive.yaml'
+    assert len(searches) == 1
+
+    # A new processing run (context) rebuilds the index
+    find_samples(SimpleNamespace(m_context=Context()), 'LNbO_004')
+    assert len(searches) == 2
+
+
+def test_yaml_write_back_coalesces_appends(tmp_path):
+    from types import SimpleNamespace
+
+    import structlog
+    import yaml
+
+    logger = structlog.get_logger()
+    reprocessed = []
+
+    class Context:
+        upload = SimpleNamespace(
+            process_updated_raw_file=lambda path, **k: reprocessed.append(path)
+        )
+
+        def raw_path(self):
+            return str(tmp_path)
+
+        def raw_path_exists(self, path):
+            return (tmp_path / path).exists()
+
+        def raw_file(self, path, mode='r'):
+            return open(tmp_path / path, mode)
+
+    (tmp_path / 'stack.archive.yaml').write_text(
+        yaml.dump({'data': {'name': 'S1', 'layers': [{'reference': 'a'}]}})
+    )
+    context = Context()
+    write_back = yaml_write_back(context)
+    assert yaml_write_back(context) is write_back
+
+    with write_back.batch(logger=logger):
+        for ref in ('a', 'b', 'c', 'b'):
+            write_back.append(
+                'stack.archive.yaml',
+                'layers',
+                {'reference': ref},
+                unique=('reference',),
+            )
+        assert write_back.flush(logger=logger) == []  # deferred to the batch end
+    assert reprocessed == ['stack.archive.yaml']
+    layers = yaml.safe_load((tmp_path / 'stack.archive.yaml').read_text())['data']
+    assert [layer['reference'] for layer in layers['layers']] == ['a', 'b', 'c']
+
+    # Nothing new to append → no write and no reprocess
+    write_back.append(
+        'stack.archive.yaml', 'layers', {'reference': 'c'}, ('reference',)
+    )
+    assert write_back.flush(logger=logger) == []
+    assert reprocessed == ['stack.archive.yaml']
+
+    # A failing batch drops what it queued; a broken file does not keep the
+    # others from being updated
+    with pytest.raises(RuntimeError):
+        with write_back.batch(logger):
+            write_back.append('stack.archive.yaml', 'layers', {'reference': 'x'})
+            raise RuntimeError
+    assert write_back.flush(logger) == []
+    (tmp_path / 'broken.archive.yaml').write_text('data: [unclosed')
+    write_back.append('broken.archive.yaml', 'layers', {'reference': 'd'})
+    write_back.append('stack.archive.yaml', 'layers', {'reference': 'd'})
+    write_back.append('stack.archive.yaml', 'values', {'value': 1e-300})
+    assert write_back.flush(logger) == ['stack.archive.yaml']
+    data = yaml.safe_load((tmp_path / 'stack.archive.yaml').read_text())['data']
+    assert [layer['reference'] for layer in data['layers']] == ['a', 'b', 'c', 'd']
+    assert data['values'] == [{'value': 1e-300}]
+
+
+def test_archive_batch_writes_before_registering(tmp_path):
+    from types import SimpleNamespace
+
+    import yaml
+
+    events = []
+
+    class Context:
+        upload_id = 'up'
+        upload = SimpleNamespace(
+            process_updated_raw_file=lambda path, **k: events.append(
+                (path, sorted(p.name for p in tmp_path.iterdir()))
+            )
+        )
+
+        def raw_path_exists(self, path):
+            return (tmp_path / path).exists()
+
+        def raw_file(self, path, mode='r'):
+            return open(tmp_path / path, mode)
+
+    logger = SimpleNamespace(error=lambda msg: events.append(('error', msg)))
+    (tmp_path / 'old.archive.yaml').write_text(yaml.dump({'data': {'name': 'old'}}))
+
+    batch = ArchiveBatch(Context(), logger)
+    film = batch.add({'data': {'name': 'film'}}, 'film.archive.yaml')
+    assert batch.exists('film.archive.yaml')
+    batch.add({'data': {'name': 'stack'}}, 'stack.archive.yaml')
+    batch.add({'data': {'name': 'new'}}, 'old.archive.yaml')  # edited by a user
+    assert film.endswith('#data')
+    assert events == []
+
+    assert batch.commit() == ['film.archive.yaml', 'stack.archive.yaml']
+    files = ['film.archive.yaml', 'old.archive.yaml', 'stack.archive.yaml']
+    assert events[0][0] == 'error'
+    assert events[1:] == [('film.archive.yaml', files), ('stack.archive.yaml', files)]
+    assert yaml.safe_load((tmp_path / 'old.archive.yaml').read_text()) == {
+        'data': {'name': 'old'}
+    }
+
+
+def test_prefetch_collects_unresolved_archive_references():
+    from nomad.metainfo import MProxy
+
+    from nomad_inl_base.utils import _unresolved_urls
+
+    urls = {}
+    _unresolved_urls(
+        [
+            [MProxy('../uploads/up/archive/e1#data'), None],
+            MProxy('#/data/sources/0'),  # within the same archive
+            MProxy('../uploads/up/archive/e2#/data'),
+            MProxy('../uploads/up/archive/e1#/data/layers/0'),
+        ],
+        urls,
+    )
+    assert urls == {
+        '../uploads/up/archive/e1': 'e1',
+        '../uploads/up/archive/e2': 'e2',
+    }